@@ -0,0 +1,16 @@
+"""Throughput & memory benchmarks for loading Knowledge Graphs.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: __init__.py
+     Created on 18 October, 2026 @ 12:10 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
@@ -0,0 +1,108 @@
+"""Lookup throughput of one Knowledge Graph shared by reader threads.
+
+   Plain `sqlite3` point queries on the same file run alongside as the
+   ceiling: threads only help as far as SQLite (which releases the GIL)
+   scales on this machine.
+
+   Usage:
+     python -m benchmarks.concurrent_reads --entities 50000 --lookups 20000
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: concurrent_reads.py
+     Created on 18 October, 2026 @ 08:05 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+import os
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from sage.core.utils import Log, File
+from sage.core.graph import KnowledgeGraph
+from sage.core.schema import Vertex
+
+from benchmarks.ntriples import generate
+
+
+def serve(kg: KnowledgeGraph, sample: list, threads: int):
+    # Each worker expands a slice of the sample on its own session.
+    def work(ids):
+        try:
+            for vertex_id in ids:
+                kg.neighbors(kg.get_vertex(vertex_id=vertex_id))
+        finally:
+            kg.release_session()
+
+    return run(work, sample, threads)
+
+
+def raw(path: str, sample: list, threads: int):
+    # The same lookup & expansion with `sqlite3`, one connection per worker.
+    def work(ids):
+        conn = sqlite3.connect(path)
+        try:
+            for vertex_id in ids:
+                conn.execute('SELECT * FROM vertex WHERE id = ?', (vertex_id,)).fetchall()
+                conn.execute('SELECT edge.predicate, vertex.* FROM edge '
+                             'JOIN vertex ON vertex.id = edge.vertex_id '
+                             'WHERE edge.source_id = ?', (vertex_id,)).fetchall()
+        finally:
+            conn.close()
+
+    return run(work, sample, threads)
+
+
+def run(work, sample: list, threads: int):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(work, [sample[i::threads] for i in range(threads)]))
+    return time.perf_counter() - start
+
+
+def main(entities: int, lookups: int, max_threads: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = File.join(tmp, 'benchmark-threads.nt.gz')
+        n_triples = generate(path, entities)
+        Log.info(f'Generated {n_triples:,} triples, {os.cpu_count()} CPUs.')
+
+        kg = KnowledgeGraph('benchmark-threads', base_dir=tmp, overwrite=True,
+                            profile='serve', pool_size=max_threads)
+        kg.add_triple(KnowledgeGraph.stream(path), chunk_size=10000)
+        ids = [vertex_id for vertex_id, in kg._sess.query(Vertex.id)]
+        random.seed(0)
+        sample = [random.choice(ids) for _ in range(lookups)]
+
+        db_path = File.join(tmp, 'benchmark-threads.db')
+        threads = 1
+        while threads <= max_threads:
+            elapsed = serve(kg, sample, threads)
+            baseline = raw(db_path, sample, threads)
+            Log.info(f'{threads:>3} threads: {lookups / elapsed:,.0f} lookups/sec '
+                     f'({elapsed:.2f}s), sqlite3 alone {lookups / baseline:,.0f} lookups/sec.')
+            threads *= 2
+        kg.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Concurrent read benchmark.')
+    parser.add_argument('--entities', type=int, default=50000,
+                        help='Number of synthetic entities (5 triples each).')
+    parser.add_argument('--lookups', type=int, default=20000,
+                        help='Number of random vertex lookups & expansions.')
+    parser.add_argument('--max-threads', type=int, default=8,
+                        help='Reader threads, doubled from 1 up to this.')
+    args = parser.parse_args()
+
+    main(entities=args.entities, lookups=args.lookups, max_threads=args.max_threads)
@@ -0,0 +1,105 @@
+"""Start-up cost of `sage.core`, checked against a time budget.
+
+   Every statement runs in a fresh interpreter with `python -X importtime`;
+   the best of `--runs` is compared with its budget and the slowest
+   modules are listed. Exits with status 1 when a budget is exceeded, so
+   it can gate CI.
+
+   Usage:
+     python -m benchmarks.import_time --runs 5 --top 10
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: import_time.py
+     Created on 18 October, 2026 @ 10:20 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+import sys
+import argparse
+import subprocess
+
+from config.consts import FS
+
+from sage.core.utils import Log
+
+# Statement -> budget in milliseconds, on top of the interpreter's own start-up.
+BUDGETS = {
+    # Lazy: nothing heavy is imported.
+    'import sage.core': 50,
+    # SQLAlchemy, the ORM schema & the loaders.
+    'from sage.core import KnowledgeGraph': 500,
+    # `BaseKG` lives next to the SQLite backend.
+    'from sage.core import MemoryKnowledgeGraph': 500,
+}
+
+
+def import_time(statement: str, startup=()):
+    """Import times of `statement` in a fresh interpreter.
+
+    Args:
+        statement (str): Python statement to time.
+        startup (Iterable[str]): Modules imported by the interpreter itself,
+            left out of the total.
+
+    Returns:
+        Tuple[float, Dict[str, float]]: Total milliseconds & cumulative
+            milliseconds of each module it imported.
+    """
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                          cwd=FS.PROJECT_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          universal_newlines=True, check=True)
+    modules, total = {}, 0.0
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(cumulative) / 1e3
+        # Modules imported by the statement itself, not by other modules.
+        if not name[1:].startswith(' ') and name.strip() not in startup:
+            total += int(cumulative) / 1e3
+    return total, modules
+
+
+def main(runs: int, top: int):
+    if sys.version_info < (3, 7):
+        # Older interpreters ignore the flag: every statement would take 0ms.
+        Log.error('`-X importtime` needs Python 3.7 or newer.')
+        return 2
+
+    _, startup = import_time('pass')
+    over_budget = []
+    for statement, budget in BUDGETS.items():
+        total, modules = min((import_time(statement, startup) for _ in range(runs)),
+                             key=lambda result: result[0])
+        status = 'ok' if total <= budget else 'OVER BUDGET'
+        Log.info(f'{statement}: {total:,.1f}ms (budget {budget}ms) {status}')
+
+        slowest = sorted(((name, cumulative) for name, cumulative in modules.items()
+                          if name not in startup),
+                         key=lambda item: item[1], reverse=True)
+        for name, cumulative in slowest[:top]:
+            Log.info(f'  {cumulative:>8,.1f}ms  {name}')
+
+        if total > budget:
+            over_budget.append(statement)
+
+    return 1 if over_budget else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Import-time budget of `sage.core`.')
+    parser.add_argument('--runs', type=int, default=5,
+                        help='Fresh interpreters per statement, the fastest is kept.')
+    parser.add_argument('--top', type=int, default=10,
+                        help='Number of slowest modules listed per statement.')
+    args = parser.parse_args()
+
+    sys.exit(main(runs=args.runs, top=args.top))
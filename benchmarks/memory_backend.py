@@ -0,0 +1,78 @@
+"""Load & query throughput of the SQLite & in-memory storage backends.
+
+   Usage:
+     python -m benchmarks.memory_backend --entities 20000 --lookups 20000
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: memory_backend.py
+     Created on 18 October, 2026 @ 09:30 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+import time
+import random
+import argparse
+import tempfile
+
+from sage.core.utils import Log, File
+from sage.core.graph import KnowledgeGraph
+from sage.core.memory import MemoryKnowledgeGraph
+
+from benchmarks.ntriples import generate
+
+
+def load(path: str, base_dir: str, backend: str):
+    start = time.perf_counter()
+    if backend == 'sqlite':
+        kg = KnowledgeGraph('benchmark-backend', base_dir=base_dir,
+                            overwrite=True, profile='bulk')
+    else:
+        kg = MemoryKnowledgeGraph('benchmark-backend')
+    kg.add_triple(KnowledgeGraph.stream(path))
+    return kg, time.perf_counter() - start
+
+
+def serve(kg, lookups: int):
+    # Random vertex lookups & neighbor expansions.
+    ids = sorted(vertex.id for vertex in kg.iter_vertices())
+    random.seed(0)
+    sample = [random.choice(ids) for _ in range(lookups)]
+
+    start = time.perf_counter()
+    for vertex_id in sample:
+        kg.neighbors(kg.get(vertex_id))
+    return time.perf_counter() - start
+
+
+def main(entities: int, lookups: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = File.join(tmp, 'benchmark-backend.nt.gz')
+        n_triples = generate(path, entities)
+        Log.info(f'Generated {n_triples:,} triples.')
+
+        for backend in ('sqlite', 'memory'):
+            kg, load_time = load(path, tmp, backend)
+            serve_time = serve(kg, lookups)
+            kg.close()
+            Log.info(f'{backend:>6}: loaded {n_triples / load_time:,.0f} triples/sec '
+                     f'({load_time:.2f}s), served {lookups / serve_time:,.0f} lookups/sec '
+                     f'({serve_time:.2f}s).')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Storage backend benchmark.')
+    parser.add_argument('--entities', type=int, default=20000,
+                        help='Number of synthetic entities (5 triples each).')
+    parser.add_argument('--lookups', type=int, default=20000,
+                        help='Number of random vertex lookups & expansions.')
+    args = parser.parse_args()
+
+    main(entities=args.entities, lookups=args.lookups)
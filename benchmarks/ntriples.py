@@ -0,0 +1,94 @@
+"""Throughput & peak memory of the streaming N-Triples loader.
+
+   Usage:
+     python -m benchmarks.ntriples --entities 100000 --chunk-size 50000
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: ntriples.py
+     Created on 18 October, 2026 @ 12:10 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+import os
+import gzip
+import time
+import argparse
+import tempfile
+import resource
+
+from config.consts import FS
+
+from sage.core.utils import Log, File
+from sage.core.graph import KnowledgeGraph
+from sage.core.reader import iter_ntriples
+
+
+def generate(path: str, entities: int):
+    """Write a synthetic, DBpedia-like gzipped N-Triples dump.
+
+    Every entity has 3 literals and links to 2 other entities.
+    """
+    with gzip.open(path, mode='wt', encoding='utf-8') as f:
+        for i in range(entities):
+            s = f'<http://example.org/resource/E{i}>'
+            f.write(f'{s} <http://schema.org/name> "Entity {i}"@en .\n'
+                    f'{s} <http://schema.org/position> '
+                    f'"{i}"^^<http://www.w3.org/2001/XMLSchema#integer> .\n'
+                    f'{s} <http://schema.org/description> "Entity \\"{i}\\" of {entities}." .\n'
+                    f'{s} <http://schema.org/knows> '
+                    f'<http://example.org/resource/E{(i + 1) % entities}> .\n'
+                    f'{s} <http://schema.org/sameAs> '
+                    f'<http://example.org/resource/E{(i * 7) % entities}> .\n')
+    return entities * 5
+
+
+def max_rss_mb():
+    # `ru_maxrss` is in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main(entities: int, chunk_size: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = File.join(tmp, 'benchmark-ntriples.nt.gz')
+        n_triples = generate(path, entities)
+        Log.info(f'Generated {n_triples:,} triples '
+                 f'({os.path.getsize(path) / 1024 ** 2:.1f} MB gzipped).')
+
+        # Parsing only.
+        start = time.perf_counter()
+        for _ in iter_ntriples(path):
+            pass
+        elapsed = time.perf_counter() - start
+        Log.info(f'Parsed in {elapsed:.2f}s ({n_triples / elapsed:,.0f} triples/sec), '
+                 f'peak RSS {max_rss_mb():.1f} MB.')
+
+        # Parse & load into SQLite.
+        start = time.perf_counter()
+        kg = KnowledgeGraph('benchmark-ntriples', overwrite=True)
+        stats = kg.add_triple(KnowledgeGraph.stream(path), chunk_size=chunk_size)
+        elapsed = time.perf_counter() - start
+        Log.info(f'Loaded {stats["vertices"]:,} vertices & {stats["edges"]:,} edges '
+                 f'in {elapsed:.2f}s ({n_triples / elapsed:,.0f} triples/sec), '
+                 f'peak RSS {max_rss_mb():.1f} MB.')
+
+        kg.close()
+        File.remove(File.join(FS.DATABASE_DIR, 'benchmark-ntriples.db'))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='N-Triples loader benchmark.')
+    parser.add_argument('--entities', type=int, default=100000,
+                        help='Number of synthetic entities (5 triples each).')
+    parser.add_argument('--chunk-size', type=int, default=50000,
+                        help='Commit every `chunk-size` new vertices.')
+    args = parser.parse_args()
+
+    main(entities=args.entities, chunk_size=args.chunk_size)
@@ -0,0 +1,133 @@
+"""Load, write & read throughput of every SQLite engine profile.
+
+   Usage:
+     python -m benchmarks.sqlite_profiles --entities 50000 --dir resources/database
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: sqlite_profiles.py
+     Created on 18 October, 2026 @ 07:10 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+import time
+import random
+import argparse
+import tempfile
+import threading
+
+from sqlalchemy import text
+
+from config.consts import SETUP
+
+from sage.core.utils import Log, File
+from sage.core.graph import KnowledgeGraph
+from sage.core.schema import Vertex
+
+from benchmarks.ntriples import generate
+
+# Payload rewrite, each in its own transaction.
+UPDATE = text("UPDATE vertex SET payload = :payload WHERE id = :id")
+
+
+def load(path: str, base_dir: str, profile: str, chunk_size: int):
+    # Bulk load with frequent commits, mostly bound by parsing & the ORM.
+    start = time.perf_counter()
+    kg = KnowledgeGraph(f'benchmark-{profile}', base_dir=base_dir,
+                        overwrite=True, profile=profile)
+    stats = kg.add_triple(KnowledgeGraph.stream(path), chunk_size=chunk_size)
+    elapsed = time.perf_counter() - start
+    kg.close()
+    return stats, elapsed
+
+
+def commits(kg: KnowledgeGraph, ids: list, n: int):
+    # Small write transactions: the journal & its syncs dominate.
+    start = time.perf_counter()
+    for i in range(n):
+        kg._sess.execute(UPDATE, {'id': ids[i % len(ids)], 'payload': f'{{"n": {i}}}'})
+        kg._sess.commit()
+    return time.perf_counter() - start
+
+
+def lookups(kg: KnowledgeGraph, sample: list):
+    # Random vertex lookups & neighbor expansions, through the ORM.
+    start = time.perf_counter()
+    for vertex_id in sample:
+        kg.neighbors(kg.get_vertex(vertex_id=vertex_id))
+    kg._sess.commit()
+    return time.perf_counter() - start
+
+
+def contended(kg: KnowledgeGraph, ids: list, sample: list):
+    # Lookups while another thread keeps committing writes: without WAL,
+    # readers wait for every write to finish.
+    stop = threading.Event()
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            kg._sess.execute(UPDATE, {'id': ids[i % len(ids)], 'payload': '{}'})
+            kg._sess.commit()
+            i += 1
+        kg.release_session()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        return lookups(kg, sample)
+    finally:
+        stop.set()
+        thread.join()
+
+
+def main(entities: int, n_lookups: int, n_commits: int, chunk_size: int, directory: str):
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        path = File.join(tmp, 'benchmark-profiles.nt.gz')
+        n_triples = generate(path, entities)
+        Log.info(f'Generated {n_triples:,} triples.')
+
+        for profile in SETUP.SQLITE_PROFILES:
+            stats, load_time = load(path, tmp, profile, chunk_size)
+
+            kg = KnowledgeGraph(f'benchmark-{profile}', base_dir=tmp, profile=profile)
+            ids = [vertex_id for vertex_id, in kg._sess.query(Vertex.id)]
+            kg._sess.commit()
+            random.seed(0)
+            sample = [random.choice(ids) for _ in range(n_lookups)]
+
+            commit_time = commits(kg, ids, n_commits)
+            lookup_time = lookups(kg, sample)
+            contended_time = contended(kg, ids, sample)
+            kg.close()
+
+            Log.info(f'{profile:>8}: loaded {n_triples / load_time:,.0f} triples/sec, '
+                     f'{n_commits / commit_time:,.0f} commits/sec, '
+                     f'{n_lookups / lookup_time:,.0f} lookups/sec alone & '
+                     f'{n_lookups / contended_time:,.0f} lookups/sec beside a writer.')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='SQLite engine profile benchmark.')
+    parser.add_argument('--entities', type=int, default=50000,
+                        help='Number of synthetic entities (5 triples each).')
+    parser.add_argument('--lookups', type=int, default=5000,
+                        help='Number of random vertex lookups & expansions.')
+    parser.add_argument('--commits', type=int, default=2000,
+                        help='Number of single-row write transactions.')
+    parser.add_argument('--chunk-size', type=int, default=1000,
+                        help='Commit every `chunk-size` new vertices.')
+    parser.add_argument('--dir', default=None,
+                        help='Where databases are written. Use a real disk: syncs are '
+                             'free on tmpfs, which hides the journal settings.')
+    args = parser.parse_args()
+
+    main(entities=args.entities, n_lookups=args.lookups, n_commits=args.commits,
+         chunk_size=args.chunk_size, directory=args.dir)
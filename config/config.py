@@ -23,15 +23,8 @@ import configparser
 from abc import ABCMeta
 from typing import Callable, Any
 
-# Third party libraries.
-import yaml
-
-# In order to use LibYAML bindings, which is much faster than pure Python.
-# Download and install [LibYAML](https://pyyaml.org/wiki/LibYAML).
-try:
-    from yaml import CLoader as Loader, CDumper as Dumper
-except ImportError:
-    from yaml import Loader, Dumper
+# Third party libraries: PyYAML is imported by `_yaml()` when first needed,
+# as `config.consts` is read on every start-up but never touches YAML.
 
 # Exported classes & functions.
 __all__ = [
@@ -39,6 +32,19 @@ __all__ = [
 ]
 
 
+def _yaml():
+    import yaml
+
+    # In order to use LibYAML bindings, which is much faster than pure Python.
+    # Download and install [LibYAML](https://pyyaml.org/wiki/LibYAML).
+    try:
+        from yaml import CLoader as Loader, CDumper as Dumper
+    except ImportError:
+        from yaml import Loader, Dumper
+
+    return yaml, Loader, Dumper
+
+
 # noinspection PyUnresolvedReferences
 class Attr(dict):
     """Get attributes.
@@ -185,6 +191,7 @@ class Config(metaclass=ABCMeta):
         if not os.path.isfile(file):
             raise FileNotFoundError('{} was not found'.format(file))
 
+        yaml, Loader, _ = _yaml()
         with open(file, mode="r") as f:
             cfg = Attr(yaml.load(f, Loader=Loader))
 
@@ -257,6 +264,7 @@ class Config(metaclass=ABCMeta):
             AssertionError: `dumper` must be callable.
         """
         # Use LibYAML (which is much faster than pure Python) dumper.
+        yaml, _, Dumper = _yaml()
         kwargs.setdefault('Dumper', Dumper)
 
         # Write to a YAML file.
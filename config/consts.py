@@ -91,6 +91,12 @@ class FS(metaclass=ABCMeta):
 ################################################################################################
 
 
+def _sections(cfg, prefix: str):
+    # {name: options} of every "[<prefix><name>]" section.
+    return {section[len(prefix):]: dict(cfg[section])
+            for section in cfg.sections() if section.startswith(prefix)}
+
+
 class SETUP(metaclass=ABCMeta):
     # Global setup configuration.
     __global = Config.from_cfg(os.path.join(FS.CONFIG_DIR,
@@ -98,6 +104,10 @@ class SETUP(metaclass=ABCMeta):
     # Build mode/type.
     MODE = __global['config']['MODE']
 
+    # SQLite engine profile used by default & PRAGMAs of every profile.
+    SQLITE_PROFILE = __global['sqlite']['PROFILE']
+    SQLITE_PROFILES = _sections(__global, prefix='sqlite:')
+
 
 ################################################################################################
 # +--------------------------------------------------------------------------------------------+
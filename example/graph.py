@@ -65,10 +65,10 @@ def single(name: str = 'medical-condition',
     # Query graph for a named node with schema.
     node = kg[node_name, node_schema]
     Log.debug(f'Node: {node} -- {node.id}')
-    Log.info(f'Graph Edges: ({len(node.edges)})')
-    for edge in node.edges:
-        vertex = kg[edge.vertex_id]
-        Log.debug(f'{edge.vertex} --{edge.predicate}--> {vertex}')
+    neighbors = kg.neighbors(node)
+    Log.info(f'Graph Edges: ({len(neighbors)})')
+    for predicate, vertex in neighbors:
+        Log.debug(f'{node} --{predicate}--> {vertex}')
 
     Log.info(f'Graph Payload: ({len(node.payload)})')
     for key, value in node.payload.items():
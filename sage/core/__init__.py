@@ -15,12 +15,42 @@
      Apache License 2.0
      Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
 """
-from .base import Base, Mode, Attr
-from .graph import KnowledgeGraph, MultiKnowledgeGraph
-from .schema import Vertex, Graph, Edge
-from .crawler import get_properties, get_source
-from .utils import Log, File, Cache, Downloader
-from .data import Dataset
+import sys
+import types
+import importlib
+from typing import TYPE_CHECKING
+
+# Submodules & exported names are imported on first access, so
+# `import sage.core` doesn't pay for SQLAlchemy, NumPy or BeautifulSoup
+# until a worker uses what needs them.
+_SUBMODULES = frozenset({
+    'aio', 'base', 'crawler', 'data', 'graph', 'loader', 'lru', 'memory',
+    'query', 'reader', 'schema', 'snapshot', 'utils', 'vocab', 'wikidata',
+})
+
+# Exported name -> submodule defining it.
+_EXPORTS = {
+    'Base': 'base', 'Mode': 'base', 'Attr': 'base',
+    'KnowledgeGraph': 'graph', 'MultiKnowledgeGraph': 'graph',
+    'AsyncKnowledgeGraph': 'aio',
+    'MemoryKnowledgeGraph': 'memory',
+    'Vertex': 'schema', 'Graph': 'schema', 'Edge': 'schema',
+    'get_properties': 'crawler', 'get_properties_many': 'crawler', 'get_source': 'crawler',
+    'Log': 'utils', 'File': 'utils', 'Cache': 'utils', 'Downloader': 'utils',
+    'Dataset': 'data',
+    'Vocabulary': 'vocab',
+}
+
+if TYPE_CHECKING:
+    from .base import Base, Mode, Attr
+    from .graph import KnowledgeGraph, MultiKnowledgeGraph
+    from .aio import AsyncKnowledgeGraph
+    from .memory import MemoryKnowledgeGraph
+    from .schema import Vertex, Graph, Edge
+    from .crawler import get_properties, get_properties_many, get_source
+    from .utils import Log, File, Cache, Downloader
+    from .data import Dataset
+    from .vocab import Vocabulary
 
 __all__ = [
     # Base class.
@@ -31,11 +61,40 @@ __all__ = [
 
     # Knowledge Graph.
     'Vertex', 'Edge', 'Graph',
-    'KnowledgeGraph', 'MultiKnowledgeGraph',
+    'KnowledgeGraph', 'MultiKnowledgeGraph', 'AsyncKnowledgeGraph',
+    'MemoryKnowledgeGraph',
 
     # Crawler.
-    'get_properties', 'get_source',
+    'get_properties', 'get_properties_many', 'get_source',
 
     # Dataset
     'Dataset',
+
+    # schema.org vocabulary.
+    'Vocabulary',
 ]
+
+
+class _LazyModule(types.ModuleType):
+    # Module level `__getattr__` & `__dir__` (PEP 562) need Python 3.7,
+    # the module's class provides them instead.
+
+    def __getattr__(self, name):
+        if name in _SUBMODULES:
+            return importlib.import_module(f'.{name}', __name__)
+
+        try:
+            module = _EXPORTS[name]
+        except KeyError:
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+        value = getattr(importlib.import_module(f'.{module}', __name__), name)
+        # Later lookups don't come back here.
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(__all__) | _SUBMODULES)
+
+
+sys.modules[__name__].__class__ = _LazyModule
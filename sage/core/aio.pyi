@@ -0,0 +1,205 @@
+"""Asyncio facade over a Knowledge Graph.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: aio.pyi
+     Package: sage.core
+     Created on 18 October, 2026 @ 08:40 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+from typing import (Any, AsyncIterator, Awaitable, Dict, Iterable,
+                    List, Optional, Tuple, Union)
+
+from sage.core.graph import KnowledgeGraph
+from sage.core.schema import Vertex
+from sage.core.snapshot import GraphSnapshot
+
+
+class AsyncKnowledgeGraph:
+    """Awaitable `KnowledgeGraph` methods, run on a bounded thread pool.
+
+    Every call runs on one of `max_workers` threads, each with its own
+    session (see `KnowledgeGraph` thread safety), so the event loop never
+    blocks on SQLite & reads run concurrently. Writes are still serialized
+    by the graph's writer lock.
+
+    Workers keep their session & vertex cache (`cache_size`) until
+    `close`, so repeated lookups are served from memory. Only their
+    transaction ends after every call, so the next one sees newer writes.
+    Returned vertices are detached: their columns (`id`, `label`,
+    `schema`, `payload`) are loaded but relationships (e.g. `edges`) are
+    not, use `neighbors` instead. Changes made to them aren't saved.
+
+    Examples:
+        ```python
+        >>> async with await AsyncKnowledgeGraph.open('movie', profile='serve') as akg:
+        ...     avatar, titanic = await asyncio.gather(akg.get(('Avatar', 'Movie')),
+        ...                                            akg.get(('Titanic', 'Movie')))
+        ...     await akg.get_many([('Avatar', 'Movie'), ('Dune', 'Book')])
+        ...     async for vertex in akg.iter_vertices():
+        ...         print(vertex)
+        [<Vertex(label='Avatar', schema='Movie')>, None]
+        <Vertex(label='Avatar', schema='Movie')>
+        ...
+        ```
+
+    Attributes:
+        kg (KnowledgeGraph): Wrapped Knowledge Graph.
+        max_workers (int): Size of the thread pool.
+    """
+
+    """Wrapped Knowledge Graph."""
+    kg = ...  # type: KnowledgeGraph
+
+    """Size of the thread pool."""
+    max_workers = ...  # type: int
+
+    """All vertices of the default graph, e.g. `await akg.vertices`."""
+    vertices = ...  # type: Awaitable[List[Vertex]]
+
+    def __init__(self, kg: KnowledgeGraph, max_workers: int = 0) -> None:
+        """Wrap an open Knowledge Graph.
+
+        Args:
+            kg (KnowledgeGraph): Graph to run calls on. Open it with a
+                `pool_size` of at least `max_workers`.
+            max_workers (int): Defaults to 0, i.e. `min(32, os.cpu_count() + 4)`.
+                Threads running calls.
+        """
+
+    def __repr__(self) -> str: ...
+
+    async def __aenter__(self) -> AsyncKnowledgeGraph: ...
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None: ...
+
+    def __aiter__(self) -> AsyncIterator[Vertex]:
+        """Same as `iter_vertices()`."""
+
+    @classmethod
+    async def open(cls, name: str, description: Optional[str] = None,
+                   max_workers: int = 0, **kwargs) -> AsyncKnowledgeGraph:
+        """Open (or create) a Knowledge Graph without blocking the event loop.
+
+        Args:
+            name (str): Label given to Knowledge Graph.
+            description (str): Defaults to None. Knowledge graph's description.
+            max_workers (int): Defaults to 0, i.e. `min(32, os.cpu_count() + 4)`.
+                Threads running calls.
+
+        Keyword Args:
+            Same as `KnowledgeGraph`. `pool_size` defaults to `max_workers`.
+
+        Returns:
+            AsyncKnowledgeGraph - Facade over the opened graph.
+        """
+
+    @classmethod
+    async def fromfile(cls, path: str, description: Optional[str] = None,
+                       max_workers: int = 0, **kwargs) -> AsyncKnowledgeGraph:
+        """Same as `KnowledgeGraph.fromfile`, without blocking the event loop.
+
+        `pool_size` defaults to `max_workers`, like `open`.
+        """
+
+    async def close(self) -> None:
+        """Wait for running calls, then close the graph."""
+
+    async def get(self, item: Union[str, Tuple[str, str]]) -> Optional[Vertex]:
+        """Same as `KnowledgeGraph.get`."""
+
+    async def get_many(self, items: Iterable[Union[str, Tuple[str, str]]]) -> List[Optional[Vertex]]:
+        """Same as `KnowledgeGraph.get_many`: one call for a whole batch of lookups."""
+
+    async def contains(self, item: Union[str, Tuple[str, str]]) -> bool:
+        """Same as `item in kg`."""
+
+    async def get_vertex(self, vertex_id: Optional[str] = None, label: Optional[str] = None,
+                         schema: Optional[str] = None,
+                         graph_id: Optional[str] = None) -> Optional[Vertex]:
+        """Same as `KnowledgeGraph.get_vertex`."""
+
+    async def neighbors(self, vertex: Union[str, Vertex],
+                        predicate: Optional[Union[str, Iterable[str]]] = None,
+                        direction: str = 'out') -> List[Tuple[str, Vertex]]:
+        """Same as `KnowledgeGraph.neighbors`."""
+
+    async def neighbors_many(self, vertices: Iterable[Union[str, Vertex]],
+                             predicate: Optional[Union[str, Iterable[str]]] = None,
+                             direction: str = 'out') -> Dict[str, List[Tuple[str, Vertex]]]:
+        """Same as `KnowledgeGraph.neighbors_many`."""
+
+    async def find(self, schema: Optional[str] = None, graph_id: Optional[str] = None,
+                   limit: int = 0, **props: Any) -> List[Vertex]:
+        """Same as `KnowledgeGraph.find`."""
+
+    async def search(self, query: str, schema: Optional[str] = None,
+                     graph_id: Optional[str] = None, limit: int = 10) -> List[Vertex]:
+        """Same as `KnowledgeGraph.search`."""
+
+    async def paths(self, src: Union[str, Vertex], dst: Union[str, Vertex], max_hops: int = 3,
+                    predicates: Optional[Union[str, Iterable[str]]] = None,
+                    direction: str = 'out',
+                    limit: int = 100) -> List[List[Tuple[Vertex, str, Vertex]]]:
+        """Same as `KnowledgeGraph.paths`."""
+
+    async def shortest_path(self, src: Union[str, Vertex], dst: Union[str, Vertex],
+                            max_hops: int = 6,
+                            predicates: Optional[Union[str, Iterable[str]]] = None,
+                            direction: str = 'out') -> Optional[List[Tuple[Vertex, str, Vertex]]]:
+        """Same as `KnowledgeGraph.shortest_path`."""
+
+    async def snapshot(self, payloads: bool = False) -> GraphSnapshot:
+        """Same as `KnowledgeGraph.snapshot`."""
+
+    def iter_vertices(self, graph_id: Optional[str] = None,
+                      batch_size: int = 1000) -> AsyncIterator[Vertex]:
+        """Stream a graph's vertices.
+
+        A worker thread fetches `batch_size` rows at a time into a queue
+        holding at most two batches, so memory use doesn't grow with the
+        graph & a slow consumer holds back the worker. Stopping early
+        releases the worker.
+
+        Args:
+            graph_id (str): Defaults to None. The default graph is used if not given.
+            batch_size (int): Defaults to 1000. Rows fetched per round trip.
+
+        Returns:
+            AsyncIterator[Vertex] - Vertices of the graph.
+        """
+
+    def query(self, patterns: Iterable[Tuple[Any, str, Any]], graph_id: Optional[str] = None,
+              limit: int = 0, resolve: bool = True,
+              batch_size: int = 500) -> AsyncIterator[Dict[str, Any]]:
+        """Same as `KnowledgeGraph.query`, streamed like `iter_vertices`."""
+
+    async def add_vertex(self, label: str, schema: str, graph_id: Optional[str] = None) -> Vertex:
+        """Same as `KnowledgeGraph.add_vertex`."""
+
+    async def load(self, data: Union[List[Dict[str, Any]], Dict[str, Any]], graph_id: str,
+                   bulk: bool = False, chunk_size: int = 0) -> Optional[Dict[str, float]]:
+        """Same as `KnowledgeGraph.load`."""
+
+    async def load_file(self, path: str, graph_id: Optional[str] = None, bulk: bool = False,
+                        chunk_size: int = 0) -> Optional[Dict[str, float]]:
+        """Same as `KnowledgeGraph.load_file`."""
+
+    async def add_triple(self, triples: Iterable[Tuple[str, str, Any]], graph_id: Optional[str] = None,
+                         chunk_size: int = 0, compact: bool = True) -> Dict[str, float]:
+        """Same as `KnowledgeGraph.add_triple`."""
+
+    async def load_wikidata(self, path: str, graph_id: Optional[str] = None, processes: int = 0,
+                            chunk_size: int = 0, language: str = 'en') -> Dict[str, float]:
+        """Same as `KnowledgeGraph.load_wikidata`."""
+
+    async def enable_search(self, rebuild: bool = False) -> None:
+        """Same as `KnowledgeGraph.enable_search`."""
@@ -15,7 +15,7 @@
      Apache 2.0 License
      Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
 """
-from typing import Dict, Any, AnyStr, Optional
+from typing import Dict, Any, AnyStr, Iterable, Optional
 
 # Type aliases.
 URL = str
@@ -73,3 +73,41 @@ def get_properties(schema_type: str, baseURL: Optional[URL] = 'https://schema.or
         Union[Dict[str, Any], List[Dict[str, Any]]] - Returns a dict if with_base=False,
             otherwise it returns a list of dicts.
     """
+
+
+def get_properties_many(types: Iterable[str], baseURL: Optional[URL] = 'https://schema.org/',
+                        compact: Optional[bool] = False, max_workers: int = 8,
+                        cache_dir: Optional[str] = None,
+                        max_age: Optional[int] = None) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Get properties of many schema DataTypes, concurrently & cached.
+
+    Each of the `max_workers` threads keeps its connection alive across
+    requests. Responses are kept in an on-disk HTTP cache together with
+    their parsed properties:
+        - Fresh responses (see `max_age`) are used without a request.
+        - Stale ones are revalidated with `If-None-Match`/`If-Modified-Since`,
+          and a `304 Not Modified` reuses the parsed properties.
+    Repeated runs over every schema.org type download & parse only the
+    pages that changed.
+
+    Args:
+        types (Iterable[str]): Valid schema:DataTypes. Duplicates are crawled once.
+        baseURL (str, optional): Defaults to "https://schema.org/". Base URL to schema.
+        compact (bool, optional): Defaults to False. If set to True, only property names
+            will be returned.
+        max_workers (int, optional): Defaults to 8. Concurrent requests.
+        cache_dir (str, optional): Defaults to `FS.CACHE_DIR/schema-org`. HTTP cache directory.
+        max_age (int, optional): Defaults to None. Seconds a cached response is used
+            without revalidation. None uses the response's `Cache-Control: max-age`.
+
+    Examples:
+        ```python
+        >>> results = get_properties_many(['Book', 'Movie', 'Person'], compact=True)
+        >>> results['Book']['properties'][:2]
+        ['abridged', 'bookEdition']
+        ```
+
+    Returns:
+        Dict[str, Optional[Dict[str, Any]]]: Same result as `get_properties` for
+            each type, in order. None for types which couldn't be crawled (logged).
+    """
@@ -15,13 +15,20 @@
      Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
 """
 
+import os
+import json
+import time
+import hashlib
+import functools
+import threading
 import urllib.parse
-import urllib.error
-import urllib.request
 
-from bs4 import BeautifulSoup
+from config.consts import FS
 
-from sage.core.utils import Log
+from sage.core.utils import File, Log
+
+# `urllib.request`, `http.client` (ssl, email) & BeautifulSoup are imported
+# by the functions using them, so importing `sage.core` stays cheap.
 
 ################################################################################################
 # +--------------------------------------------------------------------------------------------+
@@ -45,6 +52,9 @@ cpdef str get_source(str url, dict query_dict=None):
                       ' AppleWebKit/537.36 (KHTML, like Gecko) Chrome/'
                       '50.0.2661.102 Safari/537.36'
     }
+    import urllib.error
+    import urllib.request
+
     try:
         if query_dict is not None:
             data = urllib.parse.urlencode(query_dict)
@@ -107,24 +117,241 @@ cpdef dict get_properties(str schema_type, str baseURL='https://schema.org/', bi
     if not source:
         Log.fatal('Could not retrieve source. Please check the URL & try again.')
 
-    soup = BeautifulSoup(source, 'lxml')
-    table = soup.find('table', class_='definition-table')
-    super_types = table.find_all('tbody', class_='supertype')
-
-    cdef list properties = _parse_property(super_types[0], compact)
-    cdef dict result = {
+    return {
         '@id': 'schema:{}'.format(schema_type),
         'name': schema_type,
-        'properties': properties
+        'properties': _parse_page(source, compact),
     }
 
-    return result
+
+def get_properties_many(types, str baseURL='https://schema.org/', bint compact=False,
+                        int max_workers=8, str cache_dir=None, max_age=None):
+    # One worker per connection, each kept alive across its requests.
+    # Responses are validated with ETag/Last-Modified against an on-disk
+    # cache which also holds the parsed properties, so a page that didn't
+    # change is neither downloaded nor parsed again.
+    import http.client
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = _HTTPCache(cache_dir or File.join(FS.CACHE_DIR, 'schema-org'), max_age=max_age)
+    cdef list names = list(dict.fromkeys(types))
+    cdef dict results = {}
+
+    def crawl(str schema_type):
+        url = urllib.parse.urljoin(baseURL, schema_type)
+        try:
+            properties = cache.properties(url, compact)
+        except (OSError, ValueError, IndexError, http.client.HTTPException) as e:
+            Log.error(f'Could not crawl {url}: {e}')
+            return schema_type, None
+        return schema_type, {
+            '@id': 'schema:{}'.format(schema_type),
+            'name': schema_type,
+            'properties': properties,
+        }
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for schema_type, result in executor.map(crawl, names):
+                results[schema_type] = result
+    finally:
+        cache.close()
+
+    Log.debug(f'Crawled {len(names):,} types: {cache.stats}')
+    return results
+
+
+################################################################################################
+# +--------------------------------------------------------------------------------------------+
+# | HTTP cache: keep-alive connections & conditional requests.
+# +--------------------------------------------------------------------------------------------+
+################################################################################################
+class _HTTPCache:
+    # Redirects followed before giving up.
+    MAX_REDIRECTS = 5
+
+    def __init__(self, str cache_dir, max_age=None, float timeout=30):
+        File.make_dirs(cache_dir)
+        self.cache_dir = cache_dir
+        # Seconds a response is used without revalidation. None: the
+        # response's own `Cache-Control: max-age`.
+        self.max_age = max_age
+        self.timeout = timeout
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+        # fresh: no request, revalidated: 304, fetched: 200, parsed: pages parsed.
+        self.stats = dict.fromkeys(('fresh', 'revalidated', 'fetched', 'parsed'), 0)
+
+    def _count(self, str key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _path(self, str url, str ext):
+        return File.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + ext)
+
+    def _read_meta(self, str url):
+        try:
+            with open(self._path(url, '.json'), encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return meta if meta.get('url') == url else None
+
+    def _write(self, str path, data):
+        # Written whole or not at all: other runs may be reading the cache.
+        tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        if isinstance(data, bytes):
+            with open(tmp, mode='wb') as f:
+                f.write(data)
+        else:
+            with open(tmp, mode='w', encoding='utf-8') as f:
+                json.dump(data, f)
+        os.replace(tmp, path)
+
+    def properties(self, str url, bint compact=False):
+        cdef str variant = 'compact' if compact else 'full'
+        meta = self._read_meta(url)
+        if meta is not None and self._fresh(meta):
+            self._count('fresh')
+        else:
+            meta = self._revalidate(url, meta)
+
+        if variant not in meta['parsed']:
+            with open(self._path(url, '.html'), mode='rb') as f:
+                source = f.read().decode(meta.get('charset') or 'utf-8')
+            meta['parsed'][variant] = _parse_page(source, compact)
+            self._count('parsed')
+            self._write(self._path(url, '.json'), meta)
+        return meta['parsed'][variant]
+
+    def _revalidate(self, str url, meta):
+        cdef dict headers = {}
+        if meta is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        status, response, body = self._get(url, headers)
+        if status == 304 and meta is not None:
+            self._count('revalidated')
+            # A 304 carries the validators & freshness to use from now on.
+            meta['etag'] = response.get('ETag') or meta.get('etag')
+            meta['last_modified'] = response.get('Last-Modified') or meta.get('last_modified')
+            meta['checked'], meta['expires'] = time.time(), self._expires(response)
+            self._write(self._path(url, '.json'), meta)
+            return meta
+        if status != 200:
+            raise ValueError(f'HTTP {status}')
+
+        self._count('fetched')
+        meta = {
+            'url': url,
+            'etag': response.get('ETag'),
+            'last_modified': response.get('Last-Modified'),
+            'charset': response.get_content_charset(),
+            'checked': time.time(),
+            'expires': self._expires(response),
+            'parsed': {},
+        }
+        if 'no-store' not in (response.get('Cache-Control') or ''):
+            self._write(self._path(url, '.html'), body)
+            self._write(self._path(url, '.json'), meta)
+        else:
+            # Parsed here, as it can't be read back from the cache.
+            source = body.decode(meta['charset'] or 'utf-8')
+            meta['parsed'] = {'full': _parse_page(source, False),
+                              'compact': _parse_page(source, True)}
+        return meta
+
+    def _fresh(self, dict meta):
+        if self.max_age is not None:
+            return meta.get('checked', 0) + self.max_age > time.time()
+        return meta.get('expires', 0) > time.time()
+
+    def _expires(self, response):
+        cdef str cache_control = response.get('Cache-Control') or ''
+        if 'no-cache' in cache_control or 'no-store' in cache_control:
+            return 0
+        for directive in cache_control.split(','):
+            name, _, value = directive.strip().partition('=')
+            if name.lower() == 'max-age' and value.isdigit():
+                return time.time() + int(value)
+        return 0
+
+    def _get(self, str url, dict headers):
+        # GET over this thread's keep-alive connection to the host.
+        cdef int redirect
+        for redirect in range(self.MAX_REDIRECTS + 1):
+            parts = urllib.parse.urlsplit(url)
+            path = urllib.parse.urlunsplit(('', '', parts.path or '/', parts.query, ''))
+            status, response, body = self._request(parts.scheme, parts.netloc, path, headers)
+            if status in (301, 302, 303, 307, 308) and response.get('Location'):
+                url = urllib.parse.urljoin(url, response['Location'])
+                continue
+            return status, response, body
+        raise ValueError('Too many redirects')
+
+    def _request(self, str scheme, str netloc, str path, dict headers):
+        import http.client
+
+        connections = self._local.__dict__.setdefault('connections', {})
+        cdef int attempt
+        for attempt in range(2):
+            conn = connections.get((scheme, netloc))
+            if conn is None:
+                Connection = (http.client.HTTPSConnection if scheme == 'https'
+                              else http.client.HTTPConnection)
+                conn = connections[scheme, netloc] = Connection(netloc, timeout=self.timeout)
+                with self._lock:
+                    self._connections.append(conn)
+            try:
+                conn.request('GET', path, headers=headers)
+                response = conn.getresponse()
+                return response.status, response.headers, response.read()
+            except (http.client.HTTPException, ConnectionError):
+                # The server closed an idle connection: reconnect once.
+                conn.close()
+                del connections[scheme, netloc]
+                if attempt:
+                    raise
+
+    def close(self):
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
 
 ################################################################################################
 # +--------------------------------------------------------------------------------------------+
 # | Private functions.
 # +--------------------------------------------------------------------------------------------+
 ################################################################################################
+def _parse_page(str source, bint compact=False):
+    # Only the definition table is parsed, not the whole page.
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    soup = BeautifulSoup(source, _parser(), parse_only=SoupStrainer('table', class_='definition-table'))
+    table = soup.find('table', class_='definition-table')
+    if table is None:
+        raise ValueError('No definition table found.')
+    super_types = table.find_all('tbody', class_='supertype')
+    return _parse_property(super_types[0], compact)
+
+
+@functools.lru_cache(maxsize=None)
+def _parser():
+    # lxml is much faster, Python's own parser is always there.
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return 'html.parser'
+    return 'lxml'
+
+
 cdef list _parse_property(body, bint compact=False):
     cdef:
         list properties = []
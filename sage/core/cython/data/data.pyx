@@ -16,12 +16,14 @@
 """
 
 from sage.core.cython.base import Base
+from sage.core.utils import Downloader
 
 cdef class Dataset(Base):
     """Dataset - Base class for dataset objects.
 
     Methods:
         def maybe_download_and_extract(self): ...
+        def iter_members(self, members=None): ...
         def get(self, index): ...
         def to_tfData(self): ... [May be a decorator]
         def load(): ... [Returns a tf.Data or NumPy array based on parameters]
@@ -41,3 +43,7 @@ cdef class Dataset(Base):
 
     cpdef void maybe_download_and_extract(self):
         pass
+
+    def iter_members(self, members=None):
+        """(name, file object) of the files in the dataset's archive, without extracting it."""
+        return Downloader.iter_archive(self.path, members=members)
@@ -0,0 +1,261 @@
+"""Asyncio facade over a Knowledge Graph.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: aio.pyx
+     Created on 18 October, 2026 @ 08:40 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+# Built-in libraries.
+import os
+import asyncio
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+# Custom libraries.
+from sage.core.graph import KnowledgeGraph
+
+__all__ = [
+    'AsyncKnowledgeGraph',
+]
+
+# End of a stream of batches.
+_DONE = object()
+
+
+cdef int _default_workers():
+    # Same default as `ThreadPoolExecutor`.
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class _Closed(Exception):
+    # Raised in a producer whose consumer has gone away.
+    pass
+
+
+class AsyncKnowledgeGraph:
+    """Awaitable `KnowledgeGraph` methods, run on a bounded thread pool.
+
+    Every call runs on one of `max_workers` threads, each with its own
+    session (see `KnowledgeGraph` thread safety), so the event loop never
+    blocks on SQLite & reads run concurrently. Workers keep their session
+    & vertex cache until `close`, only the transaction ends after every
+    call: returned vertices are detached, their columns are loaded but
+    relationships (e.g. `edges`) are not, use `neighbors` instead.
+    """
+
+    def __init__(self, kg, int max_workers=0):
+        self.kg = kg
+        self.max_workers = max_workers or _default_workers()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix=f'sage-{kg.label}')
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.kg.label})'
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __aiter__(self):
+        return self.iter_vertices()
+
+    @classmethod
+    async def open(cls, str name, str description=None, int max_workers=0, **kwargs):
+        # Opening may create the database & load data: keep it off the loop too.
+        max_workers = max_workers or _default_workers()
+        # A pooled connection per worker.
+        kwargs.setdefault('pool_size', max_workers)
+        loop = asyncio.get_event_loop()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            kg = await loop.run_in_executor(executor, functools.partial(
+                KnowledgeGraph, name, description, **kwargs))
+        return cls(kg, max_workers=max_workers)
+
+    @classmethod
+    async def fromfile(cls, str path, str description=None, int max_workers=0, **kwargs):
+        # Same defaults as `open`.
+        max_workers = max_workers or _default_workers()
+        kwargs.setdefault('pool_size', max_workers)
+        loop = asyncio.get_event_loop()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            kg = await loop.run_in_executor(executor, functools.partial(
+                KnowledgeGraph.fromfile, path, description, **kwargs))
+        return cls(kg, max_workers=max_workers)
+
+    async def close(self):
+        # Wait for running calls, without blocking the loop.
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, functools.partial(self._executor.shutdown, wait=True))
+        # Workers' sessions & caches go with their threads, their (returned)
+        # connections with the engine.
+        self.kg.close()
+
+    ####################################################################################
+    # Reads.
+    ####################################################################################
+
+    async def get(self, item):
+        return await self._run(self.kg.get, item)
+
+    async def get_many(self, items):
+        return await self._run(self.kg.get_many, list(items))
+
+    async def contains(self, item):
+        return await self._run(self.kg.__contains__, item)
+
+    async def get_vertex(self, str vertex_id=None, str label=None,
+                         str schema=None, str graph_id=None):
+        return await self._run(self.kg.get_vertex, vertex_id=vertex_id, label=label,
+                               schema=schema, graph_id=graph_id)
+
+    async def neighbors(self, vertex, predicate=None, str direction='out'):
+        return await self._run(self.kg.neighbors, vertex, predicate=predicate,
+                               direction=direction)
+
+    async def neighbors_many(self, vertices, predicate=None, str direction='out'):
+        return await self._run(self.kg.neighbors_many, list(vertices),
+                               predicate=predicate, direction=direction)
+
+    async def find(self, str schema=None, str graph_id=None, int limit=0, **props):
+        return await self._run(self.kg.find, schema=schema, graph_id=graph_id,
+                               limit=limit, **props)
+
+    async def search(self, str query, str schema=None, str graph_id=None, int limit=10):
+        return await self._run(self.kg.search, query, schema=schema,
+                               graph_id=graph_id, limit=limit)
+
+    async def paths(self, src, dst, int max_hops=3, predicates=None,
+                    str direction='out', int limit=100):
+        return await self._run(self.kg.paths, src, dst, max_hops=max_hops,
+                               predicates=predicates, direction=direction, limit=limit)
+
+    async def shortest_path(self, src, dst, int max_hops=6, predicates=None,
+                            str direction='out'):
+        return await self._run(self.kg.shortest_path, src, dst, max_hops=max_hops,
+                               predicates=predicates, direction=direction)
+
+    async def snapshot(self, bint payloads=False):
+        return await self._run(self.kg.snapshot, payloads=payloads)
+
+    @property
+    def vertices(self):
+        # Awaitable, like the other reads: `await akg.vertices`.
+        return self._run(lambda: self.kg.vertices)
+
+    async def iter_vertices(self, str graph_id=None, int batch_size=1000):
+        rows = functools.partial(self.kg.iter_vertices, graph_id=graph_id,
+                                 batch_size=batch_size)
+        async for batch in self._stream(rows, batch_size):
+            for vertex in batch:
+                yield vertex
+
+    async def query(self, patterns, str graph_id=None, int limit=0, bint resolve=True,
+                    int batch_size=500):
+        matches = functools.partial(self.kg.query, list(patterns), graph_id=graph_id,
+                                    limit=limit, resolve=resolve, batch_size=batch_size)
+        async for batch in self._stream(matches, batch_size):
+            for match in batch:
+                yield match
+
+    ####################################################################################
+    # Writes: still one at a time, see `KnowledgeGraph`.
+    ####################################################################################
+
+    async def add_vertex(self, str label, str schema, str graph_id=None):
+        return await self._run(self.kg.add_vertex, label, schema, graph_id)
+
+    async def load(self, data, str graph_id, bint bulk=False, int chunk_size=0):
+        return await self._run(self.kg.load, data, graph_id, bulk=bulk, chunk_size=chunk_size)
+
+    async def load_file(self, str path, str graph_id=None, bint bulk=False, int chunk_size=0):
+        return await self._run(self.kg.load_file, path, graph_id, bulk=bulk,
+                               chunk_size=chunk_size)
+
+    async def add_triple(self, triples, str graph_id=None, int chunk_size=0, bint compact=True):
+        return await self._run(self.kg.add_triple, triples, graph_id,
+                               chunk_size=chunk_size, compact=compact)
+
+    async def load_wikidata(self, str path, str graph_id=None, int processes=0,
+                            int chunk_size=0, str language='en'):
+        return await self._run(self.kg.load_wikidata, path, graph_id, processes=processes,
+                               chunk_size=chunk_size, language=language)
+
+    async def enable_search(self, bint rebuild=False):
+        return await self._run(self.kg.enable_search, rebuild=rebuild)
+
+    ####################################################################################
+    # Executor.
+    ####################################################################################
+
+    def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_event_loop()
+        return loop.run_in_executor(self._executor, functools.partial(
+            self._call, func, args, kwargs))
+
+    def _call(self, func, tuple args, dict kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            # Next call sees newer writes, & may hit the worker's cache.
+            self.kg._end_transaction()
+
+    async def _stream(self, func, int batch_size):
+        # A worker drains the iterable returned by `func()` in batches into a bounded
+        # queue, so at most two batches are held while the consumer catches up.
+        loop = asyncio.get_event_loop()
+        queue = asyncio.Queue(maxsize=2)
+        closed = threading.Event()
+        batch_size = max(batch_size, 1)
+
+        def put(item):
+            if closed.is_set():
+                raise _Closed()
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        def produce():
+            batch = []
+            try:
+                for item in func():
+                    batch.append(item)
+                    if len(batch) >= batch_size:
+                        put(batch)
+                        batch = []
+                if batch:
+                    put(batch)
+                put(_DONE)
+            except _Closed:
+                pass
+            except BaseException as e:
+                try:
+                    put(e)
+                except _Closed:
+                    pass
+
+        producer = self._run(produce)
+        try:
+            while True:
+                item = await queue.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # Consumer stopped early: unblock the producer & wait for it to
+            # end its transaction.
+            closed.set()
+            while not queue.empty():
+                queue.get_nowait()
+            await producer
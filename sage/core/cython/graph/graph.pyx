@@ -14,45 +14,68 @@
      Apache 2.0 License
      Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
 """
+import re
+import time
+import sqlite3
+import gzip
+import itertools
 import json
+import secrets
+import threading
 from abc import abstractmethod
+from collections.abc import Iterator
 
-# from queue import Queue
-# from threading import Thread
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import (String, and_, bindparam, create_engine, event, inspect, or_, select,
+                        text, tuple_, type_coerce)
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.dialects.sqlite import insert
 
-from config.consts import FS
+from config.consts import FS, SETUP
 
 from sage.core.base import Base
-from sage.core.schema import Graph, Vertex, BaseSchema
-from sage.core.utils import File, Log
+from sage.core.loader import BulkLoader
+from sage.core.lru import LRUCache, MISSING
+from sage.core.query import Pattern
+from sage.core.reader import iter_jsonld, iter_ntriples, iter_rdfxml
+from sage.core.wikidata import iter_entities
+from sage.core.schema import Connection, Edge, Graph, Property, Vertex, BaseSchema
+from sage.core.schema import reset_neighbor_index
+from sage.core.schema import PROPERTY_BACKFILL, PROPERTY_TRIGGERS
+from sage.core.schema import SEARCH_BACKFILL, SEARCH_TABLE, SEARCH_TRIGGERS
+from sage.core.utils import Downloader, File, Log, _member_filter
+
+# `sage.core.snapshot` (NumPy) & `concurrent.futures` (multiprocessing) are
+# imported where they're used: most workers never touch them.
 
 __all__ = [
     'KnowledgeGraph',
     'MultiKnowledgeGraph',
 ]
 
+# Engine settings of a SQLite profile, in the order they're applied:
+# `page_size` must come before WAL is enabled on a new database.
+PRAGMAS = ('page_size', 'journal_mode', 'synchronous', 'cache_size',
+           'mmap_size', 'temp_store')
+_PRAGMA_VALUE = re.compile(r'-?\w+')
 
-# class Worker(Thread):
-#     def __init__(self, inst, queue):
-#         super(Worker, self).__init__()
-#         self.inst = inst
-#         self.queue = queue
-#
-#     def run(self):
-#         while True:
-#             name, data_file = self.queue.get()
-#             try:
-#                 self.inst.add_graph(name, data_file)
-#             finally:
-#                 self.queue.task_done()
+# Words of a search query, optionally followed by "*" for prefix matches.
+_SEARCH_TOKEN = re.compile(r'(\w+)(\*?)')
+
+# Name of the trigger a `CREATE TRIGGER` statement creates.
+_TRIGGER_NAME = re.compile(r'CREATE TRIGGER IF NOT EXISTS (\w+)')
+
+# `KnowledgeGraph` arguments which only matter while a graph is being built.
+_LOAD_ONLY = frozenset({'overwrite', 'data', 'data_file', 'bulk', 'chunk_size'})
 
 
 class BaseKG(Base):
     # Supported file formats.
-    SUPPORTED_FORMATS = ('json', 'jsonld', 'json-ld',
+    SUPPORTED_FORMATS = ('json', 'jsonld', 'json-ld', 'jsonl',
                          'rdf', 'xml', 'nt')
+    # Formats read as (subject, predicate, object) triples.
+    TRIPLE_FORMATS = ('rdf', 'xml', 'nt')
+    # Archives whose members are streamed by `load_archive`.
+    ARCHIVE_FORMATS = ('zip', 'tar', 'tgz', 'bz2', 'xz')
 
     def __init__(self, str name, str description=None,
                  str base_dir=None, data=None, str data_file=None,
@@ -60,11 +83,17 @@ class BaseKG(Base):
         self.label = name
         self.description = description
         # Base path where graph data is stored.
-        self.base_dir = FS.DATABASE_DIR
-        File.make_dirs(self.base_dir)
-
-        overwrite = kwargs.get('overwrite', False)
-        self._sess = self._initialize_session(overwrite=overwrite)
+        self.base_dir = base_dir or FS.DATABASE_DIR
+        # Readers may run concurrently, writers one at a time.
+        self._write_lock = threading.RLock()
+
+        # Compiled schema.org vocabulary (`sage.core.vocab`), or its path,
+        # used to pick the most specific of several `@type`s.
+        vocabulary = kwargs.get('vocabulary')
+        if isinstance(vocabulary, str):
+            from sage.core.vocab import Vocabulary
+            vocabulary = Vocabulary.load(vocabulary)
+        self.vocabulary = vocabulary
 
     def __repr__(self):
         return f'{self.name}({self.label})'
@@ -76,96 +105,170 @@ class BaseKG(Base):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self._sess.close()
+        self.close()
 
     def __contains__(self, item):
         v = self.get(item)
         return v is not None
 
+    @classmethod
+    def fromfile(cls, str path, str description=None, **kwargs):
+        # Create a new Knowledge Graph instance.
+        cdef str name = File.filename(path[:-len('.gz')] if path.endswith('.gz') else path)
+        inst = cls(name=name,
+                   description=description,
+                   data_file=path, **kwargs)
+
+        # Return Knowledge Graph object.
+        return inst
+
+    ####################################################################################
+    # Storage backend: implemented by `KnowledgeGraph` (SQLite)
+    # & `MemoryKnowledgeGraph` (`sage.core.memory`).
+    ####################################################################################
+
     @abstractmethod
     def get(self, item):
         return NotImplemented
 
-    @staticmethod
-    def read(str path):
-        # Check if file exists.
-        if not File.is_file(path):
-            raise FileNotFoundError(f'{path} was not found.')
+    @abstractmethod
+    def get_vertex(self, str vertex_id=None, str label=None,
+                   str schema=None, str graph_id=None):
+        return NotImplemented
 
-        # Get the file extension.
-        cdef str ext = File.ext(path)
+    @abstractmethod
+    def add_vertex(self, str label, str schema, str graph_id):
+        return NotImplemented
 
-        # Supported file formats.
-        if ext not in BaseKG.SUPPORTED_FORMATS:
-            raise AssertionError(f'Expected one of: {BaseKG.SUPPORTED_FORMATS}.'
-                                 f' Got {ext}')
+    @abstractmethod
+    def add_triple(self, triples, str graph_id=None, int chunk_size=0, bint compact=True):
+        return NotImplemented
 
-        if ext in ('json', 'jsonld', 'json-ld'):
-            # Load JSON-LD file.
-            with open(path, mode='r', encoding='utf-8') as f:
-                return json.loads(f.read())
-        else:
-            # TODO(victor-iyiola): Support for RDF/XML & n-triples.
-            Log.warn('RDF/XML & n-triple not yet supported.')
-            return NotImplemented
+    @abstractmethod
+    def close(self):
+        return NotImplemented
 
-    def add_vertex(self, str label, str schema, str graph_id):
-        vertex = self.get_vertex(label=label, schema=schema, graph_id=graph_id)
-        if vertex is not None:
-            return vertex
+    @abstractmethod
+    def snapshot(self, bint payloads=False):
+        return NotImplemented
 
-        # Create a new vertex.
-        vertex = Vertex(label=label, schema=schema, graph_id=graph_id)
-        self._sess.add(vertex)
-        self._sess.commit()
-        return vertex
+    def release_session(self):
+        # Nothing is held per thread unless the backend says otherwise.
+        pass
 
-    def close(self):
-        self._sess.close()
+    def _load_bulk(self, data, str graph_id, int chunk_size=0):
+        # Backends without a faster bulk path load item by item.
+        return self._load(data, graph_id)
 
-    def get_graph_by_name(self, str graph_name):
-        """Retrieve graph object by graph's name.
+    def _commit(self):
+        pass
 
-        Args:
-            graph_name (str): Name of graph to lookup.
+    def _end_transaction(self):
+        # See `KnowledgeGraph._end_transaction`.
+        pass
 
-        Returns:
-            Union[Graph, None] - Graph instance if graph name
-                is found in the db.
-        """
-        return self._sess.query(Graph).filter_by(name=graph_name).first()
+    def save_snapshot(self, str path):
+        snap = self.snapshot(payloads=True)
+        snap.save(path)
+        return snap
 
-    def get_vertex(self, str vertex_id=None, str label=None,
-                   str schema=None, str graph_id=None):
-        result = None
+    @staticmethod
+    def load_snapshot(str path, bint verify=False):
+        # Memory-mapped & read-only, no database session involved.
+        from sage.core.snapshot import GraphSnapshot
+        return GraphSnapshot.load(path, verify=verify)
 
-        if vertex_id is not None:
-            result = self._sess.query(Vertex).filter_by(id=vertex_id).first()
-        elif label is not None and schema is not None:
-            if graph_id is not None:
-                # Get vertex from a specific graph.
-                result = self._sess.query(Vertex) \
-                    .filter_by(label=label, schema=schema,
-                               graph_id=graph_id) \
-                    .first()
-            else:
-                # Get vertex from default graph.
-                result = self._sess.query(Vertex) \
-                    .filter_by(label=label, schema=schema,
-                               graph_id=self._default_graph.id) \
-                    .first()
+    @staticmethod
+    def get_format(str path):
+        # Format of (optionally gzipped) files, e.g. "nt" for "dump.nt.gz".
+        cdef str ext = File.ext(path)
+        if ext == 'gz':
+            ext = File.ext(path[:-len('.gz')])
+        return ext.lower()
+
+    @staticmethod
+    def read(str path):
+        # Check if file exists & is supported.
+        cdef str ext = BaseKG._check_file(path)
+
+        if ext in ('json', 'jsonld', 'json-ld'):
+            # Load JSON-LD file.
+            opener = gzip.open if path.endswith('.gz') else open
+            with opener(path, mode='rt', encoding='utf-8') as f:
+                return json.loads(f.read())
+        elif ext == 'jsonl':
+            return list(iter_jsonld(path))
+        elif ext == 'nt':
+            return list(iter_ntriples(path))
         else:
-            raise ValueError('Expected one of `id` or `label` & `schema`.')
+            # RDF/XML.
+            return list(iter_rdfxml(path))
 
-        return result
+    @staticmethod
+    def stream(str path, int chunk_size=65536):
+        # Check if file exists & is supported.
+        cdef str ext = BaseKG._check_file(path)
+        return BaseKG._stream(path, ext, chunk_size=chunk_size)
 
-    def get_vertex_by_label(self, str label):
-        return self._sess.query(Vertex).filter_by(label=label).all()
+    @staticmethod
+    def _stream(source, str ext, int chunk_size=65536):
+        # `source` is a path or a binary file object, e.g. an archive member.
+        if ext in ('json', 'jsonld', 'json-ld', 'jsonl'):
+            # Read JSON-LD items incrementally.
+            return iter_jsonld(source, chunk_size=chunk_size)
+        elif ext == 'nt':
+            # Read N-Triples line by line.
+            return iter_ntriples(source)
+        else:
+            # Walk RDF/XML elements incrementally.
+            return iter_rdfxml(source)
+
+    def load_file(self, str path, str graph_id=None, bint bulk=False, int chunk_size=0):
+        if graph_id is None:
+            graph_id = self._graph_id
+
+        if BaseKG.get_format(path) in BaseKG.ARCHIVE_FORMATS:
+            return self.load_archive(path, graph_id=graph_id, bulk=bulk, chunk_size=chunk_size)
+
+        data = BaseKG.stream(path)
+        if BaseKG.get_format(path) in BaseKG.TRIPLE_FORMATS:
+            return self.add_triple(data, graph_id, chunk_size=chunk_size)
+        return self.load(data, graph_id, bulk=bulk, chunk_size=chunk_size)
+
+    def load_archive(self, str path, members=None, str graph_id=None,
+                     bint bulk=False, int chunk_size=0):
+        # Members are streamed into the graph, the archive is never extracted.
+        if graph_id is None:
+            graph_id = self._graph_id
+
+        match = _member_filter(members)
+        cdef list loaded = []
+        cdef str name
+        for name, f in Downloader.iter_archive(
+                path, members=lambda member: (BaseKG.get_format(member) in BaseKG.SUPPORTED_FORMATS
+                                              and match(member))):
+            data = BaseKG._stream(f, BaseKG.get_format(name))
+            if BaseKG.get_format(name) in BaseKG.TRIPLE_FORMATS:
+                self.add_triple(data, graph_id, chunk_size=chunk_size)
+            else:
+                self.load(data, graph_id, bulk=bulk, chunk_size=chunk_size)
+            loaded.append(name)
 
-    def load(self, data, str graph_id):
+        Log.info(f'Loaded {len(loaded):,} member(s) of {path}.')
+        return loaded
+
+    def load(self, data, str graph_id, bint bulk=False, int chunk_size=0):
+        # Held for the whole (recursive) load, so it commits as one writer.
+        with self._write_lock:
+            return self._load(data, graph_id, bulk=bulk, chunk_size=chunk_size)
+
+    def _load(self, data, str graph_id, bint bulk=False, int chunk_size=0):
         # Declare schemas & labels.
         cdef str schema, label, nbr_schema, nbr_label
 
+        if bulk:
+            return self._load_bulk(data, graph_id, chunk_size=chunk_size)
+
         # First verify that `graph_id` exists.
         if isinstance(data, dict):
             # FIXME: Pass a *pointer* to `data` and not the `data` itself.
@@ -183,7 +286,7 @@ class BaseKG(Base):
                 # A new list of scopes.
                 elif isinstance(v, (list, tuple)):
                     for item in v:  # Loop through the list.
-                        self.load(item, graph_id)
+                        self._load(item, graph_id)
 
                 elif isinstance(v, dict):
                     # Direct neighboring scope.
@@ -192,14 +295,29 @@ class BaseKG(Base):
                     nbr = self.add_vertex(nbr_label, nbr_schema, graph_id)
                     vertex.add_neighbor(nbr, predicate=k)
                     # Visit direct neighboring scope.
-                    self.load(v, graph_id)
+                    self._load(v, graph_id)
 
-        elif isinstance(data, (list, tuple)):
+        elif isinstance(data, (list, tuple, Iterator)):
             for item in data:
-                self.load(item, graph_id)
+                self._load(item, graph_id)
 
         # Commit all changes.
-        self._sess.commit()
+        self._commit()
+
+    @staticmethod
+    def _check_file(str path):
+        # Check if file exists.
+        if not File.is_file(path):
+            raise FileNotFoundError(f'{path} was not found.')
+
+        # Get the file extension.
+        cdef str ext = BaseKG.get_format(path)
+
+        # Supported file formats.
+        if ext not in BaseKG.SUPPORTED_FORMATS:
+            raise AssertionError(f'Expected one of: {BaseKG.SUPPORTED_FORMATS}.'
+                                 f' Got {ext}')
+        return ext
 
     def _get_label(self, dict data, schema='Thing', marker='name'):
         # TODO: Search for best marker for given schema (with fallback strategy).
@@ -210,34 +328,11 @@ class BaseKG(Base):
         # If a list or tuple is returned. Pick the best schema.
         result = data.get(marker, default)
         if isinstance(result, (list, tuple)):
-            # TODO: Pick the best (most specific schema) `result`.
+            if self.vocabulary is not None:
+                return self.vocabulary.most_specific(result, default=default)
             return result[0]
         return result
 
-    def _initialize_session(self, bint overwrite=False):
-        import os
-        # Save current dir to switch back later.
-        cdef str cur_dir = os.path.abspath(os.curdir)
-
-        # Switch directory to base dir.
-        os.chdir(self.base_dir)
-        cdef str filename = f'{self.label}.db'
-
-        if File.is_file(filename) and overwrite:
-            File.remove(filename)
-
-        # Create DB engine & session.
-        engine = create_engine(f'sqlite:///{filename}')
-        if not File.is_file(filename):
-            BaseSchema.metadata.create_all(engine)
-        Session = sessionmaker(bind=engine)
-        sess = Session()
-
-        # Switch back to cur dir.
-        os.chdir(cur_dir)
-
-        return sess
-
 
 class KnowledgeGraph(BaseKG):
 
@@ -247,34 +342,297 @@ class KnowledgeGraph(BaseKG):
         super(KnowledgeGraph, self).__init__(name, description,
                                              base_dir=base_dir, data=data,
                                              data_file=data_file, **kwargs)
+        File.make_dirs(self.base_dir)
 
-        # Add the default graph to the db.
-        self._default_graph = self.get_graph_by_name(name)
-        if self._default_graph is None:
-            self._default_graph = Graph(name=name, description=description)
-            self._sess.add(self._default_graph)
-            self._sess.commit()
+        # One session per thread (see `_initialize_session`), but a single
+        # writer at a time: SQLite only ever allows one.
+        self._sess = self._initialize_session(overwrite=kwargs.get('overwrite', False),
+                                              profile=kwargs.get('profile'),
+                                              pragmas=kwargs.get('pragmas'),
+                                              pool_size=kwargs.get('pool_size', 5))
+
+        # Opt-in vertex cache, one per thread since cached vertices belong to
+        # that thread's session. Any session committing or rolling back bumps
+        # the generation, which empties every cache on its next lookup.
+        self._cache_size = kwargs.get('cache_size', 0)
+        self._local = threading.local()
+        self._generations = itertools.count(1)
+        self._generation = 0
+        if self._cache_size > 0:
+            event.listen(self._sess, 'after_commit', self._invalidate)
+            event.listen(self._sess, 'after_rollback', self._invalidate)
+
+        # Full-text index is opt-in, but kept up to date once it exists.
+        self._full_text = inspect(self._sess.get_bind()).has_table('vertex_fts')
+        if kwargs.get('full_text', False) and not self._full_text:
+            self.enable_search()
+
+        # Add the default graph to the db. Only its id is kept: the `Graph`
+        # object itself belongs to the session of the thread that loaded it.
+        graph = self.get_graph_by_name(name)
+        if graph is None:
+            graph = Graph(name=name, description=description)
+            with self._write_lock:
+                self._sess.add(graph)
+                self._sess.commit()
+        self._graph_id = graph.id
+
+        # Load Knowledge Graph with knowledge data.
+        if data is not None:
+            self.load(data, self._graph_id,
+                      bulk=kwargs.get('bulk', False),
+                      chunk_size=kwargs.get('chunk_size', 0))
 
         # Read knowledge data from file.
         if data_file is not None:
             # assert data is None, 'Provide `data` or `data_file` but not both.'
-            data = KnowledgeGraph.read(data_file)
+            self.load_file(data_file, self._graph_id,
+                           bulk=kwargs.get('bulk', False),
+                           chunk_size=kwargs.get('chunk_size', 0))
+
+    def add_triple(self, triples, str graph_id=None, int chunk_size=0, bint compact=True):
+        if graph_id is None:
+            graph_id = self._graph_id
+
+        # Triples are always written through the bulk loader.
+        with self._write_lock, BulkLoader(self, graph_id, chunk_size=chunk_size) as loader:
+            loader.add_triples(triples, compact=compact)
+        return loader.stats
+
+    def load_wikidata(self, str path, str graph_id=None, int processes=0,
+                      int chunk_size=0, str language='en'):
+        if graph_id is None:
+            graph_id = self._graph_id
+
+        # Parsing is spread across processes, writes stay in this one.
+        entities = iter_entities(path, processes=processes, language=language)
+        with self._write_lock, BulkLoader(self, graph_id, chunk_size=chunk_size) as loader:
+            loader.add_entities(entities)
+        return loader.stats
 
-        # Load Knowledge Graph with knowledge data.
-        if data is not None:
-            self.load(data, self._default_graph.id)
+    def add_vertex(self, str label, str schema, str graph_id):
+        if graph_id is None:
+            graph_id = self._graph_id
 
-    @classmethod
-    def fromfile(cls, str path, str description=None, **kwargs):
-        # Create a new KnowledgeGraph instance.
-        inst = cls(name=File.filename(path),
-                   description=description,
-                   data_file=path, **kwargs)
+        vertex = self.get_vertex(label=label, schema=schema, graph_id=graph_id)
+        if vertex is not None:
+            return vertex
 
-        # Return KnowledgeGraph object.
-        return inst
+        # Create a new vertex, unless a concurrent writer already did.
+        with self._write_lock:
+            self._sess.execute(
+                insert(Vertex.__table__)
+                    .values(id=secrets.token_hex(8), label=label, schema=schema,
+                            graph_id=graph_id, payload={})
+                    .on_conflict_do_nothing(index_elements=['graph_id', 'label', 'schema'])
+            )
+            self._sess.commit()
+        return self.get_vertex(label=label, schema=schema, graph_id=graph_id)
+
+    def release_session(self):
+        # Ends the calling thread's session & returns its connection to the pool.
+        self._sess.remove()
+        # Cached vertices belonged to that session, they'd now be detached.
+        cache = getattr(self._local, 'cache', None)
+        if cache is not None:
+            cache.clear()
+
+    def _end_transaction(self):
+        # Returns the calling thread's connection, so its next call sees writes
+        # committed since, but keeps its session & vertex cache. Objects are
+        # detached (columns stay loaded) & closing doesn't count as a rollback,
+        # so the cache survives.
+        self._sess.close()
+
+    def close(self):
+        engine = self._sess.get_bind()
+        self._sess.remove()
+        # Release pooled connections, so the file can be re-opened with another profile.
+        engine.dispose()
+
+    def get_graph_by_name(self, str graph_name):
+        """Retrieve graph object by graph's name.
+
+        Args:
+            graph_name (str): Name of graph to lookup.
+
+        Returns:
+            Union[Graph, None] - Graph instance if graph name
+                is found in the db.
+        """
+        return self._sess.query(Graph).filter_by(name=graph_name).first()
+
+    def get_vertex(self, str vertex_id=None, str label=None,
+                   str schema=None, str graph_id=None):
+        result = None
+
+        if vertex_id is not None:
+            result = self._sess.query(Vertex).filter_by(id=vertex_id).first()
+        elif label is not None and schema is not None:
+            if graph_id is not None:
+                # Get vertex from a specific graph.
+                result = self._sess.query(Vertex) \
+                    .filter_by(label=label, schema=schema,
+                               graph_id=graph_id) \
+                    .first()
+            else:
+                # Get vertex from default graph.
+                result = self._sess.query(Vertex) \
+                    .filter_by(label=label, schema=schema,
+                               graph_id=self._graph_id) \
+                    .first()
+        else:
+            raise ValueError('Expected one of `id` or `label` & `schema`.')
+
+        return result
+
+    def get_vertex_by_label(self, str label):
+        return self._sess.query(Vertex).filter_by(label=label).all()
+
+    def _load_bulk(self, data, str graph_id, int chunk_size=0):
+        # Buffered inserts with an in-memory get-or-create map.
+        with BulkLoader(self, graph_id, chunk_size=chunk_size) as loader:
+            loader.load(data)
+        return loader.stats
+
+    def _commit(self):
+        self._sess.commit()
+
+    def _migrate(self, engine):
+        # Bring databases created by older versions up to date.
+        cdef bint has_properties = inspect(engine).has_table('property')
+        cdef set indexes = {index['name'] for table in ('vertex', 'edge')
+                            for index in inspect(engine).get_indexes(table)}
+        BaseSchema.metadata.create_all(engine)
+
+        with engine.begin() as conn:
+            if not has_properties:
+                # Index payloads stored before the property table existed.
+                conn.execute(text(PROPERTY_BACKFILL))
+
+            # Triggers of older versions didn't index lists of values.
+            triggers = PROPERTY_TRIGGERS
+            if inspect(conn).has_table('vertex_fts'):
+                triggers += SEARCH_TRIGGERS
+            for trigger in triggers:
+                conn.execute(text(f'DROP TRIGGER IF EXISTS {_TRIGGER_NAME.search(trigger)[1]}'))
+                conn.execute(text(trigger))
+
+            columns = {column['name'] for column in inspect(conn).get_columns('edge')}
+            if 'source_id' not in columns:
+                # Edge sources used to only be stored in `connection`.
+                conn.execute(text('ALTER TABLE edge ADD COLUMN source_id VARCHAR(8) '
+                                  'REFERENCES vertex (id)'))
+                conn.execute(text('UPDATE edge SET source_id = (SELECT vertex_id FROM connection '
+                                  'WHERE connection.edge_id = edge.id)'))
+
+            # The unique indexes can't be created over duplicates, and
+            # `add_vertex` upserts can't work without them: merge them first.
+            merged = 0
+            if 'ix_vertex_graph_label_schema' not in indexes:
+                merged = _merge_duplicate_vertices(conn)
+            if merged or 'ix_edge_source_target_predicate' not in indexes:
+                _merge_duplicate_edges(conn)
+
+        for table in BaseSchema.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=engine, checkfirst=True)
+
+    def _initialize_session(self, bint overwrite=False, str profile=None, dict pragmas=None,
+                            int pool_size=5):
+        # Absolute path, rather than switching directories, so graphs
+        # can be opened concurrently from several threads.
+        cdef str filename = File.join(self.base_dir, f'{self.label}.db')
+
+        if overwrite:
+            # Along with any write-ahead log left behind.
+            for path in (filename, f'{filename}-wal', f'{filename}-shm'):
+                if File.is_file(path):
+                    File.remove(path)
+
+        # Create DB engine & session.
+        # Threads borrow pooled connections instead of waiting for one
+        # another: overflow connections are opened on demand.
+        engine = create_engine(f'sqlite:///{filename}',
+                               pool_size=pool_size, max_overflow=-1)
+        self.pragmas = sqlite_pragmas(profile, pragmas)
+        if self.pragmas:
+            event.listen(engine, 'connect', self._set_pragmas)
+        if not File.is_file(filename):
+            BaseSchema.metadata.create_all(engine)
+        else:
+            self._migrate(engine)
+        # Every thread gets (& keeps, until `release_session`) its own session.
+        factory = sessionmaker(bind=engine)
+        # Only this graph's sessions, not every `Session` of the process.
+        event.listen(factory, 'after_rollback', reset_neighbor_index)
+        return scoped_session(factory)
+
+    def _set_pragmas(self, dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in self.pragmas.items():
+            try:
+                cursor.execute(f'PRAGMA {name} = {value}')
+            except sqlite3.OperationalError as e:
+                # e.g. leaving WAL while another connection has the database open.
+                Log.warn(f'Could not set PRAGMA {name} = {value}: {e}')
+        cursor.close()
+
+    @property
+    def _default_graph(self):
+        return self._sess.get(Graph, self._graph_id)
 
     def get(self, item):
+        cache = self._thread_cache()
+        if cache is None:
+            return self._get(item)
+
+        result = cache.get(item)
+        if result is MISSING:
+            result = self._get(item)
+            # Misses are cached too, so `item in kg` followed by `kg[item]` is one query.
+            cache.put(item, result)
+            if result is not None:
+                # Same vertex under its other key.
+                cache.put(result.id if isinstance(item, tuple)
+                          else (result.label, result.schema), result)
+        return result
+
+    def get_many(self, items):
+        # Same as `[self.get(item) for item in items]`, in a query per 400 misses.
+        cdef list keys = list(items), ids = [], pairs = []
+        cdef dict found = {}
+        cdef Py_ssize_t i
+        cache = self._thread_cache()
+
+        for item in dict.fromkeys(keys):
+            result = cache.get(item) if cache is not None else MISSING
+            if result is not MISSING:
+                found[item] = result
+            elif isinstance(item, str):
+                ids.append(item)
+            elif isinstance(item, tuple):
+                assert len(item) == 2, 'Only label & schema expected.'
+                pairs.append(item)
+            else:
+                raise TypeError(f'Expected one of str or Tuple[str, str],'
+                                f'got {type(item)}')
+
+        for i in range(0, len(ids), 400):
+            for vertex in self._sess.query(Vertex).filter(Vertex.id.in_(ids[i:i + 400])):
+                found[vertex.id] = vertex
+        for i in range(0, len(pairs), 400):
+            for vertex in self._sess.query(Vertex) \
+                    .filter(Vertex.graph_id == self._graph_id,
+                            tuple_(Vertex.label, Vertex.schema).in_(pairs[i:i + 400])):
+                found[vertex.label, vertex.schema] = vertex
+
+        if cache is not None:
+            for item in ids + pairs:
+                cache.put(item, found.get(item))
+        return [found.get(item) for item in keys]
+
+    def _get(self, item):
         result = None
         if isinstance(item, str):
             result = self.get_vertex(vertex_id=item)
@@ -287,10 +645,364 @@ class KnowledgeGraph(BaseKG):
 
         return result
 
+    def cache_info(self):
+        cache = self._thread_cache()
+        return cache.info() if cache is not None else None
+
+    def cache_clear(self):
+        # Every thread's cache, not just the caller's.
+        self._generation = next(self._generations)
+
+    def _invalidate(self, session):
+        self._generation = next(self._generations)
+
+    def _thread_cache(self):
+        # The calling thread's cache, emptied if anything was written since its last use.
+        if self._cache_size <= 0:
+            return None
+        cache = getattr(self._local, 'cache', None)
+        if cache is None:
+            cache = self._local.cache = LRUCache(self._cache_size)
+            self._local.generation = self._generation
+        elif self._local.generation != self._generation:
+            cache.clear()
+            self._local.generation = self._generation
+        return cache
+
+    def neighbors(self, vertex, predicate=None, str direction='out'):
+        cdef str vertex_id = vertex if isinstance(vertex, str) else vertex.id
+        return self.neighbors_many([vertex_id], predicate=predicate,
+                                   direction=direction)[vertex_id]
+
+    def neighbors_many(self, vertices, predicate=None, str direction='out'):
+        if direction not in ('out', 'in', 'both'):
+            raise ValueError(f"Expected direction to be one of 'out', 'in' or 'both', "
+                             f"got {direction!r}.")
+
+        cdef list ids = list(dict.fromkeys(v if isinstance(v, str) else v.id
+                                           for v in vertices))
+        cdef dict result = {vertex_id: [] for vertex_id in ids}
+        cdef bint outgoing = direction in ('out', 'both')
+        cdef bint incoming = direction in ('in', 'both')
+        cdef Py_ssize_t i
+        cdef str source, target
+
+        # Chunked to stay below SQLite's bound parameter limit.
+        for i in range(0, len(ids), 400):
+            chunk = ids[i:i + 400]
+            members = set(chunk)
+            conditions = []
+            if outgoing:
+                conditions.append(and_(Edge.source_id.in_(chunk), Vertex.id == Edge.vertex_id))
+            if incoming:
+                conditions.append(and_(Edge.vertex_id.in_(chunk), Vertex.id == Edge.source_id))
+
+            # Edges & their other end in one query.
+            query = self._sess.query(Edge.source_id, Edge.vertex_id, Edge.predicate, Vertex) \
+                .join(Vertex, or_(*conditions))
+            if isinstance(predicate, str):
+                query = query.filter(Edge.predicate == predicate)
+            elif predicate is not None:
+                query = query.filter(Edge.predicate.in_(list(predicate)))
+
+            for source, target, pred, nbr in query.order_by(Edge.id):
+                if outgoing and source in members and nbr.id == target:
+                    result[source].append((pred, nbr))
+                if incoming and target in members and nbr.id == source and \
+                        not (outgoing and source == target):
+                    result[target].append((pred, nbr))
+
+        return result
+
+    def find(self, str schema=None, str graph_id=None, int limit=0, **props):
+        if graph_id is None:
+            graph_id = self._graph_id
+
+        query = self._sess.query(Vertex).filter(Vertex.graph_id == graph_id)
+        if schema is not None:
+            query = query.filter(Vertex.schema == schema)
+
+        # Each payload filter is matched against the indexed property table.
+        for key, value in props.items():
+            values = value if isinstance(value, (list, tuple, set, frozenset)) else (value,)
+            matches = select(Property.vertex_id) \
+                .where(Property.key == key, or_(*map(_property_condition, values)))
+            query = query.filter(Vertex.id.in_(matches))
+
+        if limit > 0:
+            query = query.limit(limit)
+        return query.all()
+
+    def enable_search(self, bint rebuild=False):
+        with self._write_lock:
+            if rebuild:
+                self._sess.execute(text('DROP TABLE IF EXISTS vertex_fts'))
+            if rebuild or not self._full_text:
+                self._sess.execute(text(SEARCH_TABLE))
+                for trigger in SEARCH_TRIGGERS:
+                    self._sess.execute(text(trigger))
+                self._sess.execute(text(SEARCH_BACKFILL))
+                self._sess.commit()
+            self._full_text = True
+
+    def search(self, str query, str schema=None, str graph_id=None, int limit=10):
+        if not self._full_text:
+            raise RuntimeError('Full-text search is disabled. Create the graph with '
+                               '`full_text=True` or call `enable_search()` first.')
+        if graph_id is None:
+            graph_id = self._graph_id
+
+        # Quote every token, so user input can't inject FTS5 syntax.
+        cdef str match = ' '.join(f'"{token}"{star}'
+                                  for token, star in _SEARCH_TOKEN.findall(query))
+        if not match:
+            return []
+
+        cdef str sql = ('SELECT vertex.* FROM vertex_fts '
+                        'JOIN vertex ON vertex.id = vertex_fts.vertex_id '
+                        'WHERE vertex_fts MATCH :match AND vertex.graph_id = :graph_id')
+        if schema is not None:
+            sql += ' AND vertex.schema = :schema'
+        # Label matches outrank aliases, which outrank other payload text.
+        sql += ' ORDER BY bm25(vertex_fts, 10.0, 5.0, 1.0) LIMIT :limit'
+
+        return self._sess.query(Vertex) \
+            .from_statement(text(sql)) \
+            .params(match=match, graph_id=graph_id, schema=schema,
+                    limit=limit if limit > 0 else -1) \
+            .all()
+
+    def paths(self, src, dst, int max_hops=3, predicates=None,
+              str direction='out', int limit=100):
+        if direction not in ('out', 'in', 'both'):
+            raise ValueError(f"Expected direction to be one of 'out', 'in' or 'both', "
+                             f"got {direction!r}.")
+        cdef str source = src if isinstance(src, str) else src.id
+        cdef str target = dst if isinstance(dst, str) else dst.id
+
+        # Column joined against the current node & the node it leads to.
+        if direction == 'out':
+            join, step = 'edge.source_id = walk.node', 'edge.vertex_id'
+        elif direction == 'in':
+            join, step = 'edge.vertex_id = walk.node', 'edge.source_id'
+        else:
+            join = '(edge.source_id = walk.node OR edge.vertex_id = walk.node)'
+            step = ('CASE WHEN edge.source_id = walk.node '
+                    'THEN edge.vertex_id ELSE edge.source_id END')
+
+        cdef str where = ''
+        if isinstance(predicates, str):
+            predicates = [predicates]
+        if predicates is not None:
+            where = 'AND edge.predicate IN :predicates'
+
+        # Simple paths only: `nodes` holds the visited vertices as ",id,id,".
+        # Rows are produced breadth first, so `LIMIT` stops the walk early.
+        query = text(f"""
+            WITH RECURSIVE walk(node, depth, nodes, edges) AS (
+                SELECT :source, 0, ',' || :source || ',', ''
+                UNION ALL
+                SELECT {step}, walk.depth + 1,
+                       walk.nodes || {step} || ',', walk.edges || edge.id || ','
+                FROM walk JOIN edge ON {join}
+                WHERE walk.depth < :max_hops AND walk.node != :target
+                  AND instr(walk.nodes, ',' || {step} || ',') = 0 {where}
+            )
+            SELECT edges FROM walk WHERE node = :target AND depth > 0 LIMIT :limit
+        """)
+        params = {'source': source, 'target': target, 'max_hops': max_hops,
+                  'limit': limit if limit > 0 else -1}
+        if predicates is not None:
+            query = query.bindparams(bindparam('predicates', expanding=True))
+            params['predicates'] = list(predicates)
+
+        rows = self._sess.execute(query, params)
+        return self._path_edges([[int(edge_id) for edge_id in edges.split(',') if edge_id]
+                                 for edges, in rows])
+
+    def shortest_path(self, src, dst, int max_hops=6, predicates=None, str direction='out'):
+        if direction not in ('out', 'in', 'both'):
+            raise ValueError(f"Expected direction to be one of 'out', 'in' or 'both', "
+                             f"got {direction!r}.")
+        cdef str source = src if isinstance(src, str) else src.id
+        cdef str target = dst if isinstance(dst, str) else dst.id
+        if source == target:
+            return []
+        if isinstance(predicates, str):
+            predicates = [predicates]
+
+        # Vertex -> (edge id, previous vertex, depth), searched from both ends.
+        cdef dict forward = {source: (None, None, 0)}, backward = {target: (None, None, 0)}
+        cdef list forward_frontier = [source], backward_frontier = [target]
+        cdef str reverse = {'out': 'in', 'in': 'out', 'both': 'both'}[direction]
+        cdef int hops = 0
+
+        while forward_frontier and backward_frontier and hops < max_hops:
+            hops += 1
+            # Grow the smaller side by a whole level.
+            if len(forward_frontier) <= len(backward_frontier):
+                forward_frontier = self._expand_frontier(forward_frontier, forward,
+                                                         predicates, direction)
+                met = [node for node in forward_frontier if node in backward]
+            else:
+                backward_frontier = self._expand_frontier(backward_frontier, backward,
+                                                          predicates, reverse)
+                met = [node for node in backward_frontier if node in forward]
+
+            if met:
+                meet = min(met, key=lambda node: forward[node][2] + backward[node][2])
+                edges = []
+                node = meet
+                while forward[node][0] is not None:
+                    edges.append(forward[node][0])
+                    node = forward[node][1]
+                edges.reverse()
+                node = meet
+                while backward[node][0] is not None:
+                    edges.append(backward[node][0])
+                    node = backward[node][1]
+                return self._path_edges([edges])[0]
+
+        # Not connected within `max_hops`.
+        return None
+
+    def _expand_frontier(self, list frontier, dict parents, predicates, str direction):
+        # Next BFS level: unvisited vertices one hop from `frontier`.
+        cdef list level = []
+        cdef bint outgoing = direction in ('out', 'both')
+        cdef bint incoming = direction in ('in', 'both')
+        cdef Py_ssize_t i
+
+        for i in range(0, len(frontier), 400):
+            chunk = frontier[i:i + 400]
+            members = set(chunk)
+            conditions = []
+            if outgoing:
+                conditions.append(Edge.source_id.in_(chunk))
+            if incoming:
+                conditions.append(Edge.vertex_id.in_(chunk))
+
+            query = self._sess.query(Edge.id, Edge.source_id, Edge.vertex_id) \
+                .filter(or_(*conditions))
+            if predicates is not None:
+                query = query.filter(Edge.predicate.in_(list(predicates)))
+
+            for edge_id, source, target in query.order_by(Edge.id):
+                if outgoing and source in members and target not in parents:
+                    parents[target] = (edge_id, source, parents[source][2] + 1)
+                    level.append(target)
+                if incoming and target in members and source not in parents:
+                    parents[source] = (edge_id, target, parents[target][2] + 1)
+                    level.append(source)
+        return level
+
+    def _path_edges(self, list paths):
+        # Edge ids -> (source, predicate, target) triples, in their stored direction.
+        cdef list ids = list({edge_id for path in paths for edge_id in path})
+        cdef dict edges = {}, vertices = {}
+        cdef Py_ssize_t i
+
+        for i in range(0, len(ids), 400):
+            for edge_id, source, pred, target in self._sess \
+                    .query(Edge.id, Edge.source_id, Edge.predicate, Edge.vertex_id) \
+                    .filter(Edge.id.in_(ids[i:i + 400])):
+                edges[edge_id] = (source, pred, target)
+
+        cdef list vertex_ids = list({v for source, _, target in edges.values()
+                                     for v in (source, target)})
+        for i in range(0, len(vertex_ids), 400):
+            for vertex in self._sess.query(Vertex).filter(Vertex.id.in_(vertex_ids[i:i + 400])):
+                vertices[vertex.id] = vertex
+
+        return [[(vertices[edges[edge_id][0]], edges[edge_id][1], vertices[edges[edge_id][2]])
+                 for edge_id in path] for path in paths]
+
+    def query(self, patterns, str graph_id=None, int limit=0, bint resolve=True,
+              int batch_size=500):
+        if graph_id is None:
+            graph_id = self._graph_id
+
+        # (label, schema) pairs name constant vertices.
+        cdef list resolved = []
+        for pattern in patterns:
+            pattern = list(pattern)
+            for i in (0, 2):
+                if isinstance(pattern[i], tuple):
+                    pattern[i] = self.get(pattern[i])
+                    if pattern[i] is None:
+                        # Unknown vertex: nothing can match.
+                        return iter(())
+            resolved.append(pattern)
+
+        # Compiled upfront, so malformed patterns raise here & not on first `next`.
+        query = Pattern(resolved)
+        sql, params = query.compile(graph_id, limit=limit)
+        return self._stream_matches(query, self._sess.execute(text(sql), params),
+                                    resolve, max(batch_size, 1))
+
+    def _stream_matches(self, query, result, bint resolve, int batch_size):
+        cdef list names = [name[1:] for name in query.variables]
+        cdef list vertex_columns = [i for i, kind in enumerate(query.variables.values())
+                                    if kind == 'vertex']
+        cdef dict vertices
+        cdef Py_ssize_t i
+
+        while True:
+            rows = result.fetchmany(batch_size)
+            if not rows:
+                break
+            if resolve:
+                # One vertex lookup per batch of rows.
+                vertices = {}
+                ids = list({row[j] for row in rows for j in vertex_columns})
+                for i in range(0, len(ids), 400):
+                    for vertex in self._sess.query(Vertex).filter(Vertex.id.in_(ids[i:i + 400])):
+                        vertices[vertex.id] = vertex
+                rows = [[vertices[value] if j in vertex_columns else value
+                         for j, value in enumerate(row)] for row in rows]
+            for row in rows:
+                yield dict(zip(names, row))
+
+    def snapshot(self, bint payloads=False):
+        # Two bulk queries instead of one per edge.
+        cdef str graph_id = self._graph_id
+        columns = [Vertex.id, Vertex.label, Vertex.schema]
+        if payloads:
+            # Raw JSON, decoded by the snapshot on demand.
+            columns.append(type_coerce(Vertex.__table__.c.payload, String))
+        vertices = self._sess.query(*columns).filter_by(graph_id=graph_id)
+        edges = self._sess.query(Connection.vertex_id, Edge.vertex_id, Edge.predicate) \
+            .join(Edge, Edge.id == Connection.edge_id) \
+            .join(Vertex, Vertex.id == Connection.vertex_id) \
+            .filter(Vertex.graph_id == graph_id)
+        from sage.core.snapshot import GraphSnapshot
+        return GraphSnapshot.from_edges(vertices, edges)
+
+    def iter_vertices(self, str graph_id=None, int batch_size=1000):
+        if batch_size < 1:
+            raise ValueError(f'Expected batch_size to be at least 1, got {batch_size}.')
+        if graph_id is None:
+            graph_id = self._graph_id
+
+        # Pages of `batch_size` rows in id order, instead of all at once like
+        # `vertices`. Each page starts after the last id: no open cursor is
+        # held between pages & no OFFSET scan.
+        cdef str last = ''
+        while True:
+            page = self._sess.query(Vertex) \
+                .filter(Vertex.graph_id == graph_id, Vertex.id > last) \
+                .order_by(Vertex.id) \
+                .limit(batch_size) \
+                .all()
+            yield from page
+            if len(page) < batch_size:
+                break
+            last = page[-1].id
+
     @property
     def vertices(self):
         return self._sess.query(Vertex) \
-            .filter_by(graph_id=self._default_graph.id) \
+            .filter_by(graph_id=self._graph_id) \
             .all()
 
 
@@ -305,6 +1017,8 @@ class MultiKnowledgeGraph(Base):
 
         # List of graphs contained in Multi-KG.
         self._graphs = dict()
+        # Seconds taken to build each graph by `from_dir`.
+        self.timings = dict()
 
     def __getitem__(self, item):
         result = None
@@ -336,7 +1050,7 @@ class MultiKnowledgeGraph(Base):
         return result
 
     @classmethod
-    def from_dir(cls, str path):
+    def from_dir(cls, str path, int max_workers=0, bint use_threads=False, **kwargs):
         # `path` must be a directory.
         if not File.is_dir(path):
             raise FileNotFoundError(f"{path} does not exist"
@@ -348,22 +1062,44 @@ class MultiKnowledgeGraph(Base):
 
         # Get all files in directory.
         cdef str file_path
+        cdef dict files = {}
         for file_path in File.get_files(path, optimize=False):
-            if File.ext(file_path) in KnowledgeGraph.SUPPORTED_FORMATS:
-                name = File.filename(file_path)
-                inst.add_graph(name.replace(' ', '_').replace('-', '_'),
-                               data_file=file_path)
+            if KnowledgeGraph.get_format(file_path) in KnowledgeGraph.SUPPORTED_FORMATS:
+                name = File.filename(file_path[:-len('.gz')]
+                                     if file_path.endswith('.gz') else file_path)
+                name = name.replace(' ', '_').replace('-', '_')
+                if name in files:
+                    raise KeyError(f'{name} already exists.')
+                files[name] = file_path
             else:
                 Log.warn(f'{file_path} not supported.')
 
+        # Each graph is built into its own db file by a pool worker.
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+        Executor = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+        with Executor(max_workers=max_workers or None) as executor:
+            futures = [executor.submit(_build_graph, name, inst.base_dir, file_path, kwargs)
+                       for name, file_path in files.items()]
+            for future in as_completed(futures):
+                name, seconds = future.result()
+                inst.timings[name] = seconds
+                Log.info(f'Loaded `{name}` in {seconds:.2f}s.')
+
+        # Open the built graphs in the calling thread, with the same settings
+        # (profile, cache, vocabulary...) but without loading them again.
+        cdef dict settings = {key: value for key, value in kwargs.items()
+                              if key not in _LOAD_ONLY}
+        for name in files:
+            inst.add_graph(name, **settings)
+
         return inst
 
-    def add_graph(self, str name, str data_file=None):
+    def add_graph(self, str name, str data_file=None, **kwargs):
         if name in self._graphs:
             raise KeyError(f'{name} already exists.')
 
-        g = Graph(name, base=self.base_dir,
-                  data_file=data_file)
+        g = KnowledgeGraph(name, base_dir=self.base_dir,
+                           data_file=data_file, **kwargs)
         self._graphs[name] = g
 
         return g
@@ -387,3 +1123,97 @@ class MultiKnowledgeGraph(Base):
     @property
     def graphs(self):
         return list(self._graphs.values())
+
+
+def sqlite_pragmas(str profile=None, dict pragmas=None):
+    """PRAGMAs of a SQLite profile from `global.cfg`, updated with `pragmas`."""
+    if profile is None:
+        profile = SETUP.SQLITE_PROFILE
+    if profile not in SETUP.SQLITE_PROFILES:
+        raise ValueError(f'Unknown SQLite profile {profile!r}, expected one of '
+                         f'{tuple(SETUP.SQLITE_PROFILES)}.')
+
+    settings = {**SETUP.SQLITE_PROFILES[profile], **(pragmas or {})}
+    cdef dict result = {}
+    for name in PRAGMAS:
+        if name in settings:
+            value = str(settings.pop(name))
+            # Values are spliced into the statement, so keep them to plain words.
+            if not _PRAGMA_VALUE.fullmatch(value):
+                raise ValueError(f'Invalid value for PRAGMA {name}: {value!r}')
+            result[name] = value
+    if settings:
+        raise ValueError(f'Unsupported PRAGMAs {tuple(settings)}, expected any of {PRAGMAS}.')
+    return result
+
+
+def _build_graph(str name, str base_dir, str data_file, dict kwargs):
+    # Runs in a pool worker: build the graph's db file & report how long it took.
+    cdef double start = time.perf_counter()
+    kg = KnowledgeGraph(name, base_dir=base_dir, data_file=data_file, **kwargs)
+    kg.close()
+    return name, time.perf_counter() - start
+
+
+def _merge_duplicate_vertices(conn):
+    # Vertices sharing (graph_id, label, schema) are merged into the oldest one:
+    # edges & connections are repointed, payloads combined (oldest values win).
+    cdef dict groups = {}
+    for vertex_id, graph_id, label, schema, payload in conn.execute(text(
+            'SELECT v.id, v.graph_id, v.label, v.schema, v.payload FROM vertex AS v '
+            'JOIN (SELECT graph_id, label, schema FROM vertex GROUP BY graph_id, label, schema '
+            '      HAVING COUNT(*) > 1) AS d '
+            'ON v.graph_id = d.graph_id AND v.label = d.label AND v.schema = d.schema '
+            'ORDER BY v.rowid')):
+        groups.setdefault((graph_id, label, schema), []).append((vertex_id, payload))
+    if not groups:
+        return 0
+
+    # Repointed edges may collide: duplicates are removed by `_merge_duplicate_edges`.
+    conn.execute(text('DROP INDEX IF EXISTS ix_edge_source_target_predicate'))
+
+    cdef list merged = [], payloads = []
+    for rows in groups.values():
+        keep = rows[0][0]
+        merged += [{'old': vertex_id, 'new': keep} for vertex_id, _ in rows[1:]]
+
+        payload = {}
+        for _, value in reversed(rows):
+            payload.update(json.loads(value) if value else {})
+        if payload != (json.loads(rows[0][1]) if rows[0][1] else {}):
+            payloads.append({'id': keep, 'payload': json.dumps(payload)})
+
+    conn.execute(text('UPDATE edge SET vertex_id = :new WHERE vertex_id = :old'), merged)
+    conn.execute(text('UPDATE edge SET source_id = :new WHERE source_id = :old'), merged)
+    conn.execute(text('UPDATE OR IGNORE connection SET vertex_id = :new '
+                      'WHERE vertex_id = :old'), merged)
+    conn.execute(text('DELETE FROM connection WHERE vertex_id = :old'), merged)
+    conn.execute(text('DELETE FROM vertex WHERE id = :old'), merged)
+    if payloads:
+        conn.execute(text('UPDATE vertex SET payload = :payload WHERE id = :id'), payloads)
+
+    Log.warn(f'Merged {len(merged):,} duplicate vertices into {len(groups):,}.')
+    return len(merged)
+
+
+def _merge_duplicate_edges(conn):
+    # Keep the first of the edges sharing (source, target, predicate).
+    cdef str duplicates = ('SELECT id FROM edge WHERE source_id IS NOT NULL AND id NOT IN ('
+                           'SELECT MIN(id) FROM edge WHERE source_id IS NOT NULL '
+                           'GROUP BY source_id, vertex_id, predicate)')
+    conn.execute(text(f'DELETE FROM connection WHERE edge_id IN ({duplicates})'))
+    result = conn.execute(text(f'DELETE FROM edge WHERE id IN ({duplicates})'))
+    if result.rowcount:
+        Log.warn(f'Removed {result.rowcount:,} duplicate edges.')
+
+
+def _property_condition(value):
+    # Match a single payload value against its typed property column.
+    if isinstance(value, bool):
+        return and_(Property.kind == 'bool', Property.value_number == int(value))
+    elif isinstance(value, (int, float)):
+        return and_(Property.kind == 'number', Property.value_number == value)
+    elif isinstance(value, str):
+        return Property.value_text == value
+    raise TypeError(f'Expected str, int, float or bool property value, '
+                    f'got {type(value)}')
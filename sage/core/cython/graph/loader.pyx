@@ -0,0 +1,276 @@
+"""Bulk write path for loading large Knowledge Graphs.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: loader.pyx
+     Created on 18 October, 2026 @ 10:12 AM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+# Built-in libraries.
+import time
+import secrets
+from collections.abc import Iterator
+
+# Third-party libraries.
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.dialects.sqlite import insert
+
+# Custom libraries.
+from sage.core.reader import Literal, add_literal, local_name
+from sage.core.schema import Connection, Edge, Vertex, reset_neighbor_index
+from sage.core.utils import Log
+
+__all__ = [
+    'BulkLoader',
+]
+
+
+class BulkLoader:
+    """Buffered get-or-create writer used by `BaseKG.load(..., bulk=True)`.
+
+    Vertices are resolved from an in-memory (label, schema) -> id map
+    instead of one query per node, and new rows are written with
+    executemany inserts. The resulting graph is the same as the one
+    produced by the per-row path. Edges are only de-duplicated in memory
+    until they're written: the unique edge index takes over from there,
+    so the id map is the only state growing with the graph.
+    """
+
+    # Maximum number of buffered rows before they're written to the db.
+    BUFFER_SIZE = 50000
+
+    def __init__(self, kg, str graph_id, int chunk_size=0):
+        self.kg = kg
+        self.graph_id = graph_id
+        # Commit every `chunk_size` new vertices (0 = single transaction).
+        self.chunk_size = chunk_size
+        self._sess = kg._sess
+
+        # Make sure pending ORM changes are visible to the bulk queries.
+        self._sess.commit()
+
+        # (label, schema) -> vertex id of every vertex in the graph.
+        self._ids = {
+            (label, schema): vertex_id
+            for vertex_id, label, schema in self._sess.query(
+                Vertex.id, Vertex.label, Vertex.schema
+            ).filter_by(graph_id=graph_id)
+        }
+
+        # (source, target, predicate) of the buffered edges.
+        self._edges = set()
+        self._next_edge_id = (self._sess.query(func.max(Edge.id)).scalar() or 0) + 1
+
+        # Write buffers.
+        self._vertices = {}  # New vertex rows: id -> row.
+        self._payloads = {}  # Payload updates of persisted vertices: id -> dict.
+        self._appended = set()  # (id, key) of `_payloads` added with `add_literal`.
+        self._edge_rows = []
+        self._pending = 0
+
+        # Statistics.
+        self.stats = None
+        self.n_vertices = 0
+        self.n_edges = 0
+        self._start = time.perf_counter()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._sess.rollback()
+
+    def add_vertex(self, str label, str schema):
+        cdef str vertex_id = self._ids.get((label, schema))
+        if vertex_id is not None:
+            return vertex_id
+
+        # Create a new vertex.
+        vertex_id = secrets.token_hex(8)
+        self._ids[label, schema] = vertex_id
+        self._vertices[vertex_id] = {
+            'id': vertex_id, 'label': label, 'schema': schema,
+            'graph_id': self.graph_id, 'payload': {},
+        }
+        self.n_vertices += 1
+        self._buffered()
+        return vertex_id
+
+    def add_payload(self, str vertex_id, str key, value, bint append=False):
+        # `append` keeps repeated values of `key` as a list (see `add_literal`).
+        row = self._vertices.get(vertex_id)
+        if row is not None:
+            if append:
+                add_literal(row['payload'], key, value)
+            else:
+                row['payload'][key] = value
+        else:
+            # Vertex has already been written, update it on next flush.
+            payload = self._payloads.setdefault(vertex_id, {})
+            if append:
+                add_literal(payload, key, value)
+                self._appended.add((vertex_id, key))
+            else:
+                payload[key] = value
+                self._appended.discard((vertex_id, key))
+            self._buffered()
+
+    def add_edge(self, str source, str target, str predicate):
+        # Source is already connected to target by this predicate (written
+        # edges are ignored by the unique index when flushed).
+        cdef tuple key = (source, target, predicate)
+        if key in self._edges:
+            return
+
+        self._edges.add(key)
+        self._edge_rows.append({'id': self._next_edge_id,
+                                'vertex_id': target,
+                                'predicate': predicate,
+                                'source_id': source})
+        self._next_edge_id += 1
+        self._buffered()
+
+    def _buffered(self):
+        # Count a buffered row, writing the buffers once they're full.
+        self._pending += 1
+        if 0 < self.chunk_size <= len(self._vertices):
+            self.flush(commit=True)
+        elif self._pending >= self.BUFFER_SIZE:
+            self.flush(commit=False)
+
+    def load(self, data):
+        # Mirrors `BaseKG.load` so both paths build identical graphs.
+        cdef str schema, label, nbr_schema, nbr_label, vertex_id, nbr_id
+
+        if isinstance(data, dict):
+            schema = self.kg._get_schema(data, marker='@type', default='Thing')
+            label = self.kg._get_label(data, schema=schema, marker='name')
+            vertex_id = self.add_vertex(label, schema)
+
+            for k, v in data.items():
+                # Key doesn't start with "@" & Value must be a primitive type.
+                if not k.startswith('@') and isinstance(v, (int, float, str, bool)):
+                    self.add_payload(vertex_id, k, v)
+                # A new list of scopes.
+                elif isinstance(v, (list, tuple)):
+                    for item in v:
+                        self.load(item)
+
+                elif isinstance(v, dict):
+                    # Direct neighboring scope.
+                    nbr_schema = self.kg._get_schema(v, marker='@type', default='Thing')
+                    nbr_label = self.kg._get_label(v, schema=nbr_schema, marker='name')
+                    nbr_id = self.add_vertex(nbr_label, nbr_schema)
+                    self.add_edge(vertex_id, nbr_id, k)
+                    # Visit direct neighboring scope.
+                    self.load(v)
+
+        elif isinstance(data, (list, tuple, Iterator)):
+            for item in data:
+                self.load(item)
+
+    def add_triples(self, triples, bint compact=True):
+        # Subjects & IRI objects become vertices, literals become payload.
+        cdef str subject, predicate, vertex_id
+
+        for subject, predicate, obj in triples:
+            vertex_id = self.add_vertex(subject, 'Thing')
+            if compact:
+                predicate = local_name(predicate)
+
+            if isinstance(obj, str) and not isinstance(obj, Literal):
+                self.add_edge(vertex_id, self.add_vertex(obj, 'Thing'), predicate)
+            else:
+                # Repeated predicates, e.g. names in several languages, are kept.
+                self.add_payload(vertex_id, predicate, obj, append=True)
+
+    def add_entities(self, entities):
+        # Records from `sage.core.wikidata.iter_entities`.
+        cdef str label, schema, vertex_id, predicate, target, target_schema
+        cdef dict payload
+
+        for label, schema, payload, edges in entities:
+            vertex_id = self.add_vertex(label, schema)
+            for k, v in payload.items():
+                self.add_payload(vertex_id, k, v)
+            for predicate, target, target_schema in edges:
+                self.add_edge(vertex_id, self.add_vertex(target, target_schema), predicate)
+
+    def flush(self, bint commit=False):
+        vertex_table = Vertex.__table__
+
+        if self._vertices:
+            self._sess.execute(vertex_table.insert(), list(self._vertices.values()))
+            self._vertices.clear()
+
+        if self._payloads:
+            # Merge new payload into what's already stored.
+            updates = []
+            ids = list(self._payloads.keys())
+            for i in range(0, len(ids), 500):
+                for vertex_id, payload in self._sess.query(Vertex.id, Vertex.payload) \
+                        .filter(Vertex.id.in_(ids[i:i + 500])):
+                    payload = {k: list(v) if isinstance(v, list) else v
+                               for k, v in (payload or {}).items()}
+                    for key, value in self._payloads[vertex_id].items():
+                        if (vertex_id, key) not in self._appended:
+                            payload[key] = value
+                            continue
+                        for item in (value if isinstance(value, list) else [value]):
+                            add_literal(payload, key, item)
+                    updates.append({'_id': vertex_id, 'payload': payload})
+
+            self._sess.execute(vertex_table.update()
+                               .where(vertex_table.c.id == bindparam('_id'))
+                               .values(payload=bindparam('payload')),
+                               updates)
+            self._payloads.clear()
+            self._appended.clear()
+
+        if self._edge_rows:
+            # Edges written by earlier flushes (or loads) are skipped, and only
+            # the new ones (ids from this flush) get their connection.
+            edge_table = Edge.__table__
+            first_id = self._edge_rows[0]['id']
+            self._sess.execute(insert(edge_table).on_conflict_do_nothing(), self._edge_rows)
+            result = self._sess.execute(
+                Connection.__table__.insert().from_select(
+                    ['edge_id', 'vertex_id'],
+                    select(edge_table.c.id, edge_table.c.source_id)
+                        .where(edge_table.c.id >= first_id)))
+            self.n_edges += result.rowcount
+            self._edge_rows = []
+            self._edges.clear()
+            # Vertices loaded in this session don't know about these edges.
+            reset_neighbor_index(self._sess)
+
+        self._pending = 0
+        if commit:
+            self._sess.commit()
+
+    def close(self):
+        self.flush(commit=True)
+
+        cdef double elapsed = time.perf_counter() - self._start
+        cdef double rate = self.n_vertices / elapsed if elapsed > 0 else 0.0
+        Log.info(f'Loaded {self.n_vertices:,} vertices & {self.n_edges:,} edges '
+                 f'in {elapsed:.2f}s ({rate:,.0f} vertices/sec).')
+
+        self.stats = {
+            'vertices': self.n_vertices,
+            'edges': self.n_edges,
+            'seconds': elapsed,
+            'vertices_per_sec': rate,
+        }
+        return self.stats
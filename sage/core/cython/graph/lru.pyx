@@ -0,0 +1,79 @@
+"""Size-bounded least recently used (LRU) cache.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: lru.pyx
+     Created on 18 October, 2026 @ 03:10 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+# Built-in libraries.
+from collections import OrderedDict
+
+__all__ = [
+    'LRUCache', 'MISSING',
+]
+
+# Returned by `LRUCache.get` for keys which aren't cached.
+MISSING = object()
+
+
+class LRUCache:
+    """Mapping which evicts its least recently used entry once full."""
+
+    def __init__(self, int maxsize):
+        if maxsize <= 0:
+            raise ValueError(f'Expected a positive maxsize, got {maxsize}.')
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+        # Statistics.
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __repr__(self):
+        return (f'LRUCache(size={len(self)}, maxsize={self.maxsize}, '
+                f'hits={self.hits}, misses={self.misses}, evictions={self.evictions})')
+
+    def get(self, key):
+        value = self._data.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        # Statistics are kept, only the entries are dropped.
+        self._data.clear()
+
+    def info(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+        }
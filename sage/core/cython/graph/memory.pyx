@@ -0,0 +1,571 @@
+"""In-memory storage backend for Knowledge Graphs.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: memory.pyx
+     Created on 18 October, 2026 @ 09:30 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+# Built-in libraries.
+import sys
+import json
+import time
+import heapq
+import secrets
+import itertools
+from collections import deque
+
+# Custom libraries.
+from sage.core.graph import BaseKG
+from sage.core.query import Pattern, is_variable
+from sage.core.reader import Literal, add_literal, local_name
+from sage.core.wikidata import iter_entities
+
+__all__ = [
+    'MemoryKnowledgeGraph', 'MemoryVertex', 'MemoryEdge',
+]
+
+
+class MemoryEdge:
+    """Edge record: `source_id` is connected to `vertex_id` by `predicate`."""
+
+    __slots__ = ('id', 'source_id', 'vertex_id', 'predicate')
+
+    def __init__(self, int edge_id, str source_id, str vertex_id, str predicate):
+        # Creation order, as edge ids are in the database.
+        self.id = edge_id
+        self.source_id = source_id
+        self.vertex_id = vertex_id
+        self.predicate = predicate
+
+    def __repr__(self):
+        return f'<Edge({self.vertex_id}, {self.predicate})>'
+
+    def __eq__(self, other):
+        if isinstance(other, MemoryEdge):
+            return self.id == other.id
+        return self.vertex_id == other
+
+    def __hash__(self):
+        return hash(self.id)
+
+
+class MemoryVertex:
+    """Vertex record holding its own out & in adjacency lists."""
+
+    __slots__ = ('id', 'label', 'schema', 'graph_id', 'payload',
+                 'edges', 'in_edges', '_targets', '_edge_ids')
+
+    def __init__(self, str vertex_id, str label, str schema, str graph_id, edge_ids):
+        self.id = vertex_id
+        self.label = label
+        self.schema = schema
+        self.graph_id = graph_id
+        self.payload = {}
+        self.edges = []
+        self.in_edges = []
+        # (target id, predicate) of `edges`, created with the first edge.
+        self._targets = None
+        self._edge_ids = edge_ids
+
+    def __repr__(self):
+        return f"<Vertex(label='{self.label}', schema='{self.schema}')>"
+
+    def __eq__(self, other):
+        if isinstance(other, MemoryVertex):
+            return self.id == other.id
+        elif isinstance(other, tuple):
+            return (self.label, self.schema) == other
+        elif isinstance(other, str):
+            return self.id == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.id, self.label, self.schema))
+
+    def add_neighbor(self, nbr, predicate=None):
+        # Same contract as `Vertex.add_neighbor`: existing edges are reused.
+        if predicate is not None:
+            predicate = sys.intern(predicate)
+        if self._targets is None:
+            self._targets = {}
+        edge = self._targets.get((nbr.id, predicate))
+        if edge is None:
+            edge = MemoryEdge(next(self._edge_ids), self.id, nbr.id, predicate)
+            self._targets[nbr.id, predicate] = edge
+            self.edges.append(edge)
+            nbr.in_edges.append(edge)
+        return edge
+
+    def add_payload(self, payload):
+        for k, v in payload.items():
+            # Key doesn't start with "@" & Value must be a primitive type.
+            if not k.startswith('@') and isinstance(v, (int, float, str, bool)):
+                self.payload[sys.intern(k)] = v
+
+    def get_connection(self, nbr, predicate=None):
+        if predicate is not None:
+            return (self._targets or {}).get((nbr.id, predicate))
+        for edge in self.edges:
+            if edge.vertex_id == nbr.id:
+                return edge
+        return None
+
+
+class MemoryKnowledgeGraph(BaseKG):
+    """Knowledge Graph held in dicts & adjacency lists instead of SQLite.
+
+    Nothing is written to disk (see `save_snapshot` to persist one), so
+    it's meant for ephemeral graphs that fit in RAM: per-request graphs,
+    tests & fast exploratory loads.
+    """
+
+    def __init__(self, str name, str description=None,
+                 str base_dir=None, data=None, str data_file=None,
+                 **kwargs):
+        super(MemoryKnowledgeGraph, self).__init__(name, description,
+                                                   base_dir=base_dir, data=data,
+                                                   data_file=data_file, **kwargs)
+        self._graph_id = secrets.token_hex(8)
+        # Vertex id -> vertex, in creation order.
+        self._vertices = {}
+        # (graph id, label, schema) -> vertex.
+        self._keys = {}
+        self._edge_ids = itertools.count(1)
+
+        # Load Knowledge Graph with knowledge data.
+        if data is not None:
+            self.load(data, self._graph_id)
+
+        # Read knowledge data from file.
+        if data_file is not None:
+            self.load_file(data_file, self._graph_id)
+
+    def __len__(self):
+        return len(self._vertices)
+
+    ####################################################################################
+    # Vertices.
+    ####################################################################################
+
+    def get(self, item):
+        if isinstance(item, str):
+            return self._vertices.get(item)
+        elif isinstance(item, tuple):
+            assert len(item) == 2, 'Only label & schema expected.'
+            return self._keys.get((self._graph_id, item[0], item[1]))
+        raise TypeError(f'Expected one of str or Tuple[str, str],'
+                        f'got {type(item)}')
+
+    def get_many(self, items):
+        return [self.get(item) for item in items]
+
+    def get_vertex(self, str vertex_id=None, str label=None,
+                   str schema=None, str graph_id=None):
+        if vertex_id is not None:
+            return self._vertices.get(vertex_id)
+        elif label is not None and schema is not None:
+            return self._keys.get((graph_id or self._graph_id, label, schema))
+        raise ValueError('Expected one of `id` or `label` & `schema`.')
+
+    def get_vertex_by_label(self, str label):
+        return [v for v in list(self._vertices.values()) if v.label == label]
+
+    def add_vertex(self, str label, str schema, str graph_id):
+        if graph_id is None:
+            graph_id = self._graph_id
+
+        with self._write_lock:
+            vertex = self._keys.get((graph_id, label, schema))
+            if vertex is None:
+                vertex = MemoryVertex(secrets.token_hex(8), sys.intern(label),
+                                      sys.intern(schema), graph_id, self._edge_ids)
+                self._vertices[vertex.id] = vertex
+                self._keys[graph_id, vertex.label, vertex.schema] = vertex
+            return vertex
+
+    @property
+    def vertices(self):
+        return [v for v in list(self._vertices.values()) if v.graph_id == self._graph_id]
+
+    def iter_vertices(self, str graph_id=None, int batch_size=1000):
+        # Already in memory: `batch_size` is accepted for API parity.
+        if batch_size < 1:
+            raise ValueError(f'Expected batch_size to be at least 1, got {batch_size}.')
+        if graph_id is None:
+            graph_id = self._graph_id
+        return (v for v in list(self._vertices.values()) if v.graph_id == graph_id)
+
+    def close(self):
+        self._vertices.clear()
+        self._keys.clear()
+
+    ####################################################################################
+    # Loading.
+    ####################################################################################
+
+    def add_triple(self, triples, str graph_id=None, int chunk_size=0, bint compact=True):
+        # Same graph as `BulkLoader.add_triples`: literals become payload.
+        if graph_id is None:
+            graph_id = self._graph_id
+        cdef str subject, predicate
+
+        with self._write_lock, _Stats(self) as stats:
+            for subject, predicate, obj in triples:
+                vertex = self.add_vertex(subject, 'Thing', graph_id)
+                if compact:
+                    predicate = local_name(predicate)
+
+                if isinstance(obj, str) and not isinstance(obj, Literal):
+                    vertex.add_neighbor(self.add_vertex(obj, 'Thing', graph_id), predicate)
+                else:
+                    # Repeated predicates, e.g. names in several languages, are kept.
+                    add_literal(vertex.payload, sys.intern(predicate), obj)
+        return stats.stats
+
+    def load_wikidata(self, str path, str graph_id=None, int processes=0,
+                      int chunk_size=0, str language='en'):
+        if graph_id is None:
+            graph_id = self._graph_id
+
+        entities = iter_entities(path, processes=processes, language=language)
+        with self._write_lock, _Stats(self) as stats:
+            for label, schema, payload, edges in entities:
+                vertex = self.add_vertex(label, schema, graph_id)
+                vertex.add_payload(payload)
+                for predicate, target, target_schema in edges:
+                    vertex.add_neighbor(self.add_vertex(target, target_schema, graph_id),
+                                        predicate)
+        return stats.stats
+
+    ####################################################################################
+    # Queries.
+    ####################################################################################
+
+    def neighbors(self, vertex, predicate=None, str direction='out'):
+        cdef str vertex_id = vertex if isinstance(vertex, str) else vertex.id
+        return self.neighbors_many([vertex_id], predicate=predicate,
+                                   direction=direction)[vertex_id]
+
+    def neighbors_many(self, vertices, predicate=None, str direction='out'):
+        _check_direction(direction)
+        cdef list ids = list(dict.fromkeys(v if isinstance(v, str) else v.id
+                                           for v in vertices))
+        cdef dict result = {}
+        predicates = _predicates(predicate)
+
+        for vertex_id in ids:
+            vertex = self._vertices.get(vertex_id)
+            result[vertex_id] = [] if vertex is None else [
+                (edge.predicate, self._vertices[other])
+                for edge, other in _incident(vertex, direction)
+                if predicates is None or edge.predicate in predicates
+            ]
+        return result
+
+    def find(self, str schema=None, str graph_id=None, int limit=0, **props):
+        if graph_id is None:
+            graph_id = self._graph_id
+
+        cdef list conditions = []
+        for key, value in props.items():
+            values = value if isinstance(value, (list, tuple, set, frozenset)) else (value,)
+            for v in values:
+                _check_literal(v)
+            conditions.append((key, tuple(values)))
+
+        # Full scan: payloads are plain dicts, changed in place.
+        cdef list result = []
+        for vertex in list(self._vertices.values()):
+            if vertex.graph_id != graph_id or (schema is not None and vertex.schema != schema):
+                continue
+            if all(key in vertex.payload and
+                   any(_matches(vertex.payload[key], v) for v in values)
+                   for key, values in conditions):
+                result.append(vertex)
+                if 0 < limit <= len(result):
+                    break
+        return result
+
+    def search(self, str query, str schema=None, str graph_id=None, int limit=10):
+        raise RuntimeError('Full-text search needs the SQLite backend (`KnowledgeGraph`).')
+
+    def paths(self, src, dst, int max_hops=3, predicates=None,
+              str direction='out', int limit=100):
+        _check_direction(direction)
+        cdef str source = src if isinstance(src, str) else src.id
+        cdef str target = dst if isinstance(dst, str) else dst.id
+        predicates = _predicates(predicates)
+        cdef list paths = []
+
+        # Breadth first over simple paths, like the recursive query in `KnowledgeGraph`.
+        queue = deque([(source, (source,), ())])
+        while queue:
+            node, nodes, edges = queue.popleft()
+            if node == target and edges:
+                paths.append(edges)
+                if 0 < limit <= len(paths):
+                    break
+                continue
+            if len(edges) >= max_hops or node not in self._vertices:
+                continue
+            for edge, other in _incident(self._vertices[node], direction):
+                if other not in nodes and (predicates is None or edge.predicate in predicates):
+                    queue.append((other, nodes + (other,), edges + (edge,)))
+
+        return [[self._triple(edge) for edge in path] for path in paths]
+
+    def shortest_path(self, src, dst, int max_hops=6, predicates=None, str direction='out'):
+        _check_direction(direction)
+        cdef str source = src if isinstance(src, str) else src.id
+        cdef str target = dst if isinstance(dst, str) else dst.id
+        if source == target:
+            return []
+        predicates = _predicates(predicates)
+
+        # Vertex -> (edge, previous vertex).
+        cdef dict parents = {source: None}
+        cdef list frontier = [source]
+        cdef int hops = 0
+        while frontier and hops < max_hops:
+            hops += 1
+            level = []
+            for node in frontier:
+                if node not in self._vertices:
+                    continue
+                for edge, other in _incident(self._vertices[node], direction):
+                    if other in parents or (predicates is not None and
+                                            edge.predicate not in predicates):
+                        continue
+                    parents[other] = (edge, node)
+                    if other == target:
+                        path = []
+                        while parents[other] is not None:
+                            edge, other = parents[other]
+                            path.append(self._triple(edge))
+                        return path[::-1]
+                    level.append(other)
+            frontier = level
+
+        # Not connected within `max_hops`.
+        return None
+
+    def query(self, patterns, str graph_id=None, int limit=0, bint resolve=True,
+              int batch_size=500):
+        if graph_id is None:
+            graph_id = self._graph_id
+
+        # (label, schema) pairs name constant vertices.
+        cdef list resolved = []
+        for pattern in patterns:
+            pattern = list(pattern)
+            for i in (0, 2):
+                if isinstance(pattern[i], tuple):
+                    pattern[i] = self.get(pattern[i])
+                    if pattern[i] is None:
+                        # Unknown vertex: nothing can match.
+                        return iter(())
+            resolved.append(pattern)
+
+        # Validated upfront, so malformed patterns raise here & not on first `next`.
+        query = Pattern(resolved)
+        return self._solve(query, graph_id, limit, resolve)
+
+    def snapshot(self, bint payloads=False):
+        vertices = [(v.id, v.label, v.schema, json.dumps(v.payload)) if payloads
+                    else (v.id, v.label, v.schema) for v in self.vertices]
+        edges = [(e.source_id, e.vertex_id, e.predicate)
+                 for v in self.vertices for e in v.edges]
+        from sage.core.snapshot import GraphSnapshot
+        return GraphSnapshot.from_edges(vertices, edges)
+
+    ####################################################################################
+    # Helpers.
+    ####################################################################################
+
+    def _triple(self, edge):
+        # (source, predicate, target) in the edge's stored direction.
+        return self._vertices[edge.source_id], edge.predicate, self._vertices[edge.vertex_id]
+
+    def _solve(self, query, str graph_id, int limit, bint resolve):
+        # Joins the planned atoms one at a time, depth first, so matches
+        # stream out without materializing intermediate results.
+        cdef list atoms = query.plan()
+        cdef list names = [name[1:] for name in query.variables]
+        cdef list kinds = list(query.variables.values())
+        cdef int count = 0
+
+        def solve(int i, dict binding):
+            if i == len(atoms):
+                yield binding
+                return
+            for extended in self._match_atom(atoms[i], binding, graph_id):
+                yield from solve(i + 1, extended)
+
+        for binding in solve(0, {}):
+            values = [binding[v] for v in query.variables]
+            if resolve:
+                values = [self._vertices[value] if kind == 'vertex' else value
+                          for value, kind in zip(values, kinds)]
+            yield dict(zip(names, values))
+            count += 1
+            if 0 < limit <= count:
+                return
+
+    def _match_atom(self, tuple atom, dict binding, str graph_id):
+        kind = atom[0]
+        if kind == 'vertex':
+            vertex_id = _value(atom[1], binding)
+            if vertex_id is None:
+                candidates = [v for v in list(self._vertices.values())
+                              if v.graph_id == graph_id]
+            else:
+                vertex = self._vertices.get(vertex_id)
+                candidates = [] if vertex is None or vertex.graph_id != graph_id else [vertex]
+            for vertex in candidates:
+                extended = _bind(binding, atom[1], vertex.id)
+                for schema in atom[2]:
+                    if extended is None:
+                        break
+                    extended = _bind(extended, schema, vertex.schema)
+                if extended is not None:
+                    yield extended
+
+        elif kind == 'edge':
+            _, subject, predicate, obj = atom
+            source, target = _value(subject, binding), _value(obj, binding)
+            if source is not None:
+                edges = self._vertices[source].edges if source in self._vertices else []
+            elif target is not None:
+                edges = self._vertices[target].in_edges if target in self._vertices else []
+            else:
+                edges = [e for v in list(self._vertices.values()) for e in v.edges]
+            for edge in edges:
+                extended = _bind(binding, subject, edge.source_id)
+                if extended is not None:
+                    extended = _bind(extended, predicate, edge.predicate)
+                if extended is not None:
+                    extended = _bind(extended, obj, edge.vertex_id)
+                if extended is not None:
+                    yield extended
+
+        else:
+            _, subject, key, literal = atom
+            vertex_id, name = _value(subject, binding), _value(key, binding)
+            if vertex_id is not None:
+                vertex = self._vertices.get(vertex_id)
+                candidates = [] if vertex is None else [vertex]
+            else:
+                candidates = list(self._vertices.values())
+            for vertex in candidates:
+                if name is not None:
+                    items = [(name, vertex.payload[name])] if name in vertex.payload else []
+                else:
+                    items = list(vertex.payload.items())
+                for k, v in items:
+                    if _matches(v, literal):
+                        extended = _bind(binding, subject, vertex.id)
+                        if extended is not None:
+                            extended = _bind(extended, key, k)
+                        if extended is not None:
+                            yield extended
+
+
+class _Stats:
+    # Same statistics as `BulkLoader.stats`.
+
+    def __init__(self, kg):
+        self.kg = kg
+        self.stats = None
+
+    def edges(self):
+        return sum(len(vertex.edges) for vertex in self.kg._vertices.values())
+
+    def __enter__(self):
+        self._vertices = len(self.kg._vertices)
+        self._edges = self.edges()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        cdef double elapsed = time.perf_counter() - self._start
+        cdef int n_vertices = len(self.kg._vertices) - self._vertices
+        self.stats = {
+            'vertices': n_vertices,
+            'edges': self.edges() - self._edges,
+            'seconds': elapsed,
+            'vertices_per_sec': n_vertices / elapsed if elapsed > 0 else 0.0,
+        }
+
+
+cdef _check_direction(str direction):
+    if direction not in ('out', 'in', 'both'):
+        raise ValueError(f"Expected direction to be one of 'out', 'in' or 'both', "
+                         f"got {direction!r}.")
+
+
+cdef _predicates(predicate):
+    # None (any predicate) or a set of accepted predicates.
+    if predicate is None:
+        return None
+    return {predicate} if isinstance(predicate, str) else set(predicate)
+
+
+def _incident(vertex, str direction):
+    # (edge, id of its other end) in creation order.
+    if direction == 'out':
+        return [(edge, edge.vertex_id) for edge in vertex.edges]
+    elif direction == 'in':
+        return [(edge, edge.source_id) for edge in vertex.in_edges]
+    # Both lists are sorted by edge id. Self-loops are listed once.
+    merged = heapq.merge(vertex.edges, [e for e in vertex.in_edges
+                                        if e.source_id != e.vertex_id],
+                         key=lambda edge: edge.id)
+    return [(edge, edge.vertex_id if edge.source_id == vertex.id else edge.source_id)
+            for edge in merged]
+
+
+cdef _value(term, dict binding):
+    # Value of a constant or bound variable, None if unbound.
+    if is_variable(term):
+        return binding.get(term)
+    return getattr(term, 'id', term)
+
+
+cdef _bind(dict binding, term, value):
+    # `binding` extended with `term = value`, or None if they disagree.
+    if not is_variable(term):
+        return binding if getattr(term, 'id', term) == value else None
+    bound = binding.get(term)
+    if bound is None:
+        extended = dict(binding)
+        extended[term] = value
+        return extended
+    return binding if bound == value else None
+
+
+cdef _check_literal(value):
+    if not isinstance(value, (str, int, float, bool)):
+        raise TypeError(f'Expected str, int, float or bool property value, '
+                        f'got {type(value)}')
+
+
+cdef bint _matches(stored, wanted):
+    # Typed comparison, as in the property table: booleans aren't numbers.
+    _check_literal(wanted)
+    if isinstance(stored, list):
+        # Repeated literals, each one indexed in the property table.
+        return any(_matches(item, wanted) for item in stored)
+    if isinstance(wanted, bool) or isinstance(stored, bool):
+        return isinstance(wanted, bool) and isinstance(stored, bool) and stored == wanted
+    elif isinstance(wanted, (int, float)):
+        return isinstance(stored, (int, float)) and stored == wanted
+    return isinstance(stored, str) and stored == wanted
@@ -0,0 +1,200 @@
+"""Basic graph pattern (BGP) queries compiled to a single SQL join.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: query.pyx
+     Created on 18 October, 2026 @ 05:40 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+
+__all__ = [
+    'Pattern', 'is_variable',
+]
+
+# Predicate matching a vertex's schema instead of an edge.
+TYPE = '@type'
+
+# Heuristic cost of scanning each kind of table, before & after some of its
+# columns are bound by earlier joins (see `_cost`).
+_UNBOUND_VERTEX = 1e6
+_UNBOUND_EDGE = 1e5
+
+
+cpdef bint is_variable(term):
+    return isinstance(term, str) and term.startswith('?') and len(term) > 1
+
+
+class Pattern:
+    """Conjunction of (subject, predicate, object) triple patterns.
+
+    Terms starting with "?" are variables. Subjects are vertex variables or
+    constant vertex ids. Objects are vertex variables, constant vertices
+    (given as `Vertex` objects) or literals, which match primitive payload
+    values through the property table. The "@type" predicate matches a
+    vertex's schema, its object is a schema name or a string variable.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = [tuple(pattern) for pattern in patterns]
+        if not self.patterns:
+            raise ValueError('Expected at least one triple pattern.')
+
+        # Variable name -> "vertex" or "string", in order of appearance.
+        self.variables = {}
+        for pattern in self.patterns:
+            if len(pattern) != 3:
+                raise ValueError(f'Expected (subject, predicate, object) patterns, got {pattern!r}')
+            subject, predicate, obj = pattern
+            if not is_variable(subject) and not isinstance(subject, str) \
+                    and not hasattr(subject, 'id'):
+                raise TypeError(f'Expected a variable, vertex or vertex id subject, '
+                                f'got {subject!r}')
+            if not isinstance(predicate, str):
+                raise TypeError(f'Expected a str predicate, got {predicate!r}')
+
+            self._declare(subject, 'vertex')
+            self._declare(predicate, 'string')
+            if predicate == TYPE or not is_variable(obj):
+                self._declare(obj, 'string')
+            else:
+                self._declare(obj, 'vertex')
+
+    def __repr__(self):
+        return f'Pattern({self.patterns!r})'
+
+    def compile(self, str graph_id, int limit=0):
+        """SQL selecting every variable, with joins ordered by estimated cost.
+
+        Returns:
+            Tuple[str, Dict[str, Any]] - SQL & its bound parameters.
+        """
+        cdef dict params = {'graph_id': graph_id}
+        # Variable -> SQL expression of its value, from the first table binding it.
+        cdef dict columns = {}
+        cdef list tables = [], conditions = []
+
+        def param(value):
+            name = f'p{len(params)}'
+            params[name] = value
+            return f':{name}'
+
+        def term(value, str column):
+            # Condition tying `column` to a constant or (possibly bound) variable.
+            if not is_variable(value):
+                conditions.append(f'{column} = {param(getattr(value, "id", value))}')
+            elif value in columns:
+                conditions.append(f'{column} = {columns[value]}')
+            else:
+                columns[value] = column
+
+        for atom in self.plan():
+            kind, alias = atom[0], f't{len(tables)}'
+
+            if kind == 'vertex':
+                tables.append(f'vertex AS {alias}')
+                term(atom[1], f'{alias}.id')
+                conditions.append(f'{alias}.graph_id = :graph_id')
+                for schema in atom[2]:
+                    term(schema, f'{alias}.schema')
+            elif kind == 'edge':
+                _, subject, predicate, obj = atom
+                tables.append(f'edge AS {alias}')
+                term(subject, f'{alias}.source_id')
+                term(predicate, f'{alias}.predicate')
+                term(obj, f'{alias}.vertex_id')
+            else:
+                _, subject, key, value = atom
+                tables.append(f'property AS {alias}')
+                term(subject, f'{alias}.vertex_id')
+                term(key, f'{alias}.key')
+                conditions.append(_literal(value, alias, param))
+
+        # CROSS JOIN keeps SQLite from re-ordering the planned joins.
+        cdef str select = ', '.join(f'{columns[v]} AS v{i}' for i, v in enumerate(self.variables))
+        cdef str sql = (f'SELECT {select} FROM {" CROSS JOIN ".join(tables)} '
+                        f'WHERE {" AND ".join(conditions)}')
+        if limit > 0:
+            sql += f' LIMIT {limit:d}'
+        return sql, params
+
+    def plan(self):
+        """Atoms in join order, as `compile` emits them."""
+        cdef list atoms = self._atoms(), order = []
+        cdef set bound = set()
+        while atoms:
+            # Cheapest atom given what's bound so far. Ties keep pattern order.
+            atom = min(atoms, key=lambda a: _cost(a, bound))
+            atoms.remove(atom)
+            order.append(atom)
+            bound.update(t for t in atom[1:] if is_variable(t))
+        return order
+
+    def _atoms(self):
+        # ('vertex', var, schemas) per vertex variable, plus one
+        # ('edge', s, p, o) or ('property', s, key, literal) per pattern.
+        cdef dict schemas = {v: [] for v, kind in self.variables.items() if kind == 'vertex'}
+        cdef list atoms = []
+        for subject, predicate, obj in self.patterns:
+            if predicate == TYPE and is_variable(subject):
+                schemas[subject].append(obj)
+            elif predicate == TYPE:
+                # Constant subject: check its schema with a one-row vertex lookup.
+                atoms.append(('vertex', subject, [obj]))
+            elif is_variable(obj) or hasattr(obj, 'id'):
+                atoms.append(('edge', subject, predicate, obj))
+            else:
+                atoms.append(('property', subject, predicate, obj))
+        return [('vertex', v, s) for v, s in schemas.items()] + atoms
+
+    def _declare(self, term, str kind):
+        if not is_variable(term):
+            return
+        previous = self.variables.setdefault(term, kind)
+        if previous != kind:
+            raise ValueError(f'{term} is used both as a {previous} & a {kind}.')
+
+
+cdef double _cost(tuple atom, set bound):
+    # Rough number of rows each atom adds per row joined so far: constants &
+    # bound variables hit an index, anything else scans.
+    kind = atom[0]
+    if kind == 'vertex':
+        if not is_variable(atom[1]) or atom[1] in bound:
+            return 1
+        # Schema filters aren't indexed but do cut the rows passed on.
+        return _UNBOUND_VERTEX / (10 if atom[2] else 1)
+
+    subject, predicate, obj = atom[1:]
+    fixed_subject = not is_variable(subject) or subject in bound
+    fixed_predicate = not is_variable(predicate) or predicate in bound
+    if kind == 'property':
+        # Indexed on (key, value) & vertex_id.
+        return 1 if fixed_subject else (10 if fixed_predicate else _UNBOUND_EDGE)
+
+    fixed_object = not is_variable(obj) or obj in bound
+    if fixed_subject and fixed_object:
+        return 1
+    elif fixed_subject or fixed_object:
+        # Out- or in-edges of one vertex.
+        return 10 if fixed_predicate else 50
+    return _UNBOUND_EDGE / 100 if fixed_predicate else _UNBOUND_EDGE
+
+
+cdef str _literal(value, str alias, param):
+    # Match a primitive payload value against its typed property column.
+    if isinstance(value, bool):
+        return f"{alias}.kind = 'bool' AND {alias}.value_number = {param(int(value))}"
+    elif isinstance(value, (int, float)):
+        return f"{alias}.kind = 'number' AND {alias}.value_number = {param(value)}"
+    elif isinstance(value, str):
+        return f'{alias}.value_text = {param(value)}'
+    raise TypeError(f'Expected str, int, float or bool property value, '
+                    f'got {type(value)}')
@@ -0,0 +1,583 @@
+"""Streaming readers for Linked Data files.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: reader.pyx
+     Created on 18 October, 2026 @ 11:05 AM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+# Built-in libraries.
+import io
+import re
+import gzip
+import json
+import secrets
+from urllib.parse import urljoin
+from xml.etree.ElementTree import iterparse, tostring
+
+__all__ = [
+    'Literal', 'local_name', 'add_literal',
+    'iter_jsonld', 'iter_ntriples', 'iter_rdfxml',
+]
+
+# Shared JSON decoder & whitespace pattern.
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# XML Schema datatypes converted to Python primitives.
+XSD = 'http://www.w3.org/2001/XMLSchema#'
+_XSD_TYPES = {
+    **{XSD + t: int for t in ('integer', 'int', 'long', 'short', 'byte',
+                              'nonNegativeInteger', 'nonPositiveInteger',
+                              'positiveInteger', 'negativeInteger',
+                              'unsignedLong', 'unsignedInt',
+                              'unsignedShort', 'unsignedByte')},
+    **{XSD + t: float for t in ('decimal', 'double', 'float')},
+    XSD + 'boolean': lambda v: {'true': True, '1': True,
+                                'false': False, '0': False}[v],
+}
+
+
+class Literal(str):
+    """String literal, as opposed to an IRI or blank node."""
+    __slots__ = ()
+
+    def __repr__(self):
+        return f'Literal({str.__repr__(self)})'
+
+
+cpdef str local_name(str iri):
+    """Last segment of an IRI, e.g. "name" for "http://schema.org/name"."""
+    cdef Py_ssize_t i = max(iri.rfind('#'), iri.rfind('/'), iri.rfind(':'))
+    if 0 <= i < len(iri) - 1:
+        return iri[i + 1:]
+    return iri
+
+
+cpdef object literal(str value, str datatype=None):
+    """Convert a lexical value to a Python primitive based on its datatype."""
+    convert = _XSD_TYPES.get(datatype)
+    if convert is not None:
+        try:
+            return convert(value.strip())
+        except (KeyError, ValueError):
+            pass
+    return Literal(value)
+
+
+cpdef void add_literal(dict payload, str key, value):
+    """Add a value to `payload[key]`, keeping repeated ones as a list."""
+    if key not in payload:
+        payload[key] = value
+        return
+
+    current = payload[key]
+    if isinstance(current, list):
+        for item in current:
+            if _same_literal(item, value):
+                return
+        current.append(value)
+    elif not _same_literal(current, value):
+        payload[key] = [current, value]
+
+
+cdef bint _same_literal(a, b):
+    # Typed comparison, as in the property table: booleans aren't numbers.
+    return (a == b and isinstance(a, bool) == isinstance(b, bool)
+            and isinstance(a, str) == isinstance(b, str))
+
+
+################################################################################################
+# +--------------------------------------------------------------------------------------------+
+# | JSON-LD: `@graph` arrays, top-level arrays & JSON-Lines.
+# +--------------------------------------------------------------------------------------------+
+################################################################################################
+def iter_jsonld(source, int chunk_size=65536):
+    """Incrementally read JSON-LD items from a file.
+
+    Top-level arrays & `@graph` arrays are yielded one item at a time,
+    and so are consecutive top-level values (JSON-Lines). Only the item
+    being decoded is held in memory.
+
+    Args:
+        source (Union[str, IO]): Path to a (optionally gzipped) file, or
+            an open text/binary file object.
+        chunk_size (int, optional): Defaults to 65536. Number of
+            characters read at a time.
+
+    Raises:
+        ValueError: Malformed JSON.
+
+    Yields:
+        Union[Dict[str, Any], List[Any]] - Top-level JSON-LD items.
+    """
+    f, should_close = _open_text(source)
+    try:
+        stream = _JSONStream(f, chunk_size)
+        while True:
+            c = stream.peek()
+            if not c:
+                break
+            elif c == '[':
+                yield from _iter_array(stream)
+            elif c == '{':
+                yield from _iter_object(stream)
+            else:
+                raise ValueError(f'Expected an object or array, got {c!r} '
+                                 f'at position {stream.offset}.')
+    finally:
+        _close_text(f, source, should_close)
+
+
+def _iter_array(stream):
+    stream.expect('[')
+    if stream.peek() == ']':
+        stream.pos += 1
+        return
+
+    while True:
+        yield stream.value()
+        if stream.peek() == ',':
+            stream.pos += 1
+        else:
+            stream.expect(']')
+            return
+
+
+def _iter_object(stream):
+    cdef dict node = {}
+    cdef bint has_graph = False
+
+    stream.expect('{')
+    if stream.peek() == '}':
+        stream.pos += 1
+    else:
+        while True:
+            key = stream.value()
+            stream.expect(':')
+            if key == '@graph' and stream.peek() == '[':
+                # Named graph: stream its nodes instead of building the list.
+                has_graph = True
+                yield from _iter_array(stream)
+            else:
+                node[key] = stream.value()
+
+            if stream.peek() == ',':
+                stream.pos += 1
+            else:
+                stream.expect('}')
+                break
+
+    # The `@graph` container is only a node if it has properties of its own.
+    if not has_graph or any(not k.startswith('@') for k in node):
+        yield node
+
+
+class _JSONStream:
+    """Text buffer which decodes one JSON value at a time."""
+
+    def __init__(self, f, int chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        # Characters discarded from the front of the buffer.
+        self.consumed = 0
+        self.eof = False
+
+    @property
+    def offset(self):
+        return self.consumed + self.pos
+
+    def fill(self, int size=0):
+        data = self.f.read(max(size, self.chunk_size))
+        if not data:
+            self.eof = True
+            return False
+
+        # Drop what has already been decoded.
+        self.consumed += self.pos
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self):
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, str char):
+        cdef str c = self.peek()
+        if c != char:
+            raise ValueError(f'Expected {char!r}, got {c or "EOF"!r} '
+                             f'at position {self.offset}.')
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+                # A value ending at the end of the buffer may be truncated (e.g. numbers).
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise ValueError(f'Invalid JSON at position '
+                                     f'{self.consumed + e.pos}: {e.msg}.') from e
+
+            # Incomplete value. Grow the buffer geometrically.
+            self.fill(len(self.buf) - self.pos)
+
+
+################################################################################################
+# +--------------------------------------------------------------------------------------------+
+# | N-Triples: one `<subject> <predicate> object .` statement per line.
+# +--------------------------------------------------------------------------------------------+
+################################################################################################
+_IRI = r'<([^>]*)>'
+_BNODE = r'(_:[^\s]*[^\s.])'
+_LITERAL = r'"((?:[^"\\]|\\.)*)"(?:\^\^<([^>]*)>|@([a-zA-Z]+(?:-[a-zA-Z0-9]+)*))?'
+_TRIPLE = re.compile(rf'[ \t]*(?:{_IRI}|{_BNODE})[ \t]*{_IRI}[ \t]*'
+                     rf'(?:{_IRI}|{_BNODE}|{_LITERAL})[ \t]*\.[ \t]*(?:#.*)?\s*$')
+_ESCAPE = re.compile(r'\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))')
+_ESCAPES = {'t': '\t', 'b': '\b', 'n': '\n', 'r': '\r', 'f': '\f',
+            '"': '"', "'": "'", '\\': '\\'}
+
+
+def iter_ntriples(source, bint strict=True):
+    """Incrementally read triples from an N-Triples file.
+
+    IRIs & blank nodes are returned as `str` (blank nodes keep their `_:`
+    prefix). Literals are converted to `int`, `float` or `bool` for numeric &
+    boolean XML Schema datatypes, otherwise they're returned as `Literal`.
+
+    Args:
+        source (Union[str, IO]): Path to a (optionally gzipped) file, or
+            an open text/binary file object.
+        strict (bool, optional): Defaults to True. Raise on malformed lines,
+            otherwise they're skipped.
+
+    Raises:
+        ValueError: Malformed line when `strict=True`.
+
+    Yields:
+        Tuple[str, str, Union[str, Literal, int, float, bool]] - Subject,
+            predicate & object.
+    """
+    cdef str line
+    cdef Py_ssize_t line_no = 0
+
+    match = _TRIPLE.match
+    f, should_close = _open_text(source)
+    try:
+        for line in f:
+            line_no += 1
+            m = match(line)
+            if m is None:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                if strict:
+                    raise ValueError(f'Invalid N-Triples statement on line {line_no}: {line}')
+                continue
+
+            s_iri, s_bnode, p, o_iri, o_bnode, value, datatype, _ = m.groups()
+            if value is not None:
+                obj = literal(_unescape(value), datatype)
+            elif o_iri is not None:
+                obj = _unescape(o_iri)
+            else:
+                obj = o_bnode
+
+            yield (_unescape(s_iri) if s_iri is not None else s_bnode), _unescape(p), obj
+    finally:
+        _close_text(f, source, should_close)
+
+
+cdef str _unescape(str value):
+    if '\\' not in value:
+        return value
+    return _ESCAPE.sub(_replace_escape, value)
+
+
+def _replace_escape(m):
+    if m.group(3) is not None:
+        return _ESCAPES.get(m.group(3), m.group(0))
+    return chr(int(m.group(1) or m.group(2), 16))
+
+
+################################################################################################
+# +--------------------------------------------------------------------------------------------+
+# | RDF/XML: node & property elements, walked with an incremental parser.
+# +--------------------------------------------------------------------------------------------+
+################################################################################################
+RDF = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#'
+_XML = '{http://www.w3.org/XML/1998/namespace}'
+
+# Syntax attributes which aren't property attributes.
+_SYNTAX_ATTRS = frozenset(RDF + a for a in ('about', 'ID', 'nodeID', 'resource',
+                                            'parseType', 'datatype', 'bagID', 'aboutEach'))
+
+# Element kinds on the parser stack.
+cdef enum:
+    _ROOT = 0         # rdf:RDF
+    _NODE = 1         # Node element, or property element with rdf:parseType="Resource".
+    _PROPERTY = 2     # Property element whose object isn't known yet.
+    _RESOURCE = 3     # Property element with rdf:resource, rdf:nodeID or property attributes.
+    _COLLECTION = 4   # Property element with rdf:parseType="Collection".
+    _XML_LITERAL = 5  # Property element with rdf:parseType="Literal".
+    _XML_CONTENT = 6  # Element inside an XML literal.
+
+
+class _Frame:
+    __slots__ = ('kind', 'elem', 'base', 'subject', 'predicate', 'obj', 'datatype', 'items', 'li')
+
+    def __init__(self, int kind, elem, str base, str subject=None, str predicate=None):
+        self.kind = kind
+        self.elem = elem
+        self.base = base
+        self.subject = subject
+        self.predicate = predicate
+        self.obj = None
+        self.datatype = None
+        self.items = None
+        self.li = 0
+
+
+def iter_rdfxml(source, str base=None):
+    """Incrementally read triples from an RDF/XML file.
+
+    The document is walked with `xml.etree.ElementTree.iterparse` & elements
+    are cleared as soon as their triples have been emitted, so memory doesn't
+    grow with the size of the file. Objects are returned as for `iter_ntriples`.
+
+    Args:
+        source (Union[str, IO]): Path to a (optionally gzipped) file, or
+            an open file object.
+        base (str, optional): Defaults to None. Base IRI used to resolve
+            relative IRIs when the document has no `xml:base`.
+
+    Raises:
+        ValueError: Malformed XML.
+
+    Yields:
+        Tuple[str, str, Union[str, Literal, int, float, bool]] - Subject,
+            predicate & object.
+    """
+    cdef list stack = []
+    cdef str tag, subject, predicate, parse_type
+    # Blank node prefix, so anonymous nodes of different files don't collide.
+    cdef str bnode_prefix = f'_:{secrets.token_hex(4)}b'
+    cdef Py_ssize_t n_bnodes = 0
+
+    f, should_close = _open_binary(source)
+    try:
+        for event, elem in iterparse(f, events=('start', 'end')):
+            tag = _iri(elem.tag)
+
+            if event == 'start':
+                parent = stack[-1] if stack else None
+                frame_base = elem.get(_XML + 'base')
+                if frame_base is not None:
+                    frame_base = _resolve(frame_base, parent.base if parent else base)
+                else:
+                    frame_base = parent.base if parent else base
+
+                if parent is None and tag == RDF + 'RDF':
+                    stack.append(_Frame(_ROOT, elem, frame_base))
+
+                elif parent is not None and parent.kind in (_XML_LITERAL, _XML_CONTENT):
+                    # Kept as is & serialized when the literal ends.
+                    stack.append(_Frame(_XML_CONTENT, elem, frame_base))
+
+                elif parent is None or parent.kind in (_ROOT, _PROPERTY, _COLLECTION):
+                    # Node element.
+                    subject = _node_subject(elem, frame_base)
+                    if subject is None:
+                        n_bnodes += 1
+                        subject = f'{bnode_prefix}{n_bnodes}'
+
+                    if parent is not None and parent.kind == _PROPERTY:
+                        parent.obj = subject
+                        yield parent.subject, parent.predicate, subject
+                    elif parent is not None and parent.kind == _COLLECTION:
+                        parent.items.append(subject)
+
+                    if tag != RDF + 'Description':
+                        yield subject, RDF + 'type', tag
+                    yield from _property_attrs(elem, subject, frame_base)
+                    stack.append(_Frame(_NODE, elem, frame_base, subject))
+
+                elif parent.kind == _NODE:
+                    # Property element.
+                    predicate = tag
+                    if predicate == RDF + 'li':
+                        parent.li += 1
+                        predicate = f'{RDF}_{parent.li}'
+                    frame = _Frame(_PROPERTY, elem, frame_base, parent.subject, predicate)
+                    parse_type = _attr(elem, 'parseType')
+
+                    if parse_type == 'Resource':
+                        n_bnodes += 1
+                        frame.kind, frame.subject = _NODE, f'{bnode_prefix}{n_bnodes}'
+                        yield parent.subject, predicate, frame.subject
+                    elif parse_type == 'Collection':
+                        frame.kind, frame.items = _COLLECTION, []
+                    elif parse_type is not None:
+                        frame.kind = _XML_LITERAL
+                    elif (_attr(elem, 'resource') is not None
+                          or _attr(elem, 'nodeID') is not None
+                          or _has_property_attrs(elem)):
+                        frame.kind = _RESOURCE
+                        frame.obj = _node_subject(elem, frame_base, attr='resource')
+                        if frame.obj is None:
+                            n_bnodes += 1
+                            frame.obj = f'{bnode_prefix}{n_bnodes}'
+                        yield parent.subject, predicate, frame.obj
+                        yield from _property_attrs(elem, frame.obj, frame_base)
+                    else:
+                        frame.datatype = _attr(elem, 'datatype')
+                    stack.append(frame)
+
+                else:
+                    raise ValueError(f'Unexpected element {elem.tag!r} in RDF/XML.')
+
+            else:
+                frame = stack.pop()
+                if frame.kind == _XML_CONTENT:
+                    continue
+
+                if frame.kind == _PROPERTY and frame.obj is None:
+                    yield frame.subject, frame.predicate, literal(elem.text or '', frame.datatype)
+
+                elif frame.kind == _XML_LITERAL:
+                    value = (elem.text or '') + ''.join(tostring(child, encoding='unicode')
+                                                        for child in elem)
+                    yield frame.subject, frame.predicate, Literal(value)
+
+                elif frame.kind == _COLLECTION:
+                    # rdf:first/rdf:rest list of the collected nodes.
+                    node = RDF + 'nil'
+                    for item in reversed(frame.items):
+                        n_bnodes += 1
+                        cell = f'{bnode_prefix}{n_bnodes}'
+                        yield cell, RDF + 'first', item
+                        yield cell, RDF + 'rest', node
+                        node = cell
+                    yield frame.subject, frame.predicate, node
+
+                # Processed: free the element & what it holds.
+                elem.clear()
+                if stack and stack[-1].kind == _ROOT:
+                    stack[-1].elem.clear()
+    except SyntaxError as e:
+        # `xml.etree.ElementTree.ParseError`.
+        raise ValueError(f'Invalid RDF/XML: {e}') from e
+    finally:
+        if should_close:
+            f.close()
+
+
+cdef str _iri(str name):
+    # "{namespace}local" -> "namespacelocal".
+    if name[0] == '{':
+        return name[1:].replace('}', '', 1)
+    return name
+
+
+cdef object _attr(elem, str name):
+    # RDF syntax attribute, qualified or not.
+    value = elem.get(f'{{{RDF}}}{name}')
+    return value if value is not None else elem.get(name)
+
+
+cdef str _resolve(str iri, str base):
+    return urljoin(base, iri) if base else iri
+
+
+cdef object _node_subject(elem, str base, str attr='about'):
+    value = _attr(elem, attr)
+    if value is not None:
+        return _resolve(value, base)
+
+    value = _attr(elem, 'nodeID')
+    if value is not None:
+        return f'_:{value}'
+
+    value = _attr(elem, 'ID')
+    if value is not None and attr == 'about':
+        return _resolve(f'#{value}', base)
+    return None
+
+
+cdef bint _is_property_attr(str name):
+    return not name.startswith(_XML) and _iri(name) not in _SYNTAX_ATTRS \
+        and name not in ('about', 'ID', 'nodeID', 'resource', 'parseType', 'datatype')
+
+
+cdef bint _has_property_attrs(elem):
+    for name in elem.keys():
+        if _is_property_attr(name):
+            return True
+    return False
+
+
+def _property_attrs(elem, str subject, str base):
+    cdef str name, predicate
+    for name, value in elem.items():
+        if not _is_property_attr(name):
+            continue
+        predicate = _iri(name)
+        if predicate == RDF + 'type' or name == 'type':
+            yield subject, RDF + 'type', _resolve(value, base)
+        else:
+            yield subject, predicate, Literal(value)
+
+
+################################################################################################
+# +--------------------------------------------------------------------------------------------+
+# | Private functions.
+# +--------------------------------------------------------------------------------------------+
+################################################################################################
+def _open_text(source, str encoding='utf-8'):
+    # Returns a text file object & whether it should be closed by the caller.
+    if isinstance(source, str):
+        if source.endswith('.gz'):
+            return gzip.open(source, mode='rt', encoding=encoding), True
+        return open(source, mode='r', encoding=encoding), True
+
+    if isinstance(source, io.TextIOBase):
+        return source, False
+
+    # Binary file object, e.g. an archive member.
+    return io.TextIOWrapper(source, encoding=encoding), False
+
+
+def _open_binary(source):
+    # Returns a file object for XML parsing & whether it should be closed by the caller.
+    if isinstance(source, str):
+        if source.endswith('.gz'):
+            return gzip.open(source, mode='rb'), True
+        return open(source, mode='rb'), True
+    return source, False
+
+
+def _close_text(f, source, bint should_close):
+    if should_close:
+        f.close()
+    elif f is not source:
+        # Leave the caller's binary file open.
+        f.detach()
@@ -19,15 +19,16 @@ import json
 import secrets
 
 # Third-party libraries.
-from sqlalchemy import Column, ForeignKey, Integer, String, Text
+from sqlalchemy import DDL, Column, Float, ForeignKey, Index, Integer, String, Text, event
 from sqlalchemy.sql import operators
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import object_session, relationship
 from sqlalchemy.types import TypeDecorator, VARCHAR
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.ext.declarative import declarative_base
 
 __all__ = [
-    'Edge', 'Vertex', 'Graph'
+    'Edge', 'Vertex', 'Graph', 'Property',
+    'reset_neighbor_index',
 ]
 
 BaseSchema = declarative_base()
@@ -35,6 +36,8 @@ BaseSchema = declarative_base()
 
 class JSONEncodedDict(TypeDecorator):
     impl = VARCHAR
+    # Stateless, so statements using it can be compiled once & cached.
+    cache_ok = True
 
     def coerce_compared_value(self, op, value):
         if op in (operators.like_op, operators.notlike_op):
@@ -71,16 +74,30 @@ class Connection(BaseSchema):
 
 class Edge(BaseSchema):
     __tablename__ = 'edge'
+    __table_args__ = (
+        # At most one edge per (source, target, predicate).
+        Index('ix_edge_source_target_predicate', 'source_id', 'vertex_id', 'predicate',
+              unique=True),
+        # Incoming edges of a vertex.
+        Index('ix_edge_vertex_id', 'vertex_id'),
+        # Edges with a given predicate, for triple pattern queries.
+        Index('ix_edge_predicate', 'predicate'),
+    )
+
     id = Column(Integer, primary_key=True)
     # Vertex which the edge is connected to.
     vertex_id = Column(String(8), ForeignKey('vertex.id'))
     predicate = Column(String(256))
+    # Source vertex, denormalized from `connection` so edges can be looked up
+    # (and kept unique) without going through the secondary table.
+    source_id = Column(String(8), ForeignKey('vertex.id'))
     # Source Vertex (`vertex`) is connected to `vertex_id`.
     vertex = relationship('Vertex', uselist=False, secondary='connection')
 
-    def __init__(self, str vertex_id, str predicate):
+    def __init__(self, str vertex_id, str predicate, str source_id=None):
         self.vertex_id = vertex_id
         self.predicate = predicate
+        self.source_id = source_id
 
     def __repr__(self):
         return f'<Edge({self.vertex_id}, {self.predicate})>'
@@ -91,6 +108,12 @@ class Edge(BaseSchema):
 
 class Vertex(BaseSchema):
     __tablename__ = 'vertex'
+    __table_args__ = (
+        # Vertex lookup by label & schema. Also backs `add_vertex` upsert.
+        Index('ix_vertex_graph_label_schema', 'graph_id', 'label', 'schema',
+              unique=True),
+        Index('ix_vertex_label', 'label'),
+    )
 
     # Unique ID.
     id = Column(String(8), primary_key=True, unique=True,
@@ -107,6 +130,8 @@ class Vertex(BaseSchema):
     graph_id = Column(String(8), ForeignKey('graph.id'))
 
     def __init__(self, str label = None, str schema = None, str graph_id=None, dict payload=None):
+        # Assigned upfront so edges can reference the vertex before it's flushed.
+        self.id = secrets.token_hex(8)
         self.label = label  # Key: name
         self.schema = schema  # Key: @type
         self.graph_id = graph_id  # Graph which vertex belongs to.
@@ -147,12 +172,30 @@ class Vertex(BaseSchema):
         Returns:
             Edge - Edge object containing connection details.
         """
-        for edge in self.edges:
-            if edge.vertex_id == nbr.id:
+        cdef dict index = self._neighbor_index()
+        cdef tuple key = (nbr.id, predicate)
+        if key in index:
+            edge = self._find_edge(nbr.id, predicate)
+            if edge is not None:
                 return edge
+            # Index outlived the edge (e.g. written by another session): rebuild it.
+            self.__dict__.pop('_neighbors', None)
+            index = self._neighbor_index()
+            if key in index:
+                return self._find_edge(nbr.id, predicate)
+
         # Edge not found. Create new edge.
-        edge = Edge(nbr.id, predicate=predicate)
-        self.edges.append(edge)
+        edge = Edge(nbr.id, predicate=predicate, source_id=self.id)
+        sess = object_session(self)
+        if sess is None or 'edges' in self.__dict__:
+            self.edges.append(edge)
+        else:
+            # Write the connection without loading every edge of `self`.
+            edge.vertex = self
+            sess.add(edge)
+
+        index[key] = True
+        index.setdefault(nbr.id, predicate)
         return edge
 
     def add_payload(self, payload):
@@ -161,21 +204,189 @@ class Vertex(BaseSchema):
             if not k.startswith('@') and isinstance(v, (int, float, str, bool)):
                 self.payload[k] = v
 
-    def get_connection(self, nbr):
+    def get_connection(self, nbr, predicate=None):
         """Retrieve immediate connection to target vertex.
 
         Args:
             nbr (Vertex):
+            predicate (str): Defaults to None. Connection with this predicate,
+                otherwise the first connection to `nbr`.
 
         Returns:
             Union[Edge, None] - Containing details about their connection.
         """
-        for edge in self.edges:
-            if edge.vertex_id == nbr.id:
-                return edge
+        cdef dict index = self._neighbor_index()
+        if predicate is None:
+            if nbr.id not in index:
+                # No connection.
+                return None
+            predicate = index[nbr.id]
+        elif (nbr.id, predicate) not in index:
+            return None
+
+        return self._find_edge(nbr.id, predicate)
+
+    def _neighbor_index(self):
+        # Holds `(target id, predicate)` keys & `target id -> first predicate`.
+        # Plain attribute, so it survives the session expiring `edges` on commit
+        # & is only built once per instance. Edges themselves aren't referenced,
+        # so committing doesn't have to expire every edge of a hub. Rollbacks &
+        # bulk writes drop it (see `reset_neighbor_index`).
+        index = self.__dict__.get('_neighbors')
+        if index is not None:
+            return index
+
+        index = {}
+        sess = object_session(self)
+        if sess is None or 'edges' in self.__dict__:
+            rows = [(edge.vertex_id, edge.predicate) for edge in self.edges]
+        else:
+            rows = sess.query(Edge.vertex_id, Edge.predicate) \
+                .filter_by(source_id=self.id) \
+                .order_by(Edge.id)
+        for target, predicate in rows:
+            index[target, predicate] = True
+            index.setdefault(target, predicate)
+
+        self._neighbors = index
+        return index
+
+    def _find_edge(self, str target, predicate):
+        sess = object_session(self)
+        if sess is None or 'edges' in self.__dict__:
+            for edge in self.edges:
+                if edge.vertex_id == target and edge.predicate == predicate:
+                    return edge
+            return None
+        # Indexed by (source_id, vertex_id, predicate).
+        return sess.query(Edge) \
+            .filter_by(source_id=self.id, vertex_id=target, predicate=predicate) \
+            .first()
+
+
+def reset_neighbor_index(session, *args):
+    """Drop the neighbor index of every vertex in `session`.
+
+    Called after a rollback of the graph's sessions, which discards edges
+    the index still holds, and after edges are written without the ORM
+    (`BulkLoader`).
+    """
+    for obj in list(session.identity_map.values()):
+        if isinstance(obj, Vertex):
+            obj.__dict__.pop('_neighbors', None)
+
+
+class Property(BaseSchema):
+    """Typed copy of a primitive `Vertex.payload` entry, indexed for lookups.
+
+    Rows are maintained by SQLite triggers on `vertex`, so every writer
+    (ORM, `BulkLoader` or raw SQL) keeps them in sync with `payload`.
+    """
+    __tablename__ = 'property'
+    __table_args__ = (
+        Index('ix_property_key_text', 'key', 'value_text'),
+        Index('ix_property_key_number', 'key', 'value_number'),
+        Index('ix_property_vertex', 'vertex_id'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    vertex_id = Column(String(8), ForeignKey('vertex.id'), nullable=False)
+    key = Column(String(256), nullable=False)
+    # One of "text", "number" or "bool".
+    kind = Column(String(8), nullable=False)
+    value_text = Column(Text)
+    # Numbers & booleans (as 0 or 1).
+    value_number = Column(Float)
+
+    def __repr__(self):
+        return f'<Property({self.key}={self.value})>'
+
+    @property
+    def value(self):
+        if self.kind == 'text':
+            return self.value_text
+        elif self.kind == 'bool':
+            return bool(self.value_number)
+        return self.value_number
+
+
+# Property rows from the primitive values of `{v}.payload`, `{v}` being
+# the trigger's `new` row or the `vertex` table itself. Lists of values
+# (repeated RDF predicates) get a row per item: `json_each` of a primitive
+# is the primitive itself.
+_INSERT_PROPERTIES = """
+    INSERT INTO property (vertex_id, key, kind, value_text, value_number)
+    SELECT {v}.id, entry.key,
+           CASE item.type WHEN 'text' THEN 'text' WHEN 'true' THEN 'bool'
+                          WHEN 'false' THEN 'bool' ELSE 'number' END,
+           CASE item.type WHEN 'text' THEN item.value END,
+           CASE WHEN item.type != 'text' THEN item.value END
+    FROM {source}json_each({v}.payload) AS entry,
+         json_each({v}.payload, entry.fullkey) AS item
+    WHERE {v}.payload IS NOT NULL
+      AND item.type IN ('text', 'integer', 'real', 'true', 'false')
+"""
+
+PROPERTY_TRIGGERS = (
+    f"""CREATE TRIGGER IF NOT EXISTS tr_vertex_property_insert AFTER INSERT ON vertex
+        BEGIN
+            {_INSERT_PROPERTIES.format(v='new', source='')};
+        END""",
+    f"""CREATE TRIGGER IF NOT EXISTS tr_vertex_property_update AFTER UPDATE OF payload ON vertex
+        BEGIN
+            DELETE FROM property WHERE vertex_id = old.id;
+            {_INSERT_PROPERTIES.format(v='new', source='')};
+        END""",
+    """CREATE TRIGGER IF NOT EXISTS tr_vertex_property_delete AFTER DELETE ON vertex
+        BEGIN
+            DELETE FROM property WHERE vertex_id = old.id;
+        END""",
+)
+# Fills `property` for vertices written before the table existed.
+PROPERTY_BACKFILL = _INSERT_PROPERTIES.format(v='vertex', source='vertex, ')
+
+for _trigger in PROPERTY_TRIGGERS:
+    event.listen(Property.__table__, 'after_create', DDL(_trigger))
+
+
+# Optional FTS5 full-text index of vertex labels, aliases & string payload
+# values. Documents share their vertex's rowid, so triggers can update them
+# without scanning the index.
+SEARCH_TABLE = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS vertex_fts USING fts5(
+        label, aliases, text, vertex_id UNINDEXED,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+"""
+
+# Document of `{v}`, the trigger's `new` row or the `vertex` table itself.
+_INSERT_DOCUMENT = """
+    INSERT INTO vertex_fts (rowid, label, aliases, text, vertex_id)
+    SELECT {v}.rowid, {v}.label,
+           (SELECT group_concat(value, ' ') FROM json_each({v}.payload, '$.aliases')),
+           (SELECT group_concat(item.value, ' ')
+            FROM json_each({v}.payload) AS entry, json_each({v}.payload, entry.fullkey) AS item
+            WHERE item.type = 'text' AND entry.key NOT IN ('name', 'aliases')),
+           {v}.id
+"""
 
-        # No connection.
-        return None
+SEARCH_TRIGGERS = (
+    f"""CREATE TRIGGER IF NOT EXISTS tr_vertex_fts_insert AFTER INSERT ON vertex
+        BEGIN
+            {_INSERT_DOCUMENT.format(v='new')};
+        END""",
+    f"""CREATE TRIGGER IF NOT EXISTS tr_vertex_fts_update AFTER UPDATE OF label, payload ON vertex
+        BEGIN
+            DELETE FROM vertex_fts WHERE rowid = old.rowid;
+            {_INSERT_DOCUMENT.format(v='new')};
+        END""",
+    """CREATE TRIGGER IF NOT EXISTS tr_vertex_fts_delete AFTER DELETE ON vertex
+        BEGIN
+            DELETE FROM vertex_fts WHERE rowid = old.rowid;
+        END""",
+)
+# Indexes every existing vertex.
+SEARCH_BACKFILL = _INSERT_DOCUMENT.format(v='vertex') + ' FROM vertex'
 
 
 class Graph(BaseSchema):
@@ -0,0 +1,471 @@
+"""Read-only, in-memory adjacency snapshot of a Knowledge Graph.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: snapshot.pyx
+     Created on 18 October, 2026 @ 02:20 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+# Built-in libraries.
+import json
+import zlib
+import struct
+
+# Third-party libraries.
+import numpy as np
+
+__all__ = [
+    'GraphSnapshot', 'StringTable',
+]
+
+# Binary snapshot format: magic, version & section count, a table of
+# (name, dtype, byte offset, length, crc32) sections, the CRC32 of everything
+# before it, then 64-byte aligned little-endian arrays.
+MAGIC = b'SAGESNAP'
+VERSION = 1
+_HEADER = struct.Struct('<8sII')
+_SECTION = struct.Struct('<32s8sQQI4x')
+_CRC = struct.Struct('<I')
+_ALIGN = 64
+
+
+class StringTable:
+    """Read-only sequence of strings packed into two flat arrays.
+
+    String `i` is the UTF-8 bytes `data[offsets[i]:offsets[i + 1]]`. With
+    `codes`, item `i` is string `codes[i]` instead, so repeated strings are
+    stored once. Items are decoded on access, which keeps memory-mapped
+    tables zero-copy.
+    """
+
+    def __init__(self, offsets, data, codes=None):
+        self.offsets = offsets
+        self.data = data
+        self.codes = codes
+
+    @classmethod
+    def from_strings(cls, strings, bint intern=False):
+        cdef dict interned = {}
+        cdef list codes = []
+        if intern:
+            for string in strings:
+                codes.append(interned.setdefault(string, len(interned)))
+            strings = list(interned)
+
+        cdef list encoded = [(string or '').encode('utf-8') for string in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+        data = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        return cls(offsets, data, np.asarray(codes, dtype=np.int32) if intern else None)
+
+    def __len__(self):
+        if self.codes is not None:
+            return len(self.codes)
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if self.codes is not None:
+            i = self.codes[i]
+        return self.data[self.offsets[i]:self.offsets[i + 1]].tobytes().decode('utf-8')
+
+    def __iter__(self):
+        cdef Py_ssize_t i
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        return f'StringTable(size={len(self):,})'
+
+
+class GraphSnapshot:
+    """Compressed sparse row (CSR) adjacency of a graph.
+
+    Outgoing edges of vertex `i` are `targets[offsets[i]:offsets[i + 1]]`,
+    described by `predicates[offsets[i]:offsets[i + 1]]` which index into
+    `predicate_names`. Traversals work on vertex indices, see `index_of`
+    & `vertex_ids` to convert from & to vertex ids.
+    """
+
+    def __init__(self, vertex_ids, labels, schemas,
+                 sources, targets, predicates, list predicate_names, payloads=None):
+        # Vertex id <-> index map.
+        self.vertex_ids = vertex_ids
+        self.labels = labels
+        self.schemas = schemas
+        # JSON encoded payload of every vertex, if captured.
+        self.payloads = payloads
+        # Lookup maps, built on first use.
+        self._index = None
+        self._label_index = None
+        # Vertex indices sorted by id & by (label, schema), for lookups
+        # without `index` or `_label_index`.
+        self._id_order = None
+        self._label_order = None
+
+        # Interned predicates.
+        self.predicate_names = predicate_names
+        self.predicate_index = {name: i for i, name in enumerate(predicate_names)}
+
+        if sources is not None:
+            self.offsets, self.targets, self.predicates = _csr(len(vertex_ids), sources,
+                                                               targets, predicates)
+        # Incoming edges, built on first use.
+        self._reverse = None
+
+    @classmethod
+    def from_edges(cls, vertices, edges):
+        """Build from (id, label, schema[, payload]) vertices & (source, target, predicate) edges."""
+        cdef list vertex_ids = [], labels = [], schemas = [], payloads = []
+        for row in vertices:
+            vertex_ids.append(row[0])
+            labels.append(row[1])
+            schemas.append(row[2])
+            if len(row) > 3:
+                payloads.append(row[3])
+
+        cdef dict index = {vertex_id: i for i, vertex_id in enumerate(vertex_ids)}
+        cdef dict predicate_index = {}
+        cdef list sources = [], targets = [], predicates = []
+        for source, target, predicate in edges:
+            # Skip edges leaving the graph.
+            if source not in index or target not in index:
+                continue
+            sources.append(index[source])
+            targets.append(index[target])
+            predicates.append(predicate_index.setdefault(predicate, len(predicate_index)))
+
+        return cls(vertex_ids, labels, schemas,
+                   np.asarray(sources, dtype=np.int64),
+                   np.asarray(targets, dtype=np.int64),
+                   np.asarray(predicates, dtype=np.int32),
+                   list(predicate_index), payloads=payloads or None)
+
+    @classmethod
+    def load(cls, str path, bint verify=False):
+        """Memory-map a snapshot written by `save`.
+
+        Arrays are read-only views of the file, so opening costs no copies &
+        the pages are shared by every process mapping the same file.
+        """
+        buffer = np.memmap(path, dtype=np.uint8, mode='r')
+        cdef dict sections = _read_sections(buffer, verify)
+
+        def table(str name, bint interned=False):
+            if f'{name}.offsets' not in sections:
+                return None
+            return StringTable(sections[f'{name}.offsets'], sections[f'{name}.data'],
+                               sections[f'{name}.codes'] if interned else None)
+
+        inst = cls(table('vertex_ids'), table('labels'), table('schemas', interned=True),
+                   None, None, None, list(table('predicate_names')),
+                   payloads=table('payloads'))
+        inst.offsets = sections['offsets']
+        inst.targets = sections['targets']
+        inst.predicates = sections['predicates']
+        inst._reverse = (sections['reverse.offsets'], sections['reverse.sources'],
+                         sections['reverse.predicates'])
+        inst._id_order = sections['id_order']
+        # Not in snapshots saved before it was added.
+        inst._label_order = sections.get('label_order')
+        return inst
+
+    def save(self, str path):
+        """Write the snapshot in the binary format read by `load`."""
+        cdef list sections = [
+            ('offsets', self.offsets), ('targets', self.targets),
+            ('predicates', self.predicates),
+            ('reverse.offsets', self.reverse[0]), ('reverse.sources', self.reverse[1]),
+            ('reverse.predicates', self.reverse[2]),
+            ('id_order', self._sorted_ids()),
+            ('label_order', self._sorted_labels()),
+        ]
+        for name, strings, interned in (('vertex_ids', self.vertex_ids, False),
+                                        ('labels', self.labels, False),
+                                        ('schemas', self.schemas, True),
+                                        ('predicate_names', self.predicate_names, False),
+                                        ('payloads', self.payloads, False)):
+            if strings is None:
+                continue
+            table = strings if isinstance(strings, StringTable) \
+                else StringTable.from_strings(strings, intern=interned)
+            sections += [(f'{name}.offsets', table.offsets), (f'{name}.data', table.data)]
+            if table.codes is not None:
+                sections.append((f'{name}.codes', table.codes))
+        _write_sections(path, sections)
+
+    @property
+    def index(self):
+        # Vertex id -> index.
+        if self._index is None:
+            self._index = {vertex_id: i for i, vertex_id in enumerate(self.vertex_ids)}
+        return self._index
+
+    def payload(self, vertex):
+        """Decoded payload of a vertex."""
+        if self.payloads is None:
+            raise ValueError('Snapshot was taken without payloads.')
+        cdef Py_ssize_t i = vertex if isinstance(vertex, (int, np.integer)) \
+            else self.index_of(vertex)
+        return json.loads(self.payloads[i] or '{}')
+
+    def __len__(self):
+        return len(self.vertex_ids)
+
+    def __repr__(self):
+        return (f'GraphSnapshot(vertices={len(self):,}, edges={self.n_edges:,}, '
+                f'predicates={len(self.predicate_names):,})')
+
+    @property
+    def n_edges(self):
+        return len(self.targets)
+
+    def index_of(self, vertex):
+        # Vertex id, (label, schema) or an object with an `id`.
+        if isinstance(vertex, tuple):
+            if self._label_index is None and self._label_order is not None:
+                # Binary search over the sorted labels of a loaded snapshot.
+                return _search(self._label_order, self._label_key, tuple(vertex))
+            if self._label_index is None:
+                self._label_index = {key: i for i, key in
+                                     enumerate(zip(self.labels, self.schemas))}
+            return self._label_index[vertex]
+
+        cdef str vertex_id = vertex if isinstance(vertex, str) else vertex.id
+        if self._index is not None or self._id_order is None:
+            return self.index[vertex_id]
+        # Binary search over the sorted ids of a loaded snapshot.
+        return _search(self._id_order, self.vertex_ids.__getitem__, vertex_id)
+
+    def indices(self, vertices):
+        if isinstance(vertices, np.ndarray):
+            return vertices.astype(np.int64, copy=False)
+        if isinstance(vertices, (str, tuple)) or hasattr(vertices, 'id'):
+            vertices = [vertices]
+        return np.asarray([v if isinstance(v, (int, np.integer)) else self.index_of(v)
+                           for v in vertices], dtype=np.int64)
+
+    def degree(self, vertices=None, str direction='out'):
+        cdef list parts = []
+        if direction in ('out', 'both'):
+            parts.append(np.diff(self.offsets))
+        if direction in ('in', 'both'):
+            parts.append(np.diff(self.reverse[0]))
+        if not parts:
+            raise ValueError(f"Expected direction to be one of 'out', 'in' or 'both', "
+                             f"got {direction!r}.")
+
+        degrees = parts[0] if len(parts) == 1 else parts[0] + parts[1]
+        return degrees if vertices is None else degrees[self.indices(vertices)]
+
+    def neighbors(self, vertex, predicates=None, str direction='out'):
+        cdef Py_ssize_t i = vertex if isinstance(vertex, (int, np.integer)) \
+            else self.index_of(vertex)
+        return np.unique(self._expand(np.asarray([i], dtype=np.int64),
+                                      self._predicate_ids(predicates), direction))
+
+    def bfs(self, sources, int max_depth=-1, predicates=None, str direction='out'):
+        """Hop distance from `sources` to every vertex (-1 when unreachable)."""
+        frontier = np.unique(self.indices(sources))
+        predicate_ids = self._predicate_ids(predicates)
+
+        distance = np.full(len(self), -1, dtype=np.int32)
+        distance[frontier] = 0
+        cdef int depth = 0
+        while len(frontier) and (max_depth < 0 or depth < max_depth):
+            depth += 1
+            targets = self._expand(frontier, predicate_ids, direction)
+            # Only vertices which haven't been visited yet.
+            targets = targets[distance[targets] < 0]
+            frontier = np.unique(targets)
+            distance[frontier] = depth
+        return distance
+
+    def k_hop(self, sources, int k=1, predicates=None, str direction='out',
+              bint include_sources=False):
+        """Indices of vertices at most `k` hops away from `sources`."""
+        distance = self.bfs(sources, max_depth=k, predicates=predicates, direction=direction)
+        return np.flatnonzero(distance >= 0 if include_sources else distance > 0)
+
+    def subgraph(self, sources, int k=1, predicates=None, str direction='out'):
+        """Edges traversed when expanding `k` hops from `sources`.
+
+        Returns (sources, predicate ids, targets) arrays, with edges always
+        pointing in their stored direction.
+        """
+        distance = self.bfs(sources, max_depth=k, predicates=predicates, direction=direction)
+        predicate_ids = self._predicate_ids(predicates)
+        # Vertices whose edges are expanded.
+        inner = np.flatnonzero((distance >= 0) & (distance < k))
+
+        cdef list parts = []
+        if direction in ('out', 'both'):
+            edges = _edge_slice(self.offsets, inner)
+            parts.append((np.repeat(inner, np.diff(self.offsets)[inner]),
+                          self.predicates[edges], self.targets[edges]))
+        if direction in ('in', 'both'):
+            offsets, sources_, predicates_ = self.reverse
+            edges = _edge_slice(offsets, inner)
+            parts.append((sources_[edges], predicates_[edges],
+                          np.repeat(inner, np.diff(offsets)[inner])))
+
+        src = np.concatenate([p[0] for p in parts])
+        pred = np.concatenate([p[1] for p in parts])
+        dst = np.concatenate([p[2] for p in parts])
+        if predicate_ids is not None:
+            mask = np.isin(pred, predicate_ids)
+            src, pred, dst = src[mask], pred[mask], dst[mask]
+        if direction == 'both':
+            # Edges between two inner vertices are seen from both ends.
+            _, unique = np.unique(np.stack([src, pred.astype(np.int64), dst]),
+                                  axis=1, return_index=True)
+            unique.sort()
+            src, pred, dst = src[unique], pred[unique], dst[unique]
+        return src, pred, dst
+
+    def to_ids(self, indices):
+        return [self.vertex_ids[i] for i in indices]
+
+    @property
+    def reverse(self):
+        # (offsets, sources, predicates) of incoming edges.
+        if self._reverse is None:
+            sources = np.repeat(np.arange(len(self), dtype=np.int64), np.diff(self.offsets))
+            self._reverse = _csr(len(self), self.targets, sources, self.predicates)
+        return self._reverse
+
+    def _sorted_ids(self):
+        if self._id_order is None:
+            self._id_order = np.asarray(sorted(range(len(self)), key=self.vertex_ids.__getitem__),
+                                        dtype=np.int64)
+        return self._id_order
+
+    def _sorted_labels(self):
+        if self._label_order is None:
+            self._label_order = np.asarray(sorted(range(len(self)), key=self._label_key),
+                                           dtype=np.int64)
+        return self._label_order
+
+    def _label_key(self, Py_ssize_t i):
+        # Empty labels are stored as ''.
+        return self.labels[i] or '', self.schemas[i] or ''
+
+    def _predicate_ids(self, predicates):
+        if predicates is None:
+            return None
+        if isinstance(predicates, str):
+            predicates = [predicates]
+        return np.asarray([self.predicate_index[p] for p in predicates
+                           if p in self.predicate_index], dtype=np.int32)
+
+    def _expand(self, frontier, predicate_ids, str direction):
+        # Neighbor indices of every vertex in `frontier`.
+        cdef list neighbors = []
+        if direction in ('out', 'both'):
+            edges = _edge_slice(self.offsets, frontier)
+            if predicate_ids is not None:
+                edges = edges[np.isin(self.predicates[edges], predicate_ids)]
+            neighbors.append(self.targets[edges])
+        if direction in ('in', 'both'):
+            offsets, sources, predicates = self.reverse
+            edges = _edge_slice(offsets, frontier)
+            if predicate_ids is not None:
+                edges = edges[np.isin(predicates[edges], predicate_ids)]
+            neighbors.append(sources[edges])
+        if not neighbors:
+            raise ValueError(f"Expected direction to be one of 'out', 'in' or 'both', "
+                             f"got {direction!r}.")
+        return np.concatenate(neighbors)
+
+
+cdef Py_ssize_t _search(order, key_of, key) except -1:
+    # Index whose `key_of` is `key`, `order` being indices sorted by `key_of`.
+    # Only ~log2(N) keys are decoded, so memory-mapped tables stay on disk.
+    cdef Py_ssize_t lo = 0, hi = len(order), mid
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if key_of(order[mid]) < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo == len(order) or key_of(order[lo]) != key:
+        raise KeyError(key)
+    return order[lo]
+
+
+def _csr(Py_ssize_t n, sources, targets, predicates):
+    # Sort edges by source & count them per vertex.
+    order = np.argsort(sources, kind='stable')
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=n), out=offsets[1:])
+    return offsets, targets[order], predicates[order]
+
+
+def _edge_slice(offsets, vertices):
+    # Concatenated edge index ranges [offsets[v], offsets[v + 1]) of `vertices`.
+    starts = offsets[vertices]
+    counts = offsets[vertices + 1] - starts
+    cdef Py_ssize_t total = counts.sum()
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    # Offset of each range in the output, subtracted from a running index.
+    shifts = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return np.arange(total, dtype=np.int64) + shifts
+
+
+def _write_sections(str path, list sections, bytes magic=MAGIC, int version=VERSION):
+    cdef list entries = []
+    cdef long long offset = _HEADER.size + len(sections) * _SECTION.size + _CRC.size
+    arrays = []
+    for name, array in sections:
+        # Fixed byte order, so snapshots are portable.
+        array = np.ascontiguousarray(array, dtype=np.dtype(array.dtype).newbyteorder('<'))
+        offset += -offset % _ALIGN
+        entries.append(_SECTION.pack(name.encode('ascii'), array.dtype.str.encode('ascii'),
+                                     offset, len(array), zlib.crc32(array)))
+        arrays.append((offset, array))
+        offset += array.nbytes
+
+    header = _HEADER.pack(magic, version, len(sections)) + b''.join(entries)
+    with open(path, mode='wb') as f:
+        f.write(header + _CRC.pack(zlib.crc32(header)))
+        for offset, array in arrays:
+            f.write(b'\0' * (offset - f.tell()))
+            f.write(array.tobytes())
+
+
+def _read_sections(buffer, bint verify, bytes magic=MAGIC, int version=VERSION):
+    # Also the container of other binary formats, told apart by `magic`.
+    found, found_version, count = _HEADER.unpack(buffer[:_HEADER.size].tobytes())
+    if found != magic:
+        raise ValueError('Not a graph snapshot.' if magic == MAGIC
+                         else f'Not a {magic.decode("ascii")} file.')
+    if found_version != version:
+        raise ValueError(f'Unsupported snapshot version {found_version}, expected {version}.')
+
+    cdef Py_ssize_t end = _HEADER.size + count * _SECTION.size
+    header = buffer[:end].tobytes()
+    if _CRC.unpack(buffer[end:end + _CRC.size].tobytes())[0] != zlib.crc32(header):
+        raise ValueError('Snapshot header is corrupted.')
+
+    cdef dict sections = {}
+    for i in range(count):
+        name, dtype, offset, length, crc = _SECTION.unpack_from(header, _HEADER.size
+                                                                + i * _SECTION.size)
+        name = name.rstrip(b'\0').decode('ascii')
+        array = np.frombuffer(buffer, dtype=np.dtype(dtype.rstrip(b'\0').decode('ascii')),
+                              count=length, offset=offset)
+        # Whole-file checksums cost a full read, so they're opt-in.
+        if verify and zlib.crc32(array) != crc:
+            raise ValueError(f'Snapshot section {name!r} is corrupted.')
+        sections[name] = array
+    return sections
@@ -0,0 +1,264 @@
+"""Compiled, offline index of the schema.org vocabulary.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: vocab.pyx
+     Created on 18 October, 2026 @ 11:30 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+# Built-in libraries.
+import gzip
+import json
+
+# Third-party libraries.
+import numpy as np
+
+# Custom libraries.
+from sage.core.reader import local_name
+from sage.core.snapshot import StringTable, _read_sections, _write_sections
+
+__all__ = [
+    'Vocabulary',
+]
+
+# Vocabulary files use the snapshot container (see `sage.core.snapshot`)
+# with their own magic & version.
+MAGIC = b'SAGEVOCB'
+VERSION = 1
+
+# `@type`s of classes & properties in the vocabulary's JSON-LD.
+_CLASS = 'rdfs:Class'
+_PROPERTY = 'rdf:Property'
+
+
+class Vocabulary:
+    """Type hierarchy & property tables of schema.org, by interned ids.
+
+    Types & properties are sorted by name and identified by their index.
+    Row `i` of `closure` is a bitset of every supertype of type `i` (itself
+    included), so "is-a" checks are a single bit test. Property domains &
+    ranges and the properties of each type are CSR (offsets, ids) tables.
+    """
+
+    # Latest release of the vocabulary, as JSON-LD.
+    URL = 'https://schema.org/version/latest/schemaorg-current-https.jsonld'
+
+    def __init__(self, list types, closure, depth, list properties,
+                 domains, ranges, type_properties):
+        self.types = types
+        self.properties = properties
+        self.closure = closure
+        # Longest `rdfs:subClassOf` chain from a root type.
+        self.depth = depth
+        # (offsets, type ids) of every property & (offsets, property ids) of every type.
+        self._domains = domains
+        self._ranges = ranges
+        self._type_properties = type_properties
+
+        self._type_index = {name: i for i, name in enumerate(types)}
+        self._property_index = {name: i for i, name in enumerate(properties)}
+
+    @classmethod
+    def from_jsonld(cls, source):
+        """Compile the vocabulary from its JSON-LD (a path, optionally gzipped, or data)."""
+        if isinstance(source, str):
+            opener = gzip.open if source.endswith('.gz') else open
+            with opener(source, mode='rt', encoding='utf-8') as f:
+                source = json.load(f)
+        nodes = source.get('@graph', []) if isinstance(source, dict) else source
+
+        cdef dict parents = {}, domains = {}, ranges = {}
+        for node in nodes:
+            node_types = _ids(node.get('@type'))
+            name = local_name(node['@id'])
+            if _CLASS in node_types:
+                parents.setdefault(name, []).extend(
+                    local_name(parent) for parent in _ids(node.get('rdfs:subClassOf')))
+            elif _PROPERTY in node_types:
+                domains[name] = [local_name(t) for t in _ids(node.get('schema:domainIncludes'))]
+                ranges[name] = [local_name(t) for t in _ids(node.get('schema:rangeIncludes'))]
+
+        cdef list types = sorted(parents), properties = sorted(domains)
+        cdef dict index = {name: i for i, name in enumerate(types)}
+        # Types outside of the vocabulary (e.g. `rdfs:Class`) are dropped.
+        cdef list parent_ids = [[index[p] for p in parents[name] if p in index]
+                                for name in types]
+        bits, depth = _closure(parent_ids)
+
+        cdef Py_ssize_t words = (len(types) + 63) // 64
+        closure = np.zeros((len(types), words), dtype=np.uint64)
+        for i, row in enumerate(bits):
+            closure[i] = np.frombuffer(row.to_bytes(words * 8, 'little'), dtype='<u8')
+
+        cdef list own = [[] for _ in types]
+        for p, name in enumerate(properties):
+            for t in domains[name]:
+                if t in index:
+                    own[index[t]].append(p)
+
+        return cls(types, closure, np.asarray(depth, dtype=np.int32), properties,
+                   _csr([[index[t] for t in domains[name] if t in index] for name in properties]),
+                   _csr([[index[t] for t in ranges[name] if t in index] for name in properties]),
+                   _csr(own))
+
+    @classmethod
+    def load(cls, str path, bint verify=False):
+        """Memory-map a vocabulary written by `save`."""
+        buffer = np.memmap(path, dtype=np.uint8, mode='r')
+        cdef dict sections = _read_sections(buffer, verify, magic=MAGIC, version=VERSION)
+
+        types = list(StringTable(sections['types.offsets'], sections['types.data']))
+        properties = list(StringTable(sections['properties.offsets'],
+                                      sections['properties.data']))
+        closure = sections['closure'].reshape(len(types), (len(types) + 63) // 64)
+        return cls(types, closure, sections['depth'], properties,
+                   *[(sections[f'{name}.offsets'], sections[f'{name}.ids'])
+                     for name in ('domains', 'ranges', 'type_properties')])
+
+    def save(self, str path):
+        """Write the vocabulary in the binary format read by `load`."""
+        cdef list sections = [('closure', self.closure.reshape(-1)), ('depth', self.depth)]
+        for name, strings in (('types', self.types), ('properties', self.properties)):
+            table = StringTable.from_strings(strings)
+            sections += [(f'{name}.offsets', table.offsets), (f'{name}.data', table.data)]
+        for name, (offsets, ids) in (('domains', self._domains), ('ranges', self._ranges),
+                                     ('type_properties', self._type_properties)):
+            sections += [(f'{name}.offsets', offsets), (f'{name}.ids', ids)]
+        _write_sections(path, sections, magic=MAGIC, version=VERSION)
+
+    def __len__(self):
+        return len(self.types)
+
+    def __contains__(self, name):
+        return local_name(name) in self._type_index
+
+    def __repr__(self):
+        return f'Vocabulary(types={len(self.types):,}, properties={len(self.properties):,})'
+
+    def type_id(self, str name):
+        # "Book", "schema:Book" & "https://schema.org/Book" are the same type.
+        return self._type_index[local_name(name)]
+
+    def is_a(self, str name, str supertype):
+        """Whether `name` is `supertype` or one of its subtypes."""
+        i, j = self._type_index.get(local_name(name)), self._type_index.get(local_name(supertype))
+        if i is None or j is None:
+            return local_name(name) == local_name(supertype)
+        return _has(self.closure, i, j)
+
+    def most_specific(self, types, default=None):
+        """Most specific of `types`: a subtype over its supertypes, else the deepest.
+
+        Ties keep the first one. Unknown types are only picked when none is
+        known, which is the first one, as without a vocabulary.
+        """
+        if isinstance(types, str):
+            return types
+
+        best, best_id = None, -1
+        for name in types:
+            i = self._type_index.get(local_name(name), -1)
+            if i < 0:
+                best = best if best is not None else name
+            elif best_id < 0:
+                best, best_id = name, i
+            elif i != best_id and (_has(self.closure, i, best_id) or
+                                   (not _has(self.closure, best_id, i)
+                                    and self.depth[i] > self.depth[best_id])):
+                best, best_id = name, i
+        return default if best is None else best
+
+    def supertypes(self, str name):
+        """Every supertype of `name`, nearest first."""
+        cdef Py_ssize_t i = self.type_id(name)
+        ids = [j for j in _members(self.closure[i], len(self.types)) if j != i]
+        return [self.types[j] for j in sorted(ids, key=lambda j: -self.depth[j])]
+
+    def subtypes(self, str name):
+        """Every subtype of `name`, by name."""
+        cdef Py_ssize_t j = self.type_id(name)
+        column = (self.closure[:, j >> 6] >> np.uint64(j & 63)) & np.uint64(1)
+        return [self.types[i] for i in np.flatnonzero(column) if i != j]
+
+    def domains(self, str prop):
+        """Types `prop` can be used on."""
+        return self._lookup(self._domains, self._property_index[local_name(prop)], self.types)
+
+    def ranges(self, str prop):
+        """Expected types of `prop`'s values."""
+        return self._lookup(self._ranges, self._property_index[local_name(prop)], self.types)
+
+    def properties_of(self, str name, bint inherited=True):
+        """Properties of `name`, including those of its supertypes when `inherited`."""
+        cdef Py_ssize_t i = self.type_id(name)
+        ids = _members(self.closure[i], len(self.types)) if inherited else [i]
+        return sorted({prop for t in ids
+                       for prop in self._lookup(self._type_properties, t, self.properties)})
+
+    @staticmethod
+    def _lookup(table, Py_ssize_t i, list names):
+        offsets, ids = table
+        return [names[k] for k in ids[offsets[i]:offsets[i + 1]]]
+
+
+def _ids(value):
+    # `@id`s of a JSON-LD value: a string, a node or a list of either.
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        value = [value]
+    return [v['@id'] if isinstance(v, dict) else v for v in value]
+
+
+def _closure(list parent_ids):
+    # Supertype bitsets (Python ints) & depth of every type, visiting parents first.
+    cdef Py_ssize_t n = len(parent_ids)
+    cdef list bits = [0] * n, depth = [0] * n
+    # 0: unseen, 1: on the current path, 2: done.
+    cdef list state = [0] * n
+    for root in range(n):
+        stack = [root]
+        while stack:
+            i = stack[-1]
+            if state[i] == 0:
+                state[i] = 1
+                for p in parent_ids[i]:
+                    if state[p] == 1:
+                        raise ValueError('Cycle in the type hierarchy.')
+                    if state[p] == 0:
+                        stack.append(p)
+                continue
+
+            stack.pop()
+            if state[i] == 1:
+                bits[i] = 1 << i
+                for p in parent_ids[i]:
+                    bits[i] |= bits[p]
+                    depth[i] = max(depth[i], depth[p] + 1)
+                state[i] = 2
+    return bits, depth
+
+
+def _csr(list rows):
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum([len(row) for row in rows], out=offsets[1:])
+    return offsets, np.asarray([i for row in rows for i in row], dtype=np.int32)
+
+
+def _has(closure, Py_ssize_t i, Py_ssize_t j):
+    # Bit `j` of row `i`: type `i` is-a type `j`.
+    return bool(int(closure[i, j >> 6]) >> (j & 63) & 1)
+
+
+def _members(row, Py_ssize_t n):
+    # Indices of the bits set in a bitset row.
+    bits = np.unpackbits(row.astype('<u8').view(np.uint8), bitorder='little')
+    return np.flatnonzero(bits[:n]).tolist()
@@ -0,0 +1,218 @@
+"""Parallel ingestion of Wikidata JSON entity dumps.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: wikidata.pyx
+     Created on 18 October, 2026 @ 01:05 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+# Built-in libraries.
+import os
+import gzip
+import json
+import multiprocessing
+from collections import deque
+
+__all__ = [
+    'transform', 'iter_entities',
+]
+
+# Default number of bytes (or lines of a gzipped dump) parsed per task.
+BLOCK_SIZE = 1 << 24
+LINES_PER_TASK = 2000
+
+
+cpdef tuple transform(dict entity, str language='en'):
+    """Flatten a Wikidata entity into a vertex & its outgoing edges.
+
+    Returns:
+        Tuple[str, str, Dict[str, Any], List[Tuple[str, str, str]]] - Entity
+            id (vertex label), entity type (vertex schema), payload & a list
+            of (property, target id, target schema) edges.
+    """
+    cdef str entity_id = entity['id']
+    cdef str schema = entity.get('type', 'item').title()
+    cdef dict payload = {}, ranks = {}
+    cdef list edges = []
+    cdef str prop, rank
+
+    label = _text(entity.get('labels'), language)
+    if label is not None:
+        payload['name'] = label
+    description = _text(entity.get('descriptions'), language)
+    if description is not None:
+        payload['description'] = description
+    aliases = (entity.get('aliases') or {}).get(language)
+    if aliases:
+        payload['aliases'] = [alias['value'] for alias in aliases]
+
+    for prop, statements in (entity.get('claims') or {}).items():
+        for statement in statements:
+            rank = statement.get('rank') or 'normal'
+            snak = statement.get('mainsnak') or {}
+            if rank == 'deprecated' or snak.get('snaktype') != 'value':
+                continue
+
+            datavalue = snak['datavalue']
+            value = datavalue['value']
+            if datavalue['type'] == 'wikibase-entityid':
+                edges.append((prop, _entity_id(value),
+                              value.get('entity-type', 'item').title()))
+                continue
+
+            # Payload keeps a single value: the first preferred, else the first normal.
+            if prop in ranks and not (rank == 'preferred' and ranks[prop] != 'preferred'):
+                continue
+            value = _value(datavalue['type'], value, language)
+            if value is not None:
+                payload[prop] = value
+                ranks[prop] = rank
+
+    return entity_id, schema, payload, edges
+
+
+def iter_entities(str path, int processes=0, str language='en',
+                  long long block_size=BLOCK_SIZE):
+    """Parse & transform a Wikidata dump in a process pool.
+
+    Uncompressed dumps are split into `block_size` byte ranges which are read
+    & parsed by the workers. Gzipped dumps can't be seeked, so lines are read
+    by this process & parsed by the workers in batches. At most two tasks
+    per worker are in flight, so memory stays bounded.
+
+    Yields:
+        Tuple[str, str, Dict[str, Any], List[Tuple[str, str, str]]] -
+            Transformed entities, in file order. See `transform`.
+    """
+    if processes <= 0:
+        processes = os.cpu_count() or 1
+
+    if path.endswith('.gz'):
+        tasks = ((_parse_lines, (lines, language)) for lines in _iter_line_batches(path))
+    else:
+        tasks = ((_parse_range, (path, start, end, language))
+                 for start, end in _byte_ranges(path, block_size))
+
+    if processes == 1:
+        for func, args in tasks:
+            yield from func(*args)
+        return
+
+    with multiprocessing.Pool(processes) as pool:
+        pending = deque()
+        for func, args in tasks:
+            pending.append(pool.apply_async(func, args))
+            if len(pending) >= 2 * processes:
+                yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
+
+
+################################################################################################
+# +--------------------------------------------------------------------------------------------+
+# | Workers.
+# +--------------------------------------------------------------------------------------------+
+################################################################################################
+def _parse_range(str path, long long start, long long end, str language):
+    # Transform entities on lines starting in [start, end).
+    cdef list records = []
+    cdef long long pos = start
+
+    with open(path, mode='rb') as f:
+        if start > 0:
+            # Skip the line started by the previous range.
+            f.seek(start - 1)
+            pos = start - 1 + len(f.readline())
+
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+            entity = _parse_line(line)
+            if entity is not None:
+                records.append(transform(entity, language))
+    return records
+
+
+def _parse_lines(list lines, str language):
+    cdef list records = []
+    for line in lines:
+        entity = _parse_line(line)
+        if entity is not None:
+            records.append(transform(entity, language))
+    return records
+
+
+cdef object _parse_line(line):
+    # Dumps are a JSON array with one entity per line: "[", "{...},", ..., "]".
+    line = line.strip()
+    if line[-1:] in (b',', ','):
+        line = line[:-1]
+    if not line or line in (b'[', b']', '[', ']'):
+        return None
+    return json.loads(line)
+
+
+################################################################################################
+# +--------------------------------------------------------------------------------------------+
+# | Private functions.
+# +--------------------------------------------------------------------------------------------+
+################################################################################################
+def _byte_ranges(str path, long long block_size):
+    cdef long long size = os.path.getsize(path)
+    cdef long long start
+    for start in range(0, size, max(block_size, 1)):
+        yield start, min(start + block_size, size)
+
+
+def _iter_line_batches(str path):
+    cdef list batch = []
+    with gzip.open(path, mode='rb') as f:
+        for line in f:
+            batch.append(line)
+            if len(batch) >= LINES_PER_TASK:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+cdef object _text(dict values, str language):
+    if values:
+        value = values.get(language)
+        if value is not None:
+            return value['value']
+    return None
+
+
+cdef str _entity_id(dict value):
+    if 'id' in value:
+        return value['id']
+    prefix = 'P' if value.get('entity-type') == 'property' else 'Q'
+    return f'{prefix}{value["numeric-id"]}'
+
+
+cdef object _value(str kind, value, str language):
+    # Primitive payload value of a non-entity datavalue.
+    if kind == 'string':
+        return value
+    elif kind == 'quantity':
+        amount = value['amount']
+        return float(amount) if '.' in amount or 'e' in amount.lower() else int(amount)
+    elif kind == 'time':
+        return value['time']
+    elif kind == 'monolingualtext':
+        return value['text'] if value.get('language') == language else None
+    elif kind == 'globecoordinate':
+        # Well-Known Text, as used by the Wikidata Query Service.
+        return f'Point({value["longitude"]} {value["latitude"]})'
+    return None
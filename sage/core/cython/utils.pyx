@@ -16,28 +16,23 @@
 """
 
 # Built-in libraries.
+import io
 import os
 import sys
+import json
 import stat
+import time
 import pickle
 import logging
-import tarfile
-import zipfile
-import urllib.error
-import urllib.parse
-import urllib.request
+import threading
 
 from abc import ABCMeta
 from enum import IntEnum
-from pprint import PrettyPrinter
-from logging.config import fileConfig
 from typing import Iterable, Callable
 
-# Third-party library.
-import numpy as np
-
-# Custom libraries.
-from config import consts
+# Heavy & rarely needed modules (urllib.request, tarfile, zipfile, NumPy,
+# `config.consts`) are imported by the methods using them, which keeps
+# `import sage.core` cheap for short-lived jobs.
 
 # Exported classes and functions.
 __all__ = [
@@ -69,6 +64,9 @@ class Downloader(metaclass=ABCMeta):
                           ' AppleWebKit/537.36 (KHTML, like Gecko) Chrome/'
                           '50.0.2661.102 Safari/537.36'
         }
+        import urllib.error
+        import urllib.parse
+        import urllib.request
 
         try:
             if query_dict is not None:
@@ -88,12 +86,20 @@ class Downloader(metaclass=ABCMeta):
         return response
 
     @staticmethod
-    def maybe_download(str url, str download_dir=None, bint extract=False, bint overwrite=False):
+    def maybe_download(str url, str download_dir=None, bint extract=False, bint overwrite=False,
+                       str sha256=None, int segments=4, long long min_segment_size=1 << 24,
+                       int retries=3, bint progress=True):
         """Download and extract the data if it doesn't already exist.
 
         Notes:
             Assumes the url is a zip or tar-ball file.
 
+            The file is streamed into "<filename>.part" (its progress saved in
+            "<filename>.part.json") and renamed once complete: an interrupted
+            download resumes where it stopped with HTTP Range requests. Large
+            files are fetched as parallel ranged segments when the server
+            accepts ranges.
+
         Arguments:
             url {str} -- Internet URL for the tar-file to download.
                 e.g: "http://nlp.stanford.edu/data/glove.6B.zip"
@@ -104,8 +110,24 @@ class Downloader(metaclass=ABCMeta):
             extract {bool} -- If set to `True` compressed files are extracted automatically.
                 (default {False})
 
-            overwrite {bool} -- Force download even if the file already exists.
-                (default {False})
+            overwrite {bool} -- Force download even if the file already exists,
+                discarding any partial download. (default {False})
+
+            sha256 {str} -- Expected SHA-256 hex digest, computed while the
+                file is written. (default {None})
+
+            segments {int} -- Maximum number of parallel ranged requests. (default {4})
+
+            min_segment_size {int} -- Smallest segment in bytes: smaller files
+                are downloaded with one request. (default {16 MiB})
+
+            retries {int} -- Attempts per segment after a dropped connection
+                or a server error. (default {3})
+
+            progress {bool} -- Print the download progress. (default {True})
+
+        Raises:
+            ValueError: Checksum mismatch. The partial download is removed.
 
         Returns:
             str: Filename if `extract==False`, otherwise `extract_dir` is returned.
@@ -124,20 +146,18 @@ class Downloader(metaclass=ABCMeta):
             File.make_dirs(download_dir)
 
             # Download the file from the internet.
-            filename, _ = urllib.request.urlretrieve(
-                url=url, filename=filename,
-                reporthook=Log.report_hook
-            )
+            _Download(url, filename, sha256=sha256, segments=segments,
+                      min_segment_size=min_segment_size, retries=retries,
+                      progress=progress).run(restart=overwrite)
 
             Log.info("\nDownload finished.")
+        else:
+            Log.info("Data has apparently already been downloaded and unpacked.")
 
-            return (Downloader.maybe_extract(file=filename,
-                                             extract_dir=download_dir,
-                                             overwrite=overwrite) if extract
-                    else filename)
-
-        Log.info("Data has apparently already been downloaded and unpacked.")
-        return filename
+        return (Downloader.maybe_extract(file=filename,
+                                         extract_dir=download_dir,
+                                         overwrite=overwrite) if extract
+                else filename)
 
     @staticmethod
     def maybe_extract(str file, str extract_dir=None, bint overwrite=False):
@@ -160,6 +180,9 @@ class Downloader(metaclass=ABCMeta):
         # Read mode.
         cdef str mode = "r"
 
+        import tarfile
+        import zipfile
+
         if zipfile.is_zipfile(file):
             Extractor = zipfile.ZipFile
         elif tarfile.is_tarfile(file):
@@ -180,6 +203,332 @@ class Downloader(metaclass=ABCMeta):
         Log.info('Successfully extracted to {}'.format(extract_dir))
         return extract_dir
 
+    @staticmethod
+    def iter_archive(str file, members=None, bint decompress=True):
+        """Iterate (name, file object) of the regular files in a zip or tarball.
+
+        Members are streamed straight out of the archive, nothing is extracted
+        to disk. Tarballs (.tar, .tar.gz, .tar.bz2, .tar.xz) are read in one
+        sequential pass, so each file object is only valid until the next
+        member is requested.
+
+        Arguments:
+            file {str} -- Path to the archive.
+
+            members {Union[str, Iterable[str], Callable[[str], bool]]} -- Glob
+                pattern(s) or predicate on member names, e.g. "*.nt.gz". (default {None})
+
+            decompress {bool} -- Transparently decompress ".gz" members. (default {True})
+
+        Raises:
+            FileNotFoundError: `file` doesn't exist.
+            ValueError: `file` is neither a zip nor a tarball.
+        """
+        # Ensure the file exists.
+        if not File.is_file(file):
+            raise FileNotFoundError('"{}" not found!'.format(file))
+
+        import tarfile
+        import zipfile
+
+        match = _member_filter(members)
+        if zipfile.is_zipfile(file):
+            with zipfile.ZipFile(file) as archive:
+                for info in archive.infolist():
+                    if info.is_dir() or not match(info.filename):
+                        continue
+                    with archive.open(info) as f:
+                        yield info.filename, _member_stream(f, info.filename, decompress)
+
+        elif tarfile.is_tarfile(file):
+            # Stream mode: no seeking back, members are read as they come.
+            with tarfile.open(file, mode='r|*') as archive:
+                for member in archive:
+                    if not member.isfile() or not match(member.name):
+                        continue
+                    with archive.extractfile(member) as f:
+                        yield member.name, _member_stream(io.BufferedReader(_TarMember(f)),
+                                                          member.name, decompress)
+        else:
+            # Unrecognized compressed file.
+            raise ValueError('{} must a zipped or tarball file'.format(file))
+
+
+def _member_filter(members):
+    # Predicate on archive member names: glob pattern(s) or a callable.
+    if members is None:
+        return lambda name: True
+    if callable(members):
+        return members
+
+    import fnmatch
+    cdef tuple patterns = (members,) if isinstance(members, str) else tuple(members)
+    return lambda name: any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+
+class _TarMember(io.RawIOBase):
+    # Members of tarballs read in stream mode raise on `seekable()` (which
+    # `io.TextIOWrapper` calls) on older Pythons: present them as unseekable.
+    def __init__(self, f):
+        self._f = f
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self._f.readinto(b)
+
+
+def _member_stream(f, str name, bint decompress):
+    if decompress and name.endswith('.gz'):
+        import gzip
+        return gzip.GzipFile(fileobj=f, mode='rb')
+    return f
+
+
+class _Restart(Exception):
+    # The server ignored a Range request, or the file changed since the last attempt.
+    pass
+
+
+class _Download:
+    """Resumable, segmented & verified download of `url` into `filename`.
+
+    Workers stream their byte range into "<filename>.part" while the calling
+    thread hashes its contiguous downloaded prefix (reading it back from the
+    page cache), reports progress & saves the state needed to resume.
+    """
+
+    # Bytes read from the network, written & hashed at a time.
+    CHUNK_SIZE = 1 << 20
+    # Seconds between progress reports & saved states.
+    INTERVAL = 0.5
+    # Socket timeout, in seconds.
+    TIMEOUT = 60
+
+    def __init__(self, str url, str filename, str sha256=None, int segments=4,
+                 long long min_segment_size=1 << 24, int retries=3, bint progress=True):
+        self.url, self.filename = url, filename
+        self.part, self.state_file = f'{filename}.part', f'{filename}.part.json'
+        self.sha256 = sha256.lower() if sha256 else None
+        self.max_segments, self.min_segment_size = max(segments, 1), max(min_segment_size, 1)
+        self.retries, self.progress = retries, progress
+
+        # Guards `done`, `finished` & `error`.
+        self._cond = threading.Condition()
+
+    def run(self, bint restart=False, bint ranges=True):
+        import hashlib
+
+        size, validator, accept_ranges = self._probe()
+        ranges = ranges and accept_ranges
+        state = None if restart or not ranges else self._load_state(size, validator)
+        if state is None:
+            state = {'url': self.url, 'size': size, 'validator': validator,
+                     'segments': self._split(size, ranges)}
+            state['done'] = [0] * len(state['segments'])
+            open(self.part, 'wb').close()
+        elif state['done'] and any(state['done']):
+            Log.info(f'Resuming {self.url} at {sum(state["done"]):,} of {size:,} bytes.')
+
+        self.size, self.validator = size, validator
+        self.segments, self.done = state['segments'], state['done']
+        self.finished, self.error, self.stop = 0, None, False
+
+        self.hasher = hashlib.sha256() if self.sha256 else None
+        self.hashed = 0
+        cdef double last = 0
+
+        threads = [threading.Thread(target=self._worker, args=(k,), daemon=True)
+                   for k in range(len(self.segments))]
+        # Unbuffered: read-ahead would keep bytes not yet written by the workers.
+        with open(self.part, 'rb', buffering=0) as reader:
+            for thread in threads:
+                thread.start()
+            try:
+                while True:
+                    with self._cond:
+                        if self.finished < len(threads) and self.error is None:
+                            self._cond.wait(self.INTERVAL)
+                        finished, error = self.finished == len(threads), self.error
+                    if self.hasher is not None:
+                        self._hash(reader)
+                    if error is not None or finished or time.monotonic() - last >= self.INTERVAL:
+                        last = time.monotonic()
+                        self._save_state()
+                        if self.progress and self.size > 0:
+                            Log.progress(sum(self.done), self.size)
+                    if error is not None or finished:
+                        break
+            finally:
+                with self._cond:
+                    self.stop = True
+                for thread in threads:
+                    thread.join()
+                self._save_state()
+
+            if error is None and self.hasher is not None:
+                self._hash(reader)
+
+        if isinstance(error, _Restart) and ranges:
+            Log.warn(f'Restarting {self.url} without ranges: {error}')
+            return self.run(restart=True, ranges=False)
+        if error is not None:
+            raise error
+
+        if self.hasher is not None and self.hasher.hexdigest() != self.sha256:
+            File.remove(self.part)
+            File.remove(self.state_file)
+            raise ValueError(f'SHA-256 mismatch for {self.url}: expected {self.sha256}, '
+                             f'got {self.hasher.hexdigest()}.')
+
+        os.replace(self.part, self.filename)
+        File.remove(self.state_file)
+        return self.filename
+
+    def _probe(self):
+        # (size or -1, ETag or Last-Modified, whether byte ranges are accepted).
+        import urllib.error
+        import urllib.request
+
+        request = urllib.request.Request(self.url, method='HEAD')
+        try:
+            with urllib.request.urlopen(request, timeout=self.TIMEOUT) as response:
+                headers = response.headers
+        except urllib.error.HTTPError as e:
+            # Some servers refuse HEAD: a plain GET will tell.
+            Log.debug(f'HEAD {self.url}: {e}')
+            return -1, None, False
+
+        length = headers.get('Content-Length', '')
+        cdef long long size = int(length) if length.isdigit() else -1
+        ranges = headers.get('Accept-Ranges', '').lower() == 'bytes' and size > 0
+        return size, headers.get('ETag') or headers.get('Last-Modified'), ranges
+
+    def _split(self, long long size, bint ranges):
+        # [start, end) of every segment, `end` is -1 when the size is unknown.
+        if not ranges or size <= 0:
+            return [[0, size]]
+        cdef long long n = max(1, min(self.max_segments, size // self.min_segment_size))
+        return [[k * size // n, (k + 1) * size // n] for k in range(n)]
+
+    def _load_state(self, long long size, validator):
+        # Resume only the same version of the same file.
+        if validator is None or not File.is_file(self.state_file) or not File.is_file(self.part):
+            return None
+        try:
+            with open(self.state_file, encoding='utf-8') as f:
+                state = json.load(f)
+        except ValueError:
+            return None
+        if (state.get('url'), state.get('size'), state.get('validator')) != (self.url, size, validator):
+            return None
+        return state
+
+    def _save_state(self):
+        with self._cond:
+            state = {'url': self.url, 'size': self.size, 'validator': self.validator,
+                     'segments': self.segments, 'done': list(self.done)}
+        tmp = f'{self.state_file}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp, self.state_file)
+
+    def _watermark(self):
+        # End of the contiguous downloaded prefix.
+        cdef long long end = 0
+        with self._cond:
+            for (start, stop), done in zip(self.segments, self.done):
+                end = start + done
+                if stop < 0 or end < stop:
+                    break
+        return end
+
+    def _hash(self, reader):
+        # Feed the newly downloaded part of the prefix to `hasher`.
+        cdef long long end = self._watermark()
+        if end < self.hashed:
+            # Restarted from scratch.
+            import hashlib
+            self.hasher, self.hashed = hashlib.sha256(), 0
+        reader.seek(self.hashed)
+        while self.hashed < end:
+            data = reader.read(min(self.CHUNK_SIZE, end - self.hashed))
+            if not data:
+                break
+            self.hasher.update(data)
+            self.hashed += len(data)
+
+    def _worker(self, Py_ssize_t k):
+        try:
+            self._fetch(k)
+        except BaseException as e:
+            with self._cond:
+                self.error = self.error or e
+        finally:
+            with self._cond:
+                self.finished += 1
+                self._cond.notify()
+
+    def _fetch(self, Py_ssize_t k):
+        import http.client
+        import urllib.error
+        import urllib.request
+
+        cdef long long start = self.segments[k][0], end = self.segments[k][1], offset
+        cdef int attempt = 0
+        whole = len(self.segments) == 1 and start == 0
+
+        while True:
+            offset = start + self.done[k]
+            if end >= 0 and offset >= end:
+                return
+
+            headers = {}
+            if offset > 0 or not whole:
+                headers['Range'] = f'bytes={offset}-{end - 1 if end >= 0 else ""}'
+                if self.validator is not None:
+                    headers['If-Range'] = self.validator
+            request = urllib.request.Request(self.url, headers=headers)
+
+            try:
+                with urllib.request.urlopen(request, timeout=self.TIMEOUT) as response, \
+                        open(self.part, 'r+b') as f:
+                    if 'Range' in headers and response.status != 206:
+                        if not whole:
+                            raise _Restart(f'HTTP {response.status} for bytes {offset}-')
+                        # The whole file again, from the start.
+                        with self._cond:
+                            offset, self.done[k] = 0, 0
+                        f.truncate(0)
+                    f.seek(offset)
+                    while not self.stop:
+                        chunk = response.read(self.CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        # Visible to the hashing reader before it's counted.
+                        f.flush()
+                        with self._cond:
+                            self.done[k] += len(chunk)
+                            self._cond.notify()
+
+                if self.stop or end < 0 or start + self.done[k] >= end:
+                    return
+                raise ConnectionError(f'Connection closed at byte {start + self.done[k]:,}')
+
+            except urllib.error.HTTPError as e:
+                if e.code < 500 or attempt >= self.retries:
+                    raise
+                attempt += 1
+                Log.warn(f'Retrying {self.url} ({attempt}/{self.retries}): {e}')
+            except (OSError, http.client.HTTPException) as e:
+                if attempt >= self.retries:
+                    raise
+                attempt += 1
+                Log.warn(f'Retrying {self.url} ({attempt}/{self.retries}): {e}')
+            time.sleep(min(0.5 * 2 ** (attempt - 1), 30))
+
 
 ################################################################################################
 # +--------------------------------------------------------------------------------------------+
@@ -500,9 +849,9 @@ class File(metaclass=ABCMeta):
 # +--------------------------------------------------------------------------------------------+
 ################################################################################################
 class Log(metaclass=ABCMeta):
-    # File logger configuration.
-    fileConfig(consts.LOGGER.ROOT)
-    _logger = logging.getLogger()
+    # File logger, configured from `consts.LOGGER.ROOT` on first use.
+    _logger = None
+    _lock = threading.Lock()
 
     # Log Levels.
     Level = IntEnum('Level', names={
@@ -514,44 +863,62 @@ class Log(metaclass=ABCMeta):
         'NOTSET': 0,
     })
 
-    # Log Level.
-    level = _logger.level
+    # Log Level, set once the logger is configured.
+    level = logging.NOTSET
 
     @staticmethod
     def setLevel(level: int):
-        Log._logger.setLevel(level=level)
+        Log.getLogger().setLevel(level=level)
 
     @staticmethod
     def getLogger():
+        if Log._logger is None:
+            with Log._lock:
+                if Log._logger is None:
+                    Log._configure()
         return Log._logger
 
+    @staticmethod
+    def _configure():
+        # Parsing the config (and importing its formatter) is deferred
+        # until something is logged.
+        from logging.config import fileConfig
+        from config import consts
+
+        # Loggers of the host application, created before this point, stay on.
+        fileConfig(consts.LOGGER.ROOT, disable_existing_loggers=False)
+
+        logger = logging.getLogger()
+        Log.level = logger.level
+        Log._logger = logger
+
     @staticmethod
     def debug(*args, **kwargs):
-        Log._logger.debug(*args, **kwargs)
+        Log.getLogger().debug(*args, **kwargs)
 
     @staticmethod
     def info(*args, **kwargs):
-        Log._logger.info(*args, **kwargs)
+        Log.getLogger().info(*args, **kwargs)
 
     @staticmethod
     def warn(*args, **kwargs):
-        Log._logger.warning(*args, **kwargs)
+        Log.getLogger().warning(*args, **kwargs)
 
     @staticmethod
     def error(*args, **kwargs):
-        Log._logger.error(*args, **kwargs)
+        Log.getLogger().error(*args, **kwargs)
 
     @staticmethod
     def critical(*args, **kwargs):
-        Log._logger.critical(*args, **kwargs)
+        Log.getLogger().critical(*args, **kwargs)
 
     @staticmethod
     def exception(*args, **kwargs):
-        Log._logger.exception(*args, **kwargs)
+        Log.getLogger().exception(*args, **kwargs)
 
     @staticmethod
     def fatal(*args, int code=-1, **kwargs):
-        Log._logger.fatal(*args, **kwargs)
+        Log.getLogger().fatal(*args, **kwargs)
         exit(code)
 
     @staticmethod
@@ -572,7 +939,7 @@ class Log(metaclass=ABCMeta):
         if not kwargs.pop('verbose', 1):
             return
 
-        Log._logger.log(Log.level, *args, **kwargs)
+        Log.getLogger().log(Log.level, *args, **kwargs)
 
     @staticmethod
     def pretty(args, stream=None, size_t indent=1, size_t width=80, size_t depth=0, *, bint compact=False):
@@ -592,12 +959,14 @@ class Log(metaclass=ABCMeta):
             compact (bool, optional): Defaults to False. If true, several items
                 will be combined in one line.
         """
+        from pprint import PrettyPrinter
+
         printer = PrettyPrinter(stream=sys.stdout, indent=indent,
                                 width=width, depth=None if depth == 0 else depth, compact=compact)
         printer.pprint(args)
 
     @staticmethod
-    def progress(int count, int max_count):
+    def progress(long long count, long long max_count):
         """Prints task progress *(in %)*.
 
         Args:
@@ -617,23 +986,25 @@ class Log(metaclass=ABCMeta):
         sys.stdout.flush()
 
     @staticmethod
-    def report_hook(int block_no, bytes read_size, bytes file_size):
+    def report_hook(long long block_no, long long read_size, long long file_size):
         """Calculates download progress of downloaded files.
 
         Args:
             block_no {int}: Current download state.
-            read_size {bytes}: Current downloaded size.
-            file_size {bytes}: Total file size.
+            read_size {int}: Block size, in bytes.
+            file_size {int}: Total file size, in bytes. -1 when unknown.
 
         Returns:
             None.
         """
         # Calculates download progress given the block number, a read size,
         #  and the total file size of the URL target.
-        cdef float pct_complete = float(block_no * read_size) / float(file_size)
+        if file_size <= 0:
+            return
+        cdef float pct_complete = min(float(block_no * read_size) / float(file_size), 1.0)
 
         cdef str msg = "\r\t -Download progress {:.02%}".format(pct_complete)
-        sys.stdout.stdwrite(msg)
+        sys.stdout.write(msg)
         sys.stdout.flush()
 
 
@@ -674,6 +1045,9 @@ class Cache(metaclass=ABCMeta):
             Any: The result of calling the function or creating the object-instance.
         """
 
+        if use_numpy:
+            import numpy as np
+
         # If the cache-file exists.
         if File.exists(cache_path):
             if use_numpy:
@@ -757,6 +1131,8 @@ class Cache(metaclass=ABCMeta):
             Nothing.
         """
 
+        import numpy as np
+
         # Load the data using numpy.
         data = np.load(in_path)
 
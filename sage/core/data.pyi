@@ -14,9 +14,32 @@
      Apache 2.0 License
      Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
 """
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional, Tuple, Union
 
 
 class Dataset:
     def __init__(self, path: str): ...
 
     def get(self, index: int) -> int: ...
+
+    def iter_members(self, members: Optional[Union[str, Iterable[str], Callable[[str], bool]]] = None
+                     ) -> Iterator[Tuple[str, BinaryIO]]:
+        """Stream the files of the dataset's archive (`path`), without extracting it.
+
+        Examples:
+            ```python
+            >>> dataset = Dataset('datasets/webqsp.zip')
+            >>> for name, f in dataset.iter_members('*.json'):
+            ...     questions = json.load(f)
+            ```
+
+        Args:
+            members (Union[str, Iterable[str], Callable[[str], bool]]): Defaults
+                to None (every file). Glob pattern(s) or predicate on member names.
+
+        See Also:
+            `Downloader.iter_archive` - Iterate the files in a zip or tarball.
+
+        Yields:
+            Tuple[str, BinaryIO] - Member name & its (decompressed) content.
+        """
@@ -16,23 +16,72 @@
 """
 
 # Built-in libraries.
-from typing import Union, Tuple, List, Dict, Any, Iterable, Optional
+from typing import Union, Tuple, List, Dict, Any, Callable, Iterable, Iterator, Optional
 
 # Custom libraries.
 from sage.core.base import Base
 from sage.core.schema import Graph, Vertex
+from sage.core.snapshot import GraphSnapshot
+from sage.core.vocab import Vocabulary
+
+
+"""PRAGMAs a SQLite profile may set, in the order they're applied."""
+PRAGMAS = ...  # type: Tuple[str, ...]
+
+
+def sqlite_pragmas(profile: Optional[str] = None,
+                   pragmas: Optional[Dict[str, Union[str, int]]] = None) -> Dict[str, str]:
+    """PRAGMAs of a SQLite profile from `config/setup/global.cfg`, updated with `pragmas`.
+
+    Examples:
+        ```python
+        >>> sqlite_pragmas('serve', {'mmap_size': 0})
+        {'journal_mode': 'WAL', 'synchronous': 'NORMAL', 'cache_size': '-131072',
+         'mmap_size': '0', 'temp_store': 'MEMORY'}
+        ```
+
+    Args:
+        profile (Optional[str]): Defaults to `SETUP.SQLITE_PROFILE`. Profile name.
+        pragmas (Optional[Dict[str, Union[str, int]]]): Defaults to None. Overrides.
+
+    Raises:
+        ValueError: Unknown profile, PRAGMA or a value which isn't a plain word or number.
+
+    Returns:
+        Dict[str, str] - PRAGMA name -> value, ordered as `PRAGMAS`.
+    """
 
 
 class BaseKG(Base):
+    """Storage-agnostic Knowledge Graph.
+
+    Reading & loading data (`load`, `load_file`, `fromfile`) and snapshots
+    live here. Storage backends implement `get`, `get_vertex`, `add_vertex`,
+    `add_triple`, `close` & `snapshot`: `KnowledgeGraph` (SQLite) and
+    `sage.core.memory.MemoryKnowledgeGraph` (dicts & adjacency lists).
+    """
+
     """Supported file formats."""
     SUPPORTED_FORMATS = ...  # type: Tuple[str]
 
+    """Formats read as (subject, predicate, object) triples."""
+    TRIPLE_FORMATS = ...  # type: Tuple[str]
+
+    """Archives whose members are streamed by `load_archive`."""
+    ARCHIVE_FORMATS = ...  # type: Tuple[str]
+
     """Label given to Knowledge Graph for reference."""
     label = ...  # type: str
 
     """Description of the Knowledge Graph."""
     description = ...  # type: str
 
+    """schema.org vocabulary picking the most specific `@type`, if any."""
+    vocabulary = ...  # type: Optional[Vocabulary]
+
+    """PRAGMAs run on every new database connection."""
+    pragmas = ...  # type: Dict[str, str]
+
     def __init__(self, name: str, description: Optional[str] = None, base_dir: Optional[str] = None,
                  data: Optional[Union[Dict[str, Any], Iterable[Dict[str, Any]]]] = None,
                  data_file: Optional[str] = None,
@@ -51,13 +100,27 @@ class BaseKG(Base):
         Keyword Args:
             overwrite (bool): Defaults to False. Overwrite existing
                 Knowledge graph with same name.
+            bulk (bool): Defaults to False. Load `data` with bulk inserts.
+            chunk_size (int): Defaults to 0. Commit every `chunk_size` new
+                vertices when `bulk=True`.
+            profile (str): Defaults to `SETUP.SQLITE_PROFILE`. SQLite engine
+                profile from `config/setup/global.cfg`: "default", "bulk"
+                (cheap commits, not crash safe) or "serve" (WAL, so readers
+                don't wait for writers, & mmap reads).
+            pragmas (Dict[str, Union[str, int]]): Defaults to None. Overrides
+                of the profile's PRAGMAs, see `PRAGMAS`.
+            pool_size (int): Defaults to 5. Connections kept open for
+                reuse by threads. More are opened when needed.
+            vocabulary (Union[str, Vocabulary]): Defaults to None. Compiled
+                schema.org vocabulary (or its path) used to store vertices
+                with several `@type`s under the most specific one, instead
+                of the first.
 
         Raises:
             FileNotFoundError: When `data_file` doesn't exist.
             AssertionError: Raised when `data_file` isn't of the
                 supported format.
-            NotImplementedError: Raised when unimplemented supported
-                file format is encountered.
+            ValueError: Unknown `profile` or invalid `pragmas`.
         """
 
     def __repr__(self) -> str: ...
@@ -110,6 +173,46 @@ class BaseKG(Base):
             Union[List, Dict[str, Any]] - Linked data in a list or dict data structure.
         """
 
+    @staticmethod
+    def get_format(path: str) -> str:
+        """File format of a path, ignoring a trailing `.gz`.
+
+        Args:
+            path (str): Path to file, e.g. `dump.nt.gz`.
+
+        Returns:
+            str - Lower-cased format, e.g. `nt`.
+        """
+
+    @staticmethod
+    def stream(path: str, chunk_size: int = 65536) -> Iterator[Union[Dict[str, Any], List[Any], Tuple[str, str, Any]]]:
+        """Incrementally read data from a given file.
+
+        Unlike `read`, the file is never fully loaded in memory. Items are
+        yielded as soon as they're parsed, so they can be loaded while the
+        rest of the file is still being read.
+
+        JSON-LD files yield top-level items (see `sage.core.reader.iter_jsonld`),
+        while `TRIPLE_FORMATS` yield (subject, predicate, object) triples (see
+        `sage.core.reader.iter_ntriples` & `sage.core.reader.iter_rdfxml`).
+        Unlike `read`, a top-level `@graph` container yields its nodes, not
+        itself (unless it has properties of its own).
+
+        Args:
+            path (str): Path to file containing Linked data. File must be supported
+                file formats. See `KnowledgeGraph.SUPPORTED_FORMATS`.
+            chunk_size (int): Defaults to 65536. Number of characters read at a
+                time from JSON-LD files.
+
+        Raises:
+            FileNotFoundError: `path` doesn't exist.
+            AssertionError: `path` isn't of a supported format.
+
+        Returns:
+            Iterator[Union[Dict[str, Any], List[Any], Tuple[str, str, Any]]] - Top-level
+                items or triples in file.
+        """
+
     def add_edge(self, sub, obj, pred):
         """Add new edge to graph.
 
@@ -122,22 +225,167 @@ class BaseKG(Base):
 
         """
 
-    def add_triple(self, triples: Iterable[Tuple[str, str, str]]) -> None: ...
+    def add_triple(self, triples: Iterable[Tuple[str, str, Any]], graph_id: Optional[str] = None,
+                   chunk_size: int = 0, compact: bool = True) -> Dict[str, float]:
+        """Bulk load (subject, predicate, object) triples.
+
+        Subjects & IRI objects are get-or-created as vertices labelled with
+        their IRI (schema `Thing`). IRI objects are connected to their subject
+        with the predicate as the edge's description, while literal objects
+        (`sage.core.reader.Literal`, `int`, `float` or `bool`) are stored in
+        the subject's payload.
+
+        Examples:
+            ```python
+            >>> from sage.core.reader import iter_ntriples
+            >>> kg = KnowledgeGraph('dbpedia')
+            >>> kg.add_triple(iter_ntriples('mappingbased-objects.nt.gz'), chunk_size=100000)
+            INFO     | Loaded 5,012,281 vertices & 18,746,174 edges in ...
+            ```
+
+        Args:
+            triples (Iterable[Tuple[str, str, Any]]): Triples, e.g. from
+                `sage.core.reader.iter_ntriples`.
+            graph_id (str): Defaults to the default graph. Graph to load into.
+            chunk_size (int): Defaults to 0. Commit every `chunk_size` new
+                vertices. 0 loads everything in a single transaction.
+            compact (bool): Defaults to True. Use the local name of predicate
+                IRIs (e.g. `name` for `http://schema.org/name`).
+
+        Returns:
+            Dict[str, float] - Load statistics. See `sage.core.loader.BulkLoader.close`.
+        """
+
+    def load_file(self, path: str, graph_id: Optional[str] = None, bulk: bool = False,
+                  chunk_size: int = 0) -> Optional[Dict[str, float]]:
+        """Stream a file into the Knowledge Graph.
+
+        JSON-LD files are passed to `load`, triple formats (see `TRIPLE_FORMATS`)
+        to `add_triple` & archives (see `ARCHIVE_FORMATS`) to `load_archive`.
+
+        Notes:
+            JSON-LD is streamed (see `stream`), so the nodes of a top-level
+            `{"@context": ..., "@graph": [...]}` container are loaded without
+            the container itself. Before streaming, the container was also
+            loaded as an isolated "Unknown" `Thing` vertex. `load(read(path))`
+            still does that.
+
+        Args:
+            path (str): Path to file. File must be supported file formats.
+                See `KnowledgeGraph.SUPPORTED_FORMATS`.
+            graph_id (str): Defaults to the default graph. Graph to load into.
+            bulk (bool): Defaults to False. Load JSON-LD with bulk inserts.
+                Triples are always bulk loaded.
+            chunk_size (int): Defaults to 0. Commit every `chunk_size` new
+                vertices when bulk loading.
+
+        Raises:
+            FileNotFoundError: `path` doesn't exist.
+            AssertionError: `path` isn't of a supported format.
+
+        Returns:
+            Optional[Dict[str, float]] - Load statistics when bulk loading, or
+                the loaded member names of an archive.
+        """
+
+    def load_archive(self, path: str, members: Optional[Union[str, Iterable[str], Callable[[str], bool]]] = None,
+                     graph_id: Optional[str] = None, bulk: bool = False,
+                     chunk_size: int = 0) -> List[str]:
+        """Stream the supported files of a zip or tarball into the Knowledge Graph.
+
+        Members are parsed as they're decompressed (see `Downloader.iter_archive`),
+        nothing is extracted to disk. Each one is loaded like `load_file` would,
+        e.g. `dump/part-0001.nt.gz` as gzipped N-Triples. Members that aren't
+        of a supported format are skipped.
+
+        Examples:
+            ```python
+            >>> kg = KnowledgeGraph('wikidata')
+            >>> kg.load_archive('dumps.tar.gz', members='dump/*.nt.gz')
+            ['dump/part-0000.nt.gz', 'dump/part-0001.nt.gz']
+            ```
+
+        Args:
+            path (str): Path to a zip or tarball.
+            members (Union[str, Iterable[str], Callable[[str], bool]]): Defaults
+                to None (every supported file). Glob pattern(s) or predicate on
+                member names.
+            graph_id (str): Defaults to the default graph. Graph to load into.
+            bulk (bool): Defaults to False. Load JSON-LD with bulk inserts.
+            chunk_size (int): Defaults to 0. Commit every `chunk_size` new
+                vertices when bulk loading.
+
+        Raises:
+            FileNotFoundError: `path` doesn't exist.
+            ValueError: `path` is neither a zip nor a tarball.
+
+        Returns:
+            List[str] - Names of the loaded members, in archive order.
+        """
+
+    def load_wikidata(self, path: str, graph_id: Optional[str] = None, processes: int = 0,
+                      chunk_size: int = 0, language: str = 'en') -> Dict[str, float]:
+        """Load a Wikidata JSON entity dump (`latest-all.json(.gz)`).
+
+        Entities are parsed & transformed in a `multiprocessing` pool (see
+        `sage.core.wikidata.iter_entities`) while this process bulk-inserts
+        them, so ingestion scales with the number of cores. Vertices are
+        labelled with their entity id (e.g. `Q60`) & claims pointing to other
+        entities become edges described by the property id (e.g. `P150`).
+
+        Examples:
+            ```python
+            >>> kg = KnowledgeGraph('wikidata')
+            >>> kg.load_wikidata('latest-all.json.gz', processes=8, chunk_size=100000)
+            INFO     | Loaded ...
+            >>> kg['Q60', 'Item'].payload['name']
+            'New York City'
+            ```
+
+        Args:
+            path (str): Path to a (optionally gzipped) Wikidata JSON dump.
+            graph_id (str): Defaults to the default graph. Graph to load into.
+            processes (int): Defaults to 0. Number of worker processes.
+                0 uses all CPUs.
+            chunk_size (int): Defaults to 0. Commit every `chunk_size` new
+                vertices. 0 loads everything in a single transaction.
+            language (str): Defaults to 'en'. Language of labels & text values.
+
+        Returns:
+            Dict[str, float] - Load statistics. See `sage.core.loader.BulkLoader.close`.
+        """
 
     def add_vertex(self, label: str, schema: Optional[str] = None, graph_id: Optional[str] = None) -> Vertex:
         """Add a new Vertex/Node to the Graph if it doesn't already exist.
 
+        Notes:
+            New vertices are written with `INSERT ... ON CONFLICT DO NOTHING`
+            against the unique (graph_id, label, schema) index, so concurrent
+            writers adding the same vertex end up sharing one row.
+
         Args:
             label (str):
             schema (str): Defaults to None.
-            graph_id (str): Defaults to None.
+            graph_id (str): Defaults to None. The default graph is used if not given.
 
         Returns:
             Vertex - Added vertex.
         """
 
+    def release_session(self) -> None:
+        """Close the calling thread's session & return its connection to the pool.
+
+        Call it at the end of each unit of work in worker threads (e.g. per
+        request), its next lookup starts a new session which sees every
+        write committed since. The thread's vertex cache is emptied too,
+        since its vertices belonged to the closed session.
+
+        Returns:
+            None
+        """
+
     def close(self) -> None:
-        """Close database session & clean up resources.
+        """Close database session & release the engine's pooled connections.
 
         Returns:
             None
@@ -181,16 +429,22 @@ class BaseKG(Base):
             Union[Vertex, None] - Returns vertex if vertex exists in Graph otherwise, None.
         """
 
-    def load(self, data: Union[List[Dict[str, Any]], Dict[str, Any]], graph_id: str) -> None:
+    def load(self, data: Union[List[Dict[str, Any]], Dict[str, Any]], graph_id: str,
+             bulk: bool = False, chunk_size: int = 0) -> Optional[Dict[str, float]]:
         """Load knowledge data to Knowledge Graph.
 
         Args:
             data (Union[List[Dict[str, Any]], Dict[str, Any]]): Knowledge data to
-                be loaded into Knowledge Graph.
+                be loaded into Knowledge Graph. Iterators (e.g. from `stream`)
+                are consumed item by item.
             graph_id (str): Graph id to load vertices to. Defaults to the default graph.
+            bulk (bool): Defaults to False. Resolve vertices from an in-memory map &
+                write them with bulk inserts. See `sage.core.loader.BulkLoader`.
+            chunk_size (int): Defaults to 0. Only used when `bulk=True`. Commit every
+                `chunk_size` new vertices. 0 loads everything in one transaction.
 
         Returns:
-            None
+            Optional[Dict[str, float]] - Load statistics if `bulk=True`, otherwise None.
         """
 
 
@@ -211,7 +465,8 @@ class MultiKnowledgeGraph(Base):
     Attributes:
         name (str): Graph's identifier & the base name in file system.
         base (str): Base file where graph db is stored.
-        graphs (List[Graph]): List of related graphs.
+        graphs (List[KnowledgeGraph]): List of related graphs.
+        timings (Dict[str, float]): Seconds taken to build each graph by `from_dir`.
 
     Raises:
         FileNotFoundError - Occurs when a file is not found.
@@ -251,7 +506,10 @@ class MultiKnowledgeGraph(Base):
     base = ...  # type: str
 
     """List of related graphs."""
-    graphs = ...  # type: List[Graph]
+    graphs = ...  # type: List[KnowledgeGraph]
+
+    """Seconds taken to build each graph by `from_dir`."""
+    timings = ...  # type: Dict[str, float]
 
     def __init__(self, name: str, **kwargs):
         """Initialize an empty multiple knowledge graph.
@@ -296,25 +554,61 @@ class MultiKnowledgeGraph(Base):
                 arguments.
         """
 
-    def add_graph(self, name: str, data_file: str = None) -> Graph:
+    def add_graph(self, name: str, data_file: str = None, **kwargs) -> KnowledgeGraph:
         """Adds a new graph into the Knowledge Graph with optional data loaded.
 
+        The graph is stored in its own db file under `base_dir`.
+
         Args:
             name (str): Graph name identifier.
             data_file (str): Defaults to None. Path to a loadable data into
                 the graph. File must be of supported format.
-                See `Graph.SUPPORTED_FORMAT`.
+                See `KnowledgeGraph.SUPPORTED_FORMATS`.
+
+        Keyword Args:
+            See `KnowledgeGraph.__init__`, e.g. `overwrite`, `bulk` & `chunk_size`.
+
+        Raises:
+            KeyError: A graph named `name` already exists.
 
         Returns:
-            Graph - Returns created graph.
+            KnowledgeGraph - Returns created graph.
         """
 
     @classmethod
-    def from_dir(cls: MultiKnowledgeGraph, path: str) -> MultiKnowledgeGraph:
+    def from_dir(cls: MultiKnowledgeGraph, path: str, max_workers: int = 0,
+                 use_threads: bool = False, **kwargs) -> MultiKnowledgeGraph:
         """Creates a multiple graphs from data inferred from files in directory.
 
+        Every supported file is loaded into its own graph (named after the
+        file) by a bounded pool of workers, each writing to a separate SQLite
+        file under `base_dir`. Once built, the graphs are opened in the calling
+        thread with the same keyword arguments, except those only used for
+        loading (`overwrite`, `bulk`, `chunk_size`...). Build times are logged
+        & kept in `timings`.
+
+        Examples:
+            ```python
+            >>> mkg = MultiKnowledgeGraph.from_dir('resources/graph/schema-org', max_workers=4)
+            INFO     | Loaded `movie` in 0.41s.
+            ...
+            >>> mkg.timings['movie']
+            0.41
+            ```
+
         Args:
             path (str): Path to a directory containing files to be loaded.
+            max_workers (int): Defaults to 0. Maximum number of files loaded
+                concurrently. 0 uses the number of CPUs.
+            use_threads (bool): Defaults to False. Use a thread pool instead
+                of a process pool. Threads are cheaper to start but share the GIL.
+
+        Keyword Args:
+            See `KnowledgeGraph.__init__`, e.g. `overwrite`, `bulk` & `chunk_size`.
+
+        Raises:
+            FileNotFoundError: `path` isn't a directory.
+            KeyError: Two files map to the same graph name.
 
         Returns:
             MultiKnowledgeGraph - An instance of multiple knowledge graph
@@ -346,6 +640,23 @@ class KnowledgeGraph(BaseKG):
         label (str): Label given to Knowledge Graph for description.
         graph (Graph): Internal graph database managed by Knowledge Graph.
 
+    Thread Safety:
+        One writer, many readers. Every thread gets its own database session
+        & pooled connection, so lookups, `neighbors`, `find`, `search`,
+        `paths` & `query` can run concurrently. Writes (`add_vertex`, `load`,
+        `load_file`, `add_triple`, `load_wikidata` & `enable_search`) are
+        serialized by a lock. Open the graph with `profile='serve'` (WAL) so
+        readers aren't blocked while a write commits. Vertices belong to the
+        session of the thread that fetched them: don't share them across
+        threads, look them up again by id. Worker threads should call
+        `release_session` when done, to return their connection & see
+        writes made since.
+
+        Concurrency makes reads safe & non-blocking, not faster: most of a
+        lookup is ORM code holding the GIL (SQLite itself is ~3% of it), so
+        threads don't add throughput. Scale reads with processes, each
+        opening the graph, or with `load_snapshot` replicas.
+
     See Also:
         MultiKnowledgeGraph - stores multiple related graphs.
 
@@ -394,19 +705,42 @@ class KnowledgeGraph(BaseKG):
         Keyword Args:
             overwrite (bool): Defaults to False. Overwrite existing
                 Knowledge graph with same name.
+            bulk (bool): Defaults to False. Load `data` with bulk inserts.
+            chunk_size (int): Defaults to 0. Commit every `chunk_size` new
+                vertices when `bulk=True`.
+            cache_size (int): Defaults to 0. Keep up to `cache_size` lookups
+                of `get`, `__getitem__` & `__contains__` in an LRU cache. The
+                cache is emptied whenever a session commits or rolls back.
+                Each thread has its own cache. 0 disables caching.
+            full_text (bool): Defaults to False. Create the full-text index
+                used by `search`, see `enable_search`.
+            profile (str): Defaults to `SETUP.SQLITE_PROFILE`. SQLite engine
+                profile from `config/setup/global.cfg`: "default", "bulk"
+                (cheap commits, not crash safe) or "serve" (WAL, so readers
+                don't wait for writers, & mmap reads).
+            pragmas (Dict[str, Union[str, int]]): Defaults to None. Overrides
+                of the profile's PRAGMAs, see `PRAGMAS`.
+            pool_size (int): Defaults to 5. Connections kept open for
+                reuse by threads. More are opened when needed.
+            vocabulary (Union[str, Vocabulary]): Defaults to None. Compiled
+                schema.org vocabulary (or its path) used to store vertices
+                with several `@type`s under the most specific one, instead
+                of the first.
 
         Raises:
             FileNotFoundError: When `data_file` doesn't exist.
             AssertionError: Raised when `data_file` isn't of the
                 supported format.
-            NotImplementedError: Raised when unimplemented supported
-                file format is encountered.
+            ValueError: Unknown `profile` or invalid `pragmas`.
         """
 
     @classmethod
     def fromfile(cls: KnowledgeGraph, path: str, description: str = None, **kwargs) -> KnowledgeGraph:
         """Create KnowledgeGraph instance from file.
 
+        The file is read incrementally (see `BaseKG.stream`) & each item is
+        loaded as soon as it's parsed.
+
         Args:
             path (str): Path to a file. File must be supported file formats.
                 See `KnowledgeGraph.SUPPORTED_FORMATS`.
@@ -414,6 +748,9 @@ class KnowledgeGraph(BaseKG):
 
         Keyword Args:
             overwrite (bool): Defaults to False. Overwrite existing database file.
+            bulk (bool): Defaults to False. Load file with bulk inserts.
+            chunk_size (int): Defaults to 0. Commit every `chunk_size` new
+                vertices when `bulk=True`.
 
         Returns:
             KnowledgeGraph - An instance of knowledge graph, loaded with data
@@ -429,3 +766,354 @@ class KnowledgeGraph(BaseKG):
         Returns:
             Union[Vertex, None] - Returns a vertex object, or None otherwise.
         """
+
+    def get_many(self, items: Iterable[Union[str, Tuple[str, str]]]) -> List[Optional[Vertex]]:
+        """Look up many vertices by id or (label, schema) at once.
+
+        Same result as `[kg.get(item) for item in items]`, but cache misses
+        are fetched with one query per 400 items instead of one each.
+
+        Examples:
+            ```python
+            >>> kg.get_many([('Avatar', 'Movie'), avatar.id, ('Dune', 'Book')])
+            [<Vertex(label='Avatar', schema='Movie')>, <Vertex(label='Avatar', schema='Movie')>, None]
+            ```
+
+        Args:
+            items (Iterable[Union[str, Tuple[str, str]]]): Vertex ids or
+                (label, schema) pairs from the default graph.
+
+        Raises:
+            TypeError: An item isn't a str or tuple.
+
+        Returns:
+            List[Optional[Vertex]] - Vertex or None for each item, in order.
+        """
+
+    def cache_info(self) -> Optional[Dict[str, int]]:
+        """Vertex cache statistics.
+
+        Examples:
+            ```python
+            >>> kg = KnowledgeGraph('movie', cache_size=10000)
+            >>> ('Avatar', 'Movie') in kg and kg['Avatar', 'Movie']
+            <Vertex(label='Avatar', schema='Movie')>
+            >>> kg.cache_info()
+            {'hits': 1, 'misses': 1, 'evictions': 0, 'size': 2, 'maxsize': 10000}
+            ```
+
+        Returns:
+            Optional[Dict[str, int]] - `hits`, `misses`, `evictions`, `size` &
+                `maxsize` of the calling thread's cache, or None if caching
+                is disabled.
+        """
+
+    def cache_clear(self) -> None:
+        """Empty the vertex cache of every thread. Statistics are kept."""
+
+    def neighbors(self, vertex: Union[str, Vertex], predicate: Optional[Union[str, Iterable[str]]] = None,
+                  direction: str = 'out') -> List[Tuple[str, Vertex]]:
+        """Neighbors of a vertex & the predicates connecting them, in one query.
+
+        Replaces iterating `vertex.edges` & calling `kg[edge.vertex_id]` for
+        each edge, which costs a query per neighbor.
+
+        Examples:
+            ```python
+            >>> avatar = kg['Avatar', 'Movie']
+            >>> kg.neighbors(avatar)
+            [('director', <Vertex(label='James Cameron', schema='Person')>)]
+            >>> kg.neighbors(kg['James Cameron', 'Person'], direction='in')
+            [('director', <Vertex(label='Avatar', schema='Movie')>)]
+            ```
+
+        Args:
+            vertex (Union[str, Vertex]): Vertex or vertex ID.
+            predicate (Optional[Union[str, Iterable[str]]]): Defaults to None.
+                Only follow edges with these predicates.
+            direction (str): Defaults to 'out'. 'out' for edges leaving
+                `vertex`, 'in' for edges pointing to it or 'both'.
+
+        Raises:
+            ValueError: Unknown `direction`.
+
+        Returns:
+            List[Tuple[str, Vertex]] - (predicate, neighbor) pairs in insertion order.
+        """
+
+    def neighbors_many(self, vertices: Iterable[Union[str, Vertex]],
+                       predicate: Optional[Union[str, Iterable[str]]] = None,
+                       direction: str = 'out') -> Dict[str, List[Tuple[str, Vertex]]]:
+        """Batched `neighbors`: one query per 400 source vertices.
+
+        Args:
+            vertices (Iterable[Union[str, Vertex]]): Vertices or vertex IDs.
+            predicate (Optional[Union[str, Iterable[str]]]): Defaults to None.
+                Only follow edges with these predicates.
+            direction (str): Defaults to 'out'. One of 'out', 'in' or 'both'.
+
+        Raises:
+            ValueError: Unknown `direction`.
+
+        Returns:
+            Dict[str, List[Tuple[str, Vertex]]] - (predicate, neighbor) pairs
+                of every vertex ID.
+        """
+
+    def find(self, schema: Optional[str] = None, graph_id: Optional[str] = None,
+             limit: int = 0, **props: Any) -> List[Vertex]:
+        """Vertices whose payload matches every `props` filter.
+
+        Filters run in SQL against the indexed property table, so payloads
+        are never decoded in Python. Only primitive payload values (str, int,
+        float & bool) are indexed.
+
+        Examples:
+            ```python
+            >>> kg.find(schema='Movie', genre='Science Fiction')
+            [<Vertex(label='Avatar', schema='Movie')>]
+            >>> kg.find(genre=['Science Fiction', 'Drama'], limit=10)
+            [<Vertex(label='Avatar', schema='Movie')>, ...]
+            ```
+
+        Args:
+            schema (Optional[str]): Defaults to None. Only vertices of this schema.
+            graph_id (Optional[str]): Defaults to None. Graph to search,
+                the default graph if None.
+            limit (int): Defaults to 0. Maximum number of vertices, 0 for all.
+            **props (Any): Payload key & expected value. A list, tuple or set
+                matches any of its values.
+
+        Raises:
+            TypeError: A value isn't a str, int, float or bool.
+
+        Returns:
+            List[Vertex] - Matching vertices.
+        """
+
+    def enable_search(self, rebuild: bool = False) -> None:
+        """Create the FTS5 full-text index & index every existing vertex.
+
+        Triggers keep the index in sync with `vertex` from then on, including
+        after the graph is re-opened. Same as passing `full_text=True` when
+        creating the graph.
+
+        Args:
+            rebuild (bool): Defaults to False. Drop & rebuild an existing
+                index, e.g. after a `VACUUM` re-numbered vertex rowids.
+
+        Returns:
+            None
+        """
+
+    def search(self, query: str, schema: Optional[str] = None,
+               graph_id: Optional[str] = None, limit: int = 10) -> List[Vertex]:
+        """Ranked full-text search over vertex labels, aliases & string payload values.
+
+        Every word of `query` must match; a word ending with "*" matches as a
+        prefix. Results are ranked with BM25, label matches weigh most, then
+        aliases, then other payload text.
+
+        Examples:
+            ```python
+            >>> kg = KnowledgeGraph('movies', full_text=True, data_file='movie.jsonld')
+            >>> kg.search('james cam*', schema='Person')
+            [<Vertex(label='James Cameron', schema='Person')>]
+            ```
+
+        Args:
+            query (str): Words to search for.
+            schema (Optional[str]): Defaults to None. Only vertices of this schema.
+            graph_id (Optional[str]): Defaults to None. Graph to search,
+                the default graph if None.
+            limit (int): Defaults to 10. Maximum number of results, 0 for all.
+
+        Raises:
+            RuntimeError: Full-text index wasn't enabled.
+
+        Returns:
+            List[Vertex] - Matching vertices, best match first.
+        """
+
+    def paths(self, src: Union[str, Vertex], dst: Union[str, Vertex], max_hops: int = 3,
+              predicates: Optional[Union[str, Iterable[str]]] = None,
+              direction: str = 'out', limit: int = 100) -> List[List[Tuple[Vertex, str, Vertex]]]:
+        """Simple paths of at most `max_hops` edges from `src` to `dst`.
+
+        Runs as a single recursive CTE inside SQLite. Paths never visit a
+        vertex twice & are produced shortest first, so the walk stops as
+        soon as `limit` paths are found.
+
+        Examples:
+            ```python
+            >>> kg.paths(kg['Avatar', 'Movie'], kg['Suzy Amis', 'Person'], max_hops=2)
+            [[(<Vertex(label='Avatar', schema='Movie')>, 'director',
+               <Vertex(label='James Cameron', schema='Person')>),
+              (<Vertex(label='James Cameron', schema='Person')>, 'spouse',
+               <Vertex(label='Suzy Amis', schema='Person')>)]]
+            ```
+
+        Args:
+            src (Union[str, Vertex]): Start vertex or vertex ID.
+            dst (Union[str, Vertex]): End vertex or vertex ID.
+            max_hops (int): Defaults to 3. Maximum number of edges in a path.
+            predicates (Optional[Union[str, Iterable[str]]]): Defaults to None.
+                Only follow edges with these predicates.
+            direction (str): Defaults to 'out'. Follow edges forward ('out'),
+                backward ('in') or both ways ('both').
+            limit (int): Defaults to 100. Maximum number of paths, 0 for all.
+                Keep it set on dense graphs: the number of simple paths
+                grows exponentially with `max_hops`.
+
+        Raises:
+            ValueError: Unknown `direction`.
+
+        Returns:
+            List[List[Tuple[Vertex, str, Vertex]]] - Paths as lists of
+                (source, predicate, target) edges, in their stored direction.
+        """
+
+    def shortest_path(self, src: Union[str, Vertex], dst: Union[str, Vertex], max_hops: int = 6,
+                      predicates: Optional[Union[str, Iterable[str]]] = None,
+                      direction: str = 'out') -> Optional[List[Tuple[Vertex, str, Vertex]]]:
+        """Shortest path from `src` to `dst` with a bidirectional breadth first search.
+
+        Each BFS level is fetched with one query (per 400 vertices), always
+        growing the smaller of the two frontiers; visited vertices are
+        never expanded twice.
+
+        Args:
+            src (Union[str, Vertex]): Start vertex or vertex ID.
+            dst (Union[str, Vertex]): End vertex or vertex ID.
+            max_hops (int): Defaults to 6. Give up after this many edges.
+            predicates (Optional[Union[str, Iterable[str]]]): Defaults to None.
+                Only follow edges with these predicates.
+            direction (str): Defaults to 'out'. One of 'out', 'in' or 'both'.
+
+        Raises:
+            ValueError: Unknown `direction`.
+
+        Returns:
+            Optional[List[Tuple[Vertex, str, Vertex]]] - (source, predicate, target)
+                edges of the path, an empty list when `src` is `dst` or None
+                when they aren't connected within `max_hops`.
+        """
+
+    def query(self, patterns: Iterable[Tuple[Any, str, Any]], graph_id: Optional[str] = None,
+              limit: int = 0, resolve: bool = True,
+              batch_size: int = 500) -> Iterator[Dict[str, Union[str, Vertex]]]:
+        """Stream matches of a basic graph pattern, evaluated as a single SQL join.
+
+        Terms starting with "?" are variables. Subjects are variables, vertex
+        ids, `Vertex` objects or (label, schema) pairs. Objects are variables,
+        `Vertex` objects, (label, schema) pairs or literals (str, int, float,
+        bool) matched against payload values. The "@type" predicate matches
+        a vertex's schema. See `sage.core.query.Pattern` for join planning.
+
+        Examples:
+            ```python
+            >>> for match in kg.query([('?m', 'director', '?p'), ('?m', '@type', 'Movie'),
+            ...                        ('?p', 'name', 'James Cameron')]):
+            ...     print(match['m'])
+            <Vertex(label='Avatar', schema='Movie')>
+            ```
+
+        Args:
+            patterns (Iterable[Tuple[Any, str, Any]]): (subject, predicate, object)
+                triple patterns.
+            graph_id (Optional[str]): Defaults to None. Graph to match,
+                the default graph if None.
+            limit (int): Defaults to 0. Maximum number of matches, 0 for all.
+            resolve (bool): Defaults to True. Bind vertex variables to `Vertex`
+                objects (one extra lookup per batch), otherwise to vertex ids.
+            batch_size (int): Defaults to 500. Rows fetched at a time.
+
+        Raises:
+            ValueError: Invalid patterns, see `Pattern`.
+            TypeError: Invalid subject, predicate or literal.
+
+        Returns:
+            Iterator[Dict[str, Union[str, Vertex]]] - Variable name (without
+                "?") -> value, for every match.
+        """
+
+    def snapshot(self, payloads: bool = False) -> GraphSnapshot:
+        """Export the default graph into an in-memory CSR adjacency.
+
+        Vertices & edges are read with two bulk queries. The snapshot is
+        read-only & doesn't follow later changes to the graph.
+
+        Examples:
+            ```python
+            >>> kg = KnowledgeGraph.fromfile('resources/graph/schema-org/movie.jsonld')
+            >>> snap = kg.snapshot()
+            >>> snap
+            GraphSnapshot(vertices=..., edges=..., predicates=...)
+            >>> hops = snap.k_hop([('Avatar', 'Movie')], k=2, predicates=['director'])
+            >>> snap.to_ids(hops)
+            ['e147c670075ef62b']
+            ```
+
+        Args:
+            payloads (bool): Defaults to False. Also capture the JSON payload
+                of every vertex, see `GraphSnapshot.payload`.
+
+        Returns:
+            GraphSnapshot - Vertices, edges & interned predicates of the graph.
+        """
+
+    def save_snapshot(self, path: str) -> GraphSnapshot:
+        """Write the default graph, payloads included, to a binary snapshot file.
+
+        See `GraphSnapshot.save` for the format & `load_snapshot` to open it.
+
+        Args:
+            path (str): Destination file.
+
+        Returns:
+            GraphSnapshot - The snapshot which was written.
+        """
+
+    def iter_vertices(self, graph_id: Optional[str] = None,
+                      batch_size: int = 1000) -> Iterator[Vertex]:
+        """Iterate over a graph's vertices, fetching `batch_size` rows at a time.
+
+        Unlike `vertices`, memory use doesn't grow with the graph.
+
+        Args:
+            graph_id (str): Defaults to None. The default graph is used if not given.
+            batch_size (int): Defaults to 1000. Rows fetched per round trip.
+
+        Raises:
+            ValueError: `batch_size` is less than 1.
+
+        Returns:
+            Iterator[Vertex] - Vertices of the graph.
+        """
+
+    @staticmethod
+    def load_snapshot(path: str, verify: bool = False) -> GraphSnapshot:
+        """Memory-map a snapshot written by `save_snapshot`, without opening the database.
+
+        Meant for read-only replicas: opening is independent of the graph's
+        size & processes mapping the same file share its pages.
+
+        Examples:
+            ```python
+            >>> kg.save_snapshot('movies.snap')
+            >>> snap = KnowledgeGraph.load_snapshot('movies.snap')
+            >>> snap.payload(('Avatar', 'Movie'))['duration']
+            162
+            ```
+
+        Args:
+            path (str): Snapshot file.
+            verify (bool): Defaults to False. Check every section's CRC32,
+                which reads the whole file.
+
+        Raises:
+            ValueError: Not a snapshot, unsupported version or corrupted data.
+
+        Returns:
+            GraphSnapshot - Read-only snapshot backed by the file.
+        """
@@ -0,0 +1,183 @@
+"""Bulk write path for loading large Knowledge Graphs.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: loader.pyi
+     Package: sage.core
+     Created on 18 October, 2026 @ 10:12 AM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+from typing import Any, Dict, Iterable, List, Tuple, Union, Optional
+
+from sage.core.graph import BaseKG
+
+
+class BulkLoader:
+    """Buffered get-or-create writer used by `BaseKG.load(..., bulk=True)`.
+
+    Vertices are resolved from an in-memory `(label, schema) -> id` map
+    instead of one query per node. New vertices, edges & connections are
+    buffered and written with executemany inserts, either in a single
+    transaction or committed every `chunk_size` vertices. Edges are
+    de-duplicated in memory until they're written, then by the unique
+    edge index, so the id map is the only state growing with the graph.
+
+    Examples:
+        ```python
+        >>> with BulkLoader(kg, kg._default_graph.id, chunk_size=100000) as loader:
+        ...     loader.load(data)
+        INFO     | Loaded 250,000 vertices & 410,311 edges in 9.81s (25,484 vertices/sec).
+        >>> loader.stats['vertices_per_sec']
+        25484.2
+        ```
+
+    Attributes:
+        BUFFER_SIZE (int): Maximum number of buffered rows before they are
+            written (but not committed) to the database.
+        kg (BaseKG): Knowledge Graph being loaded.
+        graph_id (str): Graph vertices are loaded into.
+        chunk_size (int): Commit every `chunk_size` new vertices.
+            0 loads everything in a single transaction.
+        n_vertices (int): Number of vertices created so far.
+        n_edges (int): Number of edges created so far.
+        stats (Optional[Dict[str, float]]): Load statistics, available
+            after `close()`.
+    """
+
+    """Maximum number of buffered rows before they are written to the db."""
+    BUFFER_SIZE = ...  # type: int
+
+    """Knowledge Graph being loaded."""
+    kg = ...  # type: BaseKG
+
+    """Graph vertices are loaded into."""
+    graph_id = ...  # type: str
+
+    """Commit every `chunk_size` new vertices. 0 means single transaction."""
+    chunk_size = ...  # type: int
+
+    """Number of vertices created so far."""
+    n_vertices = ...  # type: int
+
+    """Number of edges created so far."""
+    n_edges = ...  # type: int
+
+    """Load statistics, available after `close()`."""
+    stats = ...  # type: Optional[Dict[str, float]]
+
+    def __init__(self, kg: BaseKG, graph_id: str, chunk_size: int = 0):
+        """Create a bulk loader for `graph_id`.
+
+        Args:
+            kg (BaseKG): Knowledge Graph to load into.
+            graph_id (str): Graph vertices are loaded into.
+            chunk_size (int): Defaults to 0. Commit every `chunk_size` new
+                vertices. 0 loads everything in a single transaction.
+        """
+
+    def __enter__(self) -> BulkLoader: ...
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Flush & commit, or roll back if an exception was raised."""
+
+    def add_vertex(self, label: str, schema: str) -> str:
+        """Get or create a vertex.
+
+        Args:
+            label (str): Vertex label.
+            schema (str): Vertex schema.
+
+        Returns:
+            str - Vertex ID.
+        """
+
+    def add_payload(self, vertex_id: str, key: str, value: Union[int, float, str, bool],
+                    append: bool = False) -> None:
+        """Set a payload entry on a vertex.
+
+        Args:
+            vertex_id (str): Vertex ID returned by `add_vertex`.
+            key (str): Payload key.
+            value (Union[int, float, str, bool]): Primitive payload value.
+            append (bool): Defaults to False. Keep earlier values of `key`,
+                collecting them into a list (see `sage.core.reader.add_literal`).
+
+        Returns:
+            None
+        """
+
+    def add_edge(self, source: str, target: str, predicate: str) -> None:
+        """Connect `source` to `target` unless they're already connected by `predicate`.
+
+        Args:
+            source (str): Source vertex ID.
+            target (str): Target vertex ID.
+            predicate (str): Description of their connection.
+
+        Returns:
+            None
+        """
+
+    def load(self, data: Union[List[Dict[str, Any]], Dict[str, Any]]) -> None:
+        """Buffer knowledge data. Same traversal as `BaseKG.load`.
+
+        Args:
+            data (Union[List[Dict[str, Any]], Dict[str, Any]]): Knowledge data.
+
+        Returns:
+            None
+        """
+
+    def add_triples(self, triples: Iterable[Tuple[str, str, Any]], compact: bool = True) -> None:
+        """Buffer (subject, predicate, object) triples.
+
+        Subjects & IRI objects become vertices with schema `Thing`, literal
+        objects become payload entries & IRI objects are connected to their
+        subject by an edge. Repeated literal predicates, e.g. a name in
+        several languages, are collected into a list.
+
+        Args:
+            triples (Iterable[Tuple[str, str, Any]]): Triples, e.g. from
+                `sage.core.reader.iter_ntriples`.
+            compact (bool): Defaults to True. Use the local name of predicate IRIs.
+
+        Returns:
+            None
+        """
+
+    def add_entities(self, entities: Iterable[Tuple[str, str, Dict[str, Any], List[Tuple[str, str, str]]]]) -> None:
+        """Buffer transformed Wikidata entities.
+
+        Args:
+            entities (Iterable[Tuple[str, str, Dict[str, Any], List[Tuple[str, str, str]]]]):
+                Entities from `sage.core.wikidata.iter_entities`.
+
+        Returns:
+            None
+        """
+
+    def flush(self, commit: bool = False) -> None:
+        """Write buffered rows to the database.
+
+        Args:
+            commit (bool): Defaults to False. Commit the transaction after writing.
+
+        Returns:
+            None
+        """
+
+    def close(self) -> Dict[str, float]:
+        """Flush, commit & report throughput.
+
+        Returns:
+            Dict[str, float] - Number of `vertices` & `edges` created, elapsed
+                `seconds` & `vertices_per_sec`.
+        """
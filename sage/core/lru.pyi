@@ -0,0 +1,77 @@
+"""Size-bounded least recently used (LRU) cache.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: lru.pyi
+     Package: sage.core
+     Created on 18 October, 2026 @ 03:10 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+from typing import Any, Dict, Hashable
+
+"""Returned by `LRUCache.get` for keys which aren't cached."""
+MISSING = ...  # type: object
+
+
+class LRUCache:
+    """Mapping which evicts its least recently used entry once full.
+
+    Examples:
+        ```python
+        >>> cache = LRUCache(2)
+        >>> cache.put('a', 1); cache.put('b', 2); cache.put('c', 3)
+        >>> cache.get('a') is MISSING
+        True
+        >>> cache.info()
+        {'hits': 0, 'misses': 1, 'evictions': 1, 'size': 2, 'maxsize': 2}
+        ```
+
+    Attributes:
+        maxsize (int): Maximum number of entries.
+        hits (int): Number of `get` calls which found their key.
+        misses (int): Number of `get` calls which didn't.
+        evictions (int): Number of entries evicted to make room.
+    """
+
+    maxsize = ...  # type: int
+    hits = ...  # type: int
+    misses = ...  # type: int
+    evictions = ...  # type: int
+
+    def __init__(self, maxsize: int):
+        """Create an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of entries.
+
+        Raises:
+            ValueError: `maxsize` isn't positive.
+        """
+
+    def __len__(self) -> int: ...
+
+    def __contains__(self, key: Hashable) -> bool: ...
+
+    def get(self, key: Hashable) -> Any:
+        """Cached value of `key`, marked as most recently used.
+
+        Returns:
+            Any - Cached value, or `MISSING`.
+        """
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache `value`, evicting the least recently used entry if full."""
+
+    def clear(self) -> None:
+        """Drop every entry. Statistics are kept."""
+
+    def info(self) -> Dict[str, int]:
+        """`hits`, `misses`, `evictions`, current `size` & `maxsize`."""
@@ -0,0 +1,186 @@
+"""In-memory storage backend for Knowledge Graphs.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: memory.pyi
+     Package: sage.core
+     Created on 18 October, 2026 @ 09:30 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from sage.core.graph import BaseKG
+from sage.core.snapshot import GraphSnapshot
+
+
+class MemoryEdge:
+    """Edge record: `source_id` is connected to `vertex_id` by `predicate`.
+
+    Attributes:
+        id (int): Creation order.
+        source_id (str): Source vertex id.
+        vertex_id (str): Target vertex id.
+        predicate (str): Interned predicate.
+    """
+    __slots__ = ('id', 'source_id', 'vertex_id', 'predicate')
+
+    def __init__(self, edge_id: int, source_id: str, vertex_id: str, predicate: str) -> None: ...
+
+    def __repr__(self) -> str: ...
+
+
+class MemoryVertex:
+    """Vertex record holding its own out & in adjacency lists.
+
+    Same attributes & `add_neighbor`/`get_connection` contract as
+    `sage.core.schema.Vertex`, without a database session behind it.
+
+    Attributes:
+        id (str): Unique ID.
+        label (str): Interned label.
+        schema (str): Interned schema.
+        graph_id (str): Graph which vertex belongs to.
+        payload (Dict[str, Any]): Primitive properties.
+        edges (List[MemoryEdge]): Outgoing edges, in creation order.
+        in_edges (List[MemoryEdge]): Incoming edges, in creation order.
+    """
+    __slots__ = ('id', 'label', 'schema', 'graph_id', 'payload',
+                 'edges', 'in_edges', '_targets', '_edge_ids')
+
+    def __repr__(self) -> str: ...
+
+    def add_neighbor(self, nbr: MemoryVertex, predicate: Optional[str] = None) -> MemoryEdge:
+        """Connect to `nbr`, or return the existing edge with this predicate."""
+
+    def add_payload(self, payload: Dict[str, Any]) -> None:
+        """Copy primitive values of keys not starting with "@"."""
+
+    def get_connection(self, nbr: MemoryVertex,
+                       predicate: Optional[str] = None) -> Optional[MemoryEdge]:
+        """Edge to `nbr` with `predicate`, otherwise its first edge to `nbr`."""
+
+
+class MemoryKnowledgeGraph(BaseKG):
+    """Knowledge Graph held in dicts & adjacency lists instead of SQLite.
+
+    A drop-in `BaseKG` backend for graphs that fit in RAM: vertices live in
+    an id -> record dict plus a (graph, label, schema) index, each record
+    keeps its own out & in edge lists, and labels, schemas & predicates are
+    interned. Reads & writes don't pay for SQL or the ORM.
+
+    It supports the same API as `KnowledgeGraph`: `get`, `get_many`,
+    `add_vertex`, `load`, `load_file`, `add_triple`, `load_wikidata`,
+    `neighbors`, `neighbors_many`, `find`, `paths`, `shortest_path`,
+    `query`, `vertices`, `iter_vertices` & snapshots. The differences are:
+        - Nothing is persisted, use `save_snapshot` to keep a copy.
+        - `search` isn't supported (it needs SQLite's FTS5).
+        - `find` scans payloads instead of using an index.
+        - `paths` returns the same paths, but their order within one
+          depth may differ.
+
+    Writes are serialized by the same writer lock as `KnowledgeGraph`.
+
+    Examples:
+        ```python
+        >>> kg = MemoryKnowledgeGraph('movie', data=KnowledgeGraph.read(path))
+        >>> kg.neighbors(kg['Avatar', 'Movie'])
+        [('director', <Vertex(label='James Cameron', schema='Person')>)]
+        >>> kg.save_snapshot('movie.snap')
+        ```
+    """
+
+    """List of all vertices in the default graph."""
+    vertices = ...  # type: List[MemoryVertex]
+
+    def __init__(self, name: str, description: Optional[str] = None, base_dir: Optional[str] = None,
+                 data: Optional[Union[Dict[str, Any], Iterable[Dict[str, Any]]]] = None,
+                 data_file: Optional[str] = None,
+                 **kwargs):
+        """In-memory Knowledge Graph initialization.
+
+        Args:
+            name (str): Label given to Knowledge Graph for description.
+            description (str): Defaults to None. Knowledge graph's description.
+            base_dir (str): Defaults to `FS.DATABASE_DIR`. Unused, nothing is written.
+            data (Union[Dict[str, Any], Iterable[Dict[str, Any]]]): Defaults to None.
+                Knowledge data to be loaded into the Knowledge Graph.
+            data_file (str): Defaults to None. Path to Knowledge data.
+
+        Keyword Args:
+            vocabulary (Union[str, Vocabulary]): Defaults to None. See `KnowledgeGraph`.
+
+        Raises:
+            FileNotFoundError: When `data_file` doesn't exist.
+        """
+
+    def __len__(self) -> int:
+        """Number of vertices, in every graph."""
+
+    def get(self, item: Union[str, Tuple[str, str]]) -> Optional[MemoryVertex]: ...
+
+    def get_many(self, items: Iterable[Union[str, Tuple[str, str]]]) -> List[Optional[MemoryVertex]]: ...
+
+    def get_vertex(self, vertex_id: Optional[str] = None, label: Optional[str] = None,
+                   schema: Optional[str] = None,
+                   graph_id: Optional[str] = None) -> Optional[MemoryVertex]: ...
+
+    def get_vertex_by_label(self, label: str) -> List[MemoryVertex]: ...
+
+    def add_vertex(self, label: str, schema: str, graph_id: Optional[str] = None) -> MemoryVertex: ...
+
+    def iter_vertices(self, graph_id: Optional[str] = None,
+                      batch_size: int = 1000) -> Iterator[MemoryVertex]: ...
+
+    def close(self) -> None:
+        """Drop every vertex & edge."""
+
+    def add_triple(self, triples: Iterable[Tuple[str, str, Any]], graph_id: Optional[str] = None,
+                   chunk_size: int = 0, compact: bool = True) -> Dict[str, float]:
+        """Same graph & statistics as `KnowledgeGraph.add_triple`. `chunk_size` is ignored."""
+
+    def load_wikidata(self, path: str, graph_id: Optional[str] = None, processes: int = 0,
+                      chunk_size: int = 0, language: str = 'en') -> Dict[str, float]:
+        """Same graph & statistics as `KnowledgeGraph.load_wikidata`."""
+
+    def neighbors(self, vertex: Union[str, MemoryVertex],
+                  predicate: Optional[Union[str, Iterable[str]]] = None,
+                  direction: str = 'out') -> List[Tuple[str, MemoryVertex]]: ...
+
+    def neighbors_many(self, vertices: Iterable[Union[str, MemoryVertex]],
+                       predicate: Optional[Union[str, Iterable[str]]] = None,
+                       direction: str = 'out') -> Dict[str, List[Tuple[str, MemoryVertex]]]: ...
+
+    def find(self, schema: Optional[str] = None, graph_id: Optional[str] = None,
+             limit: int = 0, **props: Any) -> List[MemoryVertex]: ...
+
+    def search(self, query: str, schema: Optional[str] = None,
+               graph_id: Optional[str] = None, limit: int = 10) -> List[MemoryVertex]:
+        """Not supported.
+
+        Raises:
+            RuntimeError: Always, full-text search needs `KnowledgeGraph`.
+        """
+
+    def paths(self, src: Union[str, MemoryVertex], dst: Union[str, MemoryVertex],
+              max_hops: int = 3, predicates: Optional[Union[str, Iterable[str]]] = None,
+              direction: str = 'out',
+              limit: int = 100) -> List[List[Tuple[MemoryVertex, str, MemoryVertex]]]: ...
+
+    def shortest_path(self, src: Union[str, MemoryVertex], dst: Union[str, MemoryVertex],
+                      max_hops: int = 6, predicates: Optional[Union[str, Iterable[str]]] = None,
+                      direction: str = 'out') -> Optional[List[Tuple[MemoryVertex, str, MemoryVertex]]]: ...
+
+    def query(self, patterns: Iterable[Tuple[Any, str, Any]], graph_id: Optional[str] = None,
+              limit: int = 0, resolve: bool = True,
+              batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Same as `KnowledgeGraph.query`, joined in memory in the planned order."""
+
+    def snapshot(self, payloads: bool = False) -> GraphSnapshot: ...
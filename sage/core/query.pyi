@@ -0,0 +1,106 @@
+"""Basic graph pattern (BGP) queries compiled to a single SQL join.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: query.pyi
+     Package: sage.core
+     Created on 18 October, 2026 @ 05:40 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+from sage.core.schema import Vertex
+
+# A variable ("?name"), constant vertex, vertex id, predicate or literal.
+Term = Union[str, int, float, bool, Vertex]
+
+"""Predicate matching a vertex's schema instead of an edge."""
+TYPE = ...  # type: str
+
+
+def is_variable(term: Any) -> bool:
+    """Whether `term` is a variable, i.e. a string starting with "?"."""
+
+
+class Pattern:
+    """Conjunction of (subject, predicate, object) triple patterns.
+
+    Terms starting with "?" are variables. Subjects are vertex variables or
+    constant vertex ids. Objects are vertex variables, constant vertices
+    (given as `Vertex` objects) or literals, which match primitive payload
+    values through the property table. The "@type" predicate matches a
+    vertex's schema, its object is a schema name or a string variable.
+
+    The patterns compile to one SQL statement joining `vertex`, `edge` &
+    `property`. Joins are ordered greedily by a heuristic cost: constants &
+    variables bound by earlier joins hit an index, so they go first, while
+    unconstrained scans go last. `CROSS JOIN` keeps SQLite on that order.
+
+    Examples:
+        ```python
+        >>> query = Pattern([('?m', 'director', '?p'), ('?m', '@type', 'Movie')])
+        >>> query.variables
+        {'?m': 'vertex', '?p': 'vertex'}
+        >>> sql, params = query.compile(graph_id)
+        ```
+
+    Attributes:
+        patterns (List[Tuple[Term, str, Term]]): Triple patterns.
+        variables (Dict[str, str]): Variable name -> "vertex" or "string",
+            in order of appearance.
+    """
+
+    """Triple patterns."""
+    patterns = ...  # type: List[Tuple[Term, str, Term]]
+
+    """Variable name -> "vertex" or "string", in order of appearance."""
+    variables = ...  # type: Dict[str, str]
+
+    def __init__(self, patterns: Iterable[Tuple[Term, str, Term]]) -> None:
+        """Validate patterns & infer the kind of every variable.
+
+        Args:
+            patterns (Iterable[Tuple[Term, str, Term]]): (subject, predicate, object)
+                triple patterns.
+
+        Raises:
+            ValueError: No patterns, a pattern isn't a triple or a variable is
+                used both as a vertex & a string.
+            TypeError: Invalid subject or predicate.
+        """
+
+    def __repr__(self) -> str: ...
+
+    def compile(self, graph_id: str, limit: int = 0) -> Tuple[str, Dict[str, Any]]:
+        """SQL selecting every variable, with joins ordered by estimated cost.
+
+        Column `v<i>` of each result row is the value of the i-th variable.
+
+        Args:
+            graph_id (str): Graph which vertex variables belong to.
+            limit (int): Defaults to 0. Maximum number of rows, 0 for all.
+
+        Raises:
+            TypeError: A literal isn't a str, int, float or bool.
+
+        Returns:
+            Tuple[str, Dict[str, Any]] - SQL & its bound parameters.
+        """
+
+    def plan(self) -> List[Tuple]:
+        """Atoms in join order, as `compile` emits them.
+
+        Atoms are ('vertex', variable, schemas), ('edge', subject, predicate, object)
+        or ('property', subject, key, literal) tuples.
+
+        Returns:
+            List[Tuple] - Ordered atoms.
+        """
@@ -0,0 +1,188 @@
+"""Streaming readers for Linked Data files.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: reader.pyi
+     Package: sage.core
+     Created on 18 October, 2026 @ 11:05 AM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple, Union
+
+# Type aliases.
+Source = Union[str, IO]
+Triple = Tuple[str, str, Union[str, 'Literal', int, float, bool]]
+
+"""XML Schema namespace."""
+XSD = ...  # type: str
+
+"""RDF syntax namespace."""
+RDF = ...  # type: str
+
+
+class Literal(str):
+    """String literal, as opposed to an IRI or blank node (plain `str`)."""
+
+
+def local_name(iri: str) -> str:
+    """Last segment of an IRI.
+
+    Examples:
+        ```python
+        >>> local_name('http://schema.org/name')
+        'name'
+        >>> local_name('http://xmlns.com/foaf/0.1/#knows')
+        'knows'
+        ```
+
+    Args:
+        iri (str): An IRI.
+
+    Returns:
+        str - Segment after the last `#`, `/` or `:`.
+    """
+
+
+def literal(value: str, datatype: Optional[str] = None) -> Union[Literal, int, float, bool]:
+    """Convert a lexical value to a Python primitive based on its datatype.
+
+    Args:
+        value (str): Lexical form of the literal.
+        datatype (str): Defaults to None. Datatype IRI, e.g. `xsd:integer`.
+
+    Returns:
+        Union[Literal, int, float, bool] - Numeric & boolean XML Schema
+            datatypes are converted, everything else is a `Literal`.
+    """
+
+
+def add_literal(payload: Dict[str, Any], key: str, value: Union[str, int, float, bool]) -> None:
+    """Add a value to `payload[key]`, keeping repeated ones as a list.
+
+    RDF predicates can have several literals, e.g. `"Alpha"@en` & `"Alfa"@es`
+    for `schema:name`: the first one is stored as is, later distinct ones
+    turn it into a list (in order of appearance). Equal values are only kept
+    once, `True` & `1` being different.
+
+    Examples:
+        ```python
+        >>> payload = {}
+        >>> for value in ('Alpha', 'Alfa', 'Alpha'):
+        ...     add_literal(payload, 'name', value)
+        >>> payload
+        {'name': ['Alpha', 'Alfa']}
+        ```
+
+    Args:
+        payload (Dict[str, Any]): Vertex payload, updated in place.
+        key (str): Payload key, e.g. the predicate's local name.
+        value (Union[str, int, float, bool]): Literal value.
+    """
+
+
+def iter_jsonld(source: Source, chunk_size: int = 65536) -> Iterator[Union[Dict[str, Any], List[Any]]]:
+    """Incrementally read JSON-LD items from a file.
+
+    Top-level arrays & `@graph` arrays are yielded one item at a time,
+    and so are consecutive top-level values (JSON-Lines). Only the item
+    being decoded is held in memory.
+
+    Notes:
+        A top-level `{"@context": ..., "@graph": [...]}` container yields the
+        nodes in `@graph`. The container itself is only yielded if it has
+        properties other than JSON-LD keywords.
+        So, loaded into a Knowledge Graph, a keyword-only container no longer
+        becomes an (isolated) "Unknown" `Thing` vertex, as it does when the
+        whole document is loaded as a `dict`.
+
+    Examples:
+        ```python
+        >>> for item in iter_jsonld('resources/graph/schema-org/movie.jsonld'):
+        ...     print(item['@type'], item['name'])
+        Movie Pirates of the Carribean: On Stranger Tides (2011)
+        ```
+
+    Args:
+        source (Union[str, IO]): Path to a (optionally gzipped) file, or
+            an open text/binary file object.
+        chunk_size (int, optional): Defaults to 65536. Number of
+            characters read at a time.
+
+    Raises:
+        ValueError: Malformed JSON.
+
+    Yields:
+        Union[Dict[str, Any], List[Any]] - Top-level JSON-LD items.
+    """
+
+
+def iter_ntriples(source: Source, strict: bool = True) -> Iterator[Triple]:
+    """Incrementally read triples from an N-Triples file.
+
+    IRIs & blank nodes are returned as `str` (blank nodes keep their `_:`
+    prefix). Literals are converted to `int`, `float` or `bool` for numeric &
+    boolean XML Schema datatypes, otherwise they're returned as `Literal`.
+    Language tags are dropped.
+
+    Examples:
+        ```python
+        >>> for triple in iter_ntriples('dump.nt.gz'):
+        ...     print(triple)
+        ('http://example.org/Q60', 'http://schema.org/name', Literal('New York City'))
+        ```
+
+    Args:
+        source (Union[str, IO]): Path to a (optionally gzipped) file, or
+            an open text/binary file object.
+        strict (bool, optional): Defaults to True. Raise on malformed lines,
+            otherwise they're skipped.
+
+    Raises:
+        ValueError: Malformed line when `strict=True`.
+
+    Yields:
+        Tuple[str, str, Union[str, Literal, int, float, bool]] - Subject,
+            predicate & object.
+    """
+
+
+def iter_rdfxml(source: Source, base: Optional[str] = None) -> Iterator[Triple]:
+    """Incrementally read triples from an RDF/XML file.
+
+    The document is walked with `xml.etree.ElementTree.iterparse` & every
+    element is cleared once its triples have been emitted, so no DOM is ever
+    built. Typed node elements yield an `rdf:type` triple, `rdf:li` is
+    numbered (`rdf:_1`, `rdf:_2`, ...), `rdf:parseType="Collection"` yields an
+    `rdf:first`/`rdf:rest` list & `rdf:parseType="Literal"` yields the
+    serialized XML as a `Literal`. Anonymous nodes get blank node ids unique
+    to this call. Objects are returned as for `iter_ntriples`.
+
+    Examples:
+        ```python
+        >>> for triple in iter_rdfxml('foaf.rdf'):
+        ...     print(triple)
+        ('http://example.org/alice', 'http://www.w3.org/1999/02/22-rdf-syntax-ns#type', 'http://xmlns.com/foaf/0.1/Person')
+        ('http://example.org/alice', 'http://xmlns.com/foaf/0.1/name', Literal('Alice'))
+        ```
+
+    Args:
+        source (Union[str, IO]): Path to a (optionally gzipped) file, or
+            an open file object.
+        base (str, optional): Defaults to None. Base IRI used to resolve
+            relative IRIs when the document has no `xml:base`.
+
+    Raises:
+        ValueError: Malformed XML.
+
+    Yields:
+        Tuple[str, str, Union[str, Literal, int, float, bool]] - Subject,
+            predicate & object.
+    """
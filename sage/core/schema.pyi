@@ -16,7 +16,9 @@
 """
 
 # Built-in libraries.
-from typing import Union, Tuple, List, Dict, Optional
+from typing import Any, Union, Tuple, List, Dict, Optional
+from sqlalchemy import Index
+from sqlalchemy.orm import Session
 from sqlalchemy.ext.declarative import declarative_base
 
 # TypeVars.
@@ -27,7 +29,7 @@ class Edge(BaseSchema):
     """Edge which is describes the connection between one Vertex & it's neighbors.
 
     Methods:
-        def __init__(self, vertex_id: str, predicate: str): ...
+        def __init__(self, vertex_id: str, predicate: str, source_id: Optional[str] = None): ...
 
         def __repr__(self) -> str: ...
 
@@ -38,6 +40,7 @@ class Edge(BaseSchema):
         id (int): Table's primary key.
         vertex_id (str): Vertex which the edge is connected to.
         predicate (str): Describing the connection `vertex` has with `vertex_id`.
+        source_id (str): ID of the source Vertex, i.e. `vertex.id`.
         vertex (Vertex): Source Vertex (`vertex`) is connected to `vertex_id`.
 
     """
@@ -45,6 +48,9 @@ class Edge(BaseSchema):
     """Table name."""
     __tablename__ = ...  # type: str
 
+    """Unique (source_id, vertex_id, predicate), vertex_id & predicate indexes."""
+    __table_args__ = ...  # type: Tuple[Index, Index, Index]
+
     """Table's primary key."""
     id = ...  # type: int
 
@@ -54,16 +60,84 @@ class Edge(BaseSchema):
     """Describing the connection `vertex` has with `vertex_id`."""
     predicate = ...  # type: str
 
+    """ID of the source Vertex. Same as `vertex.id`, without the `connection` join."""
+    source_id = ...  # type: Optional[str]
+
     """Source Vertex (`vertex`) is connected to `vertex_id`."""
     vertex = ...  # type: Vertex
 
-    def __init__(self, vertex_id: str, predicate: Optional[str]): ...
+    def __init__(self, vertex_id: str, predicate: Optional[str], source_id: Optional[str] = None): ...
 
     def __repr__(self) -> str: ...
 
     def __eq__(self, other: str) -> bool: ...
 
 
+class Property(BaseSchema):
+    """Typed, indexed copy of a primitive `Vertex.payload` entry.
+
+    Kept in sync with `vertex.payload` by SQLite triggers (see
+    `PROPERTY_TRIGGERS`), whichever way the payload is written.
+
+    Attributes:
+        __tablename__ (str): Table name.
+        id (int): Table's primary key.
+        vertex_id (str): Vertex which the payload belongs to.
+        key (str): Payload key.
+        kind (str): One of "text", "number" or "bool".
+        value_text (Optional[str]): Value of "text" properties.
+        value_number (Optional[float]): Value of "number" & "bool" (0 or 1) properties.
+        value (Union[str, float, bool]): Value decoded according to `kind`.
+
+    """
+
+    """Table name."""
+    __tablename__ = ...  # type: str
+
+    """(key, value_text), (key, value_number) & vertex_id indexes."""
+    __table_args__ = ...  # type: Tuple[Index, Index, Index]
+
+    """Table's primary key."""
+    id = ...  # type: int
+
+    """Vertex which the payload belongs to."""
+    vertex_id = ...  # type: str
+
+    """Payload key."""
+    key = ...  # type: str
+
+    """One of "text", "number" or "bool"."""
+    kind = ...  # type: str
+
+    """Value of "text" properties."""
+    value_text = ...  # type: Optional[str]
+
+    """Value of "number" & "bool" (0 or 1) properties."""
+    value_number = ...  # type: Optional[float]
+
+    def __repr__(self) -> str: ...
+
+    @property
+    def value(self) -> Union[str, float, bool]: ...
+
+
+"""`CREATE TRIGGER` statements syncing `property` on vertex insert, payload update & delete."""
+PROPERTY_TRIGGERS = ...  # type: Tuple[str, str, str]
+
+"""`INSERT` statement indexing the payload of every existing vertex."""
+PROPERTY_BACKFILL = ...  # type: str
+
+
+"""`CREATE VIRTUAL TABLE` statement of the FTS5 vertex index."""
+SEARCH_TABLE = ...  # type: str
+
+"""`CREATE TRIGGER` statements syncing `vertex_fts` on vertex insert, update & delete."""
+SEARCH_TRIGGERS = ...  # type: Tuple[str, str, str]
+
+"""`INSERT` statement indexing every existing vertex in `vertex_fts`."""
+SEARCH_BACKFILL = ...  # type: str
+
+
 class Graph(BaseSchema):
     """Graph database Schema.
 
@@ -138,6 +212,9 @@ class Vertex(BaseSchema):
     """Table name"""
     __tablename__ = ...  # type: str
 
+    """Unique (graph_id, label, schema) index & index on label."""
+    __table_args__ = ...  # type: Tuple[Index, Index]
+
     """Unique 8-bit token assigned to each Vertex."""
     id = ...  # type: str
 
@@ -199,6 +276,13 @@ class Vertex(BaseSchema):
     def add_neighbor(self, nbr: Vertex, predicate: Optional[str] = None) -> Edge:
         """Add new connection to the current Vertex object.
 
+        A vertex may be connected to the same neighbor by several predicates,
+        but each (neighbor, predicate) only once. Existing connections are
+        looked up in an index of the vertex's edges, built with a single query
+        the first time it's needed, so adding N neighbors is O(N) rather than
+        re-loading `edges` on every call. The index is dropped on rollback &
+        after bulk writes (see `reset_neighbor_index`).
+
         Args:
             nbr (Vertex): Destination vertex, which current vertex
                 is connected to.
@@ -218,11 +302,13 @@ class Vertex(BaseSchema):
             None
         """
 
-    def get_connection(self, nbr: Vertex) -> Union[Edge, None]:
+    def get_connection(self, nbr: Vertex, predicate: Optional[str] = None) -> Union[Edge, None]:
         """Retrieve immediate connection to target vertex.
 
         Args:
             nbr (Vertex): Vertex to get connected edges from.
+            predicate (str): Defaults to None. Connection with this predicate,
+                otherwise the first connection to `nbr`.
 
         Returns:
             Union[Edge, None] - Returns edge or None if it doesn't exits.
@@ -238,3 +324,19 @@ class Vertex(BaseSchema):
         Returns:
             str - Connection predicate (description).
         """
+
+
+def reset_neighbor_index(session: Session, *args: Any) -> None:
+    """Drop the neighbor index of every vertex in `session`.
+
+    Called after a rollback of the graph's sessions, which discards edges
+    the index still holds, and after edges are written without the ORM
+    (`BulkLoader`).
+
+    Args:
+        session (Session): Session whose vertices are reset.
+        *args (Any): Extra event arguments, ignored.
+
+    Returns:
+        None
+    """
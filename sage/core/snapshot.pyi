@@ -0,0 +1,308 @@
+"""Read-only, in-memory adjacency snapshot of a Knowledge Graph.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: snapshot.pyi
+     Package: sage.core
+     Created on 18 October, 2026 @ 02:20 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from sage.core.schema import Vertex
+
+# A vertex index, vertex id, (label, schema) pair or Vertex object.
+VertexRef = Union[int, str, Tuple[str, str], Vertex]
+
+
+"""First 8 bytes of every snapshot file."""
+MAGIC = ...  # type: bytes
+
+"""Snapshot format version written by `GraphSnapshot.save`."""
+VERSION = ...  # type: int
+
+
+class StringTable:
+    """Read-only sequence of strings packed into two flat arrays.
+
+    String `i` is the UTF-8 bytes `data[offsets[i]:offsets[i + 1]]`. With
+    `codes`, item `i` is string `codes[i]` instead, so repeated strings are
+    stored once. Items are decoded on access, which keeps memory-mapped
+    tables zero-copy.
+
+    Attributes:
+        offsets (np.ndarray): `int64` array of string offsets, one more than strings.
+        data (np.ndarray): `uint8` UTF-8 bytes of every string.
+        codes (Optional[np.ndarray]): `int32` string of every item, for interned tables.
+    """
+
+    offsets = ...  # type: np.ndarray
+    data = ...  # type: np.ndarray
+    codes = ...  # type: Optional[np.ndarray]
+
+    def __init__(self, offsets: np.ndarray, data: np.ndarray,
+                 codes: Optional[np.ndarray] = None) -> None: ...
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[Optional[str]], intern: bool = False) -> StringTable:
+        """Pack strings, None is stored as an empty string.
+
+        Args:
+            strings (Iterable[Optional[str]]): Strings to pack.
+            intern (bool): Defaults to False. Store every distinct string once.
+
+        Returns:
+            StringTable
+        """
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, i: int) -> str: ...
+
+    def __iter__(self) -> Iterator[str]: ...
+
+
+class GraphSnapshot:
+    """Compressed sparse row (CSR) adjacency of a graph.
+
+    Outgoing edges of vertex `i` are `targets[offsets[i]:offsets[i + 1]]`,
+    described by `predicates[offsets[i]:offsets[i + 1]]` which index into
+    `predicate_names`. Incoming edges are indexed the same way on first use
+    (see `reverse`). Traversals are vectorized over whole frontiers & work
+    on vertex indices. Use `index_of`/`indices` & `to_ids` to convert from
+    & to vertex ids.
+
+    Examples:
+        ```python
+        >>> snap = kg.snapshot()
+        >>> avatar = snap.index_of(('Avatar', 'Movie'))
+        >>> snap.degree([avatar])
+        array([1])
+        >>> distance = snap.bfs([avatar], max_depth=3)
+        >>> snap.to_ids(snap.k_hop([avatar], k=2, direction='both'))
+        ['e147c670075ef62b']
+        ```
+
+    Snapshots can be saved to a versioned, checksummed binary file & loaded
+    back with `numpy.memmap`. Loaded snapshots are zero-copy: CSR arrays are
+    views of the file & strings are `StringTable`s decoded on access.
+
+    Attributes:
+        vertex_ids (Sequence[str]): Vertex id of every index.
+        labels (Sequence[str]): Vertex label of every index.
+        schemas (Sequence[str]): Vertex schema of every index.
+        payloads (Optional[Sequence[str]]): JSON payload of every index, if captured.
+        index (Dict[str, int]): Vertex id -> index, built on first use.
+        predicate_names (List[str]): Predicate of every predicate id.
+        predicate_index (Dict[str, int]): Predicate -> predicate id.
+        offsets (np.ndarray): `int64` array of `len(self) + 1` edge offsets.
+        targets (np.ndarray): `int64` target index of every edge.
+        predicates (np.ndarray): `int32` predicate id of every edge.
+    """
+
+    vertex_ids = ...  # type: Sequence[str]
+    labels = ...  # type: Sequence[str]
+    schemas = ...  # type: Sequence[str]
+    payloads = ...  # type: Optional[Sequence[str]]
+    index = ...  # type: Dict[str, int]
+    predicate_names = ...  # type: List[str]
+    predicate_index = ...  # type: Dict[str, int]
+    offsets = ...  # type: np.ndarray
+    targets = ...  # type: np.ndarray
+    predicates = ...  # type: np.ndarray
+
+    def __init__(self, vertex_ids: Sequence[str], labels: Sequence[str], schemas: Sequence[str],
+                 sources: Optional[np.ndarray], targets: Optional[np.ndarray],
+                 predicates: Optional[np.ndarray], predicate_names: List[str],
+                 payloads: Optional[Sequence[str]] = None):
+        """Build the CSR arrays from edge lists.
+
+        Args:
+            vertex_ids (Sequence[str]): Vertex id of every index.
+            labels (Sequence[str]): Vertex label of every index.
+            schemas (Sequence[str]): Vertex schema of every index.
+            sources (Optional[np.ndarray]): Source index of every edge. None
+                leaves the CSR arrays to be assigned by the caller (see `load`).
+            targets (Optional[np.ndarray]): Target index of every edge.
+            predicates (Optional[np.ndarray]): Predicate id of every edge.
+            predicate_names (List[str]): Predicate of every predicate id.
+            payloads (Optional[Sequence[str]]): Defaults to None. JSON payload
+                of every vertex.
+        """
+
+    @classmethod
+    def from_edges(cls, vertices: Iterable[Tuple[str, ...]],
+                   edges: Iterable[Tuple[str, str, str]]) -> GraphSnapshot:
+        """Build from (id, label, schema[, payload]) vertices & (source, target, predicate) edges.
+
+        Edges with an endpoint outside of `vertices` are skipped.
+
+        Args:
+            vertices (Iterable[Tuple[str, ...]]): (id, label, schema) vertex rows,
+                optionally followed by the JSON encoded payload.
+            edges (Iterable[Tuple[str, str, str]]): Edge rows.
+
+        Returns:
+            GraphSnapshot
+        """
+
+    @classmethod
+    def load(cls, path: str, verify: bool = False) -> GraphSnapshot:
+        """Memory-map a snapshot written by `save`.
+
+        Arrays are read-only views of the file, so opening costs no copies &
+        the pages are shared by every process mapping the same file. Vertex
+        id lookups binary search the stored id order instead of building
+        `index`.
+
+        Args:
+            path (str): Snapshot file.
+            verify (bool): Defaults to False. Check every section's CRC32,
+                which reads the whole file. The header is always checked.
+
+        Raises:
+            ValueError: Not a snapshot, unsupported version or corrupted data.
+
+        Returns:
+            GraphSnapshot - Read-only snapshot backed by the file.
+        """
+
+    def save(self, path: str) -> None:
+        """Write the snapshot in the binary format read by `load`.
+
+        The file holds a header (magic, version, section table & its CRC32)
+        followed by 64-byte aligned little-endian arrays: the CSR arrays of
+        outgoing & incoming edges, vertex indices sorted by id & by (label,
+        schema) & `StringTable` sections for vertex ids, labels, interned
+        schemas, predicates & payloads.
+
+        Args:
+            path (str): Destination file.
+        """
+
+    def payload(self, vertex: VertexRef) -> Dict[str, Any]:
+        """Decoded payload of a vertex.
+
+        Raises:
+            ValueError: Snapshot was taken without payloads.
+        """
+
+    def __len__(self) -> int:
+        """Number of vertices."""
+
+    @property
+    def n_edges(self) -> int:
+        """Number of edges."""
+
+    @property
+    def reverse(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(offsets, sources, predicates) CSR arrays of incoming edges."""
+
+    def index_of(self, vertex: Union[str, Tuple[str, str], Vertex]) -> int:
+        """Index of a vertex id, (label, schema) pair or Vertex.
+
+        Loaded snapshots binary search their sorted id & label sections, so
+        a lookup only decodes O(log N) strings of the mapped file.
+
+        Raises:
+            KeyError: Vertex isn't in the snapshot.
+        """
+
+    def indices(self, vertices: Union[VertexRef, Iterable[VertexRef], np.ndarray]) -> np.ndarray:
+        """`int64` indices of one or more vertices."""
+
+    def to_ids(self, indices: Iterable[int]) -> List[str]:
+        """Vertex ids of vertex indices."""
+
+    def degree(self, vertices: Optional[Union[VertexRef, Iterable[VertexRef]]] = None,
+               direction: str = 'out') -> np.ndarray:
+        """Number of edges of `vertices`, or of every vertex if not given.
+
+        Args:
+            vertices (Optional[Iterable[VertexRef]]): Defaults to all vertices.
+            direction (str): Defaults to 'out'. One of 'out', 'in' or 'both'.
+
+        Raises:
+            ValueError: Unknown `direction`.
+
+        Returns:
+            np.ndarray - Degree of each vertex.
+        """
+
+    def neighbors(self, vertex: VertexRef, predicates: Optional[Union[str, Iterable[str]]] = None,
+                  direction: str = 'out') -> np.ndarray:
+        """Sorted indices of the direct neighbors of `vertex`.
+
+        Args:
+            vertex (VertexRef): Vertex to expand.
+            predicates (Optional[Union[str, Iterable[str]]]): Defaults to None.
+                Only follow edges with these predicates.
+            direction (str): Defaults to 'out'. One of 'out', 'in' or 'both'.
+
+        Returns:
+            np.ndarray - Neighbor indices.
+        """
+
+    def bfs(self, sources: Union[VertexRef, Iterable[VertexRef]], max_depth: int = -1,
+            predicates: Optional[Union[str, Iterable[str]]] = None,
+            direction: str = 'out') -> np.ndarray:
+        """Breadth-first search from `sources`, one vectorized step per hop.
+
+        Args:
+            sources (Union[VertexRef, Iterable[VertexRef]]): Start vertices.
+            max_depth (int): Defaults to -1. Maximum number of hops, -1 for no limit.
+            predicates (Optional[Union[str, Iterable[str]]]): Defaults to None.
+                Only follow edges with these predicates.
+            direction (str): Defaults to 'out'. One of 'out', 'in' or 'both'.
+
+        Returns:
+            np.ndarray - `int32` hop distance of every vertex, -1 if unreachable.
+        """
+
+    def k_hop(self, sources: Union[VertexRef, Iterable[VertexRef]], k: int = 1,
+              predicates: Optional[Union[str, Iterable[str]]] = None,
+              direction: str = 'out', include_sources: bool = False) -> np.ndarray:
+        """Sorted indices of vertices at most `k` hops away from `sources`.
+
+        Args:
+            sources (Union[VertexRef, Iterable[VertexRef]]): Start vertices.
+            k (int): Defaults to 1. Maximum number of hops.
+            predicates (Optional[Union[str, Iterable[str]]]): Defaults to None.
+                Only follow edges with these predicates.
+            direction (str): Defaults to 'out'. One of 'out', 'in' or 'both'.
+            include_sources (bool): Defaults to False. Include `sources`.
+
+        Returns:
+            np.ndarray - Vertex indices.
+        """
+
+    def subgraph(self, sources: Union[VertexRef, Iterable[VertexRef]], k: int = 1,
+                 predicates: Optional[Union[str, Iterable[str]]] = None,
+                 direction: str = 'out') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Edges traversed when expanding `k` hops from `sources`.
+
+        Useful for extracting the neighbourhood of question entities in
+        multi-hop QA.
+
+        Args:
+            sources (Union[VertexRef, Iterable[VertexRef]]): Start vertices.
+            k (int): Defaults to 1. Maximum number of hops.
+            predicates (Optional[Union[str, Iterable[str]]]): Defaults to None.
+                Only follow edges with these predicates.
+            direction (str): Defaults to 'out'. One of 'out', 'in' or 'both'.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray] - Source indices,
+                predicate ids & target indices of the edges, always pointing
+                in their stored direction.
+        """
@@ -18,9 +18,9 @@
 # Built-in libraries.
 from enum import IntEnum
 from abc import ABCMeta, abstractmethod
-from typing import (List, Tuple, Iterable, Callable, Union, SupportsBytes,
+from typing import (List, Tuple, Iterable, Callable, Union,
                     TypeVar, Generic, SupportsFloat, SupportsInt, Dict,
-                    Optional, Generator, Any, AnyStr, Type, BinaryIO)
+                    Optional, Generator, Iterator, Any, AnyStr, Type, BinaryIO)
 
 # Third-party libraries.
 import numpy as np
@@ -174,13 +174,22 @@ class Downloader(metaclass=ABCMeta):
         @staticmethod
         def maybe_download(url: str, download_dir: Optional[str] = None,
                            extract: Optional[bool] = False,
-                           overwrite: Optional[bool] = False) -> str:
-            Download and extract the data if it doesn't already exist.
+                           overwrite: Optional[bool] = False,
+                           sha256: Optional[str] = None, segments: int = 4,
+                           min_segment_size: int = 1 << 24, retries: int = 3,
+                           progress: bool = True) -> str:
+            Download (resumable, segmented & verified) and extract the data
+            if it doesn't already exist.
 
         @staticmethod
         def maybe_extract(file: str, extract_dir: Optional[str] = None,
                           overwrite: Optional[bool] = False) -> str:
             Extracts downloaded files if it hasn't already been extracted.
+
+        @staticmethod
+        def iter_archive(file: str, members: Optional[Union[str, Iterable[str], Callable[[str], bool]]] = None,
+                         decompress: bool = True) -> Iterator[Tuple[str, BinaryIO]]:
+            Iterate the files in a zip or tarball, without extracting it.
     """
 
     @staticmethod
@@ -199,12 +208,23 @@ class Downloader(metaclass=ABCMeta):
     @staticmethod
     def maybe_download(url: URL, download_dir: Optional[str] = None,
                        extract: Optional[bool] = False,
-                       overwrite: Optional[bool] = False) -> str:
+                       overwrite: Optional[bool] = False,
+                       sha256: Optional[str] = None, segments: int = 4,
+                       min_segment_size: int = 1 << 24, retries: int = 3,
+                       progress: bool = True) -> str:
         """Download and extract the data if it doesn't already exist.
 
         Notes:
             Assumes the url is a zip or tar-ball file.
 
+            The file is streamed into "<filename>.part" (its progress saved in
+            "<filename>.part.json") and renamed once complete: an interrupted
+            download resumes where it stopped with HTTP Range requests, as long
+            as the server's ETag (or Last-Modified) is unchanged. Large files
+            are fetched as parallel ranged segments when the server accepts
+            ranges, and dropped connections are retried from the last byte
+            received.
+
         Arguments:
             url (URL) -- Internet URL for the tar-file to download.
                 e.g: "http://nlp.stanford.edu/data/glove.6B.zip"
@@ -215,8 +235,34 @@ class Downloader(metaclass=ABCMeta):
             extract (bool, optional) -- If set to `True` compressed files are extracted automatically.
                 (default {False})
 
-            overwrite (bool, optional) -- Force download even if the file already exists.
-                (default {False})
+            overwrite (bool, optional) -- Force download even if the file already exists,
+                discarding any partial download. (default {False})
+
+            sha256 (str, optional) -- Expected SHA-256 hex digest, computed
+                incrementally while the file is written. (default {None})
+
+            segments (int, optional) -- Maximum number of parallel ranged requests.
+                (default {4})
+
+            min_segment_size (int, optional) -- Smallest segment in bytes: smaller
+                files are downloaded with a single request. (default {16 MiB})
+
+            retries (int, optional) -- Attempts per segment after a dropped
+                connection or a server error. (default {3})
+
+            progress (bool, optional) -- Print the download progress, at most
+                twice a second. (default {True})
+
+        Raises:
+            ValueError: Checksum mismatch. The partial download is removed.
+
+        Examples:
+            ```python
+            >>> Downloader.maybe_download(
+            ...     'https://example.org/webqsp.zip', download_dir='datasets/',
+            ...     sha256='9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08')
+            'datasets/webqsp.zip'
+            ```
 
         Returns:
             str: Filename if `extract==False`, otherwise `extract_dir` is returned.
@@ -236,6 +282,41 @@ class Downloader(metaclass=ABCMeta):
             str - Path where file was extracted.
         """
 
+    @staticmethod
+    def iter_archive(file: str, members: Optional[Union[str, Iterable[str], Callable[[str], bool]]] = None,
+                     decompress: bool = True) -> Iterator[Tuple[str, BinaryIO]]:
+        """Iterate the regular files in a zip or tarball, without extracting it.
+
+        Members are decompressed straight out of the archive, so a 20 GB
+        archive can be consumed without a 20 GB extraction step. Tarballs
+        (.tar, .tar.gz, .tgz, .tar.bz2, .tar.xz) are read in a single
+        sequential pass: each file object is only valid until the next
+        member is requested. Zip members are read in the central directory's order.
+
+        Examples:
+            ```python
+            >>> for name, f in Downloader.iter_archive('dumps.tar.gz', members='*.nt.gz'):
+            ...     for triple in iter_ntriples(f):
+            ...         ...
+            ```
+
+        Args:
+            file (str): Path to a zip or tarball.
+            members (Union[str, Iterable[str], Callable[[str], bool]], optional): Defaults
+                to None (every file). Glob pattern(s), e.g. `"data/*.jsonld"`, or a
+                predicate on member names. Skipped members are never decompressed
+                (tarballs still have to read past them).
+            decompress (bool, optional): Defaults to True. Transparently decompress
+                `.gz` members (their name is unchanged).
+
+        Raises:
+            FileNotFoundError: `file` doesn't exist.
+            ValueError: `file` is neither a zip nor a tarball.
+
+        Yields:
+            Tuple[str, BinaryIO] - Member name & its binary file object.
+        """
+
 
 ################################################################################################
 # +--------------------------------------------------------------------------------------------+
@@ -557,15 +638,18 @@ class Log(metaclass=ABCMeta):
             Prints task progress *(in %)*.
 
         @staticmethod
-        def report_hook(block_no: SupportsInt,
-                        read_size: Union[SupportsBytes, SupportsInt],
-                        file_size: Union[SupportsBytes, SupportsBytes]) -> None:
+        def report_hook(block_no: SupportsInt, read_size: SupportsInt,
+                        file_size: SupportsInt) -> None:
             Calculates download progress of downloaded files.
 
 
+    Notes:
+        The logger is configured from `config/logger/<MODE>.cfg` by the first
+        message (or `Log.getLogger()`), not when `sage.core.utils` is imported.
+
     Attributes:
-        _logger (Logger): File logger configuration.
-        level (int): Log level configuration.
+        _logger (Logger): File logger configuration. None until first used.
+        level (int): Log level configuration. Set once configured.
         Level (IntEnum): Possible log level options.
     """
 
@@ -808,15 +892,17 @@ class Log(metaclass=ABCMeta):
         """
 
     @staticmethod
-    def report_hook(block_no: SupportsInt,
-                    read_size: Union[SupportsBytes, SupportsInt],
-                    file_size: Union[SupportsBytes, SupportsBytes]) -> None:
+    def report_hook(block_no: SupportsInt, read_size: SupportsInt,
+                    file_size: SupportsInt) -> None:
         """Calculates download progress of downloaded files.
 
+        Compatible with `urllib.request.urlretrieve`'s `reporthook`.
+
         Args:
             block_no (SupportsInt): Current download state.
-            read_size (Union[SupportsBytes, SupportsInt]): Current downloaded size.
-            file_size (Union[SupportsBytes, SupportsInt]): Total file size.
+            read_size (SupportsInt): Block size, in bytes.
+            file_size (SupportsInt): Total file size, in bytes. Nothing is
+                printed when it's unknown (-1).
 
         See Also:
             `Log.progress` - Prints task progress *(in %)*.
@@ -0,0 +1,181 @@
+"""Compiled, offline index of the schema.org vocabulary.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: vocab.pyi
+     Package: sage.core
+     Created on 18 October, 2026 @ 11:30 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+
+"""First 8 bytes of every vocabulary file."""
+MAGIC = ...  # type: bytes
+
+"""Vocabulary format version written by `Vocabulary.save`."""
+VERSION = ...  # type: int
+
+
+class Vocabulary:
+    """Type hierarchy & property tables of schema.org, by interned ids.
+
+    Compiled once from the vocabulary's JSON-LD, then saved to & memory-mapped
+    from a compact binary file (the `GraphSnapshot` container), so loading
+    graphs never needs the network:
+        - Types & properties are sorted by name and identified by their index.
+        - Row `i` of `closure` is a bitset of every supertype of type `i`
+          (itself included): "is-a" checks are a single bit test.
+        - Property domains & ranges and the properties of each type are
+          CSR (offsets, ids) tables.
+
+    Names may be given as "Book", "schema:Book" or "https://schema.org/Book".
+
+    Examples:
+        ```python
+        >>> vocab = Vocabulary.from_jsonld('schemaorg-current-https.jsonld')
+        >>> vocab.save('schemaorg.vocab')
+        >>> vocab = Vocabulary.load('schemaorg.vocab')
+        >>> vocab.most_specific(['Product', 'Book'])
+        'Book'
+        >>> vocab.is_a('Book', 'CreativeWork')
+        True
+        >>> kg = KnowledgeGraph('library', data=data, vocabulary='schemaorg.vocab')
+        ```
+
+    Attributes:
+        types (List[str]): Type names, by id.
+        properties (List[str]): Property names, by id.
+        closure (np.ndarray): `uint64` (types, ceil(types / 64)) supertype bitsets.
+        depth (np.ndarray): `int32` longest `rdfs:subClassOf` chain from a root type.
+    """
+
+    """Latest release of the vocabulary, as JSON-LD."""
+    URL = ...  # type: str
+
+    types = ...  # type: List[str]
+    properties = ...  # type: List[str]
+    closure = ...  # type: np.ndarray
+    depth = ...  # type: np.ndarray
+
+    def __init__(self, types: List[str], closure: np.ndarray, depth: np.ndarray,
+                 properties: List[str], domains: Tuple[np.ndarray, np.ndarray],
+                 ranges: Tuple[np.ndarray, np.ndarray],
+                 type_properties: Tuple[np.ndarray, np.ndarray]) -> None: ...
+
+    @classmethod
+    def from_jsonld(cls, source: Union[str, Dict[str, Any], List[Dict[str, Any]]]) -> Vocabulary:
+        """Compile the vocabulary from its JSON-LD.
+
+        `rdfs:Class` nodes are types, `rdf:Property` nodes are properties with
+        their `schema:domainIncludes` & `schema:rangeIncludes`. References to
+        anything else (e.g. `rdfs:Class` as a supertype) are dropped.
+
+        Args:
+            source (Union[str, Dict[str, Any], List[Dict[str, Any]]]): Path to
+                the JSON-LD file (optionally gzipped), its data or its `@graph`.
+
+        Raises:
+            ValueError: Cycle in the type hierarchy.
+
+        Returns:
+            Vocabulary: Compiled vocabulary.
+        """
+
+    @classmethod
+    def load(cls, path: str, verify: bool = False) -> Vocabulary:
+        """Memory-map a vocabulary written by `save`.
+
+        Args:
+            path (str): Vocabulary file.
+            verify (bool): Defaults to False. Check the CRC32 of every section.
+
+        Raises:
+            ValueError: Not a vocabulary, unsupported version or corrupted data.
+
+        Returns:
+            Vocabulary: Read-only vocabulary backed by the file.
+        """
+
+    def save(self, path: str) -> None:
+        """Write the vocabulary in the binary format read by `load`."""
+
+    def __len__(self) -> int:
+        """Number of types."""
+
+    def __contains__(self, name: str) -> bool:
+        """Whether `name` is a type of the vocabulary."""
+
+    def __repr__(self) -> str: ...
+
+    def type_id(self, name: str) -> int:
+        """Interned id of a type.
+
+        Raises:
+            KeyError: Unknown type.
+        """
+
+    def is_a(self, name: str, supertype: str) -> bool:
+        """Whether `name` is `supertype` or one of its subtypes.
+
+        Unknown types are only themselves.
+        """
+
+    def most_specific(self, types: Union[str, Iterable[str]], default: Optional[str] = None) -> Optional[str]:
+        """Most specific of `types`: a subtype over its supertypes, else the deepest.
+
+        Ties keep the first one. Unknown types are only picked when none is
+        known, which is then the first one, as without a vocabulary.
+
+        Args:
+            types (Union[str, Iterable[str]]): Candidate types, e.g. an `@type` list.
+            default (str): Defaults to None. Returned when `types` is empty.
+
+        Returns:
+            Optional[str]: One of `types`, as given.
+        """
+
+    def supertypes(self, name: str) -> List[str]:
+        """Every supertype of `name`, nearest first.
+
+        Raises:
+            KeyError: Unknown type.
+        """
+
+    def subtypes(self, name: str) -> List[str]:
+        """Every subtype of `name`, by name.
+
+        Raises:
+            KeyError: Unknown type.
+        """
+
+    def domains(self, prop: str) -> List[str]:
+        """Types `prop` can be used on.
+
+        Raises:
+            KeyError: Unknown property.
+        """
+
+    def ranges(self, prop: str) -> List[str]:
+        """Expected types of `prop`'s values.
+
+        Raises:
+            KeyError: Unknown property.
+        """
+
+    def properties_of(self, name: str, inherited: bool = True) -> List[str]:
+        """Properties of `name`, including those of its supertypes when `inherited`.
+
+        Raises:
+            KeyError: Unknown type.
+        """
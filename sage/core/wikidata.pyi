@@ -0,0 +1,81 @@
+"""Parallel ingestion of Wikidata JSON entity dumps.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence & Software Engineer.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: wikidata.pyi
+     Package: sage.core
+     Created on 18 October, 2026 @ 01:05 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Type aliases.
+Entity = Tuple[str, str, Dict[str, Any], List[Tuple[str, str, str]]]
+
+"""Default number of bytes of an uncompressed dump parsed per task."""
+BLOCK_SIZE = ...  # type: int
+
+"""Number of lines of a gzipped dump parsed per task."""
+LINES_PER_TASK = ...  # type: int
+
+
+def transform(entity: Dict[str, Any], language: str = 'en') -> Entity:
+    """Flatten a Wikidata entity into a vertex & its outgoing edges.
+
+    The entity id (e.g. `Q60`) is the vertex label & its type (`Item`,
+    `Property`, ...) the schema. The label, description & aliases in
+    `language` are stored as `name`, `description` & `aliases`. Claims
+    pointing to other entities become edges described by the property id,
+    while other claims store one primitive value per property (preferred
+    rank first) in the payload. Deprecated & "no value" claims are skipped.
+
+    Examples:
+        ```python
+        >>> entity_id, schema, payload, edges = transform(KnowledgeGraph.read(
+        ...     'resources/graph/wikidata/new-york.jsonld'))
+        >>> entity_id, schema, payload['name'], payload['P625']
+        ('Q60', 'Item', 'New York City', 'Point(-73.94 40.67)')
+        >>> edges[0]
+        ('P1151', 'Q6342720', 'Item')
+        ```
+
+    Args:
+        entity (Dict[str, Any]): Wikidata entity, as found in the JSON dumps.
+        language (str): Defaults to 'en'. Language of labels & text values.
+
+    Returns:
+        Tuple[str, str, Dict[str, Any], List[Tuple[str, str, str]]] - Entity
+            id (vertex label), entity type (vertex schema), payload & a list
+            of (property, target id, target schema) edges.
+    """
+
+
+def iter_entities(path: str, processes: int = 0, language: str = 'en',
+                  block_size: int = BLOCK_SIZE) -> Iterator[Entity]:
+    """Parse & transform a Wikidata dump in a process pool.
+
+    Dumps (`latest-all.json(.gz)`) hold one entity per line. Uncompressed
+    dumps are split into `block_size` byte ranges which are read & parsed by
+    the workers. Gzipped dumps can't be seeked, so lines are read by the
+    calling process & parsed by the workers in batches of `LINES_PER_TASK`.
+    At most two tasks per worker are in flight, so memory stays bounded.
+
+    Args:
+        path (str): Path to a (optionally gzipped) Wikidata JSON dump.
+        processes (int): Defaults to 0. Number of worker processes.
+            0 uses all CPUs & 1 parses in the calling process.
+        language (str): Defaults to 'en'. Language of labels & text values.
+        block_size (int): Defaults to `BLOCK_SIZE`. Bytes parsed per task.
+
+    Yields:
+        Tuple[str, str, Dict[str, Any], List[Tuple[str, str, str]]] -
+            Transformed entities, in file order. See `transform`.
+    """
@@ -0,0 +1,137 @@
+"""Tests for the asyncio Knowledge Graph facade.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence Expert & Researcher.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: test_aio.py
+     Created on 18 October, 2026 @ 08:40 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+
+# Built-in libraries.
+import asyncio
+import functools
+import threading
+import unittest
+
+# Custom libraries.
+from config.consts import FS
+from sage.core import AsyncKnowledgeGraph, File
+
+
+def run_async(test):
+    """Run a coroutine test method on the test case's event loop."""
+    @functools.wraps(test)
+    def wrapper(self):
+        return self.loop.run_until_complete(test(self))
+    return wrapper
+
+
+class TestAsyncKnowledgeGraph(unittest.TestCase):
+    MOVIES = [f'Movie {i}' for i in range(30)]
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.akg = self.loop.run_until_complete(AsyncKnowledgeGraph.open(
+            'test-aio', overwrite=True, profile='serve', max_workers=4, cache_size=10,
+            data=[{'@type': 'Movie', 'name': name, 'year': 2000 + i,
+                   'director': {'@type': 'Person', 'name': f'{name} director'}}
+                  for i, name in enumerate(self.MOVIES)]))
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.akg.close())
+        self.loop.close()
+        asyncio.set_event_loop(None)
+        for ext in ('', '-wal', '-shm'):
+            path = File.join(FS.DATABASE_DIR, f'test-aio.db{ext}')
+            if File.is_file(path):
+                File.remove(path)
+
+    @run_async
+    async def test_gather(self):
+        movies = await asyncio.gather(*(self.akg.get((name, 'Movie')) for name in self.MOVIES))
+        self.assertEqual([movie.label for movie in movies], self.MOVIES)
+        # Detached, but columns are loaded.
+        self.assertEqual(movies[3].payload['year'], 2003)
+
+        directors = await asyncio.gather(*(self.akg.neighbors(movie) for movie in movies))
+        self.assertEqual(directors[0][0][1].label, 'Movie 0 director')
+        self.assertTrue(await self.akg.contains(movies[0].id))
+        self.assertFalse(await self.akg.contains(('Dune', 'Book')))
+
+    @run_async
+    async def test_get_many(self):
+        avatar = await self.akg.add_vertex('Avatar', 'Movie')
+        result = await self.akg.get_many([('Movie 1', 'Movie'), avatar.id,
+                                          ('Dune', 'Book'), ('Movie 1', 'Movie')])
+        self.assertEqual([v and v.label for v in result],
+                         ['Movie 1', 'Avatar', None, 'Movie 1'])
+        with self.assertRaises(TypeError):
+            await self.akg.get_many([42])
+
+    @run_async
+    async def test_iter_vertices(self):
+        labels = [vertex.label async for vertex in self.akg.iter_vertices(batch_size=7)]
+        self.assertEqual(len(labels), 2 * len(self.MOVIES))
+        self.assertEqual(sorted(labels), sorted(v.label for v in await self.akg.vertices))
+
+        # Stopping early releases the worker.
+        async for vertex in self.akg:
+            break
+        self.assertEqual(len(await self.akg.find(schema='Movie')), len(self.MOVIES))
+
+    @run_async
+    async def test_query(self):
+        matches = [match async for match in self.akg.query([('?m', 'director', '?p'),
+                                                            ('?m', 'year', 2005)])]
+        self.assertEqual([m['p'].label for m in matches], ['Movie 5 director'])
+
+        with self.assertRaises(TypeError):
+            async for _ in self.akg.query([('?m', 1, '?p')]):
+                pass
+
+    @run_async
+    async def test_fromfile(self):
+        path = File.join(FS.GRAPH_DIR, 'schema-org/movie.jsonld')
+        async with await AsyncKnowledgeGraph.fromfile(path, max_workers=3, overwrite=True) as akg:
+            # A pooled connection per worker, like `open`.
+            self.assertEqual(akg.kg._sess.get_bind().pool.size(), 3)
+            self.assertGreater(len(await akg.vertices), 0)
+        File.remove(File.join(FS.DATABASE_DIR, 'movie.db'))
+
+    @run_async
+    async def test_cache(self):
+        # A single worker, so both lookups run on the same thread.
+        akg = await AsyncKnowledgeGraph.open('test-aio', max_workers=1, cache_size=10)
+        try:
+            first = await akg.get(('Movie 1', 'Movie'))
+            second = await akg.get(('Movie 1', 'Movie'))
+            self.assertEqual(second.id, first.id)
+            # Session & cache are kept between calls.
+            self.assertEqual((await akg._run(akg.kg.cache_info))['hits'], 1)
+
+            # Transactions still end: writes from elsewhere are seen.
+            await self.akg.add_vertex('Dune', 'Book')
+            self.assertIsNotNone(await akg.get(('Dune', 'Book')))
+        finally:
+            await akg.close()
+
+    @run_async
+    async def test_event_loop(self):
+        # Calls run on the pool, never on the event loop's thread.
+        loop_thread = threading.get_ident()
+        threads = await asyncio.gather(*(self.akg._run(threading.get_ident) for _ in range(20)))
+        self.assertNotIn(loop_thread, threads)
+        self.assertLessEqual(len(set(threads)), self.akg.max_workers)
+
+
+if __name__ == '__main__':
+    unittest.main()
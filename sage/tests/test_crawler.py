@@ -0,0 +1,168 @@
+"""Tests for the schema.org crawler, against a local stand-in server.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence Expert & Researcher.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: test_crawler.py
+     Created on 18 October, 2026 @ 10:50 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+
+# Built-in libraries.
+import tempfile
+import threading
+import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+# Custom libraries.
+from sage.core.crawler import get_properties, get_properties_many
+
+PROPERTY = '''
+<tr typeof="rdfs:Property" resource="http://schema.org/{name}">
+  <th class="prop-nam"><code property="rdfs:label"><a href="/{name}">{name}</a></code></th>
+  <td class="prop-ect"><link property="rangeIncludes" href="http://schema.org/Text"/>Text</td>
+  <td class="prop-desc" property="rdfs:comment">The {name} of the {type}.</td>
+</tr>'''
+
+PAGE = '''<!DOCTYPE html>
+<html><head><title>{type} - schema.org Type</title></head>
+<body><h1>{type}</h1>
+<table class="definition-table">
+  <thead><tr><th>Property</th><th>Expected Type</th><th>Description</th></tr></thead>
+  <tbody class="supertype">{properties}</tbody>
+  <tbody class="supertype"><tr typeof="rdfs:Property" resource="http://schema.org/name">
+    <th><code><a href="/name">name</a></code></th><td property="rdfs:comment">Inherited.</td>
+  </tr></tbody>
+</table></body></html>'''
+
+# schema:DataType -> its own properties.
+TYPES = {f'Type{i}': [f'prop{i}a', f'prop{i}b'] for i in range(12)}
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    # `http.server.ThreadingHTTPServer` needs Python 3.7.
+    daemon_threads = True
+
+
+class Handler(BaseHTTPRequestHandler):
+    # Keep-alive, like schema.org.
+    protocol_version = 'HTTP/1.1'
+
+    def handle(self):
+        self.server.connections += 1
+        super().handle()
+
+    def do_GET(self):
+        name = self.path.strip('/')
+        self.server.requests[name] += 1
+        if name == 'Moved':
+            return self.reply(301, headers={'Location': '/Type0'})
+        if name not in TYPES:
+            return self.reply(404)
+
+        etag = f'"{name}-{self.server.version}"'
+        if self.headers.get('If-None-Match') == etag:
+            return self.reply(304, headers={'ETag': etag})
+
+        properties = ''.join(PROPERTY.format(name=prop, type=name) for prop in TYPES[name])
+        body = PAGE.format(type=name, properties=properties).encode('utf-8')
+        self.reply(200, body, {'ETag': etag, 'Content-Type': 'text/html; charset=utf-8',
+                               'Cache-Control': self.server.cache_control})
+
+    def reply(self, status, body=b'', headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestCrawler(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.requests, self.server.connections = Counter(), 0
+        self.server.version, self.server.cache_control = 1, 'no-cache'
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f'http://127.0.0.1:{self.server.server_port}/'
+
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def crawl(self, types=tuple(TYPES), **kwargs):
+        return get_properties_many(types, baseURL=self.url, cache_dir=self.tmp.name,
+                                   max_workers=4, **kwargs)
+
+    def test_get_properties_many(self):
+        results = self.crawl(compact=True)
+        self.assertEqual(list(results), list(TYPES))
+        self.assertEqual(results['Type3'], {'@id': 'schema:Type3', 'name': 'Type3',
+                                            'properties': ['prop3a', 'prop3b']})
+        # Keep-alive: one connection per worker, not per type.
+        self.assertLessEqual(self.server.connections, 4)
+
+        prop = self.crawl(['Type5'])['Type5']['properties'][1]
+        self.assertEqual(prop, {'rdfs:label': 'prop5b', 'rdfs:Property': 'http://schema.org/prop5b',
+                                'rdfs:comment': 'The prop5b of the Type5.',
+                                'rangeIncludes': ['http://schema.org/Text'],
+                                'domainIncludes': []})
+
+    def test_revalidation(self):
+        first = self.crawl()
+        self.assertEqual(set(self.server.requests.values()), {1})
+
+        # Unchanged pages: 304s, parsed properties come from the cache.
+        self.assertEqual(self.crawl(), first)
+        self.assertEqual(set(self.server.requests.values()), {2})
+
+        # Changed pages are downloaded again.
+        self.server.version = 2
+        TYPES['Type0'].append('prop0c')
+        try:
+            self.assertEqual(self.crawl(['Type0'], compact=True)['Type0']['properties'],
+                             ['prop0a', 'prop0b', 'prop0c'])
+        finally:
+            TYPES['Type0'].pop()
+
+    def test_freshness(self):
+        self.server.cache_control = 'max-age=3600'
+        self.crawl(['Type1', 'Type2', 'Type1'])
+        self.assertEqual(self.server.requests, Counter(Type1=1, Type2=1))
+
+        # Fresh: no requests at all.
+        self.crawl(['Type1', 'Type2'], compact=True)
+        self.assertEqual(self.server.requests, Counter(Type1=1, Type2=1))
+
+        # `max_age=0` forces revalidation.
+        self.crawl(['Type1'], max_age=0)
+        self.assertEqual(self.server.requests['Type1'], 2)
+
+    def test_errors(self):
+        results = self.crawl(['Missing', 'Moved', 'Type4'], compact=True)
+        self.assertIsNone(results['Missing'])
+        self.assertEqual(results['Moved']['properties'], ['prop0a', 'prop0b'])
+        self.assertEqual(results['Type4']['properties'], ['prop4a', 'prop4b'])
+
+    def test_get_properties(self):
+        result = get_properties('Type7', baseURL=self.url, compact=True)
+        self.assertEqual(result['properties'], ['prop7a', 'prop7b'])
+
+
+if __name__ == '__main__':
+    unittest.main()
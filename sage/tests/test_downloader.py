@@ -0,0 +1,257 @@
+"""Tests for resumable downloads & streamed archives.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence Expert & Researcher.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: test_downloader.py
+     Created on 18 October, 2026 @ 11:55 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+
+# Built-in libraries.
+import io
+import os
+import re
+import gzip
+import json
+import tarfile
+import zipfile
+import hashlib
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+# Custom libraries.
+from sage.core import Dataset, Downloader, File, MemoryKnowledgeGraph
+
+# Served with Range support by `Handler`.
+DATA = os.urandom(300_000)
+SHA256 = hashlib.sha256(DATA).hexdigest()
+ETAG = '"data-v1"'
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    # `http.server.ThreadingHTTPServer` needs Python 3.7.
+    daemon_threads = True
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_HEAD(self):
+        self.reply(head=True)
+
+    def do_GET(self):
+        self.reply()
+
+    def reply(self, head=False):
+        headers = {'Content-Type': 'application/octet-stream', 'ETag': ETAG}
+        if self.server.ranges:
+            headers['Accept-Ranges'] = 'bytes'
+
+        start, end, status = 0, len(DATA), 200
+        match = re.fullmatch(r'bytes=(\d+)-(\d*)', self.headers.get('Range', ''))
+        if (self.server.ranges and match is not None
+                and self.headers.get('If-Range', ETAG) == ETAG):
+            start, status = int(match.group(1)), 206
+            end = int(match.group(2)) + 1 if match.group(2) else len(DATA)
+            headers['Content-Range'] = f'bytes {start}-{end - 1}/{len(DATA)}'
+        if not head:
+            self.server.requests.append((start, end))
+
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(end - start))
+        self.end_headers()
+        if head:
+            return
+
+        body = DATA[start:end]
+        if self.server.drop_after is not None:
+            # Dropped connection, part-way through the body.
+            body, self.server.drop_after = body[:self.server.drop_after], None
+            self.close_connection = True
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestDownloader(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.requests, self.server.ranges, self.server.drop_after = [], True, None
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f'http://127.0.0.1:{self.server.server_port}/data.bin'
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = File.join(self.tmp.name, 'data.bin')
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def download(self, **kwargs):
+        kwargs.setdefault('min_segment_size', 64 * 1024)
+        return Downloader.maybe_download(self.url, download_dir=self.tmp.name,
+                                         progress=False, **kwargs)
+
+    def read(self):
+        with open(self.filename, 'rb') as f:
+            return f.read()
+
+    def test_segments(self):
+        self.assertEqual(self.download(sha256=SHA256.upper()), self.filename)
+        self.assertEqual(self.read(), DATA)
+        # Four parallel ranged requests covering the file.
+        self.assertEqual(sorted(self.server.requests),
+                         [(0, 75_000), (75_000, 150_000), (150_000, 225_000), (225_000, 300_000)])
+        self.assertEqual(os.listdir(self.tmp.name), ['data.bin'])
+
+        # Already downloaded.
+        self.download()
+        self.assertEqual(len(self.server.requests), 4)
+
+    def test_small_file(self):
+        self.download(min_segment_size=1 << 24)
+        self.assertEqual(self.server.requests, [(0, len(DATA))])
+        self.assertEqual(self.read(), DATA)
+
+    def test_resume(self):
+        self.server.drop_after = 100_000
+        with self.assertRaises(ConnectionError):
+            self.download(segments=1, retries=0)
+        self.assertFalse(File.exists(self.filename))
+        self.assertTrue(File.exists(f'{self.filename}.part.json'))
+
+        # Only the missing bytes are requested.
+        self.download(segments=1, sha256=SHA256)
+        self.assertEqual(self.server.requests, [(0, len(DATA)), (100_000, len(DATA))])
+        self.assertEqual(self.read(), DATA)
+        self.assertFalse(File.exists(f'{self.filename}.part.json'))
+
+    def test_retry(self):
+        # Resumed within the same call.
+        self.server.drop_after = 50_000
+        self.download(sha256=SHA256)
+        self.assertEqual(len(self.server.requests), 5)
+        self.assertEqual(self.read(), DATA)
+
+    def test_no_ranges(self):
+        self.server.ranges, self.server.drop_after = False, 100_000
+        self.download(sha256=SHA256)
+        # Dropped: the whole file again.
+        self.assertEqual(self.server.requests, [(0, len(DATA)), (0, len(DATA))])
+        self.assertEqual(self.read(), DATA)
+
+    def test_checksum(self):
+        with self.assertRaises(ValueError):
+            self.download(sha256='0' * 64)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_overwrite(self):
+        with open(self.filename, 'wb') as f:
+            f.write(b'stale')
+        self.download()
+        self.assertEqual(self.read(), b'stale')
+
+        self.download(overwrite=True, sha256=SHA256)
+        self.assertEqual(self.read(), DATA)
+
+
+# Archive members: JSON-LD, gzipped N-Triples & an unsupported file.
+MEMBERS = {
+    'movies/movie.jsonld': json.dumps({'@type': 'Movie', 'name': 'Dune',
+                                       'director': {'@type': 'Person', 'name': 'Denis'}}).encode(),
+    'dump/part-0.nt.gz': gzip.compress(b'<http://example.org/Dune> '
+                                       b'<http://schema.org/author> <http://example.org/Frank> .\n'),
+    'README.txt': b'Not linked data.',
+}
+
+
+class TestArchive(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.archives = {}
+        for name, mode in (('data.zip', None), ('data.tar', 'w'), ('data.tar.gz', 'w:gz'),
+                           ('data.tar.bz2', 'w:bz2')):
+            path = self.archives[name] = File.join(self.tmp.name, name)
+            if mode is None:
+                with zipfile.ZipFile(path, mode='w') as archive:
+                    archive.writestr('movies/', b'')
+                    for member, content in MEMBERS.items():
+                        archive.writestr(member, content)
+                continue
+            with tarfile.open(path, mode=mode) as archive:
+                for member, content in MEMBERS.items():
+                    info = tarfile.TarInfo(member)
+                    info.size = len(content)
+                    archive.addfile(info, io.BytesIO(content))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_iter_archive(self):
+        for name, path in self.archives.items():
+            with self.subTest(name):
+                members = {member: f.read() for member, f in Downloader.iter_archive(path)}
+                self.assertEqual(list(members), list(MEMBERS))
+                self.assertEqual(members['movies/movie.jsonld'], MEMBERS['movies/movie.jsonld'])
+                # Decompressed on the fly.
+                self.assertTrue(members['dump/part-0.nt.gz'].startswith(b'<http://example.org/Dune>'))
+        # Nothing extracted.
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), sorted(self.archives))
+
+    def test_members(self):
+        path = self.archives['data.tar.gz']
+        names = lambda **kwargs: [name for name, _ in Downloader.iter_archive(path, **kwargs)]
+        self.assertEqual(names(members='*.nt.gz'), ['dump/part-0.nt.gz'])
+        self.assertEqual(names(members=['*.txt', 'movies/*']), ['movies/movie.jsonld', 'README.txt'])
+        self.assertEqual(names(members=lambda name: name.startswith('dump/')), ['dump/part-0.nt.gz'])
+
+        for _, f in Downloader.iter_archive(path, members='*.gz', decompress=False):
+            self.assertEqual(gzip.decompress(f.read())[:1], b'<')
+
+        dataset = Dataset(self.archives['data.zip'])
+        self.assertEqual([name for name, _ in dataset.iter_members('*.txt')], ['README.txt'])
+
+    def test_errors(self):
+        with self.assertRaises(FileNotFoundError):
+            list(Downloader.iter_archive(File.join(self.tmp.name, 'missing.zip')))
+        path = File.join(self.tmp.name, 'data.nt')
+        with open(path, 'wb') as f:
+            f.write(b'<a> <b> <c> .\n')
+        with self.assertRaises(ValueError):
+            list(Downloader.iter_archive(path))
+
+    def test_load_archive(self):
+        for name, path in self.archives.items():
+            with self.subTest(name):
+                kg = MemoryKnowledgeGraph('test-archive')
+                self.assertEqual(kg.load_archive(path), ['movies/movie.jsonld', 'dump/part-0.nt.gz'])
+                self.assertIn(('Dune', 'Movie'), kg)
+                self.assertIn(('Denis', 'Person'), kg)
+                self.assertIn(('http://example.org/Frank', 'Thing'), kg)
+
+        kg = MemoryKnowledgeGraph('test-archive', data_file=self.archives['data.tar.gz'])
+        self.assertIn(('Dune', 'Movie'), kg)
+
+        kg = MemoryKnowledgeGraph('test-archive')
+        self.assertEqual(kg.load_archive(self.archives['data.zip'], members='*.nt.gz'),
+                         ['dump/part-0.nt.gz'])
+        self.assertNotIn(('Dune', 'Movie'), kg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,12 +15,22 @@
      Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
 """
 # Built-in libraries.
+import shutil
+import sqlite3
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# Third-party libraries.
+from sqlalchemy import event, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
 # Custom libraries.
 from config.consts import FS
 from sage.core.utils import File
-from sage.core.graph import KnowledgeGraph
+from sage.core.graph import KnowledgeGraph, MultiKnowledgeGraph, sqlite_pragmas
+from sage.core.schema import Edge, reset_neighbor_index
 
 
 class TestKnowledgeGraph(unittest.TestCase):
@@ -59,5 +69,618 @@ class TestKnowledgeGraph(unittest.TestCase):
     #     # File.remove(path)
 
 
+class TestVertexIndex(unittest.TestCase):
+    INDEXES = {'ix_vertex_graph_label_schema', 'ix_vertex_label'}
+
+    def setUp(self):
+        self.path = File.join(FS.DATABASE_DIR, 'test-index.db')
+        self.kg = KnowledgeGraph('test-index', overwrite=True)
+
+    def tearDown(self):
+        self.kg.close()
+        File.remove(self.path)
+
+    def indexes(self):
+        with sqlite3.connect(self.path) as conn:
+            rows = conn.execute("SELECT name FROM sqlite_master "
+                                "WHERE type = 'index' AND tbl_name = 'vertex'")
+            return {name for name, in rows}
+
+    def test_add_vertex_upsert(self):
+        self.assertTrue(self.INDEXES <= self.indexes())
+
+        avatar = self.kg.add_vertex('Avatar', 'Movie', None)
+        self.assertEqual(self.kg.add_vertex('Avatar', 'Movie', None), avatar)
+        self.assertEqual(len(self.kg.vertices), 1)
+        self.assertEqual(self.kg['Avatar', 'Movie'].id, avatar.id)
+
+    def test_migrate_existing_db(self):
+        self.kg.add_vertex('Avatar', 'Movie', None)
+        self.kg.close()
+
+        # Database created before the indexes existed.
+        with sqlite3.connect(self.path) as conn:
+            for name in self.INDEXES:
+                conn.execute(f'DROP INDEX {name}')
+        self.assertFalse(self.INDEXES & self.indexes())
+
+        self.kg = KnowledgeGraph('test-index')
+        self.assertTrue(self.INDEXES <= self.indexes())
+        self.assertIsNotNone(self.kg['Avatar', 'Movie'])
+
+    def test_migrate_duplicates(self):
+        avatar = self.kg.add_vertex('Avatar', 'Movie', None)
+        avatar.payload['year'] = 2009
+        avatar.add_neighbor(self.kg.add_vertex('Action', 'Genre', None), 'genre')
+        self.kg._sess.commit()
+        graph_id = avatar.graph_id
+        self.kg.close()
+
+        # Duplicates written before the unique index existed.
+        with sqlite3.connect(self.path) as conn:
+            for name in self.INDEXES:
+                conn.execute(f'DROP INDEX {name}')
+            conn.execute('DROP INDEX ix_edge_source_target_predicate')
+            conn.execute("INSERT INTO vertex (id, label, schema, payload, graph_id) "
+                         "VALUES ('dup', 'Avatar', 'Movie', ?, ?)",
+                         ('{"year": 1, "rating": 7.8}', graph_id))
+            conn.execute("INSERT INTO vertex (id, label, schema, payload, graph_id) "
+                         "VALUES ('cameron', 'James Cameron', 'Person', '{}', ?)", (graph_id,))
+            for edge_id, source, target, predicate in ((100, 'dup', 'cameron', 'director'),
+                                                       (101, 'cameron', 'dup', 'directed')):
+                conn.execute('INSERT INTO edge (id, vertex_id, predicate, source_id) '
+                             'VALUES (?, ?, ?, ?)', (edge_id, target, predicate, source))
+                conn.execute('INSERT INTO connection (edge_id, vertex_id) VALUES (?, ?)',
+                             (edge_id, source))
+            # Same edge from both copies.
+            genre = conn.execute("SELECT id FROM vertex WHERE label = 'Action'").fetchone()[0]
+            conn.execute("INSERT INTO edge (id, vertex_id, predicate, source_id) "
+                         "VALUES (102, ?, 'genre', 'dup')", (genre,))
+            conn.execute("INSERT INTO connection (edge_id, vertex_id) VALUES (102, 'dup')")
+
+        self.kg = KnowledgeGraph('test-index')
+        self.assertTrue(self.INDEXES <= self.indexes())
+        avatar = self.kg['Avatar', 'Movie']
+        self.assertEqual(avatar.id, self.kg.add_vertex('Avatar', 'Movie', graph_id).id)
+        self.assertEqual(dict(avatar.payload), {'year': 2009, 'rating': 7.8})
+        self.assertEqual(sorted(edge.predicate for edge in avatar.edges), ['director', 'genre'])
+        self.assertEqual(self.kg['James Cameron', 'Person'].edges[0].vertex_id, avatar.id)
+        self.assertEqual(self.kg._sess.execute(
+            text("SELECT COUNT(*) FROM vertex WHERE label = 'Avatar'")).scalar(), 1)
+        # Writes keep working.
+        self.assertIsNotNone(self.kg.add_vertex('Titanic', 'Movie', graph_id))
+
+
+class TestEdges(unittest.TestCase):
+    def setUp(self):
+        self.path = File.join(FS.DATABASE_DIR, 'test-edges.db')
+        self.kg = KnowledgeGraph('test-edges', overwrite=True)
+
+    def tearDown(self):
+        self.kg.close()
+        File.remove(self.path)
+
+    def test_hub(self):
+        genre = self.kg.add_vertex('Drama', 'Genre', None)
+        for i in range(50):
+            movie = self.kg.add_vertex(f'Movie {i}', 'Movie', None)
+            genre.add_neighbor(movie, predicate='example')
+            genre.add_neighbor(movie, predicate='example')
+            genre.add_neighbor(movie, predicate='popular')
+            self.kg._sess.commit()
+
+        self.assertEqual(len(self.kg['Drama', 'Genre'].edges), 100)
+        with self.assertRaises(IntegrityError):
+            # Backed by a unique (source, target, predicate) index.
+            self.kg._sess.add(Edge(movie.id, 'popular', source_id=genre.id))
+            self.kg._sess.commit()
+
+    def test_rollback(self):
+        avatar = self.kg.add_vertex('Avatar', 'Movie', None)
+        cameron = self.kg.add_vertex('James Cameron', 'Person', None)
+        avatar.add_neighbor(cameron, 'director')
+        self.kg._sess.rollback()
+
+        # Rolled back edge is written again.
+        self.assertIsNotNone(avatar.add_neighbor(cameron, 'director'))
+        self.kg._sess.commit()
+        self.assertEqual(len(self.kg['Avatar', 'Movie'].edges), 1)
+
+        # Sessions of other applications aren't listened to.
+        self.assertFalse(event.contains(Session, 'after_rollback', reset_neighbor_index))
+
+    def test_bulk_edges(self):
+        a = self.kg.add_vertex('A', 'Thing', None)
+        b = self.kg.add_vertex('B', 'Thing', None)
+        self.assertIsNone(a.get_connection(b, 'knows'))
+
+        # Written by the bulk loader, outside the ORM.
+        self.kg.add_triple([('A', 'knows', 'B')])
+        self.assertIsNotNone(a.get_connection(b, 'knows'))
+        self.assertEqual(a.add_neighbor(b, 'knows').id, a.get_connection(b).id)
+
+    def test_migrate_source_id(self):
+        avatar = self.kg.add_vertex('Avatar', 'Movie', None)
+        avatar.add_neighbor(self.kg.add_vertex('James Cameron', 'Person', None), 'director')
+        self.kg._sess.commit()
+        self.kg.close()
+
+        # Database created before edges stored their source.
+        with sqlite3.connect(self.path) as conn:
+            conn.executescript('''
+                CREATE TABLE old_edge (id INTEGER PRIMARY KEY,
+                                       vertex_id VARCHAR(8) REFERENCES vertex (id),
+                                       predicate VARCHAR(256));
+                INSERT INTO old_edge SELECT id, vertex_id, predicate FROM edge;
+                DROP TABLE edge;
+                ALTER TABLE old_edge RENAME TO edge;
+            ''')
+
+        self.kg = KnowledgeGraph('test-edges')
+        avatar = self.kg['Avatar', 'Movie']
+        self.assertEqual(avatar.edges[0].source_id, avatar.id)
+        # Existing edge is found, not duplicated.
+        avatar.add_neighbor(self.kg['James Cameron', 'Person'], 'director')
+        self.kg._sess.commit()
+        self.assertEqual(len(avatar.edges), 1)
+
+
+class TestNeighbors(unittest.TestCase):
+    DATA = [
+        {'@type': 'Movie', 'name': 'Avatar',
+         'director': {'@type': 'Person', 'name': 'James Cameron'},
+         'producer': {'@type': 'Person', 'name': 'James Cameron'},
+         'actor': {'@type': 'Person', 'name': 'Sam Worthington'}},
+        {'@type': 'Movie', 'name': 'Titanic',
+         'director': {'@type': 'Person', 'name': 'James Cameron'}},
+    ]
+
+    def setUp(self):
+        self.kg = KnowledgeGraph('test-neighbors', data=self.DATA, overwrite=True)
+        self.queries = 0
+        event.listen(self.kg._sess.get_bind(), 'before_cursor_execute', self.count)
+
+    def tearDown(self):
+        self.kg.close()
+        File.remove(File.join(FS.DATABASE_DIR, 'test-neighbors.db'))
+
+    def count(self, *args):
+        self.queries += 1
+
+    def pairs(self, neighbors):
+        return sorted((predicate, vertex.label) for predicate, vertex in neighbors)
+
+    def test_neighbors(self):
+        avatar = self.kg['Avatar', 'Movie']
+        cameron = self.kg['James Cameron', 'Person']
+
+        self.queries = 0
+        self.assertEqual(self.pairs(self.kg.neighbors(avatar)),
+                         [('actor', 'Sam Worthington'), ('director', 'James Cameron'),
+                          ('producer', 'James Cameron')])
+        self.assertEqual(self.queries, 1)
+
+        self.assertEqual(self.pairs(self.kg.neighbors(avatar.id, predicate='director')),
+                         [('director', 'James Cameron')])
+        self.assertEqual(self.pairs(self.kg.neighbors(cameron, direction='in')),
+                         [('director', 'Avatar'), ('director', 'Titanic'),
+                          ('producer', 'Avatar')])
+        self.assertEqual(self.pairs(self.kg.neighbors(cameron, direction='both',
+                                                      predicate=['producer'])),
+                         [('producer', 'Avatar')])
+
+        with self.assertRaises(ValueError):
+            self.kg.neighbors(avatar, direction='up')
+
+    def test_neighbors_many(self):
+        movies = [self.kg['Avatar', 'Movie'], self.kg['Titanic', 'Movie']]
+        cameron = self.kg['James Cameron', 'Person']
+
+        self.queries = 0
+        result = self.kg.neighbors_many(movies + [cameron], direction='both')
+        self.assertEqual(self.queries, 1)
+        self.assertEqual(len(result[movies[0].id]), 3)
+        self.assertEqual(self.pairs(result[movies[1].id]), [('director', 'James Cameron')])
+        self.assertEqual(len(result[cameron.id]), 3)
+
+
+class TestFind(unittest.TestCase):
+    DATA = [
+        {'@type': 'Movie', 'name': 'Avatar', 'genre': 'Science Fiction',
+         'duration': 162, 'rating': 7.8, 'released': True},
+        {'@type': 'Movie', 'name': 'Titanic', 'genre': 'Drama',
+         'duration': 195, 'rating': 7.9, 'released': True},
+        {'@type': 'Book', 'name': 'Dune', 'genre': 'Science Fiction',
+         'released': False},
+    ]
+
+    def setUp(self):
+        self.path = File.join(FS.DATABASE_DIR, 'test-find.db')
+        self.kg = KnowledgeGraph('test-find', data=self.DATA, overwrite=True)
+
+    def tearDown(self):
+        self.kg.close()
+        File.remove(self.path)
+
+    def labels(self, vertices):
+        return sorted(vertex.label for vertex in vertices)
+
+    def test_find(self):
+        self.assertEqual(self.labels(self.kg.find(genre='Science Fiction')), ['Avatar', 'Dune'])
+        self.assertEqual(self.labels(self.kg.find(schema='Movie', genre='Science Fiction')),
+                         ['Avatar'])
+        self.assertEqual(self.labels(self.kg.find(duration=195)), ['Titanic'])
+        self.assertEqual(self.labels(self.kg.find(rating=7.8)), ['Avatar'])
+        self.assertEqual(self.labels(self.kg.find(released=False)), ['Dune'])
+        # Booleans & numbers don't match each other.
+        self.assertEqual(self.kg.find(released=1), [])
+        self.assertEqual(self.labels(self.kg.find(genre=['Drama', 'Science Fiction'],
+                                                  released=True)), ['Avatar', 'Titanic'])
+        self.assertEqual(len(self.kg.find(schema='Movie', limit=1)), 1)
+
+        with self.assertRaises(TypeError):
+            self.kg.find(genre=None)
+
+    def test_sync(self):
+        avatar = self.kg['Avatar', 'Movie']
+        avatar.payload['genre'] = 'Action'
+        self.kg._sess.commit()
+        self.assertEqual(self.labels(self.kg.find(genre='Action')), ['Avatar'])
+        self.assertEqual(self.labels(self.kg.find(genre='Science Fiction')), ['Dune'])
+
+        # Bulk writes are indexed too.
+        self.kg.load([{'@type': 'Movie', 'name': 'Avatar', 'year': 2009}],
+                     self.kg._default_graph.id, bulk=True)
+        self.assertEqual(self.labels(self.kg.find(year=2009, genre='Action')), ['Avatar'])
+
+        self.kg._sess.delete(self.kg['Dune', 'Book'])
+        self.kg._sess.commit()
+        with sqlite3.connect(self.path) as conn:
+            self.assertEqual(conn.execute('SELECT COUNT(*) FROM property p LEFT JOIN vertex v '
+                                          'ON p.vertex_id = v.id WHERE v.id IS NULL')
+                             .fetchone()[0], 0)
+
+    def test_migrate(self):
+        self.kg.close()
+
+        # Database created before payloads were indexed.
+        with sqlite3.connect(self.path) as conn:
+            conn.executescript('''
+                DROP TRIGGER tr_vertex_property_insert;
+                DROP TRIGGER tr_vertex_property_update;
+                DROP TRIGGER tr_vertex_property_delete;
+                DROP TABLE property;
+            ''')
+
+        self.kg = KnowledgeGraph('test-find')
+        self.assertEqual(self.labels(self.kg.find(genre='Science Fiction')), ['Avatar', 'Dune'])
+        # Triggers are back as well.
+        self.kg.load([{'@type': 'Movie', 'name': 'Alien', 'genre': 'Horror'}],
+                     self.kg._default_graph.id)
+        self.assertEqual(self.labels(self.kg.find(genre='Horror')), ['Alien'])
+
+
+class TestSearch(unittest.TestCase):
+    DATA = [
+        {'@type': 'Movie', 'name': 'Avatar', 'description': 'Directed by James Cameron.',
+         'director': {'@type': 'Person', 'name': 'James Cameron'}},
+        {'@type': 'Movie', 'name': 'Titanic', 'description': 'Ship sinks.'},
+        {'@type': 'Person', 'name': 'Zoë Saldaña'},
+    ]
+
+    def setUp(self):
+        self.kg = KnowledgeGraph('test-search', data=self.DATA, full_text=True, overwrite=True)
+
+    def tearDown(self):
+        self.kg.close()
+        File.remove(File.join(FS.DATABASE_DIR, 'test-search.db'))
+
+    def labels(self, vertices):
+        return [vertex.label for vertex in vertices]
+
+    def test_search(self):
+        # Label matches rank above payload matches.
+        self.assertEqual(self.labels(self.kg.search('cameron')), ['James Cameron', 'Avatar'])
+        self.assertEqual(self.labels(self.kg.search('James Cam*', schema='Person')),
+                         ['James Cameron'])
+        self.assertEqual(self.labels(self.kg.search('cameron', limit=1)), ['James Cameron'])
+        self.assertEqual(self.labels(self.kg.search('zoe saldana')), ['Zoë Saldaña'])
+        self.assertEqual(self.kg.search('cameron NOT "avatar'), [])
+        self.assertEqual(self.kg.search('*'), [])
+
+    def test_sync(self):
+        titanic = self.kg['Titanic', 'Movie']
+        titanic.payload['aliases'] = ['Unsinkable']
+        self.kg._sess.commit()
+        self.assertEqual(self.labels(self.kg.search('unsinkable')), ['Titanic'])
+        self.assertEqual(self.labels(self.kg.search('ship')), ['Titanic'])
+
+        self.kg._sess.delete(titanic)
+        self.kg._sess.commit()
+        self.assertEqual(self.kg.search('ship'), [])
+
+        # Index outlives the session.
+        self.kg.close()
+        self.kg = KnowledgeGraph('test-search')
+        self.kg.load({'@type': 'Movie', 'name': 'Aliens'}, self.kg._default_graph.id)
+        self.assertEqual(self.labels(self.kg.search('alien*')), ['Aliens'])
+
+    def test_disabled(self):
+        kg = KnowledgeGraph('test-search-disabled', data=self.DATA, overwrite=True)
+        try:
+            with self.assertRaises(RuntimeError):
+                kg.search('cameron')
+            kg.enable_search()
+            self.assertEqual(len(kg.search('cameron')), 2)
+        finally:
+            kg.close()
+            File.remove(File.join(FS.DATABASE_DIR, 'test-search-disabled.db'))
+
+
+class TestPaths(unittest.TestCase):
+    DATA = [
+        {'@type': 'Movie', 'name': 'Avatar',
+         'director': {'@type': 'Person', 'name': 'James Cameron',
+                      'spouse': {'@type': 'Person', 'name': 'Suzy Amis',
+                                 'favorite': {'@type': 'Movie', 'name': 'Avatar'}}},
+         'actor': {'@type': 'Person', 'name': 'Sam Worthington',
+                   'spouse': {'@type': 'Person', 'name': 'Suzy Amis'}}},
+        {'@type': 'Movie', 'name': 'Titanic',
+         'director': {'@type': 'Person', 'name': 'James Cameron'}},
+    ]
+
+    def setUp(self):
+        self.kg = KnowledgeGraph('test-paths', data=self.DATA, overwrite=True)
+        self.avatar = self.kg['Avatar', 'Movie']
+        self.titanic = self.kg['Titanic', 'Movie']
+        self.suzy = self.kg['Suzy Amis', 'Person']
+
+    def tearDown(self):
+        self.kg.close()
+        File.remove(File.join(FS.DATABASE_DIR, 'test-paths.db'))
+
+    def triples(self, path):
+        return [(s.label, p, o.label) for s, p, o in path]
+
+    def test_paths(self):
+        paths = [self.triples(path) for path in self.kg.paths(self.avatar, self.suzy, max_hops=2)]
+        self.assertEqual(sorted(paths), [
+            [('Avatar', 'actor', 'Sam Worthington'), ('Sam Worthington', 'spouse', 'Suzy Amis')],
+            [('Avatar', 'director', 'James Cameron'), ('James Cameron', 'spouse', 'Suzy Amis')],
+        ])
+        # Cycles (Suzy Amis -> Avatar) aren't followed.
+        self.assertEqual(len(self.kg.paths(self.avatar, self.suzy, max_hops=6)), 2)
+        self.assertEqual(len(self.kg.paths(self.avatar.id, self.suzy.id, max_hops=2,
+                                           predicates=['director', 'spouse'])), 1)
+        self.assertEqual(len(self.kg.paths(self.avatar, self.suzy, max_hops=2, limit=1)), 1)
+        self.assertEqual(self.kg.paths(self.avatar, self.titanic, max_hops=6), [])
+
+        paths = self.kg.paths(self.avatar, self.titanic, max_hops=2, direction='both')
+        self.assertEqual([self.triples(path) for path in paths], [
+            [('Avatar', 'director', 'James Cameron'), ('Titanic', 'director', 'James Cameron')],
+        ])
+        with self.assertRaises(ValueError):
+            self.kg.paths(self.avatar, self.titanic, direction='up')
+
+    def test_shortest_path(self):
+        self.assertEqual(len(self.kg.shortest_path(self.avatar, self.suzy)), 2)
+        self.assertEqual(self.triples(self.kg.shortest_path(self.suzy, self.avatar)),
+                         [('Suzy Amis', 'favorite', 'Avatar')])
+        self.assertEqual(len(self.kg.shortest_path(self.suzy, self.avatar, direction='in')), 2)
+        self.assertEqual(self.kg.shortest_path(self.avatar, self.avatar), [])
+        self.assertIsNone(self.kg.shortest_path(self.avatar, self.titanic))
+
+        sam = self.kg['Sam Worthington', 'Person']
+        path = self.triples(self.kg.shortest_path(self.titanic, sam, direction='both'))
+        # Through Avatar or Suzy Amis.
+        self.assertEqual(len(path), 3)
+        self.assertEqual(path[0], ('Titanic', 'director', 'James Cameron'))
+        self.assertIsNone(self.kg.shortest_path(self.titanic, sam, max_hops=2, direction='both'))
+        self.assertIsNone(self.kg.shortest_path(self.avatar, self.suzy, predicates='actor'))
+
+
+class TestSQLiteProfile(unittest.TestCase):
+    def tearDown(self):
+        path = File.join(FS.DATABASE_DIR, 'test-profile.db')
+        if File.is_file(path):
+            File.remove(path)
+
+    def pragma(self, kg, name):
+        return kg._sess.execute(text(f'PRAGMA {name}')).scalar()
+
+    def test_pragmas(self):
+        self.assertEqual(sqlite_pragmas('default'), {})
+        pragmas = sqlite_pragmas('serve', {'mmap_size': 0, 'page_size': 16384})
+        self.assertEqual(list(pragmas)[:2], ['page_size', 'journal_mode'])
+        self.assertEqual(pragmas['mmap_size'], '0')
+
+        with self.assertRaises(ValueError):
+            sqlite_pragmas('fastest')
+        with self.assertRaises(ValueError):
+            sqlite_pragmas(pragmas={'foreign_keys': 'ON'})
+        with self.assertRaises(ValueError):
+            sqlite_pragmas(pragmas={'cache_size': '1; DROP TABLE vertex'})
+
+    def test_profiles(self):
+        kg = KnowledgeGraph('test-profile', overwrite=True, profile='serve',
+                            pragmas={'page_size': 8192}, data={'@type': 'Movie', 'name': 'Avatar'})
+        self.assertEqual(self.pragma(kg, 'journal_mode'), 'wal')
+        self.assertEqual(self.pragma(kg, 'page_size'), 8192)
+        self.assertEqual(self.pragma(kg, 'mmap_size'), 1 << 30)
+        self.assertTrue(File.is_file(File.join(FS.DATABASE_DIR, 'test-profile.db-wal')))
+        kg.close()
+
+        kg = KnowledgeGraph('test-profile', profile='bulk')
+        self.assertEqual(self.pragma(kg, 'synchronous'), 0)
+        self.assertEqual(self.pragma(kg, 'cache_size'), -262144)
+        self.assertIsNotNone(kg['Avatar', 'Movie'])
+        kg.close()
+
+        # Overwriting drops the write-ahead log too.
+        kg = KnowledgeGraph('test-profile', overwrite=True)
+        self.assertIsNone(kg['Avatar', 'Movie'])
+        self.assertFalse(File.is_file(File.join(FS.DATABASE_DIR, 'test-profile.db-wal')))
+        kg.close()
+
+
+class TestVertexCache(unittest.TestCase):
+    def setUp(self):
+        self.kg = KnowledgeGraph('test-cache', overwrite=True, cache_size=3,
+                                 data={'@type': 'Movie', 'name': 'Avatar',
+                                       'director': {'@type': 'Person',
+                                                    'name': 'James Cameron'}})
+
+    def tearDown(self):
+        self.kg.close()
+        File.remove(File.join(FS.DATABASE_DIR, 'test-cache.db'))
+
+    def test_hits(self):
+        self.assertTrue(('Avatar', 'Movie') in self.kg)
+        avatar = self.kg['Avatar', 'Movie']
+        # Also cached by id.
+        self.assertIs(self.kg[avatar.id], avatar)
+        self.assertEqual(self.kg.cache_info(), {'hits': 2, 'misses': 1, 'evictions': 0,
+                                                'size': 2, 'maxsize': 3})
+
+        # Evicts the least recently used: Avatar's id.
+        self.assertIsNotNone(self.kg['James Cameron', 'Person'])
+        self.assertEqual(self.kg.cache_info()['evictions'], 1)
+
+    def test_invalidation(self):
+        # Misses are cached until the next write.
+        self.assertNotIn(('Titanic', 'Movie'), self.kg)
+        self.assertIsNone(self.kg['Titanic', 'Movie'])
+        self.assertEqual(self.kg.cache_info()['hits'], 1)
+
+        self.kg.add_vertex('Titanic', 'Movie', None)
+        self.assertEqual(self.kg.cache_info()['size'], 0)
+        self.assertIsNotNone(self.kg['Titanic', 'Movie'])
+
+    def test_get_many(self):
+        avatar = self.kg['Avatar', 'Movie']
+        result = self.kg.get_many([avatar.id, ('James Cameron', 'Person'), ('Dune', 'Book')])
+        self.assertIs(result[0], avatar)
+        self.assertEqual(result[1].label, 'James Cameron')
+        self.assertIsNone(result[2])
+        # Batched misses are cached too.
+        self.assertIsNone(self.kg['Dune', 'Book'])
+        self.assertEqual(self.kg.cache_info()['hits'], 2)
+
+    def test_disabled(self):
+        kg = KnowledgeGraph('test-cache')
+        try:
+            self.assertIsNone(kg.cache_info())
+            self.assertIsNotNone(kg['Avatar', 'Movie'])
+        finally:
+            kg.close()
+
+
+class TestConcurrency(unittest.TestCase):
+    MOVIES = [f'Movie {i}' for i in range(50)]
+
+    def setUp(self):
+        self.kg = KnowledgeGraph('test-threads', overwrite=True, profile='serve', cache_size=20,
+                                 data=[{'@type': 'Movie', 'name': name,
+                                        'director': {'@type': 'Person', 'name': f'{name} director'}}
+                                       for name in self.MOVIES])
+
+    def tearDown(self):
+        self.kg.close()
+        for ext in ('', '-wal', '-shm'):
+            path = File.join(FS.DATABASE_DIR, f'test-threads.db{ext}')
+            if File.is_file(path):
+                File.remove(path)
+
+    def lookup(self, name):
+        try:
+            movie = self.kg[name, 'Movie']
+            directors = [v.label for _, v in self.kg.neighbors(movie, 'director')]
+            return movie.label, self.kg[movie.id] is not None, directors, threading.get_ident()
+        finally:
+            self.kg.release_session()
+
+    def test_readers(self):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(self.lookup, self.MOVIES * 4))
+
+        for name, (label, found, directors, _) in zip(self.MOVIES * 4, results):
+            self.assertEqual(label, name)
+            self.assertTrue(found)
+            self.assertEqual(directors, [f'{name} director'])
+        # Lookups ran on several threads at once, each with its own session.
+        self.assertGreater(len({ident for *_, ident in results}), 1)
+
+    def test_writer(self):
+        def write():
+            for i in range(20):
+                self.kg.add_vertex(f'New {i}', 'Movie', None)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            writer = pool.submit(write)
+            readers = [pool.submit(self.lookup, name) for name in self.MOVIES]
+            writer.result()
+            self.assertEqual([r.result()[0] for r in readers], self.MOVIES)
+
+        # Writes from another thread are visible here, the cache was invalidated.
+        self.assertIsNone(self.kg['New 19', 'Book'])
+        self.assertIsNotNone(self.kg['New 19', 'Movie'])
+        self.assertEqual(len(self.kg.find(schema='Movie')), len(self.MOVIES) + 20)
+
+    def test_reads_skip_write_lock(self):
+        # Readers never wait for the writer.
+        with self.kg._write_lock, ThreadPoolExecutor(max_workers=1) as pool:
+            result = pool.submit(self.lookup, 'Movie 1').result(timeout=10)
+        self.assertEqual(result[0], 'Movie 1')
+
+    def test_release_session(self):
+        movie = self.kg['Movie 0', 'Movie']
+        self.kg.release_session()
+        # Not the cached vertex of the closed session, which would be detached.
+        movie = self.kg['Movie 0', 'Movie']
+        self.assertEqual([edge.predicate for edge in movie.edges], ['director'])
+
+    def test_default_graph(self):
+        # Only the id is shared, each thread loads its own `Graph`.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            graph = pool.submit(lambda: self.kg._default_graph).result()
+        self.assertEqual(graph.id, self.kg._default_graph.id)
+        self.assertIsNot(graph, self.kg._default_graph)
+
+
+class TestMultiKnowledgeGraph(unittest.TestCase):
+    PATH = File.join(FS.GRAPH_DIR, 'schema-org')
+    NAMES = {'action', 'avatar', 'creative_work', 'event',
+             'medical_condition', 'movie', 'property_value'}
+
+    def tearDown(self):
+        for kg in self.mkg.graphs:
+            kg.close()
+        shutil.rmtree(self.mkg.base_dir)
+
+    def check(self):
+        self.assertEqual(set(self.mkg.timings), self.NAMES)
+        for name in self.NAMES:
+            self.assertTrue(File.is_file(File.join(self.mkg.base_dir, f'{name}.db')))
+        self.assertIsNotNone(self.mkg['avatar', 'Avatar', 'Movie'])
+
+    def test_from_dir(self):
+        self.mkg = MultiKnowledgeGraph.from_dir(self.PATH, max_workers=2, overwrite=True)
+        self.check()
+
+    def test_from_dir_threads(self):
+        self.mkg = MultiKnowledgeGraph.from_dir(self.PATH, max_workers=2, use_threads=True,
+                                                overwrite=True, bulk=True)
+        self.check()
+
+    def test_from_dir_settings(self):
+        self.mkg = MultiKnowledgeGraph.from_dir(self.PATH, max_workers=2, use_threads=True,
+                                                overwrite=True, profile='serve', cache_size=10)
+        self.check()
+        # Settings the graphs were built with are kept once they're re-opened.
+        for kg in self.mkg.graphs:
+            self.assertEqual(kg.pragmas, sqlite_pragmas('serve'))
+            self.assertIsNotNone(kg.cache_info())
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,83 @@
+"""Tests for lazy loading of `sage.core`.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence Expert & Researcher.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: test_imports.py
+     Created on 18 October, 2026 @ 10:20 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+
+# Built-in libraries.
+import sys
+import json
+import subprocess
+import unittest
+
+# Custom libraries.
+from config.consts import FS
+import sage.core
+
+
+# Imported at start-up by nothing but the code needing them.
+HEAVY = ('sqlalchemy', 'numpy', 'bs4', 'yaml', 'colorlog', 'tarfile', 'zipfile',
+         'urllib.request', 'multiprocessing', 'concurrent.futures', 'config.consts')
+
+
+def imported(statement):
+    """Heavy modules loaded by `statement` in a fresh interpreter."""
+    code = f'import sys\n{statement}\nprint(__import__("json").dumps(sorted(sys.modules)))'
+    proc = subprocess.run([sys.executable, '-c', code], cwd=FS.PROJECT_DIR,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          universal_newlines=True, check=True)
+    modules = set(json.loads(proc.stdout.splitlines()[-1]))
+    return sorted(name for name in HEAVY if name in modules)
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_sage_core(self):
+        self.assertEqual(imported('import sage.core'), [])
+
+    def test_knowledge_graph(self):
+        # SQLAlchemy brings its own (asyncio, zipfile, ...), but nothing of ours.
+        modules = imported('from sage.core import KnowledgeGraph')
+        self.assertIn('sqlalchemy', modules)
+        for name in ('numpy', 'bs4', 'yaml', 'colorlog', 'tarfile', 'urllib.request'):
+            self.assertNotIn(name, modules)
+
+    def test_logger(self):
+        # Configured by the first message, not by importing `Log`.
+        self.assertEqual(imported('from sage.core import Log'), [])
+        self.assertIn('colorlog', imported('from sage.core import Log; Log.debug("")'))
+
+    def test_existing_loggers(self):
+        # Loggers of the host application aren't disabled by configuring ours.
+        code = ('import logging; app = logging.getLogger("myapp")\n'
+                'from sage.core import Log; Log.debug("")\n'
+                'print(app.disabled, logging.getLogger("sqlalchemy.engine").isEnabledFor(logging.INFO))')
+        proc = subprocess.run([sys.executable, '-c', code], cwd=FS.PROJECT_DIR,
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              universal_newlines=True, check=True)
+        self.assertEqual(proc.stdout.split(), ['False', 'False'])
+
+    def test_attributes(self):
+        from sage.core import utils
+        self.assertIs(sage.core.File, utils.File)
+        self.assertIs(sage.core.utils, utils)
+        self.assertIn('KnowledgeGraph', dir(sage.core))
+        self.assertIn('snapshot', dir(sage.core))
+        with self.assertRaises(AttributeError):
+            sage.core.NotAGraph
+        with self.assertRaises(ImportError):
+            from sage.core import NotAGraph  # noqa: F401
+
+
+if __name__ == '__main__':
+    unittest.main()
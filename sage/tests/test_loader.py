@@ -0,0 +1,110 @@
+"""Tests for bulk loading Knowledge Graphs.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence Expert & Researcher.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: test_loader.py
+     Created on 18 October, 2026 @ 10:40 AM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+
+# Built-in libraries.
+import unittest
+
+# Custom libraries.
+from config.consts import FS
+from sage.core import KnowledgeGraph, File
+from sage.core.loader import BulkLoader
+from sage.core.reader import Literal
+
+
+def dump(kg):
+    """Graph content without the (random) vertex ids."""
+    vertices, edges = {}, set()
+    for vertex in kg.vertices:
+        key = vertex.label, vertex.schema
+        vertices[key] = dict(vertex.payload)
+        for edge in vertex.edges:
+            nbr = kg[edge.vertex_id]
+            edges.add((key, edge.predicate, (nbr.label, nbr.schema)))
+    return vertices, edges
+
+
+class TestBulkLoader(unittest.TestCase):
+    NAMES = ('action', 'creative-work', 'event',
+             'medical-condition', 'movie', 'property-value')
+
+    def setUp(self):
+        self.graphs = []
+
+    def tearDown(self):
+        for kg in self.graphs:
+            kg.close()
+            File.remove(File.join(FS.DATABASE_DIR, f'{kg.label}.db'))
+
+    def create(self, name, **kwargs):
+        path = File.join(FS.GRAPH_DIR, f'schema-org/{name}.jsonld')
+        kg = KnowledgeGraph(f'test-loader-{len(self.graphs)}-{name}',
+                            data_file=path, overwrite=True, **kwargs)
+        self.graphs.append(kg)
+        return kg
+
+    def test_matches_per_row(self):
+        for name in self.NAMES:
+            with self.subTest(name=name):
+                expected = dump(self.create(name))
+                self.assertEqual(dump(self.create(name, bulk=True)), expected)
+                self.assertEqual(dump(self.create(name, bulk=True, chunk_size=2)),
+                                 expected)
+
+    def test_reload_is_idempotent(self):
+        kg = self.create('movie', bulk=True)
+        expected = dump(kg)
+
+        stats = kg.load(KnowledgeGraph.read(File.join(FS.GRAPH_DIR,
+                                                      'schema-org/movie.jsonld')),
+                        kg._default_graph.id, bulk=True)
+        self.assertEqual(stats['vertices'], 0)
+        self.assertEqual(stats['edges'], 0)
+        self.assertEqual(dump(kg), expected)
+
+    def test_payload_updates_are_flushed(self):
+        kg = self.create('movie')
+        with BulkLoader(kg, kg._graph_id) as loader:
+            loader.BUFFER_SIZE = 10
+            vertex_id = loader.add_vertex('Literal-only', 'Thing')
+            loader.flush()
+            # Payload of a written vertex counts toward the buffer.
+            for i in range(25):
+                loader.add_payload(vertex_id, f'p{i}', i)
+                self.assertLess(len(loader._payloads), 10)
+        self.assertEqual(kg[('Literal-only', 'Thing')].payload['p24'], 24)
+
+    def test_repeated_literals(self):
+        kg = self.create('movie')
+        triples = [('http://x.org/Alien', 'http://x.org/name', Literal('Alien')),
+                   ('http://x.org/Alien', 'http://x.org/name', Literal('Alien 1979')),
+                   ('http://x.org/Alien', 'http://x.org/director', 'http://x.org/Ridley')]
+        with BulkLoader(kg, kg._graph_id) as loader:
+            loader.add_triples(triples)
+            loader.flush()
+            # Written vertex: appended to the stored list, edge ignored.
+            loader.add_triples([('http://x.org/Alien', 'http://x.org/name', Literal('Alien')),
+                                ('http://x.org/Alien', 'http://x.org/name', Literal('Alien 3'))]
+                               + triples[2:])
+        self.assertEqual(loader.n_edges, 1)
+        alien = kg[('http://x.org/Alien', 'Thing')]
+        self.assertEqual(alien.payload['name'], ['Alien', 'Alien 1979', 'Alien 3'])
+        self.assertEqual(len(alien.edges), 1)
+        self.assertEqual([v.label for v in kg.find(name='Alien 3')], ['http://x.org/Alien'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,217 @@
+"""Tests for the in-memory storage backend, side by side with SQLite.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence Expert & Researcher.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: test_memory.py
+     Created on 18 October, 2026 @ 09:30 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+
+# Built-in libraries.
+import tempfile
+import unittest
+
+# Custom libraries.
+from config.consts import FS
+from sage.core import File, KnowledgeGraph
+from sage.core.memory import MemoryKnowledgeGraph
+from sage.core.reader import Literal
+
+
+class BackendTests:
+    """Behaviour both storage backends share. Subclasses choose the backend."""
+
+    DATA = [
+        {'@type': 'Movie', 'name': 'Avatar', 'genre': 'Science Fiction',
+         'duration': 162, 'rating': 7.8, 'released': True,
+         'director': {'@type': 'Person', 'name': 'James Cameron',
+                      'spouse': {'@type': 'Person', 'name': 'Suzy Amis',
+                                 'favorite': {'@type': 'Movie', 'name': 'Avatar'}}},
+         'producer': {'@type': 'Person', 'name': 'James Cameron'},
+         'actor': {'@type': 'Person', 'name': 'Sam Worthington',
+                   'spouse': {'@type': 'Person', 'name': 'Suzy Amis'}}},
+        {'@type': 'Movie', 'name': 'Titanic', 'genre': 'Drama',
+         'duration': 195, 'rating': 7.9, 'released': True,
+         'director': {'@type': 'Person', 'name': 'James Cameron'}},
+        {'@type': 'Book', 'name': 'Dune', 'genre': 'Science Fiction', 'released': False},
+    ]
+
+    def make(self, name, **kwargs):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.kg = self.make('test-backend', data=self.DATA)
+        self.avatar = self.kg['Avatar', 'Movie']
+        self.titanic = self.kg['Titanic', 'Movie']
+        self.cameron = self.kg['James Cameron', 'Person']
+        self.suzy = self.kg['Suzy Amis', 'Person']
+
+    def labels(self, vertices):
+        return sorted(vertex.label for vertex in vertices)
+
+    def pairs(self, neighbors):
+        return sorted((predicate, vertex.label) for predicate, vertex in neighbors)
+
+    def triples(self, path):
+        return [(s.label, p, o.label) for s, p, o in path]
+
+    def test_vertices(self):
+        self.assertEqual(len(self.kg.vertices), 6)
+        self.assertEqual(self.kg[self.avatar.id].label, 'Avatar')
+        self.assertIn(('Dune', 'Book'), self.kg)
+        self.assertNotIn(('Dune', 'Movie'), self.kg)
+        self.assertEqual(self.avatar.payload['duration'], 162)
+        self.assertEqual(self.kg.add_vertex('Avatar', 'Movie', None).id, self.avatar.id)
+        self.assertEqual([v and v.label for v in self.kg.get_many([self.suzy.id, ('X', 'Y')])],
+                         ['Suzy Amis', None])
+        self.assertEqual(self.labels(self.kg.iter_vertices(batch_size=4)),
+                         self.labels(self.kg.vertices))
+        with self.assertRaises(ValueError):
+            list(self.kg.iter_vertices(batch_size=0))
+        with self.assertRaises(TypeError):
+            self.kg.get(42)
+
+    def test_neighbors(self):
+        self.assertEqual(self.pairs(self.kg.neighbors(self.avatar)),
+                         [('actor', 'Sam Worthington'), ('director', 'James Cameron'),
+                          ('producer', 'James Cameron')])
+        self.assertEqual(self.pairs(self.kg.neighbors(self.cameron, direction='in')),
+                         [('director', 'Avatar'), ('director', 'Titanic'),
+                          ('producer', 'Avatar')])
+        self.assertEqual(self.pairs(self.kg.neighbors(self.cameron, direction='both',
+                                                      predicate=['producer', 'spouse'])),
+                         [('producer', 'Avatar'), ('spouse', 'Suzy Amis')])
+        result = self.kg.neighbors_many([self.titanic, self.cameron.id], direction='both')
+        self.assertEqual(len(result[self.cameron.id]), 4)
+        with self.assertRaises(ValueError):
+            self.kg.neighbors(self.avatar, direction='up')
+
+    def test_find(self):
+        self.assertEqual(self.labels(self.kg.find(genre='Science Fiction')), ['Avatar', 'Dune'])
+        self.assertEqual(self.labels(self.kg.find(schema='Movie', genre='Science Fiction')),
+                         ['Avatar'])
+        self.assertEqual(self.labels(self.kg.find(duration=195)), ['Titanic'])
+        self.assertEqual(self.labels(self.kg.find(rating=7.8)), ['Avatar'])
+        self.assertEqual(self.labels(self.kg.find(released=False)), ['Dune'])
+        # Booleans & numbers don't match each other.
+        self.assertEqual(self.kg.find(released=1), [])
+        self.assertEqual(self.labels(self.kg.find(genre=['Drama', 'Science Fiction'],
+                                                  released=True)), ['Avatar', 'Titanic'])
+        self.assertEqual(len(self.kg.find(schema='Movie', limit=1)), 1)
+        with self.assertRaises(TypeError):
+            self.kg.find(genre=None)
+
+    def test_paths(self):
+        paths = [self.triples(path) for path in self.kg.paths(self.avatar, self.suzy, max_hops=2)]
+        self.assertEqual(sorted(paths), [
+            [('Avatar', 'actor', 'Sam Worthington'), ('Sam Worthington', 'spouse', 'Suzy Amis')],
+            [('Avatar', 'director', 'James Cameron'), ('James Cameron', 'spouse', 'Suzy Amis')],
+            [('Avatar', 'producer', 'James Cameron'), ('James Cameron', 'spouse', 'Suzy Amis')],
+        ])
+        # Cycles (Suzy Amis -> Avatar) aren't followed.
+        self.assertEqual(len(self.kg.paths(self.avatar, self.suzy, max_hops=6)), 3)
+        self.assertEqual(len(self.kg.paths(self.avatar.id, self.suzy.id, max_hops=2,
+                                           predicates=['director', 'spouse'])), 1)
+        self.assertEqual(len(self.kg.paths(self.avatar, self.suzy, max_hops=2, limit=1)), 1)
+        self.assertEqual(self.kg.paths(self.avatar, self.titanic, max_hops=6), [])
+        self.assertEqual(len(self.kg.paths(self.avatar, self.titanic, max_hops=2,
+                                           direction='both')), 2)
+
+    def test_shortest_path(self):
+        self.assertEqual(len(self.kg.shortest_path(self.avatar, self.suzy)), 2)
+        self.assertEqual(self.triples(self.kg.shortest_path(self.suzy, self.avatar)),
+                         [('Suzy Amis', 'favorite', 'Avatar')])
+        self.assertEqual(self.kg.shortest_path(self.avatar, self.avatar), [])
+        self.assertIsNone(self.kg.shortest_path(self.avatar, self.titanic))
+        path = self.triples(self.kg.shortest_path(self.titanic, self.avatar, direction='both'))
+        self.assertEqual(path, [('Titanic', 'director', 'James Cameron'),
+                                ('Avatar', 'director', 'James Cameron')])
+
+    def test_query(self):
+        matches = list(self.kg.query([('?m', 'director', '?p'), ('?m', '@type', 'Movie'),
+                                      ('?m', 'genre', 'Drama')]))
+        self.assertEqual([(m['m'].label, m['p'].label) for m in matches],
+                         [('Titanic', 'James Cameron')])
+
+        matches = list(self.kg.query([('?p', 'spouse', '?s'), ('?p', '@type', '?t')],
+                                     resolve=False))
+        self.assertEqual(sorted(m['p'] for m in matches),
+                         sorted([self.cameron.id, self.kg['Sam Worthington', 'Person'].id]))
+        self.assertEqual({m['t'] for m in matches}, {'Person'})
+
+        matches = self.kg.query([(('Avatar', 'Movie'), '?r', self.cameron)])
+        self.assertEqual(sorted(m['r'] for m in matches), ['director', 'producer'])
+        self.assertEqual(len(list(self.kg.query([('?m', 'released', True)], limit=1))), 1)
+        self.assertEqual(list(self.kg.query([(('Up', 'Movie'), 'director', '?p')])), [])
+        with self.assertRaises(TypeError):
+            self.kg.query([('?m', 1, '?p')])
+
+    def test_add_triple(self):
+        stats = self.kg.add_triple([('http://x.org/Alien', 'http://x.org/director',
+                                     'http://x.org/Ridley'),
+                                    ('http://x.org/Alien', 'http://x.org/year', Literal('1979'))])
+        self.assertEqual((stats['vertices'], stats['edges']), (2, 1))
+        alien = self.kg['http://x.org/Alien', 'Thing']
+        self.assertEqual(alien.payload['year'], '1979')
+        self.assertEqual(self.pairs(self.kg.neighbors(alien)), [('director', 'http://x.org/Ridley')])
+
+    def test_repeated_literals(self):
+        self.kg.add_triple([('http://x.org/Alien', 'http://x.org/name', Literal('Alien')),
+                            ('http://x.org/Alien', 'http://x.org/name', Literal('Alien 1979')),
+                            ('http://x.org/Alien', 'http://x.org/name', Literal('Alien'))])
+        alien = self.kg['http://x.org/Alien', 'Thing']
+        self.assertEqual(alien.payload['name'], ['Alien', 'Alien 1979'])
+        self.assertEqual(self.labels(self.kg.find(name='Alien 1979')), ['http://x.org/Alien'])
+
+    def test_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.kg.save_snapshot(File.join(tmp, 'graph.snap'))
+            snap = self.kg.load_snapshot(File.join(tmp, 'graph.snap'), verify=True)
+            self.assertEqual(len(snap), 6)
+            self.assertEqual(snap.payload(('Titanic', 'Movie'))['duration'], 195)
+
+
+class TestSQLiteBackend(BackendTests, unittest.TestCase):
+    def make(self, name, **kwargs):
+        return KnowledgeGraph(name, overwrite=True, **kwargs)
+
+    def tearDown(self):
+        self.kg.close()
+        File.remove(File.join(FS.DATABASE_DIR, 'test-backend.db'))
+
+
+class TestMemoryBackend(BackendTests, unittest.TestCase):
+    def make(self, name, **kwargs):
+        return MemoryKnowledgeGraph(name, **kwargs)
+
+    def tearDown(self):
+        self.kg.close()
+
+    def test_no_files(self):
+        self.assertFalse(File.is_file(File.join(FS.DATABASE_DIR, 'test-backend.db')))
+
+    def test_records(self):
+        # Adjacency lists live on the vertex records.
+        self.assertEqual([edge.predicate for edge in self.avatar.edges],
+                         ['director', 'producer', 'actor'])
+        self.assertEqual(len(self.cameron.in_edges), 3)
+        # Existing edges are reused, like `Vertex.add_neighbor`.
+        edge = self.avatar.add_neighbor(self.cameron, 'director')
+        self.assertIs(edge, self.avatar.edges[0])
+        self.assertIs(self.avatar.get_connection(self.cameron, 'producer'), self.avatar.edges[1])
+        with self.assertRaises(AttributeError):
+            self.avatar.rating = 7.8
+        with self.assertRaises(RuntimeError):
+            self.kg.search('cameron')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Tests for triple pattern queries.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence Expert & Researcher.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: test_query.py
+     Created on 18 October, 2026 @ 05:40 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+
+# Built-in libraries.
+from collections.abc import Iterator
+import unittest
+
+# Third-party libraries.
+from sqlalchemy import event
+
+# Custom libraries.
+from config.consts import FS
+from sage.core import KnowledgeGraph, File
+from sage.core.query import Pattern
+
+
+class TestPattern(unittest.TestCase):
+    def test_variables(self):
+        query = Pattern([('?m', 'director', '?p'), ('?m', '@type', '?t'), ('?m', '?r', '?x')])
+        self.assertEqual(query.variables, {'?m': 'vertex', '?p': 'vertex', '?t': 'string',
+                                           '?r': 'string', '?x': 'vertex'})
+
+        with self.assertRaises(ValueError):
+            Pattern([])
+        with self.assertRaises(ValueError):
+            Pattern([('?m', 'director')])
+        with self.assertRaises(ValueError):
+            Pattern([('?m', 'director', '?p'), ('?p', '@type', '?m')])
+        with self.assertRaises(TypeError):
+            Pattern([('?m', 1, '?p')])
+
+    def test_plan(self):
+        query = Pattern([('?m', 'director', '?p'), ('?m', '@type', 'Movie'),
+                         ('?p', 'name', 'James Cameron')])
+        # Indexed literal first, then edges reachable from it, vertices last.
+        self.assertEqual([atom[0] for atom in query.plan()],
+                         ['property', 'vertex', 'edge', 'vertex'])
+        self.assertEqual(query.plan()[2], ('edge', '?m', 'director', '?p'))
+
+        sql, params = query.compile('graph', limit=5)
+        self.assertEqual(sql.count('CROSS JOIN'), 3)
+        self.assertTrue(sql.endswith('LIMIT 5'))
+        self.assertIn('James Cameron', params.values())
+
+
+class TestQuery(unittest.TestCase):
+    DATA = [
+        {'@type': 'Movie', 'name': 'Avatar', 'genre': 'Science Fiction', 'duration': 162,
+         'director': {'@type': 'Person', 'name': 'James Cameron'},
+         'actor': {'@type': 'Person', 'name': 'Sam Worthington'}},
+        {'@type': 'Movie', 'name': 'Titanic', 'genre': 'Drama', 'duration': 195,
+         'director': {'@type': 'Person', 'name': 'James Cameron'}},
+        {'@type': 'Movie', 'name': 'Terminator Salvation', 'genre': 'Science Fiction',
+         'actor': {'@type': 'Person', 'name': 'Sam Worthington'}},
+    ]
+
+    def setUp(self):
+        self.kg = KnowledgeGraph('test-query', data=self.DATA, overwrite=True)
+
+    def tearDown(self):
+        self.kg.close()
+        File.remove(File.join(FS.DATABASE_DIR, 'test-query.db'))
+
+    def rows(self, patterns, **kwargs):
+        return sorted(tuple(getattr(v, 'label', v) for v in match.values())
+                      for match in self.kg.query(patterns, **kwargs))
+
+    def test_query(self):
+        matches = self.kg.query([('?m', 'director', '?p'), ('?m', '@type', 'Movie')])
+        self.assertIsInstance(matches, Iterator)
+        self.assertEqual(sorted((m['m'].label, m['p'].label) for m in matches),
+                         [('Avatar', 'James Cameron'), ('Titanic', 'James Cameron')])
+
+        # Actors who worked with James Cameron on Science Fiction movies.
+        self.assertEqual(self.rows([('?m', 'director', ('James Cameron', 'Person')),
+                                    ('?m', 'genre', 'Science Fiction'),
+                                    ('?m', 'actor', '?a')]),
+                         [('Avatar', 'Sam Worthington')])
+        self.assertEqual(self.rows([('?m', '?r', ('Sam Worthington', 'Person')),
+                                    ('?m', 'duration', 162)]),
+                         [('Avatar', 'actor')])
+        self.assertEqual(self.rows([(self.kg['Titanic', 'Movie'], '@type', '?t')]),
+                         [('Movie',)])
+        self.assertEqual(self.rows([('?m', 'director', ('Nobody', 'Person'))]), [])
+        self.assertEqual(len(self.rows([('?m', '@type', 'Movie')], limit=2)), 2)
+
+        with self.assertRaises(TypeError):
+            # Raised eagerly, not on first `next`.
+            self.kg.query([('?m', 'duration', None)])
+
+    def test_single_query(self):
+        graph_id = self.kg._default_graph.id
+        queries = []
+        event.listen(self.kg._sess.get_bind(), 'before_cursor_execute',
+                     lambda *args: queries.append(args[2]))
+
+        matches = list(self.kg.query([('?m', 'actor', '?a'), ('?m', 'genre', 'Science Fiction')],
+                                     graph_id=graph_id, resolve=False, batch_size=1))
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(len(matches), 2)
+        self.assertTrue(all(isinstance(m['a'], str) for m in matches))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,230 @@
+"""Tests for streaming Linked Data readers.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence Expert & Researcher.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: test_reader.py
+     Created on 18 October, 2026 @ 11:40 AM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+
+# Built-in libraries.
+import io
+import gzip
+import json
+import tempfile
+import unittest
+
+# Custom libraries.
+from config.consts import FS
+from sage.core import KnowledgeGraph, File
+from sage.core.reader import RDF, Literal, iter_jsonld, iter_ntriples, iter_rdfxml
+
+
+class TestJSONLDReader(unittest.TestCase):
+    NODES = [
+        {'@type': 'Person', 'name': 'James Cameron', 'height': 1.88},
+        {'@type': 'Movie', 'name': 'Avatar', 'budget': 237000000,
+         'director': {'@type': 'Person', 'name': 'James Cameron'}},
+        {'@type': 'Movie', 'name': 'Titanic', 'genre': ['Romance', 'Drama']},
+    ]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, text):
+        path = File.join(self.tmp.name, name)
+        opener = gzip.open if name.endswith('.gz') else open
+        with opener(path, mode='wt', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+    def test_graph(self):
+        doc = json.dumps({'@context': 'https://schema.org', '@graph': self.NODES},
+                         indent=2)
+        path = self.write('graph.jsonld', doc)
+        # Tiny chunks, so values are split across reads.
+        self.assertEqual(list(iter_jsonld(path, chunk_size=7)), self.NODES)
+
+    def test_array_and_json_lines(self):
+        path = self.write('array.json', json.dumps(self.NODES))
+        self.assertEqual(list(iter_jsonld(path, chunk_size=5)), self.NODES)
+
+        path = self.write('nodes.jsonl.gz', '\n'.join(map(json.dumps, self.NODES)))
+        self.assertEqual(list(iter_jsonld(path, chunk_size=5)), self.NODES)
+
+    def test_single_object(self):
+        path = File.join(FS.GRAPH_DIR, 'schema-org/avatar.jsonld')
+        self.assertEqual(list(iter_jsonld(path)), [KnowledgeGraph.read(path)])
+
+        # Binary file objects are left open.
+        f = io.BytesIO(json.dumps(self.NODES[0]).encode('utf-8'))
+        self.assertEqual(list(iter_jsonld(f)), self.NODES[:1])
+        self.assertFalse(f.closed)
+
+    def test_invalid(self):
+        path = self.write('invalid.json', '[{"name": "Avatar"}, {"name": ]')
+        with self.assertRaises(ValueError):
+            list(iter_jsonld(path, chunk_size=4))
+
+    def test_fromfile(self):
+        path = self.write('movies.jsonl', '\n'.join(map(json.dumps, self.NODES)))
+        kg = KnowledgeGraph.fromfile(path, overwrite=True)
+        try:
+            self.assertEqual(len(kg.vertices), 3)
+            self.assertEqual(kg['Avatar', 'Movie'].payload['budget'], 237000000)
+        finally:
+            kg.close()
+            File.remove(File.join(FS.DATABASE_DIR, 'movies.db'))
+
+
+class TestNTriplesReader(unittest.TestCase):
+    DOC = (
+        '# Avatar.\n'
+        '<http://ex.org/avatar> <http://schema.org/name> "Avatar" .\n'
+        '<http://ex.org/avatar> <http://schema.org/director> <http://ex.org/cameron> .\n'
+        '<http://ex.org/avatar> <http://schema.org/budget> '
+        '"237000000"^^<http://www.w3.org/2001/XMLSchema#integer> .\n'
+        '<http://ex.org/avatar> <http://schema.org/description> "Na\\u2019vi \\"Pandora\\""@en .\r\n'
+        '\n'
+        '_:b0 <http://schema.org/review> <http://ex.org/avatar> . # Blank node.\n'
+        '<http://ex.org/cameron> <http://schema.org/name> "James Cameron" .\n'
+    )
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = File.join(self.tmp.name, 'avatar.nt.gz')
+        with gzip.open(self.path, mode='wt', encoding='utf-8') as f:
+            f.write(self.DOC)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_parse(self):
+        triples = list(iter_ntriples(self.path))
+        self.assertEqual(len(triples), 6)
+
+        s, p, o = triples[0]
+        self.assertEqual((s, p, o), ('http://ex.org/avatar', 'http://schema.org/name', 'Avatar'))
+        self.assertIsInstance(o, Literal)
+
+        # IRI objects are plain strings.
+        self.assertNotIsInstance(triples[1][2], Literal)
+        self.assertEqual(triples[2][2], 237000000)
+        self.assertEqual(triples[3][2], 'Na\u2019vi "Pandora"')
+        self.assertEqual(triples[4][0], '_:b0')
+
+    def test_invalid(self):
+        f = io.StringIO('<http://ex.org/a> <http://ex.org/b> .\n')
+        with self.assertRaises(ValueError):
+            list(iter_ntriples(f))
+        f.seek(0)
+        self.assertEqual(list(iter_ntriples(f, strict=False)), [])
+
+    def test_fromfile(self):
+        kg = KnowledgeGraph.fromfile(self.path, overwrite=True)
+        try:
+            self.assertEqual(kg.label, 'avatar')
+            self.assertEqual(len(kg.vertices), 3)
+
+            avatar = kg['http://ex.org/avatar', 'Thing']
+            self.assertEqual(avatar.payload['name'], 'Avatar')
+            self.assertEqual(avatar.payload['budget'], 237000000)
+            self.assertEqual([e.predicate for e in avatar.edges], ['director'])
+            self.assertEqual(kg[avatar.edges[0].vertex_id].payload['name'],
+                             'James Cameron')
+        finally:
+            kg.close()
+            File.remove(File.join(FS.DATABASE_DIR, 'avatar.db'))
+
+
+class TestRDFXMLReader(unittest.TestCase):
+    DOC = """<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns:xsd="http://www.w3.org/2001/XMLSchema#"
+         xmlns:foaf="http://xmlns.com/foaf/0.1/"
+         xml:base="http://ex.org/">
+  <foaf:Person rdf:about="alice" foaf:nick="ally">
+    <foaf:name xml:lang="en">Alice</foaf:name>
+    <foaf:age rdf:datatype="http://www.w3.org/2001/XMLSchema#integer">42</foaf:age>
+    <foaf:knows rdf:resource="#bob"/>
+    <foaf:knows>
+      <foaf:Person rdf:ID="carol"><foaf:name>Carol</foaf:name></foaf:Person>
+    </foaf:knows>
+    <foaf:based_near rdf:parseType="Resource"><foaf:name>Lagos</foaf:name></foaf:based_near>
+  </foaf:Person>
+  <rdf:Description rdf:about="#bob">
+    <foaf:name>Bob</foaf:name>
+    <foaf:interest rdf:parseType="Collection">
+      <rdf:Description rdf:about="http://ex.org/rdf"/>
+    </foaf:interest>
+    <foaf:bio rdf:parseType="Literal">Likes <b>XML</b>.</foaf:bio>
+  </rdf:Description>
+</rdf:RDF>
+"""
+    FOAF = 'http://xmlns.com/foaf/0.1/'
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = File.join(self.tmp.name, 'foaf.rdf')
+        with open(self.path, mode='w', encoding='utf-8') as f:
+            f.write(self.DOC)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_parse(self):
+        triples = list(iter_rdfxml(self.path))
+        foaf = self.FOAF
+        alice, bob, carol = 'http://ex.org/alice', 'http://ex.org/#bob', 'http://ex.org/#carol'
+
+        for triple in [(alice, RDF + 'type', foaf + 'Person'),
+                       (alice, foaf + 'nick', 'ally'),
+                       (alice, foaf + 'name', 'Alice'),
+                       (alice, foaf + 'age', 42),
+                       (alice, foaf + 'knows', bob),
+                       (alice, foaf + 'knows', carol),
+                       (carol, foaf + 'name', 'Carol'),
+                       (bob, foaf + 'name', 'Bob'),
+                       (bob, foaf + 'bio', 'Likes <b>XML</b>.')]:
+            self.assertIn(triple, triples)
+        self.assertEqual(len(triples), 15)
+
+        # Blank nodes.
+        place = next(o for s, p, o in triples if p == foaf + 'based_near')
+        self.assertTrue(place.startswith('_:'))
+        self.assertIn((place, foaf + 'name', 'Lagos'), triples)
+
+        cell = next(o for s, p, o in triples if p == foaf + 'interest')
+        self.assertIn((cell, RDF + 'first', 'http://ex.org/rdf'), triples)
+        self.assertIn((cell, RDF + 'rest', RDF + 'nil'), triples)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            list(iter_rdfxml(io.BytesIO(b'<rdf:RDF xmlns:rdf="%s"><rdf:Description>'
+                                        % RDF.encode())))
+
+    def test_fromfile(self):
+        kg = KnowledgeGraph.fromfile(self.path, overwrite=True)
+        try:
+            alice = kg['http://ex.org/alice', 'Thing']
+            self.assertEqual(alice.payload['age'], 42)
+            self.assertEqual(sorted(e.predicate for e in alice.edges),
+                             ['based_near', 'knows', 'knows', 'type'])
+        finally:
+            kg.close()
+            File.remove(File.join(FS.DATABASE_DIR, 'foaf.db'))
+
+
+if __name__ == '__main__':
+    unittest.main()
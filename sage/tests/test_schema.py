@@ -56,6 +56,20 @@ class TestVertex(unittest.TestCase):
         self.assertIsNone(director.id)
         self.assertIsNone(director.vertex)
 
+    def test_predicates(self):
+        nbr = Vertex('James Cameron', 'Person')
+        director = self.vertex.add_neighbor(nbr, predicate='director')
+        producer = self.vertex.add_neighbor(nbr, predicate='producer')
+
+        # Several predicates between the same pair, each added once.
+        self.assertIs(self.vertex.add_neighbor(nbr, predicate='director'), director)
+        self.assertEqual(len(self.vertex.edges), 2)
+        self.assertEqual(director.source_id, self.vertex.id)
+
+        self.assertIs(self.vertex.get_connection(nbr), director)
+        self.assertIs(self.vertex.get_connection(nbr, predicate='producer'), producer)
+        self.assertIsNone(self.vertex.get_connection(Vertex('Sam Worthington', 'Person')))
+
     def test_payload(self):
         self.assertDictEqual(self.vertex.payload, {})
         self.assertEqual(len(self.vertex.payload), 0)
@@ -43,7 +43,8 @@ class TestSchemaOrg(unittest.TestCase):
         self.assertEqual(kg.label, 'creative-work')
         self.assertEqual(len(kg.vertices), 3)
         node = kg['Holt Physical Science', 'Book']
-        self.assertEqual(len(node.edges), 2)
+        # `copyrightHolder` & `publisher` are both the same Organization.
+        self.assertEqual(len(node.edges), 3)
 
     def test_event(self):
         kg = self.create('event')
@@ -0,0 +1,175 @@
+"""Tests for in-memory graph snapshots.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence Expert & Researcher.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: test_snapshot.py
+     Created on 18 October, 2026 @ 02:50 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+
+# Built-in libraries.
+import tempfile
+import unittest
+
+# Third-party libraries.
+import numpy as np
+
+# Custom libraries.
+from config.consts import FS
+from sage.core import KnowledgeGraph, File
+from sage.core.snapshot import GraphSnapshot, StringTable
+
+
+class TestGraphSnapshot(unittest.TestCase):
+    DATA = [
+        {'@type': 'Movie', 'name': 'Avatar',
+         'director': {'@type': 'Person', 'name': 'James Cameron',
+                      'spouse': {'@type': 'Person', 'name': 'Suzy Amis'}},
+         'actor': {'@type': 'Person', 'name': 'Sam Worthington'}},
+        {'@type': 'Movie', 'name': 'Titanic',
+         'director': {'@type': 'Person', 'name': 'James Cameron'}},
+    ]
+
+    def setUp(self):
+        self.kg = KnowledgeGraph('test-snapshot', data=self.DATA, overwrite=True)
+        self.snap = self.kg.snapshot()
+
+    def tearDown(self):
+        self.kg.close()
+        File.remove(File.join(FS.DATABASE_DIR, 'test-snapshot.db'))
+
+    def labels(self, indices):
+        return sorted(self.snap.labels[i] for i in indices)
+
+    def test_csr(self):
+        self.assertEqual(len(self.snap), 5)
+        self.assertEqual(self.snap.n_edges, 4)
+        self.assertEqual(self.snap.offsets[-1], 4)
+        self.assertEqual(sorted(self.snap.predicate_names), ['actor', 'director', 'spouse'])
+
+        avatar = self.kg['Avatar', 'Movie']
+        self.assertEqual(self.snap.index_of(avatar), self.snap.index_of(avatar.id))
+        self.assertEqual(list(self.snap.degree([avatar, ('James Cameron', 'Person')])), [2, 1])
+        self.assertEqual(self.snap.degree([('James Cameron', 'Person')], direction='in')[0], 2)
+        self.assertEqual(self.snap.degree(direction='both').sum(), 8)
+
+    def test_traversal(self):
+        avatar = ('Avatar', 'Movie')
+        self.assertEqual(self.labels(self.snap.neighbors(avatar)),
+                         ['James Cameron', 'Sam Worthington'])
+        self.assertEqual(self.labels(self.snap.k_hop(avatar, k=2)),
+                         ['James Cameron', 'Sam Worthington', 'Suzy Amis'])
+        # Predicate filters apply to every hop.
+        self.assertEqual(self.labels(self.snap.k_hop(avatar, k=2, predicates='director')),
+                         ['James Cameron'])
+        self.assertEqual(self.labels(self.snap.k_hop(avatar, k=2,
+                                                     predicates=['director', 'spouse'])),
+                         ['James Cameron', 'Suzy Amis'])
+        self.assertEqual(self.labels(self.snap.k_hop(('Suzy Amis', 'Person'), k=2,
+                                                     direction='in')),
+                         ['Avatar', 'James Cameron', 'Titanic'])
+
+        distance = self.snap.bfs(avatar, direction='both')
+        self.assertEqual(distance[self.snap.index_of(('Titanic', 'Movie'))], 2)
+
+        src, pred, dst = self.snap.subgraph(avatar, k=2, direction='both')
+        edges = {(self.snap.labels[s], self.snap.predicate_names[p], self.snap.labels[d])
+                 for s, p, d in zip(src, pred, dst)}
+        self.assertEqual(len(src), 4)
+        self.assertIn(('Titanic', 'director', 'James Cameron'), edges)
+
+    def test_matches_orm(self):
+        kg = KnowledgeGraph('test-snapshot-movie', overwrite=True,
+                            data_file=File.join(FS.GRAPH_DIR, 'schema-org/movie.jsonld'))
+        try:
+            snap = kg.snapshot()
+            self.assertEqual(len(snap), len(kg.vertices))
+            for vertex in kg.vertices:
+                expected = sorted(edge.vertex_id for edge in vertex.edges)
+                self.assertEqual(sorted(snap.to_ids(snap.neighbors(vertex))), expected)
+        finally:
+            kg.close()
+            File.remove(File.join(FS.DATABASE_DIR, 'test-snapshot-movie.db'))
+
+
+class TestSnapshotFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = File.join(self.tmp.name, 'movie.snap')
+        self.kg = KnowledgeGraph('test-snapshot-file', overwrite=True,
+                                 data_file=File.join(FS.GRAPH_DIR, 'schema-org/movie.jsonld'))
+        self.saved = self.kg.save_snapshot(self.path)
+
+    def tearDown(self):
+        self.kg.close()
+        File.remove(File.join(FS.DATABASE_DIR, 'test-snapshot-file.db'))
+        self.tmp.cleanup()
+
+    def test_string_table(self):
+        table = StringTable.from_strings(['Movie', 'Person', 'Movie', None, 'Zoë'], intern=True)
+        self.assertEqual(list(table), ['Movie', 'Person', 'Movie', '', 'Zoë'])
+        self.assertEqual(len(table.offsets), 5)
+        self.assertEqual(table[-1], 'Zoë')
+
+    def test_round_trip(self):
+        snap = KnowledgeGraph.load_snapshot(self.path, verify=True)
+        self.assertIsInstance(snap.offsets, np.ndarray)
+        # Zero-copy views of the mapped file.
+        self.assertFalse(snap.targets.flags.writeable)
+        self.assertIsInstance(snap.targets.base, np.memmap)
+
+        self.assertEqual(len(snap), len(self.saved))
+        np.testing.assert_array_equal(snap.offsets, self.saved.offsets)
+        np.testing.assert_array_equal(snap.targets, self.saved.targets)
+        self.assertEqual(snap.predicate_names, self.saved.predicate_names)
+        self.assertEqual(list(snap.schemas), self.saved.schemas)
+
+        for vertex in self.kg.vertices:
+            i = snap.index_of(vertex.id)
+            self.assertEqual(snap.labels[i], vertex.label)
+            self.assertEqual(snap.index_of((vertex.label, vertex.schema)), i)
+            self.assertEqual(snap.payload(i), vertex.payload)
+            self.assertEqual(sorted(snap.to_ids(snap.neighbors(vertex))),
+                             sorted(edge.vertex_id for edge in vertex.edges))
+        with self.assertRaises(KeyError):
+            snap.index_of('0000000000000000')
+        with self.assertRaises(KeyError):
+            snap.index_of(('Avatar', 'Book'))
+        # Found without decoding every label.
+        self.assertIsNone(snap._label_index)
+
+        vertex = self.kg.vertices[0]
+        np.testing.assert_array_equal(snap.bfs(vertex.id, direction='both'),
+                                      self.saved.bfs(vertex.id, direction='both'))
+
+    def test_corruption(self):
+        with open(self.path, mode='r+b') as f:
+            f.seek(-1, 2)
+            f.write(b'\xff')
+        # Sections are only checked on request.
+        GraphSnapshot.load(self.path)
+        with self.assertRaises(ValueError):
+            GraphSnapshot.load(self.path, verify=True)
+
+        with open(self.path, mode='r+b') as f:
+            f.seek(20)
+            f.write(b'\xff')
+        with self.assertRaises(ValueError):
+            GraphSnapshot.load(self.path)
+
+        with open(self.path, mode='r+b') as f:
+            f.write(b'NOTASNAP')
+        with self.assertRaises(ValueError):
+            GraphSnapshot.load(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""Tests for the compiled schema.org vocabulary.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence Expert & Researcher.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: test_vocab.py
+     Created on 18 October, 2026 @ 11:30 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+
+# Built-in libraries.
+import gzip
+import json
+import tempfile
+import unittest
+
+# Custom libraries.
+from config.consts import FS
+from sage.core import File, KnowledgeGraph, MemoryKnowledgeGraph
+from sage.core.snapshot import GraphSnapshot
+from sage.core.vocab import Vocabulary
+
+
+def node(name, parents=(), kind='rdfs:Class'):
+    return {'@id': f'schema:{name}', '@type': kind, 'rdfs:label': name,
+            'rdfs:subClassOf': [{'@id': f'schema:{p}'} for p in parents]}
+
+
+def prop(name, domains, ranges):
+    return {'@id': f'schema:{name}', '@type': 'rdf:Property', 'rdfs:label': name,
+            'schema:domainIncludes': [{'@id': f'schema:{t}'} for t in domains],
+            'schema:rangeIncludes': {'@id': f'schema:{ranges}'}}
+
+
+# Excerpt of https://schema.org/version/latest/schemaorg-current-https.jsonld
+VOCABULARY = {'@context': {}, '@graph': [
+    node('Thing'),
+    node('CreativeWork', ['Thing']),
+    node('Product', ['Thing']),
+    # Multiple inheritance.
+    node('Book', ['CreativeWork', 'Product']),
+    node('Movie', ['CreativeWork']),
+    node('Person', ['Thing']),
+    {'@id': 'schema:DataType', '@type': 'rdfs:Class', 'rdfs:subClassOf': {'@id': 'rdfs:Class'}},
+    node('Text', ['DataType'], kind=['schema:DataType', 'rdfs:Class']),
+    # Enumeration members aren't types.
+    {'@id': 'schema:Hardcover', '@type': 'schema:BookFormatType'},
+    prop('name', ['Thing'], 'Text'),
+    prop('author', ['CreativeWork', 'Rating'], 'Person'),
+    prop('isbn', ['Book'], 'Text'),
+    prop('sku', ['Product'], 'Text'),
+]}
+
+
+class TestVocabulary(unittest.TestCase):
+    def setUp(self):
+        self.vocab = Vocabulary.from_jsonld(VOCABULARY)
+
+    def test_types(self):
+        self.assertEqual(self.vocab.types, ['Book', 'CreativeWork', 'DataType', 'Movie',
+                                            'Person', 'Product', 'Text', 'Thing'])
+        self.assertIn('schema:Book', self.vocab)
+        self.assertNotIn('Hardcover', self.vocab)
+        self.assertEqual(self.vocab.type_id('https://schema.org/Movie'), 3)
+        self.assertEqual(self.vocab.depth.tolist(), [2, 1, 0, 2, 1, 1, 1, 0])
+
+    def test_is_a(self):
+        self.assertTrue(self.vocab.is_a('Book', 'Thing'))
+        self.assertTrue(self.vocab.is_a('Book', 'Product'))
+        self.assertTrue(self.vocab.is_a('schema:Book', 'https://schema.org/Book'))
+        self.assertFalse(self.vocab.is_a('Thing', 'Book'))
+        self.assertFalse(self.vocab.is_a('Movie', 'Product'))
+        # Unknown types are only themselves.
+        self.assertTrue(self.vocab.is_a('Rating', 'Rating'))
+        self.assertFalse(self.vocab.is_a('Rating', 'Thing'))
+
+        self.assertEqual(self.vocab.supertypes('Book')[-1], 'Thing')
+        self.assertEqual(sorted(self.vocab.supertypes('Book')),
+                         ['CreativeWork', 'Product', 'Thing'])
+        self.assertEqual(self.vocab.subtypes('CreativeWork'), ['Book', 'Movie'])
+
+    def test_most_specific(self):
+        most_specific = self.vocab.most_specific
+        self.assertEqual(most_specific(['Thing', 'CreativeWork', 'Book']), 'Book')
+        self.assertEqual(most_specific(['schema:Book', 'schema:Product']), 'schema:Book')
+        # Unrelated: deepest, then first.
+        self.assertEqual(most_specific(['Person', 'Movie']), 'Movie')
+        self.assertEqual(most_specific(['Person', 'Product']), 'Person')
+        # Unknown types lose to known ones.
+        self.assertEqual(most_specific(['Rating', 'Thing']), 'Thing')
+        self.assertEqual(most_specific(['Rating', 'Review']), 'Rating')
+        self.assertEqual(most_specific([], default='Thing'), 'Thing')
+        self.assertEqual(most_specific('Movie'), 'Movie')
+
+    def test_properties(self):
+        self.assertEqual(self.vocab.domains('author'), ['CreativeWork'])
+        self.assertEqual(self.vocab.ranges('schema:author'), ['Person'])
+        self.assertEqual(self.vocab.properties_of('Book'), ['author', 'isbn', 'name', 'sku'])
+        self.assertEqual(self.vocab.properties_of('Book', inherited=False), ['isbn'])
+        with self.assertRaises(KeyError):
+            self.vocab.domains('title')
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = File.join(tmp, 'schemaorg.jsonld.gz')
+            with gzip.open(path, mode='wt', encoding='utf-8') as f:
+                json.dump(VOCABULARY, f)
+            Vocabulary.from_jsonld(path).save(File.join(tmp, 'schemaorg.vocab'))
+
+            vocab = Vocabulary.load(File.join(tmp, 'schemaorg.vocab'), verify=True)
+            self.assertEqual(vocab.types, self.vocab.types)
+            self.assertEqual(vocab.most_specific(['Product', 'Book', 'Thing']), 'Book')
+            self.assertEqual(vocab.properties_of('Movie'), ['author', 'name'])
+            self.assertEqual(vocab.subtypes('Thing'), self.vocab.subtypes('Thing'))
+
+            # Not interchangeable with graph snapshots.
+            with self.assertRaises(ValueError):
+                GraphSnapshot.load(File.join(tmp, 'schemaorg.vocab'))
+
+    def test_load_graph(self):
+        data = [{'@type': ['Product', 'Book'], 'name': 'Dune',
+                 'author': {'@type': ['Thing', 'Person'], 'name': 'Frank Herbert'}}]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = File.join(tmp, 'schemaorg.vocab')
+            self.vocab.save(path)
+
+            kg = MemoryKnowledgeGraph('test-vocab', data=data, vocabulary=self.vocab)
+            self.assertIn(('Dune', 'Book'), kg)
+            self.assertIn(('Frank Herbert', 'Person'), kg)
+
+            with KnowledgeGraph('test-vocab', data=data, overwrite=True, vocabulary=path) as kg:
+                self.assertIn(('Dune', 'Book'), kg)
+            File.remove(File.join(FS.DATABASE_DIR, 'test-vocab.db'))
+
+        # Without a vocabulary, the first type.
+        self.assertIn(('Dune', 'Product'), MemoryKnowledgeGraph('test-vocab', data=data))
+
+
+if __name__ == '__main__':
+    unittest.main()
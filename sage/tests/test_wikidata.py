@@ -0,0 +1,111 @@
+"""Tests for Wikidata entity dump ingestion.
+
+   @author
+     Victor I. Afolabi
+     Artificial Intelligence Expert & Researcher.
+     Email: javafolabi@gmail.com | victor.afolabi@zephyrtel.com
+     GitHub: https://github.com/victor-iyiola
+
+   @project
+     File: test_wikidata.py
+     Created on 18 October, 2026 @ 01:30 PM.
+
+   @license
+     Apache 2.0 License
+     Copyright (c) 2019. Victor I. Afolabi. All rights reserved.
+"""
+
+# Built-in libraries.
+import gzip
+import json
+import tempfile
+import unittest
+
+# Custom libraries.
+from config.consts import FS
+from sage.core import KnowledgeGraph, File
+from sage.core.wikidata import transform, iter_entities
+
+
+def entity(n):
+    """Small synthetic entity linking to its successor."""
+    return {
+        'id': f'Q{n}', 'type': 'item',
+        'labels': {'en': {'language': 'en', 'value': f'Entity {n}'}},
+        'claims': {
+            'P31': [{'mainsnak': {'snaktype': 'value', 'property': 'P31',
+                                  'datavalue': {'type': 'wikibase-entityid',
+                                                'value': {'entity-type': 'item',
+                                                          'numeric-id': n + 1}}},
+                     'rank': 'normal'}],
+            'P1082': [{'mainsnak': {'snaktype': 'value', 'property': 'P1082',
+                                    'datavalue': {'type': 'quantity',
+                                                  'value': {'amount': f'+{n}', 'unit': '1'}}},
+                       'rank': 'normal'},
+                      {'mainsnak': {'snaktype': 'value', 'property': 'P1082',
+                                    'datavalue': {'type': 'quantity',
+                                                  'value': {'amount': '+1.5', 'unit': '1'}}},
+                       'rank': 'deprecated'}],
+        },
+    }
+
+
+class TestWikidata(unittest.TestCase):
+    PATH = File.join(FS.GRAPH_DIR, 'wikidata/new-york.jsonld')
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.entities = [KnowledgeGraph.read(self.PATH)] + [entity(n) for n in range(1, 50)]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name):
+        # Same layout as `latest-all.json`.
+        path = File.join(self.tmp.name, name)
+        opener = gzip.open if name.endswith('.gz') else open
+        with opener(path, mode='wt', encoding='utf-8') as f:
+            f.write('[\n' + ',\n'.join(map(json.dumps, self.entities)) + '\n]\n')
+        return path
+
+    def test_transform(self):
+        entity_id, schema, payload, edges = transform(self.entities[0])
+        self.assertEqual((entity_id, schema), ('Q60', 'Item'))
+        self.assertEqual(payload['name'], 'New York City')
+        self.assertEqual(payload['aliases'], ['NYC', 'New York'])
+        self.assertEqual(payload['P625'], 'Point(-73.94 40.67)')
+        self.assertEqual(len(edges), 8)
+        self.assertIn(('P150', 'Q11299', 'Item'), edges)
+
+        # Deprecated claims are skipped.
+        self.assertEqual(transform(entity(7))[2]['P1082'], 7)
+
+    def test_iter_entities(self):
+        expected = [transform(e) for e in self.entities]
+        path = self.write('latest-all.json')
+        # Tiny byte ranges, so lines straddle range boundaries.
+        self.assertEqual(list(iter_entities(path, processes=1, block_size=97)), expected)
+        self.assertEqual(list(iter_entities(path, processes=2, block_size=97)), expected)
+
+        path = self.write('latest-all.json.gz')
+        self.assertEqual(list(iter_entities(path, processes=2)), expected)
+
+    def test_load_wikidata(self):
+        kg = KnowledgeGraph('test-wikidata', overwrite=True)
+        try:
+            stats = kg.load_wikidata(self.write('latest-all.json.gz'), processes=2)
+            # Q60, its 8 targets & Q1 ... Q50.
+            self.assertEqual(stats['vertices'], 59)
+            self.assertEqual(stats['edges'], 57)
+
+            self.assertEqual(kg['Q60', 'Item'].payload['name'], 'New York City')
+            self.assertEqual(kg['Q2', 'Item'].payload['P1082'], 2)
+            self.assertEqual([kg[e.vertex_id].label for e in kg['Q49', 'Item'].edges],
+                             ['Q50'])
+        finally:
+            kg.close()
+            File.remove(File.join(FS.DATABASE_DIR, 'test-wikidata.db'))
+
+
+if __name__ == '__main__':
+    unittest.main()